@@ -1,6 +1,6 @@
 @echo off
 echo === AI_GM_Project: Install Requirements ===
-python -m pip install fastapi uvicorn openai python-dotenv pydantic
+python -m pip install fastapi uvicorn openai python-dotenv pydantic numpy
 echo.
 echo Done. Press any key to close this window.
 pause >nul
@@ -6,9 +6,15 @@ from pydantic import BaseModel
 from dotenv import load_dotenv
 from openai import OpenAI
 import os
+import sys
 import json
 from datetime import datetime
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "scripts"))
+
+from rules_repository import get_rules, thaw
+
 # === App Setup
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -144,7 +150,8 @@ async def chat_endpoint(request: ChatRequest):
     player_input = request.player_input
 
     try:
-        npc_data = read_json(os.path.join(CHARACTER_DIR, f"{npc}.json"))
+        # character sheets are static rules data: served from the compiled bundle when fresh
+        npc_data = thaw(get_rules().get(os.path.join(BASE_DIR, CHARACTER_DIR, f"{npc}.json")))
     except:
         return {"reply": f"[ERROR] NPC '{npc}' not found."}
 
@@ -16,13 +16,25 @@ from __future__ import annotations
 from sorcery_ext import (
     is_sorceress, cast_spell, on_new_round_tick,
     apply_melee_vulnerability, consume_evade_on_melee_if_any,
-    override_from_rules
+    override_from_rules, list_spells, present_spells_menu
 )
 
 import json
 import logging
-import random
 from pathlib import Path
+from body_plans import canonical_zone
+from stance_table import ATTACK_MOD, DEFENSE_MOD, stance_of
+from combat_profile import combat_profile, configure as configure_profiles, invalidate as invalidate_profile
+from zones import ZONE_KEYS, Zone, coverage_keys_for_zone, coverage_mask, unit_mask, zone_of
+from dice import get_dice, seed_dice
+from rules_bundle import PROJECT_DIR, armor_variant, character_index, norm_key
+from rules_repository import get_rules, thaw
+from combat_policy import EnemyRulePolicy, PlayerPolicy, TurnView
+
+from combat_events import (
+    AttackMissed, AttackRolled, ArmorAbsorbed, CombatEvent, Defended,
+    Narration, UnitFell, WeaponWorn, ZoneHit, get_bus,
+)
 
 # ---- Extensions / rules loader ----
 from combat_engine_ext import (
@@ -50,11 +62,12 @@ eng = CombatEngine(rules)
 
 # ========= Safe I/O =========
 def safe_load_json(path: Path):
+    """Mutable copy of a JSON file, served by the RulesRepository (compiled bundle or raw JSON)."""
     try:
-        with open(path, "r", encoding="utf-8-sig") as f: # was 'utf-8'
-            data = json.load(f)
-            logging.debug(f"File content for {path}: {json.dumps(data, ensure_ascii=False, indent=2)[:2000]}")
-            return data
+        data = thaw(get_rules().get(path))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("File content for %s: %s", path, json.dumps(data, ensure_ascii=False, indent=2)[:2000])
+        return data
     except FileNotFoundError:
         logging.warning(f"Missing file: {path}")
         return None
@@ -85,8 +98,9 @@ def ask_int(prompt, lo=None, hi=None, default=None):
     return val
 
 # ========= Data: armors & weapons =========
-ARMORS_RAW = safe_load_json(ARMORS_JSON) or {}
-WEAPONS_RAW = safe_load_json(WEAPONS_JSON) or {}
+# Read-only views; nothing below mutates the raw tables.
+ARMORS_RAW = get_rules().get(ARMORS_JSON, None) or {}
+WEAPONS_RAW = get_rules().get(WEAPONS_JSON, None) or {}
 
 # Base damages if weapons.json misses something
 WEAPON_DAMAGE = {
@@ -97,22 +111,14 @@ DEFAULT_DURABILITY = {
 }
 
 def overlay_weapons_from_json():
-    data = WEAPONS_RAW
-    if not data:
+    if not WEAPONS_RAW:
         return
-    for key, w in data.items():
-        key_l = str(key).lower()
-        if isinstance(w, dict):
-            if "base_damage" in w:
-                try:
-                    WEAPON_DAMAGE[key_l] = int(w["base_damage"])
-                except Exception:
-                    pass
-            if "durability" in w:
-                try:
-                    DEFAULT_DURABILITY[key_l] = int(w["durability"])
-                except Exception:
-                    pass
+    # lower-cased keys and int fields are precomputed (rules_bundle.index_weapons)
+    for key_l, w in get_rules().derived("weapon_overlay").items():
+        if "base_damage" in w:
+            WEAPON_DAMAGE[key_l] = w["base_damage"]
+        if "durability" in w:
+            DEFAULT_DURABILITY[key_l] = w["durability"]
 
 overlay_weapons_from_json()
 
@@ -130,7 +136,6 @@ def resolve_armor(category_key: str):
     Returns dict with: name, weight, mobility_penalty, stamina_penalty, category, variant_key, coverage(list)
     """
     cat = str(category_key or "").strip()
-    node = ARMORS_RAW.get(cat)
 
     def pack(name, weight, vkey, coverage=None, mob_bonus=0, stam_pen=None):
         weight = int(weight)
@@ -145,16 +150,9 @@ def resolve_armor(category_key: str):
             "coverage": list(coverage or []),
         }
 
-    if node is None:
-        name, w = DEFAULT_ARMORS.get(cat, (cat or "Padded Cloth", 10))
-        return pack(name, w, "default", coverage=[])
-
-    if isinstance(node, dict) and not ("name" in node or "weight" in node):
-        if not node:
-            name, w = DEFAULT_ARMORS.get(cat, (cat, 10))
-            return pack(name, w, "default-empty")
-        vkey = "standard" if "standard" in node else next(iter(node.keys()))
-        v = node.get(vkey, {})
+    # variant dicts (and flat entries as variant "flat") are pre-resolved (rules_bundle.index_armors)
+    vkey, v = armor_variant(cat) if ARMORS_RAW else (None, None)
+    if v is not None:
         name = v.get("name", DEFAULT_ARMORS.get(cat, (cat, 10))[0])
         weight = int(v.get("weight", DEFAULT_ARMORS.get(cat, (cat, 10))[1]))
         cov = v.get("coverage", [])
@@ -162,13 +160,14 @@ def resolve_armor(category_key: str):
         stam_pen = v.get("stamina_penalty")
         return pack(name, weight, vkey, coverage=cov, mob_bonus=mob_bonus, stam_pen=stam_pen)
 
-    if isinstance(node, dict):
-        name = node.get("name", DEFAULT_ARMORS.get(cat, (cat, 10))[0])
-        weight = int(node.get("weight", DEFAULT_ARMORS.get(cat, (cat, 10))[1]))
-        cov = node.get("coverage", [])
-        mob_bonus = int(node.get("mobility_bonus", 0))
-        stam_pen = node.get("stamina_penalty")
-        return pack(name, weight, "flat", coverage=cov, mob_bonus=mob_bonus, stam_pen=stam_pen)
+    node = ARMORS_RAW.get(cat)
+    if node is None:
+        name, w = DEFAULT_ARMORS.get(cat, (cat or "Padded Cloth", 10))
+        return pack(name, w, "default", coverage=[])
+
+    if isinstance(node, dict) and not node:
+        name, w = DEFAULT_ARMORS.get(cat, (cat, 10))
+        return pack(name, w, "default-empty")
 
     if isinstance(node, (list, tuple)) and len(node) >= 2:
         name, weight = node[0], int(node[1])
@@ -193,14 +192,18 @@ def equip_armor(character):
         "category": ar["category"],
         "variant": ar["variant_key"],
         "coverage": ar["coverage"],  # coverage list (e.g., ["chest"])
+        "coverage_mask": coverage_mask(ar["coverage"]),  # bits over zones.Zone
     }
 
+    bus = get_bus()
     if ar["weight"] <= 5:
-        print(f"🛡️ {character['name']}'s {ar['name']} ({ar['category']}, weight {ar['weight']}) has minimal impact on mobility and stamina.")
+        bus.narrate("🛡️ {}'s {} ({}, weight {}) has minimal impact on mobility and stamina.",
+                    character['name'], ar['name'], ar['category'], ar['weight'])
     else:
-        print(f"⚠️ {character['name']}'s {ar['name']} ({ar['category']}, weight {ar['weight']}) reduces mobility by {ar['mobility_penalty']}% and increases stamina costs by {ar['stamina_penalty']}!")
-    print(f"🛡️ {character['name']} equips {ar['name']}")
-    logging.debug(f"Equipped {ar['name']} to {character['name']} (category={ar['category']}, variant={ar['variant_key']})")
+        bus.narrate("⚠️ {}'s {} ({}, weight {}) reduces mobility by {}% and increases stamina costs by {}!",
+                    character['name'], ar['name'], ar['category'], ar['weight'], ar['mobility_penalty'], ar['stamina_penalty'])
+    bus.narrate("🛡️ {} equips {}", character['name'], ar['name'])
+    logging.debug("Equipped %s to %s (category=%s, variant=%s)", ar['name'], character['name'], ar['category'], ar['variant_key'])
 
     # Enforce 2H + shield rule and PRINT the result
     weapon_key = None
@@ -212,7 +215,8 @@ def equip_armor(character):
     _logs = []
     enforce_two_handed_and_shield(character, wdat if isinstance(wdat, dict) else None, rules, _logs)
     for m in _logs:
-        print(m)
+        bus.narrate(m)
+    invalidate_profile(character)
 
 def _find_character_filename(key_lower: str):
     aliases = {
@@ -238,6 +242,9 @@ def _find_character_filename(key_lower: str):
                 return p2
         return None
     normalized_query = key_lower.replace(" ", "_")
+    indexed = character_index().get(norm_key(key_lower))
+    if indexed and (PROJECT_DIR / indexed).exists():
+        return PROJECT_DIR / indexed
     for p in CHAR_DIR.glob("*.json"):
         stem = p.stem.lower()
         if stem == key_lower or stem.replace(" ", "_") == normalized_query or stem.replace("_", " ") == key_lower:
@@ -275,6 +282,7 @@ def init_weapon_state(unit):
     if dur is None:
         dur = DEFAULT_DURABILITY.get(wpn, 50)
     unit["_weapon_durability"] = int(dur)
+    invalidate_profile(unit)
 
 def init_combatants(units):
     roster = list(units)
@@ -293,6 +301,8 @@ def base_damage_for(unit):
     w = (str(w or "")).lower()
     return WEAPON_DAMAGE.get(w, 8)
 
+configure_profiles(rules, base_damage=base_damage_for)
+
 def weapon_label_for_log(wpn):
     return str(wpn or "weapon")
 
@@ -301,29 +311,15 @@ def apply_durability_tick(attacker, round_log):
     if not w:
         return
     attacker["_weapon_durability"] = max(0, int(attacker.get("_weapon_durability", DEFAULT_DURABILITY.get(w, 50))) - 1)
-    label = weapon_label_for_log(w)
-    round_log.append(f"⚔️ {attacker['name']}'s {label} durability: {attacker['_weapon_durability']}")
+    round_log.append(WeaponWorn(attacker['name'], weapon_label_for_log(w), attacker['_weapon_durability']))
 
 # ========= Stance / rolls =========
 def stance_mods(stance):
-    stance = (stance or "neutral").lower()
-    atk = 0
-    df = 0
-    if stance == "offensive":
-        atk += 10
-        df -= 10
-    elif stance == "defensive":
-        atk -= 10
-        df += 10
-    return atk, df
+    s = stance_of(stance)
+    return ATTACK_MOD[s], DEFENSE_MOD[s]
 
 # ——— Aimed zones and difficulty ———
-AIM_ZONES = [
-    "head", "throat", "neck",
-    "chest", "stomach", "groin",
-    "left_upper_arm", "left_lower_arm", "right_upper_arm", "right_lower_arm",
-    "left_upper_leg", "left_lower_leg", "right_upper_leg", "right_lower_leg",
-]
+AIM_ZONES = list(ZONE_KEYS)  # head, throat, neck, chest, stomach, groin, arms, legs (zones.Zone order)
 
 def choose_target_zone():
     print("Pick a target zone:")
@@ -335,7 +331,7 @@ def choose_target_zone():
         idx = 1 if idx < 1 else idx
         idx = len(AIM_ZONES) if idx > len(AIM_ZONES) else idx
         return AIM_ZONES[idx - 1]
-    key = raw.replace(" ", "_")
+    key = canonical_zone(raw)
     if key in AIM_ZONES:
         return key
     for z in AIM_ZONES:
@@ -343,62 +339,26 @@ def choose_target_zone():
             return z
     return AIM_ZONES[0]
 
-def coverage_keys_for_zone(zone: str):
-    """Return coverage keys that should count as protection for a given hit zone."""
-    z = zone.lower()
-    if z in ("head","skull","face"):
-        return ["head","skull","face","eyes","neck"]
-    if z in ("neck",):
-        return ["neck","gorget","collar","torso"]
-    if z in ("chest","heart","rib","ribs"):
-        return ["chest","torso","breast","cuirass"]
-    if z in ("stomach","belly","abdomen","gut"):
-        return ["stomach","abdomen","belly","torso"]
-    if z in ("groin","hip","hips"):
-        return ["groin","hips","pelvis","torso"]
-
-    # Arms
-    if "arm" in z:
-        keys = [z, "arm", "arms", "shoulder", "upper_arm", "forearm"]
-        if "left" in z:
-            keys += ["left_arm","left_upper_arm","left_forearm"]
-        if "right" in z:
-            keys += ["right_arm","right_upper_arm","right_forearm"]
-        return keys
-
-    if "hand" in z:
-        return [z, "hand", "hands", "gauntlet", "arms"]
-
-    # Legs
-    if any(part in z for part in ("leg","thigh","calf","shin")):
-        keys = [z, "leg", "legs", "thigh", "calf", "shin"]
-        if "left" in z:
-            keys += ["left_leg","left_thigh","left_calf","left_shin"]
-        if "right" in z:
-            keys += ["right_leg","right_thigh","right_calf","right_shin"]
-        return keys
-
-    if any(part in z for part in ("foot","feet")):
-        return [z, "foot", "feet", "boots", "shoes", "legs"]
-
-    return [z, "torso"]
-
 def is_zone_covered(target, zone):
+    z = zone_of(zone)
+    if z is not None:
+        return bool(unit_mask(target) >> z & 1)
     cov = (target.get("_equipped_armor") or {}).get("coverage") or []
     if not cov:
         return False
-    ck = coverage_keys_for_zone(zone)
+    ck = coverage_keys_for_zone(zone)  # hands, feet and other off-list zones
     cov_low = [c.lower() for c in cov]
     return any(c in cov_low for c in ck)
 
-def attack_roll(attacker, attack_stance, target, target_stance, attack_type="normal", aimed_zone=None):
-    atk_stance_mod, _ = stance_mods(attack_stance)
-    _, def_stance_mod = stance_mods(target_stance)
+def attack_modifiers(attacker, attack_stance, target, target_stance, attack_type="normal", aimed_zone=None):
+    """Everything attack_roll adds to the two d100s; no dice are rolled (policies use it to plan)."""
+    atk_stance_mod = ATTACK_MOD[stance_of(attack_stance)]
+    def_stance_mod = DEFENSE_MOD[stance_of(target_stance)]
 
-    dex = int(attacker.get("dexterity", attacker.get("Dexterity", 25)))
-    dex_mod = dex // 10
+    prof = combat_profile(attacker)
+    dex_mod = prof.dex_mod
 
-    aimed_pen_rules = aimed_attack_penalty(attacker, rules) if str(attack_type).lower().startswith("aim") else 0
+    aimed_pen_rules = prof.aimed_penalty if str(attack_type).lower().startswith("aim") else 0
     total_aimed_pen = aimed_pen_rules  # flat penalty (no per-zone extra)
 
     stress_mod = -int(attacker.get("stress_level", 0))
@@ -419,19 +379,11 @@ def attack_roll(attacker, attack_stance, target, target_stance, attack_type="nor
     if int(attacker.get("_veil_aura_rounds", 0)) > 0:
         status_pen -= int(attacker.get("_veil_aura_penalty", 10) or 10)
 
-    atk_roll = random.randint(1, 100)
-    def_roll = random.randint(1, 100)
-
-    attack_total = atk_roll + weapon_skill + dex_mod + atk_stance_mod + status_pen - total_aimed_pen + stress_mod + pain_mod + ambush_mod
-    t_dex = int(target.get("dexterity", target.get("Dexterity", 25)))
-    t_stat = t_dex // 10
-    defense_total = def_roll + t_stat + def_stance_mod
+    t_stat = combat_profile(target).dex_mod
 
     return {
-        "atk_roll": atk_roll,
-        "def_roll": def_roll,
-        "attack_total": attack_total,
-        "defense_total": defense_total,
+        "attack_mod": weapon_skill + dex_mod + atk_stance_mod + status_pen - total_aimed_pen + stress_mod + pain_mod + ambush_mod,
+        "defense_mod": t_stat + def_stance_mod,
         "dex_mod": dex_mod,
         "t_stat": t_stat,
         "weapon_skill": weapon_skill,
@@ -440,9 +392,19 @@ def attack_roll(attacker, attack_stance, target, target_stance, attack_type="nor
         "ambush_mod": ambush_mod,
         "aimed_pen": total_aimed_pen,
         "status_pen": status_pen,   # for optional logging
-        "hit": attack_total > defense_total
     }
 
+def attack_roll(attacker, attack_stance, target, target_stance, attack_type="normal", aimed_zone=None):
+    calc = attack_modifiers(attacker, attack_stance, target, target_stance, attack_type, aimed_zone)
+    atk_roll = get_dice().d100()
+    def_roll = get_dice().d100()
+    calc["atk_roll"] = atk_roll
+    calc["def_roll"] = def_roll
+    calc["attack_total"] = atk_roll + calc["attack_mod"]
+    calc["defense_total"] = def_roll + calc["defense_mod"]
+    calc["hit"] = calc["attack_total"] > calc["defense_total"]
+    return calc
+
 # ========= Damage application =========
 def apply_damage(attacker, target, raw_damage, round_log, zone=None, is_crit=False):
     global rules
@@ -453,10 +415,10 @@ def apply_damage(attacker, target, raw_damage, round_log, zone=None, is_crit=Fal
     if zone and is_zone_covered(target, zone):
         covered = True
         dmg = max(0, int(round(dmg * 0.75)))
-        round_log.append(f"🛡️ Armor absorbs part of the blow to {zone}!")
+        round_log.append(ArmorAbsorbed(zone))
 
     # Unhelmeted headshot multiplier (only if not covered)
-    if zone and zone.lower() in ("head","skull","face") and not covered:
+    if zone and zone_of(zone) is Zone.HEAD and not covered:
         mult = float((rules.get("helmet_rules") or {}).get("unhelmeted_headshot_mult", 1.0))
         if mult > 1.0:
             dmg = int(round(dmg * mult))
@@ -466,19 +428,11 @@ def apply_damage(attacker, target, raw_damage, round_log, zone=None, is_crit=Fal
     target["current_hp"] = max(0, before - dmg)
     after = target["current_hp"]
 
-    crit_tag = " (CRIT!)" if is_crit else ""
-
     if after <= 0 and target.get("alive", True):
         target["alive"] = False
-        if zone:
-            round_log.append("🏴 " + f"{target['name']} falls! (hit to {zone}){crit_tag}")
-        else:
-            round_log.append("🏴 " + f"{target['name']} falls!{crit_tag}")
+        round_log.append(UnitFell(target['name'], "struck", zone, is_crit))
     else:
-        if zone:
-            round_log.append("💥 " + f"{target['name']} takes {dmg} damage to {zone}! ➜ HP: {after}/{target.get('total_hp', after)}{crit_tag}")
-        else:
-            round_log.append("💥 " + f"{target['name']} takes {dmg} damage! ➜ HP: {after}/{target.get('total_hp', after)}{crit_tag}")
+        round_log.append(ZoneHit(target['name'], dmg, zone, after, target.get('total_hp', after), is_crit))
 
 def cleanup_dead(units, round_log):
     return [u for u in units if u.get("alive", True)]
@@ -537,6 +491,24 @@ def choose_ability(unit):
         return None
     return raw if raw in names else None
 
+class ConsolePolicy(PlayerPolicy):
+    """The interactive prompts; run_combat's default policy."""
+
+    def choose_stance(self, view):
+        return choose_stance()
+
+    def choose_attack_type(self, view):
+        return choose_attack_type()
+
+    def choose_target_zone(self, view):
+        return choose_target_zone()
+
+    def choose_ability(self, view):
+        return choose_ability(view.player)
+
+    def choose_spell(self, view, spell_ids):
+        return present_spells_menu(view.player)
+
 def ability_damage_bonus(unit, ability_name):
     if not ability_name:
         return 0
@@ -545,30 +517,148 @@ def ability_damage_bonus(unit, ability_name):
 
 # ========= Encounter/Combat =========
 def safe_print_log(lines):
+    """Flush a round log to the event bus; typed events pass through, text becomes Narration."""
+    bus = get_bus()
+    if not bus.active:
+        return
     for entry in lines:
-        if isinstance(entry, dict):
+        if isinstance(entry, CombatEvent):
+            bus.emit(entry)
+        elif isinstance(entry, dict):
             for k, v in entry.items():
-                print(f"{k}: {v}")
+                bus.emit(Narration(f"{k}: {v}"))
         elif isinstance(entry, (list, tuple)):
             if len(entry) == 2:
                 k, v = entry
-                print(f"{k}: {v}")
+                bus.emit(Narration(f"{k}: {v}"))
             else:
-                print(" ".join(map(str, entry)))
+                bus.emit(Narration(" ".join(map(str, entry))))
         else:
-            print(str(entry))
+            bus.emit(Narration(str(entry)))
+
+MAX_ROUNDS = 40
 
-def run_combat(player, enemies, label):
+def open_combat(player, enemies, label):
+    """Prepare both sides for a fight (HP, morale, weapon state) and announce it; returns (player, enemies)."""
     enemies = init_combatants(enemies)
     player = init_combatants([player])[0]
     init_weapon_state(player)
     for e in enemies:
         init_weapon_state(e)
+    get_bus().narrate("\n⚔️ {}", label)
+    return player, enemies
 
-    print(f"\n⚔️ {label}")
-    MAX_ROUNDS = 40
-    watch = StalemateWatch(threshold=6)
-    rnd = 0
+ENEMY_RULE = EnemyRulePolicy()
+
+def enemy_turn(e, player, allies, rnd, policy, round_log):
+    """
+    One enemy's action against the player. `policy` decides from the enemy's
+    side (view.player is `e`, view.target the player, view.allies `allies`);
+    ENEMY_RULE reproduces the classic turn. Returns True if anyone took melee damage.
+    """
+    crit_hi = int(rules.get("critical_hit_threshold", 95))
+    crit_lo = int(rules.get("critical_miss_threshold", 5))
+    crit_mult = float((rules.get("critical_multipliers") or {}).get("default", 1.5))
+    head_bonus_pct = int(((rules.get("aimed_attack") or {}).get("crit_bonus_head_pct", 10)))
+    did_damage = False
+
+    # skip their action if dazed/rooted
+    if int(e.get("_dazed_rounds", 0)) > 0:
+        round_log.append(f"💫 {e['name']} is staggered and loses their action.")
+        e["_dazed_rounds"] = 0
+        return False
+    if int(e.get("_rooted_rounds", 0)) > 0:
+        round_log.append(f"⛓️ {e['name']} is trapped by the rift and cannot act.")
+        e["_rooted_rounds"] = 0
+        return False
+
+    view = TurnView(e, player, [player], rnd, allies)
+    e_stance = policy.choose_stance(view)
+    regen_stamina(e, e_stance, rules, round_log)
+
+    # enemy casters may answer with a spell; None (or a failed cast) falls back to melee
+    if is_sorceress(e):
+        sid = policy.choose_spell(view, list_spells(e))
+        foes = [player]
+        if sid is not None and cast_spell(e, foes, apply_damage, round_log, choose=lambda caster: sid):
+            allies.extend(foes[1:])  # a Veil Spawn is the player's enemy, whoever opened the rift
+            return False
+
+    a_type = policy.choose_attack_type(view)
+    aimed_zone = policy.choose_target_zone(view) if a_type == "aimed" else None
+    ability = policy.choose_ability(view)
+
+    spend_stamina(e, "attack", e_stance, ability, rules, round_log)
+    calc_e = attack_roll(e, e_stance, player, "neutral", a_type, aimed_zone=aimed_zone)
+    e_base = combat_profile(e).base_damage + ability_damage_bonus(e, ability)
+
+    bus = get_bus()
+    if bus.active:
+        if aimed_zone:
+            bus.narrate("🎯 {} aims at your {} (aimed penalty {})", e['name'], aimed_zone, calc_e['aimed_pen'])
+        bus.emit(AttackRolled(e['name'], player['name'], e_stance.upper(), calc_e['atk_roll'],
+                              calc_e['attack_total'], status_pen=calc_e.get("status_pen", 0)))
+        bus.emit(Defended(player['name'], calc_e['def_roll'], calc_e['defense_total']))
+
+    if calc_e["hit"]:
+        is_crit_e = calc_e["atk_roll"] >= crit_hi
+        if is_crit_e and aimed_zone and aimed_zone.lower() == "head":
+            e_base = int(round(e_base * (1 + head_bonus_pct / 100.0)))
+        final_e = int(round(e_base * (crit_mult if is_crit_e else 1.0)))
+
+        # Veil's Grace: if this hit would kill a Sorceress, 20% avoid; else halve the killing blow
+        if is_sorceress(player) and player.get("current_hp", 0) - final_e <= 0:
+            if get_dice().d100() <= 20:
+                round_log.append("🪽 Veil’s Grace triggers: death averted as she slips through the Veil!")
+                player["_evade_next_melee"] = True
+                # skip applying this lethal hit
+            else:
+                final_e = (final_e + 1) // 2
+                round_log.append("🩶 Veil’s Grace falters—fatal blow reduced by half.")
+                if not consume_evade_on_melee_if_any(player, round_log):
+                    final_e = apply_melee_vulnerability(player, final_e, is_melee=True)
+                    apply_damage(e, player, final_e, round_log, zone=aimed_zone, is_crit=is_crit_e)
+                    did_damage = True
+                apply_durability_tick(e, round_log)
+        else:
+            # Fade Step auto-negate? If not, apply melee vulnerability (sorceress takes +50% from melee)
+            if not consume_evade_on_melee_if_any(player, round_log):
+                final_e = apply_melee_vulnerability(player, final_e, is_melee=True)
+                apply_damage(e, player, final_e, round_log, zone=aimed_zone, is_crit=is_crit_e)
+                did_damage = True
+            apply_durability_tick(e, round_log)
+    else:
+        if bus.active:
+            bus.emit(AttackMissed(e['name'], player['name'], by_enemy=True))
+        spend_stamina(player, "parry", "neutral", None, rules, round_log)
+        # enemy crit-miss -> your riposte
+        if calc_e["atk_roll"] <= crit_lo:
+            round_log.append("⚡ Riposte! You punish their mistake!")
+            p_stance_r = "offensive"
+            regen_stamina(player, p_stance_r, rules, round_log)
+            spend_stamina(player, "attack", p_stance_r, None, rules, round_log)
+            calc_r2 = attack_roll(player, p_stance_r, e, "neutral", "normal")
+            p_base = combat_profile(player).base_damage
+            if calc_r2["hit"]:
+                is_crit_r2 = calc_r2["atk_roll"] >= crit_hi
+                final_r2 = int(round(p_base * (crit_mult if is_crit_r2 else 1.0)))
+                apply_damage(player, e, final_r2, round_log, zone=None, is_crit=is_crit_r2)
+                did_damage = True
+                apply_durability_tick(player, round_log)
+            else:
+                round_log.append("…but your riposte misses!")
+
+    return did_damage
+
+def play_round(player, enemies, rnd, policy, watch, enemy_policy=None):
+    """
+    One combat round: player turn (asking `policy`), enemy turns (asking
+    `enemy_policy`, default ENEMY_RULE; see enemy_turn), stalemate check.
+    Returns (outcome, living enemies) where outcome is "won", "lost" or None
+    while the fight goes on. All state lives in the unit dicts and `watch`.
+    """
+    bus = get_bus()
+    enemy_policy = enemy_policy or ENEMY_RULE
 
     # thresholds from rules
     crit_hi = int(rules.get("critical_hit_threshold", 95))
@@ -576,203 +666,151 @@ def run_combat(player, enemies, label):
     crit_mult = float((rules.get("critical_multipliers") or {}).get("default", 1.5))
     head_bonus_pct = int(((rules.get("aimed_attack") or {}).get("crit_bonus_head_pct", 10)))
 
-    while rnd < MAX_ROUNDS:
-        rnd += 1
-        print("\n🎛️⚔️ New Round ⚔️🎛️")
-        round_log = []
+    bus.narrate("\n🎛️⚔️ New Round ⚔️🎛️")
+    round_log = []
 
-        # --- decay temporary statuses (fog/fear/root/aura) at round start
-        on_new_round_tick(player, enemies, round_log)
+    # --- decay temporary statuses (fog/fear/root/aura) at round start
+    on_new_round_tick(player, enemies, round_log)
 
-        did_damage = False
+    did_damage = False
 
-        # filter alive
-        enemies = [e for e in enemies if e.get("alive", True)]
-        if not enemies:
-            print("🎉 The bandits are defeated! Onward to the leader's camp...")
-            return True
-        target = enemies[0]
+    # filter alive
+    enemies = [e for e in enemies if e.get("alive", True)]
+    if not enemies:
+        bus.narrate("🎉 The bandits are defeated! Onward to the leader's camp...")
+        return "won", enemies
+    target = enemies[0]
+    view = TurnView(player, target, enemies, rnd)
 
-        # =========================
-        # PLAYER TURN
-        # =========================
-        p_stance = choose_stance()
+    # =========================
+    # PLAYER TURN
+    # =========================
+    p_stance = policy.choose_stance(view)
 
-        # regen at start of your turn
-        regen_stamina(player, p_stance, rules, round_log)
+    # regen at start of your turn
+    regen_stamina(player, p_stance, rules, round_log)
 
-        # If rooted by Shroud, you lose this action (both sides get rooted when cast)
-        if int(player.get("_rooted_rounds", 0)) > 0:
-            round_log.append(f"⛓️ {player['name']} is trapped by the rift and cannot act this turn.")
-            player["_rooted_rounds"] = 0  # consumed
-        else:
-            did_cast = False
-            if is_sorceress(player):
-                did_cast = cast_spell(player, enemies, apply_damage, round_log)
+    # If rooted by Shroud, you lose this action (both sides get rooted when cast)
+    if int(player.get("_rooted_rounds", 0)) > 0:
+        round_log.append(f"⛓️ {player['name']} is trapped by the rift and cannot act this turn.")
+        player["_rooted_rounds"] = 0  # consumed
+    else:
+        did_cast = False
+        if is_sorceress(player):
+            did_cast = cast_spell(player, enemies, apply_damage, round_log,
+                                  choose=lambda caster: policy.choose_spell(view, list_spells(caster)))
 
-            if not is_sorceress(player) or not did_cast:
-                # ----- normal melee flow -----
-                a_type = choose_attack_type()
-                aimed_zone = choose_target_zone() if a_type == "aimed" else None
-                ability = choose_ability(player)
+        if not is_sorceress(player) or not did_cast:
+            # ----- normal melee flow -----
+            a_type = policy.choose_attack_type(view)
+            aimed_zone = policy.choose_target_zone(view) if a_type == "aimed" else None
+            ability = policy.choose_ability(view)
 
-                spend_stamina(player, "attack", p_stance, ability, rules, round_log)
+            spend_stamina(player, "attack", p_stance, ability, rules, round_log)
 
-                calc = attack_roll(player, p_stance, target, "neutral", a_type, aimed_zone=aimed_zone)
-                base = base_damage_for(player)
-                bonus = ability_damage_bonus(player, ability)
-                raw_damage = base + bonus
+            calc = attack_roll(player, p_stance, target, "neutral", a_type, aimed_zone=aimed_zone)
+            base = combat_profile(player).base_damage
+            bonus = ability_damage_bonus(player, ability)
+            raw_damage = base + bonus
 
+            if bus.active:
                 if a_type == "aimed" and aimed_zone:
-                    print(f"🎯 Target zone: {aimed_zone} (aimed penalty {calc['aimed_pen']})")
-
-                print(f"⚔️ {player['name']} is in {p_stance.upper()} stance")
-                print(f"🛡️ {target['name']} is in NEUTRAL stance")
-                line = f"⚔️ {player['name']} rolls {calc['atk_roll']} ➜ {calc['attack_total']} to attack!"
-                if calc.get("status_pen", 0):
-                    line += f" (−{abs(calc['status_pen'])} from fog/fear/aura)"
-                print(line)
-                print(f"🛡️ {target['name']} rolls {calc['def_roll']} ➜ {calc['defense_total']} to defend!")
-
-                if calc["hit"]:
-                    is_crit = calc["atk_roll"] >= crit_hi
-                    if is_crit and aimed_zone and aimed_zone.lower() == "head":
-                        raw_damage = int(round(raw_damage * (1 + head_bonus_pct / 100.0)))
-                    final_damage = int(round(raw_damage * (crit_mult if is_crit else 1.0)))
-                    apply_damage(player, target, final_damage, round_log, zone=aimed_zone, is_crit=is_crit)
-                    did_damage = True
-                    apply_durability_tick(player, round_log)
-                else:
-                    print("❌ Attack misses or is defended!")
-                    spend_stamina(target, "parry", "neutral", None, rules, round_log)
-                    # critical miss -> enemy riposte
-                    if calc["atk_roll"] <= crit_lo:
-                        round_log.append("⚡ Riposte! Your blunder opens you up!")
-                        e_stance_r = "offensive"
-                        regen_stamina(target, e_stance_r, rules, round_log)
-                        spend_stamina(target, "attack", e_stance_r, None, rules, round_log)
-                        calc_r = attack_roll(target, e_stance_r, player, "neutral", "normal")
-                        e_base = base_damage_for(target)
-                        if calc_r["hit"]:
-                            is_crit_r = calc_r["atk_roll"] >= crit_hi
-                            final_r = int(round(e_base * (crit_mult if is_crit_r else 1.0)))
-                            # Veil’s Grace check on lethal
-                            if is_sorceress(player) and player.get("current_hp", 0) - final_r <= 0:
-                                if random.randint(1, 100) <= 20:
-                                    round_log.append("🪽 Veil’s Grace triggers: death averted as she slips through the Veil!")
-                                    player["_evade_next_melee"] = True
-                                else:
-                                    final_r = (final_r + 1) // 2
-                                    round_log.append("🩶 Veil’s Grace falters—fatal blow reduced by half.")
-                                    if not consume_evade_on_melee_if_any(player, round_log):
-                                        final_r = apply_melee_vulnerability(player, final_r, is_melee=True)
-                                        apply_damage(target, player, final_r, round_log, zone=None, is_crit=is_crit_r)
-                                        did_damage = True
-                                apply_durability_tick(target, round_log)
+                    bus.narrate("🎯 Target zone: {} (aimed penalty {})", aimed_zone, calc['aimed_pen'])
+                bus.emit(AttackRolled(player['name'], target['name'], p_stance.upper(), calc['atk_roll'],
+                                      calc['attack_total'], status_pen=calc.get("status_pen", 0)))
+                bus.emit(Defended(target['name'], calc['def_roll'], calc['defense_total']))
+
+            if calc["hit"]:
+                is_crit = calc["atk_roll"] >= crit_hi
+                if is_crit and aimed_zone and aimed_zone.lower() == "head":
+                    raw_damage = int(round(raw_damage * (1 + head_bonus_pct / 100.0)))
+                final_damage = int(round(raw_damage * (crit_mult if is_crit else 1.0)))
+                apply_damage(player, target, final_damage, round_log, zone=aimed_zone, is_crit=is_crit)
+                did_damage = True
+                apply_durability_tick(player, round_log)
+            else:
+                if bus.active:
+                    bus.emit(AttackMissed(player['name'], target['name'], by_enemy=False))
+                spend_stamina(target, "parry", "neutral", None, rules, round_log)
+                # critical miss -> enemy riposte
+                if calc["atk_roll"] <= crit_lo:
+                    round_log.append("⚡ Riposte! Your blunder opens you up!")
+                    e_stance_r = "offensive"
+                    regen_stamina(target, e_stance_r, rules, round_log)
+                    spend_stamina(target, "attack", e_stance_r, None, rules, round_log)
+                    calc_r = attack_roll(target, e_stance_r, player, "neutral", "normal")
+                    e_base = combat_profile(target).base_damage
+                    if calc_r["hit"]:
+                        is_crit_r = calc_r["atk_roll"] >= crit_hi
+                        final_r = int(round(e_base * (crit_mult if is_crit_r else 1.0)))
+                        # Veil’s Grace check on lethal
+                        if is_sorceress(player) and player.get("current_hp", 0) - final_r <= 0:
+                            if get_dice().d100() <= 20:
+                                round_log.append("🪽 Veil’s Grace triggers: death averted as she slips through the Veil!")
+                                player["_evade_next_melee"] = True
                             else:
-                                # Fade Step auto-evade? If not, apply melee vuln
+                                final_r = (final_r + 1) // 2
+                                round_log.append("🩶 Veil’s Grace falters—fatal blow reduced by half.")
                                 if not consume_evade_on_melee_if_any(player, round_log):
                                     final_r = apply_melee_vulnerability(player, final_r, is_melee=True)
                                     apply_damage(target, player, final_r, round_log, zone=None, is_crit=is_crit_r)
                                     did_damage = True
-                                apply_durability_tick(target, round_log)
+                            apply_durability_tick(target, round_log)
                         else:
-                            round_log.append("…but the riposte fails to land.")
-
-        enemies = cleanup_dead(enemies, round_log)
-        if not enemies:
-            safe_print_log(round_log)
-            print("🎉 The bandits are defeated! Onward to the leader's camp...")
-            return True
-
-        # =========================
-        # ENEMY TURNS
-        # =========================
-        for e in list(enemies):
-            if not player.get("alive", True):
-                break
-
-            # skip their action if dazed/rooted
-            if int(e.get("_dazed_rounds", 0)) > 0:
-                round_log.append(f"💫 {e['name']} is staggered and loses their action.")
-                e["_dazed_rounds"] = 0
-                continue
-            if int(e.get("_rooted_rounds", 0)) > 0:
-                round_log.append(f"⛓️ {e['name']} is trapped by the rift and cannot act.")
-                e["_rooted_rounds"] = 0
-                continue
-
-            e_stance = "offensive" if e["current_hp"] > e["total_hp"] * 0.35 else "defensive"
-            regen_stamina(e, e_stance, rules, round_log)
-            spend_stamina(e, "attack", e_stance, None, rules, round_log)
-            calc_e = attack_roll(e, e_stance, player, "neutral", "normal")
-            e_base = base_damage_for(e)
-
-            print(f"⚔️ {e['name']} is in {e_stance.upper()} stance")
-            print(f"🛡️ {player['name']} is in NEUTRAL stance")
-            line_e = f"⚔️ {e['name']} rolls {calc_e['atk_roll']} ➜ {calc_e['attack_total']} to attack!"
-            if calc_e.get("status_pen", 0):
-                line_e += f" (−{abs(calc_e['status_pen'])} from fog/fear/aura)"
-            print(line_e)
-            print(f"🛡️ {player['name']} rolls {calc_e['def_roll']} ➜ {calc_e['defense_total']} to defend!")
-
-            if calc_e["hit"]:
-                is_crit_e = calc_e["atk_roll"] >= crit_hi
-                final_e = int(round(e_base * (crit_mult if is_crit_e else 1.0)))
-
-                # Veil's Grace: if this hit would kill a Sorceress, 20% avoid; else halve the killing blow
-                if is_sorceress(player) and player.get("current_hp", 0) - final_e <= 0:
-                    if random.randint(1, 100) <= 20:
-                        round_log.append("🪽 Veil’s Grace triggers: death averted as she slips through the Veil!")
-                        player["_evade_next_melee"] = True
-                        # skip applying this lethal hit
-                    else:
-                        final_e = (final_e + 1) // 2
-                        round_log.append("🩶 Veil’s Grace falters—fatal blow reduced by half.")
-                        if not consume_evade_on_melee_if_any(player, round_log):
-                            final_e = apply_melee_vulnerability(player, final_e, is_melee=True)
-                            apply_damage(e, player, final_e, round_log, zone=None, is_crit=is_crit_e)
-                            did_damage = True
-                        apply_durability_tick(e, round_log)
-                else:
-                    # Fade Step auto-negate? If not, apply melee vulnerability (sorceress takes +50% from melee)
-                    if not consume_evade_on_melee_if_any(player, round_log):
-                        final_e = apply_melee_vulnerability(player, final_e, is_melee=True)
-                        apply_damage(e, player, final_e, round_log, zone=None, is_crit=is_crit_e)
-                        did_damage = True
-                    apply_durability_tick(e, round_log)
-            else:
-                print("❌ Enemy attack misses or is defended!")
-                spend_stamina(player, "parry", "neutral", None, rules, round_log)
-                # enemy crit-miss -> your riposte
-                if calc_e["atk_roll"] <= crit_lo:
-                    round_log.append("⚡ Riposte! You punish their mistake!")
-                    p_stance_r = "offensive"
-                    regen_stamina(player, p_stance_r, rules, round_log)
-                    spend_stamina(player, "attack", p_stance_r, None, rules, round_log)
-                    calc_r2 = attack_roll(player, p_stance_r, e, "neutral", "normal")
-                    p_base = base_damage_for(player)
-                    if calc_r2["hit"]:
-                        is_crit_r2 = calc_r2["atk_roll"] >= crit_hi
-                        final_r2 = int(round(p_base * (crit_mult if is_crit_r2 else 1.0)))
-                        apply_damage(player, e, final_r2, round_log, zone=None, is_crit=is_crit_r2)
-                        did_damage = True
-                        apply_durability_tick(player, round_log)
+                            # Fade Step auto-evade? If not, apply melee vuln
+                            if not consume_evade_on_melee_if_any(player, round_log):
+                                final_r = apply_melee_vulnerability(player, final_r, is_melee=True)
+                                apply_damage(target, player, final_r, round_log, zone=None, is_crit=is_crit_r)
+                                did_damage = True
+                            apply_durability_tick(target, round_log)
                     else:
-                        round_log.append("…but your riposte misses!")
+                        round_log.append("…but the riposte fails to land.")
 
-        if not player.get("alive", True) or player["current_hp"] <= 0:
-            safe_print_log(round_log)
-            print("💀 You have been defeated...")
-            return False
+    enemies = cleanup_dead(enemies, round_log)
+    if not enemies:
+        safe_print_log(round_log)
+        bus.narrate("🎉 The bandits are defeated! Onward to the leader's camp...")
+        return "won", enemies
+
+    # =========================
+    # ENEMY TURNS
+    # =========================
+    for e in list(enemies):
+        if not player.get("alive", True):
+            break
+        if enemy_turn(e, player, enemies, rnd, enemy_policy, round_log):
+            did_damage = True
+
+    if not player.get("alive", True) or player["current_hp"] <= 0:
+        safe_print_log(round_log)
+        bus.narrate("💀 You have been defeated...")
+        return "lost", enemies
 
-        # Stalemate breaker
-        if watch.note(did_damage, round_log):
-            apply_fatigue_to_all([player] + enemies, round_log)
+    # Stalemate breaker
+    if watch.note(did_damage, round_log):
+        apply_fatigue_to_all([player] + enemies, round_log)
 
-        safe_print_log(round_log)
+    safe_print_log(round_log)
+    return None, enemies
+
+def run_combat(player, enemies, label, policy=None, enemy_policy=None):
+    """
+    Fight until one side falls (True = player won). `policy` makes the player's
+    decisions (see combat_policy); None means the interactive ConsolePolicy.
+    `enemy_policy` runs the enemy turns (None: ENEMY_RULE; tactical_ai.TacticalPolicy searches).
+    combat_session drives the same rounds step by step.
+    """
+    policy = policy or ConsolePolicy()
+    player, enemies = open_combat(player, enemies, label)
+    watch = StalemateWatch(threshold=6)
+
+    for rnd in range(1, MAX_ROUNDS + 1):
+        player["_last_combat_rounds"] = rnd
+        outcome, enemies = play_round(player, enemies, rnd, policy, watch, enemy_policy)
+        if outcome is not None:
+            return outcome == "won"
 
-    print("⏱️ Combat auto-ended (max rounds reached).")
+    get_bus().narrate("⏱️ Combat auto-ended (max rounds reached).")
     return False
 
 
@@ -815,7 +853,7 @@ def make_bandits(n=2):
         }
     out = []
     for i in range(1, n + 1):
-        b = json.loads(json.dumps(base))
+        b = thaw(base)
         b["name"] = f"Bandit {i}"
         equip_armor(b)
         out.append(b)
@@ -866,7 +904,7 @@ def main():
     _ = run_combat(player, [leader], "You confront Bandit Leader!")
 
 if __name__ == "__main__":
-    random.seed()
+    seed_dice(None)
     main()
 
 
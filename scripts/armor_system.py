@@ -1,9 +1,12 @@
 # file: scripts/armor_system.py
-import json
 import logging
 import os
 from typing import Dict, List, Optional
 
+from combat_events import ArmorAbsorbed, get_bus
+from rules_repository import get_rules
+from zones import zone_key, zone_label
+
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 log = logging.getLogger(__name__)
 
@@ -52,6 +55,7 @@ class ArmorPiece:
     ):
         self.name = name
         self.coverage = list(coverage)
+        self._zones = {zone_key(z): z for z in self.coverage}  # any spelling/alias → coverage entry
         self.armor_rating = dict(armor_rating)
         self.stamina_penalty = int(stamina_penalty)
         self.max_durability = int(max_durability)
@@ -95,12 +99,15 @@ class ArmorPiece:
         `zone` is required for per-zone durability. If zone is None or not covered,
         the armor doesn’t help.
         """
-        if not zone or zone not in self.coverage:
+        zone = self._zones.get(zone_key(zone)) if zone else None
+        if zone is None:
             return 0
 
         if self.current_durability.get(zone, 0) <= 0:
             # Broken on this zone
-            print(f"⚠️ {self.name} at {zone.replace('_',' ')} is broken and offers no protection!")
+            bus = get_bus()
+            if bus.active:
+                bus.emit(ArmorAbsorbed(zone, self.name, broken=True))
             return 0
 
         base_prot = int(self.armor_rating.get(damage_type, 0))
@@ -113,10 +120,12 @@ class ArmorPiece:
         dur_loss = max(1, int(damage * 0.20))
         self.current_durability[zone] = max(0, self.current_durability[zone] - dur_loss)
 
-        print(
-            f"🛡️ {self.name} ({zone.replace('_',' ')}) absorbed {absorbed} "
-            f"({damage_type}). Durability: {self.current_durability[zone]}/{self.per_zone_max[zone]}"
-        )
+        bus = get_bus()
+        if bus.active:
+            bus.emit(ArmorAbsorbed(
+                zone, self.name, absorbed, damage_type,
+                self.current_durability[zone], self.per_zone_max[zone],
+            ))
         return absorbed
 
     # --- Maintenance/UI ---
@@ -158,7 +167,7 @@ class ArmorPiece:
             cur = self.current_durability.get(z, 0)
             mx = self.per_zone_max.get(z, 1)
             if cur <= 0:
-                print(f"💀 {self.name} at {z.replace('_',' ')} is beyond field repair!")
+                print(f"💀 {self.name} at {zone_label(z)} is beyond field repair!")
                 continue
 
             add = int(mx * eff)
@@ -170,7 +179,7 @@ class ArmorPiece:
                 self.current_durability[z] = min(cur + add, mx)
 
             print(
-                f"🔧 Repaired {self.name} ({z.replace('_',' ')}) → "
+                f"🔧 Repaired {self.name} ({zone_label(z)}) → "
                 f"{self.current_durability[z]}/{mx} ({self.condition_status(z)})"
             )
 
@@ -182,8 +191,7 @@ class ArmorSystem:
         self.armors = self.load_armors(self.armor_path)
 
     def load_armors(self, file_path: str) -> dict:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = get_rules().get(file_path)
         if not isinstance(data, dict):
             raise ValueError("armors.json must be a dictionary at the top level.")
         log.debug("Loaded armors from %s", file_path)
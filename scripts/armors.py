@@ -1,10 +1,14 @@
 import json
 import os
 
+from combat_events import ArmorAbsorbed, get_bus
+from zones import zone_key
+
 class Armor:
     def __init__(self, name, coverage, armor_rating, max_durability, weight, stamina_penalty, mobility_bonus):
         self.name = name
         self.coverage = coverage
+        self._parts = {zone_key(part): part for part in coverage}  # any spelling/alias → coverage entry
         self.armor_rating = armor_rating
         self.max_durability = max_durability
         self.current_durability = {part: max_durability // len(coverage) for part in coverage}
@@ -13,9 +17,17 @@ class Armor:
         self.stamina_penalty = stamina_penalty
         self.mobility_bonus = mobility_bonus
 
+    def restore(self, other):
+        """Take `other`'s durability (the same piece, e.g. the template this one was copied from)."""
+        self.current_durability = dict(other.current_durability)
+        self.max_repairable_durability = dict(other.max_repairable_durability)
+
     def absorb_damage(self, damage, damage_type, part):
+        part = self._parts.get(zone_key(part), part) if part else part
         if part not in self.current_durability or self.current_durability[part] <= 0:
-            print(f"⚠️ {self.name} part ({part}) is broken and offers no protection!")
+            bus = get_bus()
+            if bus.active:
+                bus.emit(ArmorAbsorbed(part, self.name, broken=True))
             return damage
         protection = self.armor_rating.get(damage_type, 0)
         absorbed = min(damage, protection)
@@ -26,7 +38,12 @@ class Armor:
             self.current_durability[part] = 0
         if self.current_durability[part] < 0.2 * (self.max_durability // len(self.coverage)):
             self.max_repairable_durability[part] = int(0.8 * (self.max_durability // len(self.coverage)))
-        print(f"🛡️ {self.name} absorbed {absorbed} {damage_type} damage. Part ({part}) Durability: {self.current_durability[part]}/{self.max_repairable_durability[part]}")
+        bus = get_bus()
+        if bus.active:
+            bus.emit(ArmorAbsorbed(
+                part, self.name, absorbed, damage_type,
+                self.current_durability[part], self.max_repairable_durability[part],
+            ))
         return remaining
 
     @staticmethod
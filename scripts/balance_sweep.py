@@ -0,0 +1,378 @@
+# file: scripts/balance_sweep.py
+"""
+Weapon × armor × stance balance sweep.
+
+Every weapon in rules/weapons.json against every armor category/variant in
+rules/armors.json, for every attack stance. Each cell is a duel_lab batch: the
+attacker's template wields the cell's weapon and attacks in the cell's stance,
+the defender's template wears only the cell's armor. Cells are spread over a
+process pool and reported as
+
+    win_rate   attacker wins / duels
+    dpr        attacker damage per round (after armor)
+    ttk        mean rounds of the duels the attacker won (nan if none)
+
+Duel i of every cell rolls on DiceStream(seed).spawn(i) (common random
+numbers), so differences between cells are the gear, not the dice.
+
+Finished cells are appended to <out>.jsonl as they complete; re-running the
+same command skips them, so an interrupted sweep resumes where it stopped.
+At the end the grid is written to <out>.csv and <out>.npy (float64, shape
+weapons × armors × stances × metrics; axis labels in <out>.axes.json).
+
+Usage:
+    python scripts/balance_sweep.py --out build/sweep -n 500 -j 8
+    python scripts/balance_sweep.py --out build/axes --weapons greatsword,warhammer --armors Light_Light,Heavy_Heavy:dwarven
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import csv
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from armor_system import ArmorSystem
+from armors import Armor
+from character import Character
+from combat_events import quiet_bus, use_bus
+from dice import DiceStream, load_numpy
+from duel_lab import BULK_DICE, DEFAULT_MAX_ROUNDS, DuelPair, load_combatant, run_duel
+from rules_repository import get_rules, thaw
+
+STANCES = ("OFFENSIVE", "NEUTRAL", "DEFENSIVE")
+METRICS = ("win_rate", "dpr", "ttk")
+SWEEP_VERSION = 1
+
+
+class Cell(NamedTuple):
+    weapon: str
+    armor: str      # armors.json category, e.g. "Medium_Heavy"
+    variant: str    # "standard", "elven", "dwarven"
+    stance: str
+
+
+class CellResult(NamedTuple):
+    cell: Cell
+    duels: int
+    win_rate: float
+    dpr: float
+    ttk: float
+
+# =============================================================================
+# Grid
+# =============================================================================
+
+def weapon_keys() -> List[str]:
+    return list(get_rules().get("weapons.json", {}))
+
+
+def armor_keys() -> List[Tuple[str, str]]:
+    """(category, variant) for every armor in rules/armors.json, file order."""
+    out: List[Tuple[str, str]] = []
+    for category, node in get_rules().get("armors.json", {}).items():
+        if isinstance(node, dict) and "coverage" in node and "armor_rating" in node:
+            out.append((category, "standard"))  # no variant layer
+        elif isinstance(node, dict):
+            out.extend((category, variant) for variant in node)
+    return out
+
+
+def parse_armors(spec: Optional[str]) -> List[Tuple[str, str]]:
+    """"Light_Light,Heavy_Heavy:dwarven" → armor keys; a bare category means all its variants."""
+    every = armor_keys()
+    if not spec:
+        return every
+    out: List[Tuple[str, str]] = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        category, _, variant = part.partition(":")
+        found = [k for k in every if k[0] == category and (not variant or k[1] == variant)]
+        if not found:
+            raise SystemExit(f"❌ Unknown armor '{part}'")
+        out.extend(found)
+    return out
+
+
+def grid(weapons: Sequence[str], armors: Sequence[Tuple[str, str]],
+         stances: Sequence[str] = STANCES) -> List[Cell]:
+    return [Cell(w, a, v, s) for w in weapons for a, v in armors for s in stances]
+
+# =============================================================================
+# One cell
+# =============================================================================
+
+_TEMPLATES: Dict[str, Character] = {}
+_ARMOR_SYSTEM: Optional[ArmorSystem] = None
+
+
+def _template(key: str) -> Character:
+    """Per-process template cache so each worker parses a character only once."""
+    if key not in _TEMPLATES:
+        _TEMPLATES[key] = load_combatant(key)
+    return _TEMPLATES[key]
+
+
+def armor_piece(category: str, variant: str) -> Armor:
+    """The armor piece duel_lab's defenders wear, resolved through ArmorSystem."""
+    global _ARMOR_SYSTEM
+    if _ARMOR_SYSTEM is None:
+        _ARMOR_SYSTEM = ArmorSystem()
+    data = _ARMOR_SYSTEM._resolve_armor_dict(category, variant)
+    if not data:
+        raise KeyError(f"{category} ({variant})")
+    return Armor(
+        name=data["name"],
+        coverage=list(data["coverage"]),
+        armor_rating=dict(data["armor_rating"]),
+        max_durability=data["max_durability"],
+        weight=data.get("weight", 0),
+        stamina_penalty=data.get("stamina_penalty", 0),
+        mobility_bonus=data.get("mobility_bonus", 0),
+    )
+
+
+def cell_templates(cell: Cell, attacker_key: str, defender_key: str) -> Tuple[Character, Character]:
+    attacker = copy.deepcopy(_template(attacker_key))
+    attacker.weapon = thaw(get_rules().get("weapons.json", {})[cell.weapon])
+    defender = copy.deepcopy(_template(defender_key))
+    defender.armor = [armor_piece(cell.armor, cell.variant)]
+    defender.apply_armor_penalties()
+    return attacker, defender
+
+
+def run_cell(cell: Cell, attacker_key: str, defender_key: str, n: int, seed: int = 0,
+             max_rounds: int = DEFAULT_MAX_ROUNDS) -> CellResult:
+    attacker, defender = cell_templates(cell, attacker_key, defender_key)
+    lab = DiceStream(seed, bulk=BULK_DICE)
+    pair = DuelPair(attacker, defender)
+    wins = 0
+    win_rounds = 0
+    dpr = 0.0
+    for i in range(n):
+        winner, rounds, dealt, _ = run_duel(attacker, defender, lab.spawn(i), max_rounds,
+                                            a_first=(i % 2 == 0), stances=(cell.stance, "NEUTRAL"), pair=pair)
+        if winner == 0:
+            wins += 1
+            win_rounds += rounds
+        if rounds:
+            dpr += dealt / rounds
+    return CellResult(cell, n, wins / n if n else 0.0, dpr / n if n else 0.0,
+                      win_rounds / wins if wins else math.nan)
+
+
+def _run_cell_job(args: Tuple[Cell, str, str, int, int, int]) -> CellResult:
+    logging.disable(logging.WARNING)
+    with use_bus(quiet_bus()), open(os.devnull, "w", encoding="utf-8") as sink, \
+            contextlib.redirect_stdout(sink):
+        return run_cell(*args)
+
+# =============================================================================
+# Checkpoint
+# =============================================================================
+
+def _header(attacker_key: str, defender_key: str, n: int, seed: int, max_rounds: int) -> Dict[str, Any]:
+    return {
+        "sweep": SWEEP_VERSION,
+        "attacker": attacker_key,
+        "defender": defender_key,
+        "duels": n,
+        "seed": seed,
+        "max_rounds": max_rounds,
+        "rules": "/".join(get_rules().digest(n) for n in ("combat_rules.json", "weapons.json", "armors.json")),
+    }
+
+
+def load_checkpoint(path: str, header: Dict[str, Any]) -> Dict[Cell, CellResult]:
+    """
+    Cells already finished by an earlier run with the same settings and rules.
+    A torn last line (interrupted write) is cut off the file so that appended
+    rows start on a line of their own; undecodable lines are skipped.
+    """
+    done: Dict[Cell, CellResult] = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, "r+b") as f:
+        raw = f.read()
+        end = raw.rfind(b"\n") + 1
+        if end < len(raw):
+            f.truncate(end)
+            raw = raw[:end]
+    lines = raw.decode("utf-8", errors="replace").splitlines()
+    if not lines:
+        return done
+    if json.loads(lines[0]) != header:
+        raise SystemExit(f"❌ {path} belongs to a sweep with other settings or rules; "
+                         "use another --out or --fresh")
+    for line in lines[1:]:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # e.g. a torn row an older run appended to
+        cell = Cell(row["weapon"], row["armor"], row["variant"], row["stance"])
+        done[cell] = CellResult(cell, row["duels"], row["win_rate"], row["dpr"],
+                                math.nan if row["ttk"] is None else row["ttk"])
+    return done
+
+
+def _checkpoint_row(r: CellResult) -> str:
+    row = dict(r.cell._asdict(), duels=r.duels, win_rate=r.win_rate, dpr=r.dpr,
+               ttk=None if math.isnan(r.ttk) else r.ttk)
+    return json.dumps(row, separators=(",", ":"))
+
+# =============================================================================
+# Sweep
+# =============================================================================
+
+def sweep(cells: Sequence[Cell], attacker_key: str, defender_key: str, n: int,
+          checkpoint: str, seed: int = 0, workers: Optional[int] = None,
+          max_rounds: int = DEFAULT_MAX_ROUNDS, progress: bool = True) -> Dict[Cell, CellResult]:
+    """
+    Run every cell not yet in `checkpoint`, appending each result as it lands.
+    Returns results for all requested cells (old and new).
+    """
+    header = _header(attacker_key, defender_key, n, seed, max_rounds)
+    done = load_checkpoint(checkpoint, header)
+    todo = [c for c in cells if c not in done]
+    if progress and done:
+        print(f"⏩ Resuming: {len(cells) - len(todo)}/{len(cells)} cells already done")
+
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint)), exist_ok=True)
+    fresh = not os.path.exists(checkpoint) or os.path.getsize(checkpoint) == 0
+    workers = max(1, workers or os.cpu_count() or 1)
+    t0 = time.perf_counter()
+    with open(checkpoint, "a", encoding="utf-8") as log:
+        if fresh:
+            log.write(json.dumps(header, separators=(",", ":")) + "\n")
+
+        finished = [len(cells) - len(todo)]
+
+        def record(r: CellResult) -> None:
+            done[r.cell] = r
+            log.write(_checkpoint_row(r) + "\n")
+            log.flush()
+            finished[0] += 1
+            if progress:
+                print(f"\r⚙️ {finished[0]}/{len(cells)} cells ({time.perf_counter() - t0:.0f}s)", end="", flush=True)
+
+        jobs = [(c, attacker_key, defender_key, n, seed, max_rounds) for c in todo]
+        if workers == 1:
+            for job in jobs:
+                record(_run_cell_job(job))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = set()
+                queue = iter(jobs)
+                for job in queue:  # keep a bounded window so Ctrl-C loses little work
+                    pending.add(pool.submit(_run_cell_job, job))
+                    if len(pending) >= workers * 2:
+                        ready, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for fut in ready:
+                            record(fut.result())
+                for fut in wait(pending).done:
+                    record(fut.result())
+    if progress and todo:
+        print()
+    return {c: done[c] for c in cells}
+
+# =============================================================================
+# Output
+# =============================================================================
+
+def _axes(cells: Iterable[Cell]) -> Tuple[List[str], List[Tuple[str, str]], List[str]]:
+    weapons: Dict[str, None] = {}
+    armors: Dict[Tuple[str, str], None] = {}
+    stances: Dict[str, None] = {}
+    for c in cells:
+        weapons[c.weapon] = armors[(c.armor, c.variant)] = stances[c.stance] = None
+    return list(weapons), list(armors), list(stances)
+
+
+def write_csv(path: str, results: Dict[Cell, CellResult]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(list(Cell._fields) + ["duels"] + list(METRICS))
+        for r in results.values():
+            w.writerow(list(r.cell) + [r.duels, f"{r.win_rate:.4f}", f"{r.dpr:.3f}",
+                                       "" if math.isnan(r.ttk) else f"{r.ttk:.2f}"])
+
+
+def write_matrix(prefix: str, results: Dict[Cell, CellResult]) -> Optional[str]:
+    """<prefix>.npy (weapons × armors × stances × METRICS) + <prefix>.axes.json; None without NumPy."""
+    np = load_numpy()
+    weapons, armors, stances = _axes(results)
+    with open(prefix + ".axes.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "weapons": weapons,
+            "armors": [f"{a}:{v}" for a, v in armors],
+            "stances": stances,
+            "metrics": list(METRICS),
+        }, f, indent=2)
+    if np is None:
+        return None
+    w_ix = {k: i for i, k in enumerate(weapons)}
+    a_ix = {k: i for i, k in enumerate(armors)}
+    s_ix = {k: i for i, k in enumerate(stances)}
+    matrix = np.full((len(weapons), len(armors), len(stances), len(METRICS)), np.nan)
+    for c, r in results.items():
+        matrix[w_ix[c.weapon], a_ix[(c.armor, c.variant)], s_ix[c.stance]] = (r.win_rate, r.dpr, r.ttk)
+    np.save(prefix + ".npy", matrix)
+    return prefix + ".npy"
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[Cell, CellResult]:
+    ap = argparse.ArgumentParser(description="Sweep every weapon × armor × stance through headless duels.")
+    ap.add_argument("--out", default="build/balance_sweep",
+                    help="output prefix for .jsonl checkpoint, .csv, .npy (default build/balance_sweep)")
+    ap.add_argument("--attacker", default="wojtek", help="character who wields each weapon (default wojtek)")
+    ap.add_argument("--defender", default="wojtek", help="character who wears each armor (default wojtek)")
+    ap.add_argument("--weapons", help="comma-separated weapon keys (default: all of rules/weapons.json)")
+    ap.add_argument("--armors", help="comma-separated Category[:variant] (default: all of rules/armors.json)")
+    ap.add_argument("--stances", default=",".join(STANCES), help="comma-separated attacker stances")
+    ap.add_argument("-n", "--duels", type=int, default=500, help="duels per cell (default 500)")
+    ap.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    ap.add_argument("--seed", type=int, default=0, help="base seed; results are reproducible per seed")
+    ap.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS, help="rounds before a duel is called a draw")
+    ap.add_argument("--fresh", action="store_true", help="discard the checkpoint instead of resuming")
+    args = ap.parse_args(argv)
+
+    all_weapons = weapon_keys()
+    weapons = [w.strip() for w in args.weapons.split(",")] if args.weapons else all_weapons
+    unknown = [w for w in weapons if w not in all_weapons]
+    if unknown:
+        raise SystemExit(f"❌ Unknown weapon(s): {', '.join(unknown)}")
+    stances = [s.strip().upper() for s in args.stances.split(",") if s.strip()]
+    if any(s not in STANCES for s in stances):
+        raise SystemExit(f"❌ Stances must be among {', '.join(STANCES)}")
+    cells = grid(weapons, parse_armors(args.armors), stances)
+
+    checkpoint = args.out + ".jsonl"
+    if args.fresh and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        logging.disable(logging.WARNING)
+        name_a = _template(args.attacker).name
+        name_b = _template(args.defender).name
+    print(f"⚔️ {name_a} (each weapon) vs {name_b} (each armor): {len(cells)} cells × {args.duels} duels")
+
+    t0 = time.perf_counter()
+    results = sweep(cells, args.attacker, args.defender, args.duels, checkpoint,
+                    seed=args.seed, workers=args.workers, max_rounds=args.max_rounds)
+    write_csv(args.out + ".csv", results)
+    npy = write_matrix(args.out, results)
+    print(f"✅ {len(results)} cells in {time.perf_counter() - t0:.1f}s → {args.out}.csv"
+          + (f", {npy}" if npy else " (NumPy not installed: no .npy)"))
+    return results
+
+
+if __name__ == "__main__":
+    main()
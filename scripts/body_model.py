@@ -0,0 +1,235 @@
+# file: scripts/body_model.py
+"""
+Array-backed body-part HP.
+
+Character.body_parts and CombatHealthManager.health used to be plain dicts of
+13 string-keyed zones, copied per manager and re-summed on every damage check.
+BodyHP keeps current and maximum HP in two int arrays indexed by a shared
+BodyPlan (zone name → index), plus running totals updated on every write:
+
+    body = BodyHP.from_mapping(character.body_parts)
+    body["chest"] -= 4          # O(1); body.total / body.living_count follow
+    body.total                  # sum of positive HP, no re-scan
+    body.living()               # zones with HP > 0, plan order
+    dict(body)                  # plain dict when something needs one (JSON)
+
+It is a MutableMapping, so existing `body_parts[zone]`, `.items()`,
+`.values()`, `in` and iteration keep working. Plans are interned: every
+character using the default 13 zones shares one BodyPlan.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+
+DEFAULT_ZONES = (
+    "left_lower_leg", "right_lower_leg", "left_upper_leg", "right_upper_leg",
+    "stomach", "chest", "left_lower_arm", "right_lower_arm",
+    "left_upper_arm", "right_upper_arm", "head", "throat", "groin",
+)
+
+
+class BodyPlan:
+    """Ordered zone names and their indices; one shared instance per distinct zone list."""
+
+    __slots__ = ("zones", "index")
+
+    _interned: Dict[Tuple[str, ...], "BodyPlan"] = {}
+
+    def __init__(self, zones: Tuple[str, ...]):
+        self.zones = zones
+        self.index = {z: i for i, z in enumerate(zones)}
+
+    @classmethod
+    def of(cls, zones: Iterable[str]) -> "BodyPlan":
+        zones = tuple(zones)
+        plan = cls._interned.get(zones)
+        if plan is None:
+            plan = cls._interned[zones] = cls(zones)
+        return plan
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def __repr__(self) -> str:
+        return f"BodyPlan({len(self.zones)} zones)"
+
+
+DEFAULT_PLAN = BodyPlan.of(DEFAULT_ZONES)
+
+
+class _MaxView(Mapping):
+    """Read-only zone → max HP view of a BodyHP."""
+
+    __slots__ = ("_body",)
+
+    def __init__(self, body: "BodyHP"):
+        self._body = body
+
+    def __getitem__(self, zone: str) -> int:
+        return self._body._max[self._body._plan.index[zone]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._body._plan.zones)
+
+    def __len__(self) -> int:
+        return len(self._body._plan)
+
+
+class BodyHP(MutableMapping):
+    """Current / max HP per zone with incrementally maintained totals."""
+
+    __slots__ = ("_plan", "_hp", "_max", "_total", "_living")
+
+    def __init__(self, plan: BodyPlan, hp: Iterable[int], max_hp: Optional[Iterable[int]] = None):
+        self._plan = plan
+        self._hp = array("i", [int(v) for v in hp])
+        self._max = array("i", self._hp if max_hp is None else [int(v) for v in max_hp])
+        if len(self._hp) != len(plan) or len(self._max) != len(plan):
+            raise ValueError(f"expected {len(plan)} values for {plan!r}")
+        self._recount()
+
+    @classmethod
+    def from_mapping(cls, parts: Mapping[str, int]) -> "BodyHP":
+        """Copy of a zone → HP mapping; current HP also becomes the max."""
+        if isinstance(parts, BodyHP):
+            return parts.copy()
+        return cls(BodyPlan.of(parts.keys()), parts.values())
+
+    @classmethod
+    def default(cls, hp: Optional[Iterable[int]] = None) -> "BodyHP":
+        """Default 13-zone body; Character() weights unless `hp` is given."""
+        return cls(DEFAULT_PLAN, hp) if hp is not None else _DEFAULT_BODY.copy()
+
+    def _recount(self) -> None:
+        self._total = sum(v for v in self._hp if v > 0)
+        self._living = sum(1 for v in self._hp if v > 0)
+
+    # ---- mapping facade ----
+    def __getitem__(self, zone: str) -> int:
+        return self._hp[self._plan.index[zone]]
+
+    def __setitem__(self, zone: str, value: int) -> None:
+        i = self._plan.index.get(zone)
+        if i is None:
+            self._reshape(self._plan.zones + (zone,), extra=int(value))
+            return
+        old, new = self._hp[i], int(value)
+        self._hp[i] = new
+        self._total += max(new, 0) - max(old, 0)
+        self._living += (new > 0) - (old > 0)
+
+    def __delitem__(self, zone: str) -> None:
+        if zone not in self._plan.index:
+            raise KeyError(zone)
+        self._reshape(tuple(z for z in self._plan.zones if z != zone))
+
+    def _reshape(self, zones: Tuple[str, ...], extra: int = 0) -> None:
+        """Switch to another plan (zone added or removed); rare, O(zones)."""
+        hp, mx = dict(zip(self._plan.zones, self._hp)), dict(zip(self._plan.zones, self._max))
+        self._plan = BodyPlan.of(zones)
+        self._hp = array("i", (hp.get(z, extra) for z in zones))
+        self._max = array("i", (mx.get(z, extra) for z in zones))
+        self._recount()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._plan.zones)
+
+    def __len__(self) -> int:
+        return len(self._plan)
+
+    def __contains__(self, zone: object) -> bool:
+        return zone in self._plan.index
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"BodyHP({dict(self.items())!r})"
+
+    def values(self):  # faster than the Mapping mixin's per-key lookups
+        return list(self._hp)
+
+    def items(self):
+        return list(zip(self._plan.zones, self._hp))
+
+    def copy(self) -> "BodyHP":
+        dup = BodyHP.__new__(BodyHP)
+        dup._plan = self._plan
+        dup._hp = array("i", self._hp)
+        dup._max = array("i", self._max)
+        dup._total = self._total
+        dup._living = self._living
+        return dup
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> "BodyHP":
+        return self.copy()
+
+    def __reduce__(self):
+        # pickle zone names; the plan is re-interned on load
+        return _rebuild, (self._plan.zones, list(self._hp), list(self._max))
+
+    # ---- totals / queries ----
+    @property
+    def plan(self) -> BodyPlan:
+        return self._plan
+
+    @property
+    def total(self) -> int:
+        """Sum of positive HP over all zones."""
+        return self._total
+
+    @property
+    def max_total(self) -> int:
+        return sum(self._max)
+
+    @property
+    def living_count(self) -> int:
+        return self._living
+
+    @property
+    def crippled_count(self) -> int:
+        return len(self._plan) - self._living
+
+    @property
+    def maxima(self) -> Mapping[str, int]:
+        return _MaxView(self)
+
+    def max_hp(self, zone: str) -> int:
+        return self._max[self._plan.index[zone]]
+
+    def living(self) -> List[str]:
+        """Zones with HP > 0, in plan order."""
+        zones = self._plan.zones
+        return [zones[i] for i, v in enumerate(self._hp) if v > 0]
+
+    def damage(self, zone: str, amount: int) -> int:
+        """Subtract `amount`, clamp at 0; returns the overflow past 0."""
+        i = self._plan.index[zone]
+        old = self._hp[i]
+        overflow = max(0, amount - old)
+        self[zone] = max(0, old - amount)
+        return overflow
+
+    def reset(self) -> None:
+        """Back to max HP everywhere."""
+        self._hp = array("i", self._max)
+        self._recount()
+
+
+DEFAULT_HP = (2, 2, 4, 4, 3, 6, 1, 1, 2, 2, 2, 1, 1)  # Character() default weights
+_DEFAULT_BODY = BodyHP(DEFAULT_PLAN, DEFAULT_HP)
+
+
+def _rebuild(zones, hp, max_hp) -> BodyHP:
+    return BodyHP(BodyPlan.of(zones), hp, max_hp)
+
+
+__all__ = ["DEFAULT_ZONES", "DEFAULT_HP", "BodyPlan", "DEFAULT_PLAN", "BodyHP"]
@@ -0,0 +1,237 @@
+# file: scripts/body_plans.py
+"""
+Weighted hit-location tables per body plan.
+
+Random hits used to land uniformly: rng.choice over combat_engine's zone
+list, random.sample over living parts in Character.distribute_damage. A
+chest is a bigger target than a throat, and an ogre's head is further from a
+human's blade than a bandit's. Each plan here lists zone → weight (roughly
+the share of a strike's target area); the weights are compiled once into a
+Walker/Vose alias table, so a draw costs one uniform variate regardless of
+how many zones the plan has:
+
+    plan = plan_for(unit)             # race, bestiary entry or tags → plan
+    plan.draw(get_dice())             # 'chest'
+    plan.pick(rng, living=parts, k=2) # two distinct living zones, weighted
+    plan.table.batch(10_000, gen)     # NumPy indices into plan.zones
+
+Zone names are canonical lower_snake_case (the Character / BodyHP keys);
+canonical_zone() folds "Left Upper Arm" and "left-upper-arm" into them.
+
+Plans: humanoid, ogre, construct, quadruped, incorporeal. Bestiary creatures
+in lore/bestiary/*.json map onto them through their tags (ogrekin → ogre,
+beast → quadruped, construct → construct, spirit/phenomenon → incorporeal,
+everything else humanoid).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from dice import load_numpy
+from rules_repository import FrozenDict, get_rules
+
+BESTIARY_DIR = (Path(__file__).resolve().parent / "../lore/bestiary").resolve()
+
+
+def canonical_zone(name: str) -> str:
+    """'Left Upper Arm' / 'left-upper-arm' → 'left_upper_arm'."""
+    return "_".join(str(name).strip().lower().replace("-", " ").replace("_", " ").split())
+
+# =============================================================================
+# Alias tables
+# =============================================================================
+
+class AliasTable:
+    """Walker alias table over `zones`: O(n) to build, O(1) per draw."""
+
+    __slots__ = ("zones", "prob", "alias", "_np_tables")
+
+    def __init__(self, zones: Sequence[str], weights: Sequence[float]):
+        total = float(sum(weights))
+        if not zones or len(zones) != len(weights) or total <= 0 or min(weights) < 0:
+            raise ValueError("alias table needs one non-negative weight per zone and a positive total")
+        n = len(zones)
+        scaled = [w * n / total for w in weights]
+        prob, alias = [1.0] * n, list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:                       # Vose: pair one short and one tall column
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        self.zones = tuple(zones)
+        self.prob = tuple(prob)                       # leftovers keep probability 1 (rounding)
+        self.alias = tuple(alias)
+        self._np_tables = None
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def draw_index(self, rng) -> int:
+        u = rng.random() * len(self.zones)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def draw(self, rng) -> str:
+        return self.zones[self.draw_index(rng)]
+
+    def batch(self, size, gen):
+        """Zone indices for `size` hits from a NumPy Generator."""
+        np = load_numpy()
+        if np is None:
+            raise ImportError("AliasTable.batch requires NumPy (pip install numpy)")
+        if self._np_tables is None:
+            self._np_tables = (np.array(self.prob), np.array(self.alias, dtype=np.int64))
+        prob, alias = self._np_tables
+        i = gen.integers(0, len(self.zones), size=size)
+        return np.where(gen.random(size=size) < prob[i], i, alias[i])
+
+    def probabilities(self) -> Dict[str, float]:
+        """Exact zone probabilities implied by the table (for checks and reports)."""
+        n = len(self.zones)
+        out = dict.fromkeys(self.zones, 0.0)
+        for i, z in enumerate(self.zones):
+            out[z] += self.prob[i] / n
+            out[self.zones[self.alias[i]]] += (1.0 - self.prob[i]) / n
+        return out
+
+# =============================================================================
+# Plans
+# =============================================================================
+
+class BodyPlanTable:
+    """One body plan: zone weights and their alias table."""
+
+    __slots__ = ("name", "weights", "table")
+
+    def __init__(self, name: str, weights: Mapping[str, float]):
+        self.name = name
+        self.weights = FrozenDict({canonical_zone(z): float(w) for z, w in weights.items() if w > 0})
+        self.table = AliasTable(list(self.weights), list(self.weights.values()))
+
+    def __repr__(self) -> str:
+        return f"BodyPlanTable({self.name!r}, {len(self.table)} zones)"
+
+    @property
+    def zones(self) -> Tuple[str, ...]:
+        return self.table.zones
+
+    def draw(self, rng) -> str:
+        return self.table.draw(rng)
+
+    def pick(self, rng, living: Optional[Sequence[str]] = None, k: int = 1) -> List[str]:
+        """
+        Up to k distinct zones from `living` (default: every zone), weighted by
+        the plan. Draws from the alias table and rejects dead or repeated zones;
+        when most of the body is gone it falls back to an exact weighted draw
+        over what is left (uniform if none of it is in the plan).
+        """
+        pool = list(self.zones) if living is None else list(living)
+        allowed = set(pool)
+        k = min(k, len(pool))
+        out: List[str] = []
+        for _ in range(4 * k):
+            if len(out) == k:
+                return out
+            z = self.draw(rng)
+            if z in allowed and z not in out:
+                out.append(z)
+        rest = [z for z in pool if z not in out]
+        while len(out) < k:
+            weights = [self.weights.get(z, 0.0) for z in rest]
+            total = sum(weights)
+            if total <= 0:
+                weights, total = [1.0] * len(rest), float(len(rest))
+            u, j = rng.random() * total, 0
+            while j < len(rest) - 1 and u >= weights[j]:
+                u -= weights[j]
+                j += 1
+            out.append(rest.pop(j))
+        return out
+
+
+_PLAN_WEIGHTS = {
+    # percent of a strike's target area; the 13 Character zones
+    "humanoid": {
+        "head": 8, "throat": 2, "chest": 16, "stomach": 12, "groin": 4,
+        "left_upper_arm": 7, "right_upper_arm": 7, "left_lower_arm": 6, "right_lower_arm": 6,
+        "left_upper_leg": 9, "right_upper_leg": 9, "left_lower_leg": 7, "right_lower_leg": 7,
+    },
+    # head and throat sit above a human's reach; legs and gut are what you hit
+    "ogre": {
+        "head": 5, "throat": 1, "chest": 16, "stomach": 12, "groin": 4,
+        "left_upper_arm": 7, "right_upper_arm": 7, "left_lower_arm": 5, "right_lower_arm": 5,
+        "left_upper_leg": 10, "right_upper_leg": 10, "left_lower_leg": 9, "right_lower_leg": 9,
+    },
+    # no throat or groin worth the name; a broad armoured trunk
+    "construct": {
+        "head": 6, "chest": 24, "stomach": 14,
+        "left_upper_arm": 8, "right_upper_arm": 8, "left_lower_arm": 6, "right_lower_arm": 6,
+        "left_upper_leg": 8, "right_upper_leg": 8, "left_lower_leg": 6, "right_lower_leg": 6,
+    },
+    "quadruped": {
+        "head": 10, "throat": 4, "chest": 18, "stomach": 16, "hindquarters": 12,
+        "left_foreleg": 9, "right_foreleg": 9, "left_hindleg": 9, "right_hindleg": 9, "tail": 4,
+    },
+    "incorporeal": {"core": 30, "shroud": 70},
+}
+
+PLANS: Mapping[str, BodyPlanTable] = FrozenDict({k: BodyPlanTable(k, w) for k, w in _PLAN_WEIGHTS.items()})
+HUMANOID = PLANS["humanoid"]
+
+RACE_PLANS = {"ogre": "ogre", "ogrekin": "ogre"}
+TAG_PLANS = (  # first matching tag wins
+    ("phenomenon", "incorporeal"), ("spirit", "incorporeal"),
+    ("ogrekin", "ogre"), ("humanoid", "humanoid"),
+    ("construct", "construct"), ("beast", "quadruped"),
+)
+
+
+def plan_for_tags(tags: Sequence[str]) -> BodyPlanTable:
+    tags = {str(t).lower() for t in tags or ()}
+    for tag, plan in TAG_PLANS:
+        if tag in tags:
+            return PLANS[plan]
+    return HUMANOID
+
+
+_BESTIARY: Optional[Dict[str, str]] = None
+
+
+def bestiary_plans() -> Dict[str, str]:
+    """Creature name (lower case) → plan name for every entry in lore/bestiary/*.json."""
+    global _BESTIARY
+    if _BESTIARY is None:
+        found = {}
+        for path in sorted(BESTIARY_DIR.glob("*.json")):
+            for name, entry in (get_rules().get(path, None) or {}).items():
+                if hasattr(entry, "get"):
+                    found[name.lower()] = plan_for_tags(entry.get("tags", ())).name
+        _BESTIARY = found
+    return _BESTIARY
+
+
+def plan_for(unit: Any) -> BodyPlanTable:
+    """Plan for a unit dict or Character: explicit `body_plan`, race, bestiary name, tags, else humanoid."""
+    get = unit.get if isinstance(unit, dict) else lambda k, d=None: getattr(unit, k, d)
+    explicit = get("body_plan")
+    if explicit in PLANS:
+        return PLANS[explicit]
+    race = str(get("race", "") or "").lower()
+    if race in RACE_PLANS:
+        return PLANS[RACE_PLANS[race]]
+    name = str(get("name", "") or "").lower().replace(" ", "_")
+    known = bestiary_plans().get(name)
+    if known:
+        return PLANS[known]
+    tags = get("tags")
+    return plan_for_tags(tags) if tags else HUMANOID
+
+
+__all__ = [
+    "canonical_zone", "AliasTable", "BodyPlanTable", "PLANS", "HUMANOID",
+    "plan_for_tags", "bestiary_plans", "plan_for",
+]
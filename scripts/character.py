@@ -1,14 +1,60 @@
 # ✅ Updated: character.py — dual-layer inventory system with slots and backpack
 
-import json
-import random
+import copy
 import logging
-import os
+from dice import get_dice
+from rules_repository import get_rules
 from armors import Armor
+from body_model import BodyHP
+from body_plans import plan_for
+from combat_profile import invalidate as invalidate_profile
+from combat_events import LimbCrippled, UnitFell, get_bus
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Per-object caches (combat profile, zone index) that reset_for_duel leaves alone
+_OWN_CACHES = ("_combat_profile", "_zone_index")
+
+
+# Exact-type fast path for _fresh: most slots hold plain scalars or containers
+_SHARED = frozenset((int, float, str, bool, type(None)))
+_COPY_BY_TYPE = {list: list, dict: dict}
+
+
+def _fresh(value):
+    """One-level copy of the containers a fight mutates; everything else is shared."""
+    kind = type(value)
+    if kind in _SHARED:
+        return value
+    copier = _COPY_BY_TYPE.get(kind)
+    if copier is not None:
+        return copier(value)
+    if isinstance(value, BodyHP):
+        return value.copy()
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
 class Character:
+    # Fixed attributes live in slots; __dict__ only materialises for ad-hoc ones
+    # (class/ability extras set by loaders and spells).
+    __slots__ = (
+        "name", "race", "gender", "class_name", "background", "total_hp", "max_stamina", "stamina",
+        "bleeding", "bleeding_rate", "alive", "in_combat", "exhausted", "last_action",
+        "combat_count", "armor_weight", "inventory_weight", "mass", "shield_equipped",
+        "weapon_equipped", "weapon", "armor", "shield", "_body", "compromised_limbs",
+        "pain_penalty", "mobility_penalty", "stance", "stamina_cost_modifier", "strength",
+        "toughness", "agility", "mobility", "dexterity", "endurance", "intelligence", "willpower",
+        "perception", "charisma", "corruption_level", "stress_level", "weapon_skill", "faith",
+        "reputation", "grapple_committed", "grappled_by", "stunned", "skip_turn", "health", "tags",
+        "calories_consumed", "hunger_level", "allies", "xp", "status_effects", "power_bonus",
+        "aging_rate", "charisma_penalty", "hunt_check_bonus", "defense_bonus", "rune_craft",
+        "brine_marks", "__dict__",
+    )
+
     def __init__(self):
         self.name = ""
         self.race = ""
@@ -33,11 +79,7 @@ class Character:
         self.weapon = {}
         self.armor = []
         self.shield = None
-        self.body_parts = {
-            "left_lower_leg": 2, "right_lower_leg": 2, "left_upper_leg": 4, "right_upper_leg": 4,
-            "stomach": 3, "chest": 6, "left_lower_arm": 1, "right_lower_arm": 1,
-            "left_upper_arm": 2, "right_upper_arm": 2, "head": 2, "throat": 1, "groin": 1
-        }
+        self._body = BodyHP.default()
         self.compromised_limbs = []
         self.pain_penalty = 0
         self.mobility_penalty = 0
@@ -77,22 +119,57 @@ class Character:
         self.rune_craft = 0  # For Iron Covenant
         self.brine_marks = 0  # For Daughters of the Drowned Moon
 
+    @property
+    def body_parts(self):
+        """Zone → HP (array-backed BodyHP; behaves like the old dict)."""
+        return self._body
+
+    @body_parts.setter
+    def body_parts(self, parts):
+        self._body = parts if isinstance(parts, BodyHP) else BodyHP.from_mapping(parts)
+
+    def reset_for_duel(self, template):
+        """
+        Put this character back into `template`'s state in place. Meant for a
+        copy.deepcopy(template) reused across many fights: body HP, weapon,
+        skills and the status lists are copied one level deep, and the armor
+        pieces keep their identity but take the template's durability back.
+        """
+        for name in Character.__slots__[:-1]:   # everything but __dict__
+            if name == "armor":
+                continue
+            try:
+                setattr(self, name, _fresh(getattr(template, name)))
+            except AttributeError:
+                pass
+        mine, theirs = self.armor, template.armor
+        if len(mine) == len(theirs) and all(hasattr(p, "restore") for p in mine):
+            for piece, source in zip(mine, theirs):
+                piece.restore(source)
+        else:
+            self.armor = copy.deepcopy(theirs)
+        caches = {k: v for k, v in self.__dict__.items() if k in _OWN_CACHES}
+        self.__dict__.clear()
+        self.__dict__.update({k: _fresh(v) for k, v in template.__dict__.items() if k not in _OWN_CACHES})
+        self.__dict__.update(caches)
+        invalidate_profile(self)  # stats may have moved during the last fight
+
     def receive_damage(self, damage):
         if not self.alive:
             return
         total_damage = max(0, damage - (self.toughness // 5))
-        if total_damage >= sum(hp for hp in self.body_parts.values() if hp > 0):
+        if total_damage >= self._body.total:
             self.die()
         else:
             self.distribute_damage(total_damage)
 
     def distribute_damage(self, damage):
-        valid_parts = [part for part, hp in self.body_parts.items() if hp > 0]
+        valid_parts = self._body.living()
         if not valid_parts:
             self.die()
             return
         damage_per_part = max(1, damage // max(1, len(valid_parts) // 2))
-        hit_parts = random.sample(valid_parts, min(len(valid_parts), 2))
+        hit_parts = plan_for(self).pick(get_dice(), valid_parts, 2)
         for part in hit_parts:
             self.body_parts[part] -= damage_per_part
             if self.body_parts[part] <= 0:
@@ -110,37 +187,46 @@ class Character:
 
     def on_part_crippled(self, part):
         self.compromised_limbs.append(part)
-        if part in ["left_lower_leg", "right_lower_leg", "left_upper_leg", "right_upper_leg"]:
+        is_leg = part in ["left_lower_leg", "right_lower_leg", "left_upper_leg", "right_upper_leg"]
+        is_arm = 'arm' in part
+        if is_leg:
             self.mobility_penalty += 25
-            print(f"⚠️ {self.name}'s {part.replace('_', ' ')} is crippled!")
-            print(f"⛔ {self.name}'s mobility reduced by {self.mobility_penalty}% due to crippled legs!")
-        if 'arm' in part:
+        if is_arm:
             self.weapon_skill -= 50
-            print(f"⚠️ {self.name}'s {part.replace('_', ' ')} crippled—weapon skill reduced by 50%!")
         self.pain_penalty += 3
         self.pain_penalty = min(100, self.pain_penalty)
         self.stress_level = min(100, self.stress_level + 5)
-        print(f"😖 {self.name} suffers pain penalties! Total penalty: {self.pain_penalty}%")
-        print(f"🧠 {self.name}'s stress level rises to {self.stress_level}%")
+        bus = get_bus()
+        if bus.active:
+            bus.emit(LimbCrippled(
+                self.name, part, self.pain_penalty, self.stress_level,
+                mobility_penalty=self.mobility_penalty if is_leg else None,
+                weapon_skill_loss=is_arm,
+            ))
         self.check_corruption_outburst()
 
     def check_corruption_outburst(self):
+        bus = get_bus()
         if self.corruption_level >= 50:
-            roll = random.randint(1, 100)
+            roll = get_dice().d100()
             threshold = self.corruption_level - self.willpower - (self.faith // 2)
             if roll <= threshold:
-                print(f"😈 Corruption consumes {self.name}! They lash out uncontrollably!")
                 self.reputation = max(-100, self.reputation - 20)
-                print(f"🏛️ {self.name}'s reputation falls to {self.reputation} due to their outburst!")
+                if bus.active:
+                    bus.narrate("😈 Corruption consumes {}! They lash out uncontrollably!", self.name)
+                    bus.narrate("🏛️ {}'s reputation falls to {} due to their outburst!", self.name, self.reputation)
         if self.brine_marks >= 10:
-            print(f"😈 {self.name} succumbs to Brine Marks: speech loss, visions!")
+            if bus.active:
+                bus.narrate("😈 {} succumbs to Brine Marks: speech loss, visions!", self.name)
             self.charisma_penalty += 5
             self.perception += 5
 
     def die(self):
         self.alive = False
         self.in_combat = False
-        print(f"💀 {self.name} has died!")
+        bus = get_bus()
+        if bus.active:
+            bus.emit(UnitFell(self.name, "died"))
 
     def consume_stamina(self, amount):
         total_cost = amount + self.stamina_cost_modifier
@@ -186,6 +272,7 @@ class Character:
                 print(f"🛡️ {self.name}'s shield breaks!")
                 self.shield_equipped = False
                 self.shield = None
+                invalidate_profile(self)
 
     def wear_weapon(self):
         if self.weapon_equipped and self.weapon:
@@ -195,6 +282,7 @@ class Character:
                 print(f"⚔️ {self.name}'s weapon breaks!")
                 self.weapon_equipped = False
                 self.weapon = None
+                invalidate_profile(self)
 
     def apply_dodge_penalty(self):
         dodge_cost = 1 - (self.agility // 20)
@@ -211,6 +299,7 @@ class Character:
         total_weight = sum(getattr(armor, 'weight', 0) for armor in self.armor)
         self.mobility_penalty = 0
         self.stamina_cost_modifier = 0
+        invalidate_profile(self)  # armor list may have changed
         if self.race == "Ogre":  # Logistics Beast: 3x weight capacity
             total_weight = total_weight // 3
         for armor in self.armor:
@@ -228,7 +317,7 @@ class Character:
                 print(f"🛡️ {self.name}'s {armor.name} (weight {weight}) has minimal impact on mobility and stamina.")
 
     def athletics_check(self, difficulty):
-        roll = random.randint(1, 100)
+        roll = get_dice().d100()
         pain_penalty = min(self.pain_penalty, 20)
         total_roll = roll + (self.agility // 5) - self.mobility_penalty - pain_penalty
         print(f"🏃 {self.name} attempts athletics check (needs {difficulty}+): rolled {roll} + {self.agility // 5} (Agility) - {self.mobility_penalty} (Mobility Penalty) - {pain_penalty} (Pain) = {total_roll}")
@@ -239,6 +328,7 @@ class Character:
         max_stat = load_stats(self.race, self.gender)["max_stats"].get(stat, 50)
         new_value = min(current + amount, max_stat)
         setattr(self, stat, new_value)
+        invalidate_profile(self)
         print(f"📈 {self.name}'s {stat} increases by {amount} to {new_value}!")
 
     def can_wield_weapon(self, weapon):
@@ -262,17 +352,17 @@ class Character:
             self.hunger_level += 1
             if self.hunger_level >= 3:
                 print(f"⚠️ {self.name} hungers—10% chance to attack ally.")
-                if random.random() < 0.1 and self.allies:
-                    ally = random.choice(self.allies)
+                if get_dice().random() < 0.1 and self.allies:
+                    ally = get_dice().choice(self.allies)
                     print(f"🍖 {self.name} attacks {ally.name} in hunger!")
-                    limb = random.choice(["left_upper_arm", "right_upper_arm"])
+                    limb = get_dice().choice(["left_upper_arm", "right_upper_arm"])
                     ally.take_damage_to_zone(limb, 20)
                     ally.bleeding_rate += 1.0
                     ally.pain_penalty += 10
                     ally.stress_level += 10
                     self.health = min(self.total_hp, self.health + 5)
                     print(f"🩸 {ally.name} bleeds and suffers pain! {self.name} gains 5 HP from flesh!")
-                    roll = random.randint(1, 100)
+                    roll = get_dice().d100()
                     threshold = (ally.willpower // 5) + 30 - ally.pain_penalty // 2 - ally.stress_level // 10
                     if roll > threshold:
                         print(f"💔 {ally.name} panics from the attack and may flee!")
@@ -284,8 +374,7 @@ class Character:
         self.calories_consumed = 0
 
 def load_stats(race, gender):
-    path = os.path.join(os.path.dirname(__file__), "../rules/stats.json")
-    with open(path, 'r', encoding='utf-8') as f:
-        stats_data = json.load(f)
+    """Read-only stats entry for race/gender (parsed once via the RulesRepository)."""
+    stats_data = get_rules().get("stats.json")
     key = f"{race}_{gender}"
     return stats_data.get(key, {"starting_stats": {}, "max_stats": {}})
\ No newline at end of file
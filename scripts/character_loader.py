@@ -2,6 +2,8 @@ import json
 import os
 from character import Character
 from armors import Armor
+from rules_bundle import armor_variant
+from rules_repository import get_rules, thaw
 
 class CharacterLoader:
     def __init__(self, base_dir="res://characters/characters"):
@@ -9,31 +11,33 @@ class CharacterLoader:
         self.characters = {}
 
     def load_json_file(self, path):
+        """Read-only parsed rules file, shared through the process-wide RulesRepository."""
         try:
-            with open(path, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            return get_rules().get(path)
         except Exception as e:
             raise Exception(f"Failed to load {path}: {e}")
 
+    # Per-entry lookups return private copies: weapons, class abilities etc. end
+    # up on a Character and get mutated (durability ticks, skill changes).
     def load_weapon(self, name):
         path = os.path.join(os.path.dirname(__file__), "../rules/weapons.json")
         weapons_data = self.load_json_file(path)
-        return weapons_data.get(name, {"name": "none", "type": "none", "base_damage": 0, "damage_type": "blunt", "stance_tree": ["neutral"], "durability": 50})
+        return thaw(weapons_data.get(name, {"name": "none", "type": "none", "base_damage": 0, "damage_type": "blunt", "stance_tree": ["neutral"], "durability": 50}))
 
     def load_race(self, name):
         path = os.path.join(os.path.dirname(__file__), "../rules/races.json")
         races_data = self.load_json_file(path)
-        return races_data.get(name, {})
+        return thaw(races_data.get(name, {}))
 
     def load_class(self, name):
         path = os.path.join(os.path.dirname(__file__), "../rules/classes.json")
         classes_data = self.load_json_file(path)
-        return classes_data.get(name, {})
+        return thaw(classes_data.get(name, {}))
 
     def load_background(self, name):
         path = os.path.join(os.path.dirname(__file__), "../rules/backgrounds.json")
         backgrounds_data = self.load_json_file(path)
-        return backgrounds_data.get(name, {})
+        return thaw(backgrounds_data.get(name, {}))
 
     def load_stats(self, race, gender):
         path = os.path.join(os.path.dirname(__file__), "../rules/stats.json")
@@ -42,13 +46,11 @@ class CharacterLoader:
         return stats_data.get(key, {"starting_stats": {}, "max_stats": {}})
 
     def load_armor_piece(self, name, race):
-        path = os.path.join(os.path.dirname(__file__), "../rules/armors.json")
-        armor_data = self.load_json_file(path)
-        
         tier = name
         variant = race.lower() if race in ["Elven", "Dwarven"] else "standard"
-        
-        armor_stats = armor_data.get(tier, {}).get(variant, armor_data.get(tier, {}).get("standard"))
+
+        # variant falls back to "standard"; tables are pre-resolved in the rules bundle
+        _, armor_stats = armor_variant(tier, variant)
         if not armor_stats:
             legacy_path = os.path.join(os.path.dirname(__file__), "../rules/armore.json")
             if os.path.exists(legacy_path):
@@ -67,8 +69,8 @@ class CharacterLoader:
         
         armor = Armor(
             name=armor_stats["name"],
-            coverage=armor_stats["coverage"],
-            armor_rating=armor_stats["armor_rating"],
+            coverage=list(armor_stats["coverage"]),
+            armor_rating=dict(armor_stats["armor_rating"]),
             max_durability=armor_stats["max_durability"],
             weight=armor_stats.get("weight", 0),
             stamina_penalty=armor_stats.get("stamina_penalty", 0),
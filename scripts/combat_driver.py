@@ -0,0 +1,224 @@
+# file: scripts/combat_driver.py
+"""
+Headless driver for adventure_new.run_combat.
+
+Runs the full adventure ruleset (crits, ripostes, Veil's Grace, sorcery,
+stalemate fatigue) with a combat_policy.PlayerPolicy making the player's
+decisions, either once with the console narration or in throughput mode:
+thousands of encounters per second on a quiet event bus, each on its own
+dice stream (root.spawn(i)) so results don't depend on the worker count.
+
+Usage:
+    python scripts/combat_driver.py torvald --enemies bandit:2 --policy greedy -n 20000
+    python scripts/combat_driver.py sorceress_isolde --enemies bandit_leader --policy random --show --record run.jsonl
+    python scripts/combat_driver.py sorceress_isolde --enemies bandit_leader --replay run.jsonl --seed 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from combat_events import quiet_bus, use_bus
+from combat_policy import POLICIES, PlayerPolicy, RecordingPolicy, ReplayPolicy
+from dice import DiceStream, use_dice
+from duel_lab import mean_ci, percentile, wilson_interval
+from rules_repository import thaw
+
+import adventure_new as game
+
+
+class EncounterResult(NamedTuple):
+    won: bool
+    rounds: int
+    hp_left: int
+
+
+PolicySpec = Union[str, Callable[[], PlayerPolicy]]
+
+# =============================================================================
+# Encounter setup
+# =============================================================================
+
+def load_player(key: str) -> dict:
+    """Player sheet with armor equipped (ready to be copied per encounter)."""
+    player = game.load_character_file(key)
+    if not player:
+        raise SystemExit(f"❌ Unknown character: {key}")
+    game.equip_armor(player)
+    return player
+
+
+def load_enemies(spec: str) -> List[dict]:
+    """
+    "bandit:2,bandit_leader" → equipped enemy sheets. bandit / bandit_leader use
+    the adventure's own factories; anything else is a character file.
+    """
+    out: List[dict] = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        key, _, count = part.partition(":")
+        n = int(count or 1)
+        if key == "bandit":
+            out.extend(game.make_bandits(n))
+        elif key == "bandit_leader":
+            out.extend(game.make_bandit_leader() for _ in range(n))
+        else:
+            for _ in range(n):
+                out.append(load_player(key))
+    return out
+
+
+def make_policy(spec: PolicySpec) -> PlayerPolicy:
+    if callable(spec):
+        return spec()
+    try:
+        return POLICIES[spec]()
+    except KeyError:
+        raise SystemExit(f"❌ Unknown policy '{spec}' (choose from {', '.join(POLICIES)})")
+
+
+def run_encounter(player_t: dict, enemies_t: Sequence[dict], policy: PlayerPolicy,
+                  dice: DiceStream, label: str = "Encounter") -> EncounterResult:
+    """
+    One full run_combat on fresh copies of the templates, rolling on `dice`.
+    Policy randomness comes from dice.spawn("policy"), so replaying recorded
+    decisions with the same dice reproduces the fight exactly.
+    """
+    policy.bind_dice(dice.spawn("policy"))
+    player = thaw(player_t)
+    enemies = [thaw(e) for e in enemies_t]
+    with use_dice(dice):
+        won = game.run_combat(player, enemies, label, policy=policy)
+    return EncounterResult(bool(won), int(player.get("_last_combat_rounds", 0)), int(player.get("current_hp", 0)))
+
+# =============================================================================
+# Throughput mode
+# =============================================================================
+
+_TEMPLATES: Dict[Tuple[str, str], Tuple[dict, List[dict]]] = {}
+
+
+def _templates(player_key: str, enemy_spec: str) -> Tuple[dict, List[dict]]:
+    """Per-process cache so each worker loads and equips the sheets only once."""
+    key = (player_key, enemy_spec)
+    if key not in _TEMPLATES:
+        _TEMPLATES[key] = (load_player(player_key), load_enemies(enemy_spec))
+    return _TEMPLATES[key]
+
+
+def _run_chunk(args: Tuple[str, str, Any, int, int, int]) -> List[EncounterResult]:
+    player_key, enemy_spec, policy, seed, start, count = args
+    logging.disable(logging.WARNING)
+    with use_bus(quiet_bus()), open(os.devnull, "w", encoding="utf-8") as sink, \
+            contextlib.redirect_stdout(sink):
+        player_t, enemies_t = _templates(player_key, enemy_spec)
+        root = DiceStream(seed)
+        return [
+            run_encounter(player_t, enemies_t, make_policy(policy), root.spawn(i))
+            for i in range(start, start + count)
+        ]
+
+
+def run_encounters(player_key: str, enemy_spec: str, n: int, policy: PolicySpec = "greedy",
+                   seed: int = 0, workers: Optional[int] = 1,
+                   chunk_size: Optional[int] = None) -> List[EncounterResult]:
+    """
+    Run n encounters with console output disabled. Encounter i always rolls on
+    DiceStream(seed).spawn(i) with a fresh policy, so results are identical for
+    any worker count. `policy` must be a POLICIES name or a picklable factory
+    when workers > 1.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    if chunk_size is None:
+        chunk_size = max(1, min(2000, math.ceil(n / (workers * 4))))
+    jobs = [
+        (player_key, enemy_spec, policy, seed, start, min(chunk_size, n - start))
+        for start in range(0, n, chunk_size)
+    ]
+    if workers == 1:
+        chunks = [_run_chunk(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_chunk, jobs))
+    return [r for chunk in chunks for r in chunk]
+
+
+def summarize(results: Sequence[EncounterResult]) -> Dict[str, Any]:
+    n = len(results)
+    wins = sum(1 for r in results if r.won)
+    rounds = sorted(r.rounds for r in results)
+    hp_won = [r.hp_left for r in results if r.won]
+    return {
+        "encounters": n,
+        "win_rate": wins / n if n else 0.0,
+        "win_rate_ci": wilson_interval(wins, n),
+        "rounds": mean_ci(rounds),
+        "rounds_pct": {p: percentile(rounds, p) for p in (10, 50, 90)},
+        "hp_left_on_win": mean_ci(hp_won),
+    }
+
+
+def format_report(name: str, enemy_spec: str, policy: str, stats: Dict[str, Any], elapsed: float) -> str:
+    lo, hi = stats["win_rate_ci"]
+    r_mean, r_lo, r_hi = stats["rounds"]
+    hp, hp_lo, hp_hi = stats["hp_left_on_win"]
+    pct = stats["rounds_pct"]
+    rate = stats["encounters"] / elapsed if elapsed > 0 else float("inf")
+    return "\n".join([
+        f"⚔️ {name} ({policy}) vs {enemy_spec}: {stats['encounters']} encounters in {elapsed:.2f}s "
+        f"({rate:,.0f} encounters/s)",
+        f"🏆 Win rate {stats['win_rate']:.2%} (95% CI {lo:.2%}–{hi:.2%})",
+        f"⏱️ Rounds: mean {r_mean:.2f} (95% CI {r_lo:.2f}–{r_hi:.2f}), "
+        f"p10 {pct[10]:.0f} · p50 {pct[50]:.0f} · p90 {pct[90]:.0f}",
+        f"❤️ HP left on a win: {hp:.1f} (95% CI {hp_lo:.1f}–{hp_hi:.1f})",
+    ])
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+    ap = argparse.ArgumentParser(description="Run adventure_new combat headless with a player policy.")
+    ap.add_argument("player", help="player character, e.g. torvald")
+    ap.add_argument("--enemies", default="bandit:2", help="e.g. bandit:2 or bandit_leader (default bandit:2)")
+    ap.add_argument("--policy", default="greedy", choices=sorted(POLICIES), help="player policy (default greedy)")
+    ap.add_argument("-n", "--encounters", type=int, default=10000, help="encounters in throughput mode")
+    ap.add_argument("-j", "--workers", type=int, default=1, help="worker processes (default 1)")
+    ap.add_argument("--seed", type=int, default=0, help="base seed; results are reproducible per seed")
+    ap.add_argument("--show", action="store_true", help="play one encounter with console narration")
+    ap.add_argument("--record", metavar="JSONL", help="with --show: write the player's decisions here")
+    ap.add_argument("--replay", metavar="JSONL", help="play one encounter from recorded decisions (implies --show)")
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    if args.show or args.replay:
+        player_t, enemies_t = load_player(args.player), load_enemies(args.enemies)
+        policy: PlayerPolicy = ReplayPolicy(args.replay) if args.replay else make_policy(args.policy)
+        if args.record:
+            policy = RecordingPolicy(policy, args.record)
+        result = run_encounter(player_t, enemies_t, policy, DiceStream(args.seed).spawn(0),
+                               label=f"{player_t['name']} vs {args.enemies}")
+        if isinstance(policy, RecordingPolicy):
+            policy.close()
+        print(f"\n📋 {'Victory' if result.won else 'Defeat'} after {result.rounds} rounds, HP left {result.hp_left}")
+        return None
+
+    with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        name = _templates(args.player, args.enemies)[0]["name"]
+    t0 = time.perf_counter()
+    results = run_encounters(args.player, args.enemies, args.encounters, policy=args.policy,
+                             seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - t0
+    stats = summarize(results)
+    print(format_report(name, args.enemies, args.policy, stats, elapsed))
+    return stats
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,14 @@
 # rules/combat_engine.py
 
 import random
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from body_model import BodyHP
+from body_plans import HUMANOID, canonical_zone, plan_for
+from combat_profile import combat_profile
+from stance_table import ATTACK_MOD, DEFENSE_MOD, STANCE_CODES, stance_of
+from dice import DiceStream, get_dice, load_numpy  # NumPy is only needed for the batched API
+from combat_events import AttackMissed, AttackRolled, Defended, WeaponWorn, get_bus
 
 # =============================================================================
 # Safe access / tiny helpers
@@ -35,17 +42,15 @@ def _mod_from_stat(val: Optional[int]) -> int:
     except Exception:
         return 0
 
-_DEFAULT_ZONES: List[str] = [
-    "chest", "stomach",
-    "left upper arm", "right upper arm",
-    "left lower arm", "right lower arm",
-    "left upper leg", "right upper leg",
-    "left lower leg", "right lower leg",
-    "head",
-]
+_DEFAULT_ZONES: List[str] = list(HUMANOID.zones)  # canonical names; random hits are weighted by the plan
+
+# Stance effects come from stance_table (STANCE_CODES order); kept by name for old callers
+_STANCE_ATTACK = dict(zip(STANCE_CODES, ATTACK_MOD))
+_STANCE_DEFENSE = dict(zip(STANCE_CODES, DEFENSE_MOD))
 
-_STANCE_ATTACK = {"OFFENSIVE": +10, "NEUTRAL": 0, "DEFENSIVE": -10}
-_STANCE_DEFENSE = {"OFFENSIVE": -10, "NEUTRAL": 0, "DEFENSIVE": +10}
+# Integer codes for the batched API (index into the tuples below)
+DEFENSE_CODES: Tuple[str, ...] = ("Dodge", "Parry", "Block")
+DEFENSE_DODGE, DEFENSE_PARRY, DEFENSE_BLOCK = 0, 1, 2
 
 # =============================================================================
 # Combat Engine (backward-compatible return shape)
@@ -61,12 +66,14 @@ class CombatEngine:
     This matches your adventure.py which does:
         hit, damage = engine.attack_roll(...)
 
-    The engine prints cinematic logs, tolerates messy inputs, and never raises
+    The engine emits cinematic logs as combat_events (printed by the default
+    console sink), tolerates messy inputs, and never raises
     'too many values to unpack' because damage is always a clean list of pairs.
     """
 
-    def __init__(self, rng: Optional[random.Random] = None) -> None:
-        self.rng = rng or random.Random()
+    def __init__(self, rng: Optional[Union[random.Random, DiceStream]] = None, events: Optional[Any] = None) -> None:
+        self.rng = rng if rng is not None else get_dice()  # default: the session's dice stream
+        self.events = events  # EventBus; None = the process-wide bus (combat_events.get_bus)
         self.last_outcome: Dict[str, Any] = {}
 
     # ----------------- dice / utility -----------------
@@ -111,18 +118,64 @@ class CombatEngine:
         if isinstance(damage_parts, str):
             yield (damage_parts.lower(), 0)
 
-    def _distribute_damage(self, amount: int, attack_type: str, aimed_zone: Optional[str]) -> Dict[str, int]:
-        """Pick target zone(s) and return {zone: amount}."""
+    def _distribute_damage(self, amount: int, attack_type: str, aimed_zone: Optional[str],
+                           defender: Any = None) -> Dict[str, int]:
+        """
+        Pick target zone(s) and return {zone: amount}. Random hits follow the
+        defender's body plan but land only on zones its body_parts has (living
+        ones first), so a humanoid sheet named like a quadruped never gets
+        a "tail" it cannot take damage on.
+        """
         amount = max(0, _safe_int(amount, 0))
         if amount == 0:
             return {}
         if (attack_type or "").lower() == "aimed" and aimed_zone:
-            return {str(aimed_zone).lower(): amount}
-        zone = self.rng.choice(_DEFAULT_ZONES)
-        return {zone: amount}
+            return {canonical_zone(aimed_zone): amount}
+        plan = plan_for(defender) if defender is not None else HUMANOID
+        parts = _get(defender, "body_parts", None) if defender is not None else None
+        if hasattr(parts, "items") and len(parts):
+            if isinstance(parts, BodyHP):
+                living = parts.living() or list(parts)
+            else:
+                living = [z for z, hp in parts.items() if _safe_int(hp, 0) > 0] or list(parts)
+            return {plan.pick(self.rng, living, 1)[0]: amount}
+        return {plan.draw(self.rng): amount}
 
     # ----------------- main API -----------------
 
+    def attack_modifiers(
+        self,
+        attacker: Any,
+        defender: Any,
+        chosen_stance: str = "NEUTRAL",
+        ambush_bonus: int = 0,
+        roll_penalty: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Everything attack_roll adds to its two d100s (no dice rolled):
+        attack_mod / defense_mod totals plus the parts they are built from.
+        hit_tables turns attack_mod - defense_mod into exact odds.
+        """
+        s = stance_of(chosen_stance)
+
+        # Dex (or a flat dexterity_modifier), the weapon-skill scan and the
+        # Block > Parry > Dodge choice are compiled once per combatant
+        att = combat_profile(attacker)
+        dfd = combat_profile(defender)
+        dex_mod, weapon_skill = att.engine_dex_mod, att.weapon_skill
+        defense_kind, def_mod = dfd.defense_kind, dfd.defense_mod
+
+        return {
+            "stance": s.code,
+            "attack_mod": (dex_mod + weapon_skill + ATTACK_MOD[s]
+                           + _safe_int(ambush_bonus, 0) - _safe_int(roll_penalty, 0)),
+            "defense_mod": def_mod + DEFENSE_MOD[s],
+            "dex_mod": dex_mod,
+            "weapon_skill": weapon_skill,
+            "defense_kind": defense_kind,
+            "def_mod": def_mod,
+        }
+
     def attack_roll(
         self,
         attacker: Any,
@@ -146,78 +199,36 @@ class CombatEngine:
 
         We DO NOT modify defender HP here; your game handles armor/HP/death.
         """
-        # Normalize stance
-        stance = (chosen_stance or "NEUTRAL").upper()
-        if stance not in _STANCE_ATTACK:
-            stance = "NEUTRAL"
+        mods = self.attack_modifiers(attacker, defender, chosen_stance, ambush_bonus, roll_penalty)
+        stance = mods["stance"]
+        weapon_skill = mods["weapon_skill"]
+        defense_kind = mods["defense_kind"]
+        def_mod = mods["def_mod"]
 
         attacker_name = _get(attacker, "name", "Attacker")
         defender_name = _get(defender, "name", "Defender")
 
-        # --- Attack roll calc ---
         atk_roll = self._d100()
-        atk_mod = 0
-
-        # Dex as primary for to-hit; allow dexterity_modifier too
-        dex = _get(attacker, "dexterity", None)
-        if dex is None:
-            dex = _get(attacker, "dexterity_modifier", None)
-            if dex is not None:
-                atk_mod += _safe_int(dex, 0)
-                dex = None
-        if dex is not None:
-            atk_mod += _mod_from_stat(dex)
-
-        # weapon skill (if provided)
-        weapon_skill = 0
-        skills = _get(attacker, "skills", {}) or {}
-        if isinstance(skills, dict):
-            for k in ("swordsmanship", "club_smash", "weapon_skill"):
-                if k in skills:
-                    try:
-                        weapon_skill = int(skills[k])
-                        break
-                    except Exception:
-                        pass
-
-        atk_total = (
-            atk_roll
-            + atk_mod
-            + weapon_skill
-            + _STANCE_ATTACK[stance]
-            + _safe_int(ambush_bonus, 0)
-            - _safe_int(roll_penalty, 0)
-        )
-
-        # --- Defense roll calc ---
-        defense_kind = self._choose_defense_type(defender)
+        atk_total = atk_roll + mods["attack_mod"]
         def_roll = self._d100()
-        def_mod = 0
-        if defense_kind == "Dodge":
-            def_mod += _mod_from_stat(_get(defender, "agility", _get(defender, "dexterity", None)))
-        elif defense_kind == "Parry":
-            def_mod += _mod_from_stat(_get(defender, "dexterity", _get(defender, "agility", None)))
-        else:  # Block
-            def_mod += _mod_from_stat(_get(defender, "toughness", _get(defender, "strength", None)))
-
-        def_total = def_roll + def_mod + _STANCE_DEFENSE[stance]
-
-        # --- Cinematic logs (keep your style) ---
-        print(f"⚔️ {attacker_name} is in {stance} stance")
-        print(f"🛡️ {defender_name} is in NEUTRAL stance")  # defender stance unknown; display neutral
-        print(
-            f"⚔️ {attacker_name} rolls {atk_roll} + {weapon_skill} (Weapon Skill) + "
-            f"{_mod_from_stat(_get(attacker,'dexterity',None))} (Dexterity) - 0 (Stress) - 0 (Pain) + "
-            f"{int(_safe_int(ambush_bonus,0))} (Ambush) = {atk_total} to attack!"
-        )
-        print(
-            f"🛡️ {defender_name} rolls {def_roll} + {def_mod} (Stat) - 0 (Stress) - 0 (Pain) = "
-            f"{def_total} to defend! ({defense_kind})"
-        )
+        def_total = def_roll + mods["defense_mod"]
+
+        # --- Cinematic logs (rendered only if a sink wants text) ---
+        bus = self.events or get_bus()
+        if bus.active:
+            # defender stance unknown; display neutral
+            bus.emit(AttackRolled(
+                attacker_name, defender_name, stance, atk_roll, atk_total,
+                weapon_skill=weapon_skill,
+                dex_mod=_mod_from_stat(_get(attacker, "dexterity", None)),
+                ambush=_safe_int(ambush_bonus, 0),
+            ))
+            bus.emit(Defended(defender_name, def_roll, def_total, stat_mod=def_mod, kind=defense_kind))
 
         # --- Miss -> (False, []) and we're done ---
         if atk_total <= def_total:
-            print(f"❌ {attacker_name} misses or {defender_name} successfully defends!")
+            if bus.active:
+                bus.emit(AttackMissed(attacker_name, defender_name))
             self.last_outcome = {
                 "hit": False,
                 "attack_total": atk_total,
@@ -228,7 +239,7 @@ class CombatEngine:
             return False, []
 
         # --- Hit! Distribute damage but DON'T touch HP here ---
-        dmg_map = self._distribute_damage(weapon_damage, attack_type, aimed_zone)
+        dmg_map = self._distribute_damage(weapon_damage, attack_type, aimed_zone, defender)
         damage_list: List[Tuple[str, int]] = [(str(part), _safe_int(dmg, 0)) for part, dmg in dmg_map.items()]
 
         # Optional: chip weapon durability if present
@@ -237,8 +248,9 @@ class CombatEngine:
             try:
                 chip = self.rng.randint(1, 3)
                 weapon["durability"] = max(0, _safe_int(weapon["durability"], 0) - chip)
-                wname = weapon.get("type", "weapon")
-                print(f"⚔️ {attacker_name}'s {str(wname).capitalize()} durability: {weapon['durability']}")
+                if bus.active:
+                    wname = weapon.get("type", "weapon")
+                    bus.emit(WeaponWorn(attacker_name, str(wname).capitalize(), weapon["durability"]))
             except Exception:
                 pass
 
@@ -257,3 +269,127 @@ class CombatEngine:
         }
 
         return True, damage_list
+
+    # ----------------- batched API -----------------
+
+    def _np_rng(self):
+        """NumPy generator seeded from self.rng, so a seeded engine stays reproducible."""
+        if getattr(self, "_np_gen", None) is None:
+            self._np_gen = load_numpy().random.default_rng(self.rng.getrandbits(64))
+        return self._np_gen
+
+    def attack_roll_batch(
+        self,
+        attacker_dex,
+        defender_dex,
+        defender_agility,
+        defender_toughness,
+        weapon_skill=0,
+        stance=1,
+        defense_kind=DEFENSE_DODGE,
+        ambush_bonus=0,
+        roll_penalty=0,
+        weapon_damage=0,
+        aimed_zone=-1,
+        dex_is_modifier=False,
+    ) -> Dict[str, Any]:
+        """
+        Resolve many attacks in one vectorised call. Same rules as attack_roll:
+
+            attack  = d100 + dex//10 + weapon_skill + _STANCE_ATTACK + ambush - penalty
+            defense = d100 + stat//10 + _STANCE_DEFENSE   (stat picked by defense_kind)
+            hit     = attack > defense
+
+        Every argument is an array (or a scalar broadcast to the batch):
+          - stance:        codes into STANCE_CODES (0 OFFENSIVE, 1 NEUTRAL, 2 DEFENSIVE)
+          - defense_kind:  codes into DEFENSE_CODES (0 Dodge→agility, 1 Parry→dex, 2 Block→toughness)
+          - aimed_zone:    index into _DEFAULT_ZONES for aimed attacks, -1 for a random zone
+          - dex_is_modifier: per-attacker flag; True means attacker_dex already is a
+                           flat modifier (the `dexterity_modifier` path of attack_roll)
+
+        Use batch_vectors() to build these arrays from entities with attack_roll's
+        exact fallbacks. Returns a dict of arrays:
+            hit, atk_roll, def_roll, attack_total, defense_total,
+            zone (index into _DEFAULT_ZONES, -1 when no damage lands), damage
+        No logging, no HP changes.
+        """
+        np = load_numpy()
+        if np is None:
+            raise ImportError("attack_roll_batch requires NumPy (pip install numpy)")
+
+        arrays = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.int64) for a in (
+                attacker_dex, defender_dex, defender_agility, defender_toughness, weapon_skill,
+                stance, defense_kind, ambush_bonus, roll_penalty, weapon_damage, aimed_zone,
+                dex_is_modifier,
+            ))
+        )
+        (a_dex, d_dex, d_agi, d_tough, w_skill, stance_c, def_kind,
+         ambush, penalty, w_dmg, aimed, dex_flat) = arrays
+        shape = a_dex.shape
+        gen = self._np_rng()
+
+        stance_c = np.where((stance_c >= 0) & (stance_c < len(STANCE_CODES)), stance_c, 1)
+        stance_atk = np.array(ATTACK_MOD, dtype=np.int64)
+        stance_def = np.array(DEFENSE_MOD, dtype=np.int64)
+
+        atk_roll = gen.integers(1, 101, size=shape)
+        def_roll = gen.integers(1, 101, size=shape)
+
+        atk_mod = np.where(dex_flat != 0, a_dex, a_dex // 10)
+        attack_total = atk_roll + atk_mod + w_skill + stance_atk[stance_c] + ambush - penalty
+
+        def_stat = np.select(
+            [def_kind == DEFENSE_BLOCK, def_kind == DEFENSE_PARRY],
+            [d_tough, d_dex],
+            default=d_agi,
+        )
+        defense_total = def_roll + def_stat // 10 + stance_def[stance_c]
+
+        hit = attack_total > defense_total
+        damage = np.where(hit, np.maximum(w_dmg, 0), 0)
+        lands = damage > 0
+        random_zone = HUMANOID.table.batch(shape, gen)
+        zone = np.where(aimed >= 0, aimed, random_zone)
+        zone = np.where(lands, zone, -1)
+
+        return {
+            "hit": hit,
+            "atk_roll": atk_roll,
+            "def_roll": def_roll,
+            "attack_total": attack_total,
+            "defense_total": defense_total,
+            "zone": zone,
+            "damage": damage,
+        }
+
+
+def batch_vectors(
+    attackers: Sequence[Any],
+    defenders: Sequence[Any],
+    stances: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Extract attack_roll_batch() keyword arrays from entity pairs (dicts or objects),
+    read from the same compiled combat_profile() attack_roll uses. The attacker's
+    dex goes in as the profile's flat modifier (dex_is_modifier = 1); the
+    defender's chosen defence stat goes in as defense_mod * 10 in all three stat
+    columns, so the batch's // 10 gives back exactly the profile's modifier.
+    """
+    np = load_numpy()
+    if np is None:
+        raise ImportError("batch_vectors requires NumPy (pip install numpy)")
+    cols: Dict[str, List[int]] = {k: [] for k in (
+        "attacker_dex", "dex_is_modifier", "weapon_skill", "defender_dex",
+        "defender_agility", "defender_toughness", "defense_kind", "stance",
+    )}
+    for i, (att, dfd) in enumerate(zip(attackers, defenders)):
+        a, d = combat_profile(att), combat_profile(dfd)
+        cols["attacker_dex"].append(a.engine_dex_mod)
+        cols["dex_is_modifier"].append(1)
+        cols["weapon_skill"].append(a.weapon_skill)
+        cols["defense_kind"].append(DEFENSE_CODES.index(d.defense_kind))
+        for k in ("defender_dex", "defender_agility", "defender_toughness"):
+            cols[k].append(d.defense_mod * 10)
+        cols["stance"].append(int(stance_of(stances[i] if stances is not None else None)))
+    return {k: np.asarray(v, dtype=np.int64) for k, v in cols.items()}
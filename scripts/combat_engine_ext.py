@@ -6,16 +6,19 @@ PLUS a safe wrapper that re-exports CombatEngine/load_rules from combat_engine.p
 """
 
 from __future__ import annotations
-import logging, json, os
+import logging, os
 from typing import Any, Dict
 
+from rules_repository import get_rules
+from stance_table import stance_of
+
 log = logging.getLogger(__name__)
 
 # -------------------------
 # small utils
 # -------------------------
 def _stance_key(stance):
-    return (stance or "neutral").lower()
+    return stance_of(stance).key
 
 def _get(dic, path, default=None):
     cur = dic
@@ -167,8 +170,7 @@ def _fallback_load_rules(path_or_dict: Any) -> Dict[str, Any]:
     if not isinstance(path_or_dict, str):
         raise TypeError("load_rules(path_or_dict): expected file path (str) or dict of rules")
     path = os.path.normpath(path_or_dict)
-    with open(path, "r", encoding="utf-8") as f:
-        rules = json.load(f)
+    rules = get_rules().mutable(os.path.abspath(path))  # private copy: setdefault() below writes into it
     # optional: ensure some sections exist so _get has something to traverse
     rules.setdefault("stamina_regeneration", {"base": 0})
     rules.setdefault("stance_synergies", {})
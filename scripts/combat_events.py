@@ -0,0 +1,342 @@
+# file: scripts/combat_events.py
+"""
+Typed combat event stream with pluggable sinks.
+
+Emitters build small event records instead of f-strings and hand them to the
+active EventBus. Text is only rendered when a sink asks for it:
+
+    NullSink        – drops everything; bus.active is False so emitters skip
+                      even building the event (use for batch runs)
+    RingBufferSink  – keeps the last N event objects in memory
+    JsonlSink       – one JSON object per line (no text rendering)
+    ConsoleSink     – the cinematic console output (the default)
+
+Emitters follow one pattern so disabled output costs a single attribute check:
+
+    bus = get_bus()
+    if bus.active:
+        bus.emit(AttackRolled(...))
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Union
+
+from zones import zone_label
+
+# =============================================================================
+# Events
+# =============================================================================
+
+@dataclass(frozen=True, slots=True)
+class CombatEvent:
+    def render(self) -> str:
+        return ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d["type"] = type(self).__name__
+        return d
+
+
+@dataclass(frozen=True, slots=True)
+class AttackRolled(CombatEvent):
+    """Attack roll. weapon_skill/dex_mod/ambush are set by CombatEngine's detailed breakdown."""
+    attacker: str
+    defender: str
+    stance: str
+    roll: int
+    total: int
+    defender_stance: str = "NEUTRAL"
+    weapon_skill: Optional[int] = None
+    dex_mod: Optional[int] = None
+    ambush: Optional[int] = None
+    status_pen: int = 0
+
+    def render(self) -> str:
+        lines = [
+            f"⚔️ {self.attacker} is in {self.stance} stance",
+            f"🛡️ {self.defender} is in {self.defender_stance} stance",
+        ]
+        if self.weapon_skill is None:
+            line = f"⚔️ {self.attacker} rolls {self.roll} ➜ {self.total} to attack!"
+            if self.status_pen:
+                line += f" (−{abs(self.status_pen)} from fog/fear/aura)"
+        else:
+            line = (
+                f"⚔️ {self.attacker} rolls {self.roll} + {self.weapon_skill} (Weapon Skill) + "
+                f"{self.dex_mod} (Dexterity) - 0 (Stress) - 0 (Pain) + "
+                f"{self.ambush} (Ambush) = {self.total} to attack!"
+            )
+        lines.append(line)
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True, slots=True)
+class Defended(CombatEvent):
+    """Defence roll. stat_mod/kind are set by CombatEngine's detailed breakdown."""
+    defender: str
+    roll: int
+    total: int
+    stat_mod: Optional[int] = None
+    kind: Optional[str] = None
+
+    def render(self) -> str:
+        if self.stat_mod is None:
+            return f"🛡️ {self.defender} rolls {self.roll} ➜ {self.total} to defend!"
+        return (
+            f"🛡️ {self.defender} rolls {self.roll} + {self.stat_mod} (Stat) - 0 (Stress) - 0 (Pain) = "
+            f"{self.total} to defend! ({self.kind})"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AttackMissed(CombatEvent):
+    attacker: str
+    defender: str
+    by_enemy: Optional[bool] = None  # adventure wording; None = engine wording
+
+    def render(self) -> str:
+        if self.by_enemy is None:
+            return f"❌ {self.attacker} misses or {self.defender} successfully defends!"
+        return "❌ Enemy attack misses or is defended!" if self.by_enemy else "❌ Attack misses or is defended!"
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneHit(CombatEvent):
+    target: str
+    damage: int
+    zone: Optional[str] = None
+    hp_after: Optional[int] = None
+    hp_total: Optional[int] = None
+    crit: bool = False
+    damage_type: Optional[str] = None
+
+    def render(self) -> str:
+        crit_tag = " (CRIT!)" if self.crit else ""
+        where = f" to {self.zone}" if self.zone else ""
+        if self.hp_after is None:
+            kind = f" {self.damage_type}" if self.damage_type else ""
+            return f"💥 {self.target} takes {self.damage}{kind} damage{where}!{crit_tag}"
+        return f"💥 {self.target} takes {self.damage} damage{where}! ➜ HP: {self.hp_after}/{self.hp_total}{crit_tag}"
+
+
+@dataclass(frozen=True, slots=True)
+class ArmorAbsorbed(CombatEvent):
+    """armor=None is the adventure's generic coverage check (no per-piece stats)."""
+    zone: str
+    armor: Optional[str] = None
+    absorbed: int = 0
+    damage_type: Optional[str] = None
+    durability: Optional[int] = None
+    durability_max: Optional[int] = None
+    broken: bool = False
+
+    def render(self) -> str:
+        zone = zone_label(self.zone)
+        if self.armor is None:
+            return f"🛡️ Armor absorbs part of the blow to {self.zone}!"
+        if self.broken:
+            return f"⚠️ {self.armor} at {zone} is broken and offers no protection!"
+        return (
+            f"🛡️ {self.armor} ({zone}) absorbed {self.absorbed} "
+            f"({self.damage_type}). Durability: {self.durability}/{self.durability_max}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LimbCrippled(CombatEvent):
+    unit: str
+    part: str
+    pain_penalty: int
+    stress_level: int
+    mobility_penalty: Optional[int] = None  # set when a leg went down
+    weapon_skill_loss: bool = False         # set when an arm went down
+
+    def render(self) -> str:
+        part = zone_label(self.part)
+        lines = []
+        if self.mobility_penalty is not None:
+            lines.append(f"⚠️ {self.unit}'s {part} is crippled!")
+            lines.append(f"⛔ {self.unit}'s mobility reduced by {self.mobility_penalty}% due to crippled legs!")
+        if self.weapon_skill_loss:
+            lines.append(f"⚠️ {self.unit}'s {part} crippled—weapon skill reduced by 50%!")
+        lines.append(f"😖 {self.unit} suffers pain penalties! Total penalty: {self.pain_penalty}%")
+        lines.append(f"🧠 {self.unit}'s stress level rises to {self.stress_level}%")
+        return "\n".join(lines)
+
+
+_FELL_TEXT = {
+    "died": "💀 {unit} has died!",
+    "fallen": "💀 {unit} has fallen!",
+    "blood_loss": "💀 {unit} collapses from massive blood loss and falls unconscious!",
+    "injuries": "💀 {unit} collapses from severe injuries!",
+    "pain": "💀 {unit} collapses from overwhelming pain!",
+    "broken": "💔 {unit} breaks from the wound!",
+    "bleed_out": "💀 {unit} bleeds out!",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class UnitFell(CombatEvent):
+    unit: str
+    cause: str = "fallen"
+    zone: Optional[str] = None
+    crit: bool = False
+
+    def render(self) -> str:
+        if self.cause == "struck":
+            where = f" (hit to {self.zone})" if self.zone else ""
+            return f"🏴 {self.unit} falls!{where}{' (CRIT!)' if self.crit else ''}"
+        return _FELL_TEXT.get(self.cause, "💀 {unit} falls!").format(unit=self.unit)
+
+
+@dataclass(frozen=True, slots=True)
+class WeaponWorn(CombatEvent):
+    unit: str
+    weapon: str
+    durability: int
+
+    def render(self) -> str:
+        return f"⚔️ {self.unit}'s {self.weapon} durability: {self.durability}"
+
+
+@dataclass(frozen=True, slots=True)
+class Narration(CombatEvent):
+    """Free-form log line (round logs, banners, rule messages)."""
+    text: str
+
+    def render(self) -> str:
+        return self.text
+
+# =============================================================================
+# Sinks
+# =============================================================================
+
+class NullSink:
+    active = False
+
+    def handle(self, event: CombatEvent) -> None:
+        pass
+
+
+class RingBufferSink:
+    """Keeps the last `maxlen` events as objects; render on demand with text()."""
+    active = True
+
+    def __init__(self, maxlen: int = 1000):
+        self.buffer: Deque[CombatEvent] = deque(maxlen=maxlen)
+
+    def handle(self, event: CombatEvent) -> None:
+        self.buffer.append(event)
+
+    def events(self) -> List[CombatEvent]:
+        return list(self.buffer)
+
+    def text(self) -> str:
+        return "\n".join(e.render() for e in self.buffer)
+
+    def clear(self) -> None:
+        self.buffer.clear()
+
+
+class JsonlSink:
+    """Writes one JSON object per event; pass include_text=True to also store the rendered line."""
+    active = True
+
+    def __init__(self, target: Union[str, IO[str]], include_text: bool = False):
+        self._owns = isinstance(target, str)
+        self.fh: IO[str] = open(target, "a", encoding="utf-8") if isinstance(target, str) else target
+        self.include_text = include_text
+
+    def handle(self, event: CombatEvent) -> None:
+        d = event.to_dict()
+        if self.include_text:
+            d["text"] = event.render()
+        self.fh.write(json.dumps(d, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        if self._owns:
+            self.fh.close()
+
+
+class ConsoleSink:
+    """The cinematic console renderer (what the game always printed)."""
+    active = True
+
+    def handle(self, event: CombatEvent) -> None:
+        print(event.render())
+
+# =============================================================================
+# Bus
+# =============================================================================
+
+class EventBus:
+    def __init__(self, sinks: Optional[List[Any]] = None):
+        self.sinks: List[Any] = []
+        self.sinks_live: List[Any] = []
+        self.active = False
+        for s in sinks or []:
+            self.add_sink(s)
+
+    def _refresh(self) -> None:
+        self.sinks_live = [s for s in self.sinks if s.active]
+        self.active = bool(self.sinks_live)
+
+    def add_sink(self, sink: Any) -> None:
+        self.sinks.append(sink)
+        self._refresh()
+
+    def remove_sink(self, sink: Any) -> None:
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+        self._refresh()
+
+    def emit(self, event: CombatEvent) -> None:
+        for s in self.sinks_live:
+            s.handle(event)
+
+    def narrate(self, text: str, *args: Any) -> None:
+        """Emit a Narration; `text` is only .format()-ed with args when the bus is active."""
+        if self.active:
+            self.emit(Narration(text.format(*args) if args else text))
+
+
+_bus = EventBus([ConsoleSink()])
+
+
+def get_bus() -> EventBus:
+    return _bus
+
+
+def set_bus(bus: EventBus) -> EventBus:
+    """Install `bus` process-wide; returns the previous bus."""
+    global _bus
+    prev, _bus = _bus, bus
+    return prev
+
+
+@contextlib.contextmanager
+def use_bus(bus: EventBus) -> Iterator[EventBus]:
+    prev = set_bus(bus)
+    try:
+        yield bus
+    finally:
+        set_bus(prev)
+
+
+def quiet_bus() -> EventBus:
+    """A bus with only a NullSink (bus.active is False)."""
+    return EventBus([NullSink()])
+
+
+__all__ = [
+    "CombatEvent", "AttackRolled", "Defended", "AttackMissed", "ZoneHit", "ArmorAbsorbed",
+    "LimbCrippled", "UnitFell", "WeaponWorn", "Narration",
+    "NullSink", "RingBufferSink", "JsonlSink", "ConsoleSink",
+    "EventBus", "get_bus", "set_bus", "use_bus", "quiet_bus",
+]
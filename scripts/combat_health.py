@@ -1,172 +1,273 @@
 # file: scripts/combat_health.py
-import random
 import logging
+import re
+from bisect import bisect_left
+from typing import NamedTuple, Optional, Tuple
+
+from body_model import BodyHP
+from body_plans import plan_for
+from dice import get_dice
 from damage_consequences import DamageConsequences
+from combat_events import UnitFell, get_bus
+from rules_repository import FrozenDict
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def _fell(character, cause):
+    bus = get_bus()
+    if bus.active:
+        bus.emit(UnitFell(character.name, cause))
+
+# =============================================================================
+# Critical wound tables (shared, read-only)
+# =============================================================================
+#
+# d100 + overflow picks one of five bands per body group and damage type:
+# 1-20, 21-40, 41-60, 61-80, 81-100. Each band is (text, flags): the flags
+# (bleeding / severed / fatal / collapse) are spelled out per band rather
+# than guessed from the wording ("Tendon severed" severs nothing, "Gutted,
+# death" is fatal); stat penalties are still read from the "-N% stat" parts.
+
+WOUND_BANDS = (20, 40, 60, 80)  # inclusive upper roll of bands 0-3; band 4 is the rest
+
+_WOUND_TEXT = {
+    'arm': {
+        'blunt': (
+            ("Bone bruised, arm numb, -10% dexterity",                          ""),
+            ("Compound fracture, bleeding starts, -15% weapon_skill",           "bleeding"),
+            ("Bone shattered, arm useless, -20% dexterity, heavy bleeding",     "bleeding"),
+            ("Arm crushed, severe pain, -25% all rolls, shock",                 ""),
+            ("Arm pulverized, severed, massive blood loss, collapse likely",    "bleeding severed collapse"),
+        ),
+        'slashing': (
+            ("Shallow cut, minor bleeding, -5% weapon_skill",                   "bleeding"),
+            ("Deep gash, bleeding heavily, -10% dexterity",                     "bleeding"),
+            ("Muscle slashed, arm weakened, -15% strength",                     ""),
+            ("Artery cut, rapid blood loss, -20% all rolls",                    "bleeding"),
+            ("Arm severed, shock and trauma, instant collapse",                 "bleeding severed collapse"),
+        ),
+        'piercing': (
+            ("Puncture wound, light bleeding, -5% dexterity",                   "bleeding"),
+            ("Deep stab, internal damage, -10% stamina regen",                  ""),
+            ("Tendon pierced, arm stiff, -15% weapon_skill",                    ""),
+            ("Artery punctured, heavy bleeding, -20% all rolls",                "bleeding"),
+            ("Vital hit, arm disabled, severe shock",                           ""),
+        ),
+    },
+    'leg': {
+        'blunt': (
+            ("Leg bruised, limp, -10% mobility",                                ""),
+            ("Knee cracked, slowed movement, -15% agility",                     ""),
+            ("Bone fractured, hobbling, -20% dodge",                            ""),
+            ("Leg crushed, can't stand, -25% all movement",                     ""),
+            ("Leg shattered, severed, collapse from pain",                      "severed collapse"),
+        ),
+        'slashing': (
+            ("Cut on leg, minor bleed, -5% mobility",                           "bleeding"),
+            ("Hamstring slashed, slowed, -10% agility",                         ""),
+            ("Deep laceration, bleeding, -15% dodge",                           "bleeding"),
+            ("Tendon severed, leg useless, -20% movement",                      ""),
+            ("Leg amputated, massive trauma, shock",                            "bleeding severed"),
+        ),
+        'piercing': (
+            ("Stab in leg, light bleed, -5% agility",                           "bleeding"),
+            ("Muscle pierced, limp, -10% mobility",                             ""),
+            ("Bone hit, fracture, -15% dodge",                                  ""),
+            ("Artery nicked, heavy bleed, -20% all rolls",                      "bleeding"),
+            ("Vital pierce, leg disabled, collapse",                            "collapse"),
+        ),
+    },
+    'head': {
+        'blunt': (
+            ("Concussion, dazed, -10% all rolls",                               ""),
+            ("Skull cracked, headache, -15% perception",                        ""),
+            ("Brain trauma, disoriented, -20% intelligence",                    ""),
+            ("Severe concussion, vomiting, -25% willpower",                     ""),
+            ("Skull crushed, instant death",                                    "fatal"),
+        ),
+        'slashing': (
+            ("Scalp cut, bleeding, -5% perception",                             "bleeding"),
+            ("Ear sliced, disoriented, -10% hearing",                           ""),
+            ("Face gashed, blinded one eye, -15% accuracy",                     ""),
+            ("Throat nicked, choking, -20% breathing",                          ""),
+            ("Decapitation, immediate death",                                   "severed fatal"),
+        ),
+        'piercing': (
+            ("Puncture to head, stun, -5% all rolls",                           ""),
+            ("Eye pierced, partial blind, -10% perception",                     ""),
+            ("Brain stab, confused, -15% intelligence",                         ""),
+            ("Vital hit, coma, -20% willpower",                                 ""),
+            ("Fatal pierce, death",                                             "fatal"),
+        ),
+    },
+    'throat': {
+        'blunt': (
+            ("Throat bruised, hoarse, -10% charisma",                           ""),
+            ("Windpipe crushed, gasping, -15% stamina",                         ""),
+            ("Neck broken, paralyzed, -20% all rolls",                          ""),
+            ("Severe trauma, choking, collapse",                                "collapse"),
+            ("Instant kill from crushed throat",                                "fatal"),
+        ),
+        'slashing': (
+            ("Throat nicked, bleeding, -5% breathing",                          "bleeding"),
+            ("Jugular cut, heavy bleed, -10% stamina",                          "bleeding"),
+            ("Windpipe slashed, suffocating, -15% all rolls",                   ""),
+            ("Throat severed, gurgling death",                                  "bleeding severed fatal"),
+            ("Decapitation-level slash, instant death",                         "fatal"),
+        ),
+        'piercing': (
+            ("Throat punctured, cough, -5% charisma",                           ""),
+            ("Artery pierced, bleed out, -10% stamina",                         "bleeding"),
+            ("Vital stab, choking blood, -15% all rolls",                       "bleeding"),
+            ("Fatal pierce, quick death",                                       "fatal"),
+            ("Instant kill from throat impale",                                 "fatal"),
+        ),
+    },
+    'groin': {
+        'blunt': (
+            ("Groin bruised, pained, -10% mobility",                            ""),
+            ("Vital hit, nauseous, -15% strength",                              ""),
+            ("Crushed, agony, -20% all rolls",                                  ""),
+            ("Severe trauma, shock, collapse",                                  "collapse"),
+            ("Ruptured, fatal internal damage",                                 "fatal"),
+        ),
+        'slashing': (
+            ("Groin cut, bleeding, -5% mobility",                               "bleeding"),
+            ("Deep gash, pain surge, -10% agility",                             ""),
+            ("Severed, massive bleed, -15% all rolls",                          "bleeding severed"),
+            ("Castration, shock, collapse",                                     "severed collapse"),
+            ("Fatal slash, quick death",                                        "fatal"),
+        ),
+        'piercing': (
+            ("Puncture, sting, -5% mobility",                                   ""),
+            ("Deep stab, internal bleed, -10% stamina",                         "bleeding"),
+            ("Vital pierce, agony, -15% all rolls",                             ""),
+            ("Rupture, shock, collapse",                                        "collapse"),
+            ("Instant kill from vital hit",                                     "fatal"),
+        ),
+    },
+    'chest': {
+        'blunt': (
+            ("Ribs bruised, winded, -10% stamina",                              ""),
+            ("Ribs cracked, pained breath, -15% endurance",                     ""),
+            ("Sternum fractured, internal hurt, -20% toughness",                ""),
+            ("Heart bruised, arrhythmia, collapse",                             "collapse"),
+            ("Chest caved in, fatal",                                           "fatal"),
+        ),
+        'slashing': (
+            ("Chest cut, bleed, -5% stamina",                                   "bleeding"),
+            ("Ribs slashed, deep wound, -10% endurance",                        "bleeding"),
+            ("Lung nicked, coughing blood, -15% toughness",                     "bleeding"),
+            ("Heart slashed, bleed out",                                        "bleeding fatal"),
+            ("Chest opened, instant death",                                     "fatal"),
+        ),
+        'piercing': (
+            ("Chest puncture, sting, -5% stamina",                              ""),
+            ("Rib pierced, pain, -10% endurance",                               ""),
+            ("Lung stabbed, breath short, -15% toughness",                      ""),
+            ("Heart hit, quick death",                                          "fatal"),
+            ("Vital pierce, immediate end",                                     "fatal"),
+        ),
+    },
+    'stomach': {
+        'blunt': (
+            ("Gut punch, winded, -10% endurance",                               ""),
+            ("Organs bruised, nauseous, -15% toughness",                        ""),
+            ("Internal bleed, pain, -20% stamina",                              "bleeding"),
+            ("Rupture, shock, collapse",                                        "collapse"),
+            ("Fatal internal damage",                                           "fatal"),
+        ),
+        'slashing': (
+            ("Abdomen cut, bleed, -5% endurance",                               "bleeding"),
+            ("Gut slashed, spilling, -10% toughness",                           ""),
+            ("Organs exposed, infection risk, -15% stamina",                    ""),
+            ("Eviscerated, bleed out",                                          "bleeding fatal"),
+            ("Gutted, death",                                                   "fatal"),
+        ),
+        'piercing': (
+            ("Stab in gut, pain, -5% endurance",                                ""),
+            ("Organ puncture, bleed, -10% toughness",                           "bleeding"),
+            ("Deep wound, sepsis, -15% stamina",                                ""),
+            ("Vital stab, quick death",                                         "fatal"),
+            ("Fatal pierce",                                                    "fatal"),
+        ),
+    },
+}
+
+_PENALTY = re.compile(r"-(\d+)% ([a-z_ ]+?)\s*(?:,|$)")
+
+
+class WoundEffect(NamedTuple):
+    text: str
+    band: int
+    penalties: Tuple[Tuple[str, int], ...]   # (stat, percent), e.g. ("dexterity", 10)
+    bleeding: bool
+    severed: bool
+    fatal: bool
+    collapse: bool
+
+    def __str__(self):
+        return self.text
+
+    @classmethod
+    def parse(cls, text, band, flags=""):
+        """Build a band from its text and space-separated flags, e.g. "bleeding severed"."""
+        tags = set(flags.split())
+        unknown = tags - {"bleeding", "severed", "fatal", "collapse"}
+        if unknown:
+            raise ValueError(f"unknown wound flags {sorted(unknown)} for {text!r}")
+        penalties = tuple((stat.replace(" ", "_"), int(pct)) for pct, stat in _PENALTY.findall(text.lower()))
+        return cls(text, band, penalties, "bleeding" in tags, "severed" in tags, "fatal" in tags, "collapse" in tags)
+
+
+CRITICAL_WOUND_TABLES = FrozenDict({
+    group: FrozenDict({
+        damage_type: tuple(WoundEffect.parse(text, band, flags) for band, (text, flags) in enumerate(bands))
+        for damage_type, bands in types.items()
+    })
+    for group, types in _WOUND_TEXT.items()
+})
+del _WOUND_TEXT
+
+
+def wound_group(zone):
+    """Body group of a zone: left_upper_arm → arm, right_lower_leg → leg, chest → chest."""
+    return 'arm' if 'arm' in zone else 'leg' if 'leg' in zone else zone
+
+
+def wound_bands(zone, damage_type) -> Tuple[WoundEffect, ...]:
+    """The five bands for a zone and damage type (empty if there is no table)."""
+    return CRITICAL_WOUND_TABLES.get(wound_group(zone), {}).get(damage_type, ())
+
+
+def critical_wound(zone, damage_type, roll) -> Optional[WoundEffect]:
+    """Wound for a (d100 + overflow) roll, or None if the zone/type has no table."""
+    bands = wound_bands(zone, damage_type)
+    return bands[bisect_left(WOUND_BANDS, roll)] if bands else None
+
+
 class CombatHealthManager:
+    critical_wound_tables = CRITICAL_WOUND_TABLES  # shared, read-only
+    consequences = DamageConsequences()            # stateless; one for every manager
+
     def __init__(self, character):
         self.character = character
-        self.health = {part: hp for part, hp in character.body_parts.items()}
-        self.initial_health = self.health.copy()
-        self.total_hp = sum(self.health.values())
+        self.health = BodyHP.from_mapping(character.body_parts)  # own copy; max = starting HP
+        self.initial_health = self.health.maxima
+        self.total_hp = self.health.total
         self.starting_hp = self.total_hp
         self.bleeding_wounds = []
-        self.consequences = DamageConsequences()
         self.character.alive = True
-        self.critical_wound_tables = {
-            'arm': {
-                'blunt': [
-                    "Bone bruised, arm numb, -10% dexterity" for _ in range(20)
-                ] + ["Compound fracture, bleeding starts, -15% weapon_skill" for _ in range(20)
-                ] + ["Bone shattered, arm useless, -20% dexterity, heavy bleeding" for _ in range(20)
-                ] + ["Arm crushed, severe pain, -25% all rolls, shock" for _ in range(20)
-                ] + ["Arm pulverized, severed, massive blood loss, collapse likely" for _ in range(20)],
-                'slashing': [
-                    "Shallow cut, minor bleeding, -5% weapon_skill" for _ in range(20)
-                ] + ["Deep gash, bleeding heavily, -10% dexterity" for _ in range(20)
-                ] + ["Muscle slashed, arm weakened, -15% strength" for _ in range(20)
-                ] + ["Artery cut, rapid blood loss, -20% all rolls" for _ in range(20)
-                ] + ["Arm severed, shock and trauma, instant collapse" for _ in range(20)],
-                'piercing': [
-                    "Puncture wound, light bleeding, -5% dexterity" for _ in range(20)
-                ] + ["Deep stab, internal damage, -10% stamina regen" for _ in range(20)
-                ] + ["Tendon pierced, arm stiff, -15% weapon_skill" for _ in range(20)
-                ] + ["Artery punctured, heavy bleeding, -20% all rolls" for _ in range(20)
-                ] + ["Vital hit, arm disabled, severe shock" for _ in range(20)]
-            },
-            'leg': {
-                'blunt': [
-                    "Leg bruised, limp, -10% mobility" for _ in range(20)
-                ] + ["Knee cracked, slowed movement, -15% agility" for _ in range(20)
-                ] + ["Bone fractured, hobbling, -20% dodge" for _ in range(20)
-                ] + ["Leg crushed, can't stand, -25% all movement" for _ in range(20)
-                ] + ["Leg shattered, severed, collapse from pain" for _ in range(20)],
-                'slashing': [
-                    "Cut on leg, minor bleed, -5% mobility" for _ in range(20)
-                ] + ["Hamstring slashed, slowed, -10% agility" for _ in range(20)
-                ] + ["Deep laceration, bleeding, -15% dodge" for _ in range(20)
-                ] + ["Tendon severed, leg useless, -20% movement" for _ in range(20)
-                ] + ["Leg amputated, massive trauma, shock" for _ in range(20)],
-                'piercing': [
-                    "Stab in leg, light bleed, -5% agility" for _ in range(20)
-                ] + ["Muscle pierced, limp, -10% mobility" for _ in range(20)
-                ] + ["Bone hit, fracture, -15% dodge" for _ in range(20)
-                ] + ["Artery nicked, heavy bleed, -20% all rolls" for _ in range(20)
-                ] + ["Vital pierce, leg disabled, collapse" for _ in range(20)]
-            },
-            'head': {
-                'blunt': [
-                    "Concussion, dazed, -10% all rolls" for _ in range(20)
-                ] + ["Skull cracked, headache, -15% perception" for _ in range(20)
-                ] + ["Brain trauma, disoriented, -20% intelligence" for _ in range(20)
-                ] + ["Severe concussion, vomiting, -25% willpower" for _ in range(20)
-                ] + ["Skull crushed, instant death" for _ in range(20)],
-                'slashing': [
-                    "Scalp cut, bleeding, -5% perception" for _ in range(20)
-                ] + ["Ear sliced, disoriented, -10% hearing" for _ in range(20)
-                ] + ["Face gashed, blinded one eye, -15% accuracy" for _ in range(20)
-                ] + ["Throat nicked, choking, -20% breathing" for _ in range(20)
-                ] + ["Decapitation, immediate death" for _ in range(20)],
-                'piercing': [
-                    "Puncture to head, stun, -5% all rolls" for _ in range(20)
-                ] + ["Eye pierced, partial blind, -10% perception" for _ in range(20)
-                ] + ["Brain stab, confused, -15% intelligence" for _ in range(20)
-                ] + ["Vital hit, coma, -20% willpower" for _ in range(20)
-                ] + ["Fatal pierce, death" for _ in range(20)]
-            },
-            'throat': {
-                'blunt': [
-                    "Throat bruised, hoarse, -10% charisma" for _ in range(20)
-                ] + ["Windpipe crushed, gasping, -15% stamina" for _ in range(20)
-                ] + ["Neck broken, paralyzed, -20% all rolls" for _ in range(20)
-                ] + ["Severe trauma, choking, collapse" for _ in range(20)
-                ] + ["Instant kill from crushed throat" for _ in range(20)],
-                'slashing': [
-                    "Throat nicked, bleeding, -5% breathing" for _ in range(20)
-                ] + ["Jugular cut, heavy bleed, -10% stamina" for _ in range(20)
-                ] + ["Windpipe slashed, suffocating, -15% all rolls" for _ in range(20)
-                ] + ["Throat severed, gurgling death" for _ in range(20)
-                ] + ["Decapitation-level slash, instant death" for _ in range(20)],
-                'piercing': [
-                    "Throat punctured, cough, -5% charisma" for _ in range(20)
-                ] + ["Artery pierced, bleed out, -10% stamina" for _ in range(20)
-                ] + ["Vital stab, choking blood, -15% all rolls" for _ in range(20)
-                ] + ["Fatal pierce, quick death" for _ in range(20)
-                ] + ["Instant kill from throat impale" for _ in range(20)]
-            },
-            'groin': {
-                'blunt': [
-                    "Groin bruised, pained, -10% mobility" for _ in range(20)
-                ] + ["Vital hit, nauseous, -15% strength" for _ in range(20)
-                ] + ["Crushed, agony, -20% all rolls" for _ in range(20)
-                ] + ["Severe trauma, shock, collapse" for _ in range(20)
-                ] + ["Ruptured, fatal internal damage" for _ in range(20)],
-                'slashing': [
-                    "Groin cut, bleeding, -5% mobility" for _ in range(20)
-                ] + ["Deep gash, pain surge, -10% agility" for _ in range(20)
-                ] + ["Severed, massive bleed, -15% all rolls" for _ in range(20)
-                ] + ["Castration, shock, collapse" for _ in range(20)
-                ] + ["Fatal slash, quick death" for _ in range(20)],
-                'piercing': [
-                    "Puncture, sting, -5% mobility" for _ in range(20)
-                ] + ["Deep stab, internal bleed, -10% stamina" for _ in range(20)
-                ] + ["Vital pierce, agony, -15% all rolls" for _ in range(20)
-                ] + ["Rupture, shock, collapse" for _ in range(20)
-                ] + ["Instant kill from vital hit" for _ in range(20)]
-            },
-            'chest': {
-                'blunt': [
-                    "Ribs bruised, winded, -10% stamina" for _ in range(20)
-                ] + ["Ribs cracked, pained breath, -15% endurance" for _ in range(20)
-                ] + ["Sternum fractured, internal hurt, -20% toughness" for _ in range(20)
-                ] + ["Heart bruised, arrhythmia, collapse" for _ in range(20)
-                ] + ["Chest caved in, fatal" for _ in range(20)],
-                'slashing': [
-                    "Chest cut, bleed, -5% stamina" for _ in range(20)
-                ] + ["Ribs slashed, deep wound, -10% endurance" for _ in range(20)
-                ] + ["Lung nicked, coughing blood, -15% toughness" for _ in range(20)
-                ] + ["Heart slashed, bleed out" for _ in range(20)
-                ] + ["Chest opened, instant death" for _ in range(20)],
-                'piercing': [
-                    "Chest puncture, sting, -5% stamina" for _ in range(20)
-                ] + ["Rib pierced, pain, -10% endurance" for _ in range(20)
-                ] + ["Lung stabbed, breath short, -15% toughness" for _ in range(20)
-                ] + ["Heart hit, quick death" for _ in range(20)
-                ] + ["Vital pierce, immediate end" for _ in range(20)]
-            },
-            'stomach': {
-                'blunt': [
-                    "Gut punch, winded, -10% endurance" for _ in range(20)
-                ] + ["Organs bruised, nauseous, -15% toughness" for _ in range(20)
-                ] + ["Internal bleed, pain, -20% stamina" for _ in range(20)
-                ] + ["Rupture, shock, collapse" for _ in range(20)
-                ] + ["Fatal internal damage" for _ in range(20)],
-                'slashing': [
-                    "Abdomen cut, bleed, -5% endurance" for _ in range(20)
-                ] + ["Gut slashed, spilling, -10% toughness" for _ in range(20)
-                ] + ["Organs exposed, infection risk, -15% stamina" for _ in range(20)
-                ] + ["Eviscerated, bleed out" for _ in range(20)
-                ] + ["Gutted, death" for _ in range(20)],
-                'piercing': [
-                    "Stab in gut, pain, -5% endurance" for _ in range(20)
-                ] + ["Organ puncture, bleed, -10% toughness" for _ in range(20)
-                ] + ["Deep wound, sepsis, -15% stamina" for _ in range(20)
-                ] + ["Vital stab, quick death" for _ in range(20)
-                ] + ["Fatal pierce" for _ in range(20)]
-            }
-        }
 
     def distribute_damage(self, base_damage, damage_type, critical=False):
         if not self.character.alive:
             return
-        valid_parts = {k: v for k, v in self.health.items() if v > 0}
+        valid_parts = self.health.living()
         if not valid_parts:
             self.character.die()
             return
         damage_per_part = max(1, base_damage // max(1, len(valid_parts) // 2))
-        hit_parts = random.sample(list(valid_parts.keys()), min(len(valid_parts), 2))
+        hit_parts = plan_for(self.character).pick(get_dice(), valid_parts, 2)
         for part in hit_parts:
             damage = int(damage_per_part * (1.2 if critical else 1.0))
             overflow = max(0, damage - self.health[part])
@@ -182,7 +283,7 @@ class CombatHealthManager:
             self.add_bleeding_wound(severity, critical and part in ["chest", "stomach", "left_upper_leg", "right_upper_leg"])
         if self.total_hp <= 0:
             self.character.die()
-        logging.debug(f"Distributed {base_damage} {damage_type} damage to {self.character.name}")
+        logging.debug("Distributed %s %s damage to %s", base_damage, damage_type, self.character.name)
 
     def take_damage_to_zone(self, zone, damage, damage_type, critical=False):
         if not self.character.alive:
@@ -202,9 +303,9 @@ class CombatHealthManager:
             self.add_bleeding_wound(severity, critical and zone in ["chest", "stomach", "left_upper_leg", "right_upper_leg"])
             if self.total_hp <= 0:
                 self.character.die()
-            logging.debug(f"{self.character.name} took {damage} {damage_type} damage to {zone}")
+            logging.debug("%s took %s %s damage to %s", self.character.name, damage, damage_type, zone)
         else:
-            print(f"❌ Invalid zone: {zone}")
+            get_bus().narrate("❌ Invalid zone: {}", zone)
 
     def apply_bleeding(self):
         if not self.bleeding_wounds:
@@ -218,7 +319,7 @@ class CombatHealthManager:
             if wound["duration"] <= 0:
                 self.bleeding_wounds.remove(wound)
         if total_bleeding_damage > 0:
-            print(f"🩸 {self.character.name} suffers {total_bleeding_damage} bleeding damage!")
+            get_bus().narrate("🩸 {} suffers {} bleeding damage!", self.character.name, total_bleeding_damage)
         self.check_blood_loss_collapse()
 
     def add_bleeding_wound(self, severity, is_critical=False):
@@ -236,23 +337,22 @@ class CombatHealthManager:
 
     def apply_pain(self):
         if self.character.pain_penalty >= 30:
-            print(f"⚠️ {self.character.name} is overwhelmed by pain penalties!")
+            get_bus().narrate("⚠️ {} is overwhelmed by pain penalties!", self.character.name)
             self.check_auto_collapse()
 
     def check_blood_loss_collapse(self):
-        blood_loss = self.starting_hp - sum(max(hp, 0) for hp in self.health.values())
+        blood_loss = self.starting_hp - self.health.total
         blood_loss_percent = (blood_loss / self.starting_hp) * 100
         if blood_loss_percent >= 33 and self.character.alive:
-            print(f"💀 {self.character.name} collapses from massive blood loss and falls unconscious!")
+            _fell(self.character, "blood_loss")
             self.character.alive = False
             self.character.in_combat = False
             self.character.exhausted = True
             self.character.last_action = True
 
     def check_auto_collapse(self):
-        crippled = [part for part, hp in self.health.items() if hp <= 0]
-        if len(crippled) >= 3:
-            print(f"💀 {self.character.name} collapses from severe injuries!")
+        if self.health.crippled_count >= 3:
+            _fell(self.character, "injuries")
             self.character.alive = False
             self.character.in_combat = False
             self.character.exhausted = True
@@ -260,10 +360,10 @@ class CombatHealthManager:
             return True
         collapse_chance = self.character.pain_penalty - 30
         if collapse_chance > 0:
-            roll = random.randint(1, 100)
-            print(f"🧠 Collapse Check: Rolled {roll} vs Threshold {collapse_chance}")
+            roll = get_dice().d100()
+            get_bus().narrate("🧠 Collapse Check: Rolled {} vs Threshold {}", roll, collapse_chance)
             if roll <= collapse_chance:
-                print(f"💀 {self.character.name} collapses from overwhelming pain!")
+                _fell(self.character, "pain")
                 self.character.alive = False
                 self.character.in_combat = False
                 self.character.exhausted = True
@@ -274,13 +374,12 @@ class CombatHealthManager:
     def distribute_damage(self, base_damage, damage_type, critical=False):
         if not self.character.alive:
             return
-        valid_parts = {k: v for k, v in self.health.items() if v > 0}
-        parts = list(valid_parts.keys())
+        parts = self.health.living()
         if not parts:
             self.character.die()
             return
         damage_per_part = max(1, base_damage // max(1, len(parts) // 2))
-        hit_parts = random.sample(parts, min(len(parts), 2))
+        hit_parts = plan_for(self.character).pick(get_dice(), parts, 2)
         for part in hit_parts:
             overflow = max(0, damage_per_part - self.health[part])
             self.health[part] -= damage_per_part
@@ -292,10 +391,10 @@ class CombatHealthManager:
                 self.apply_partial_damage(part)  # New partial effects
             severity = "light" if damage_per_part <= 5 else "medium" if damage_per_part <= 10 else "heavy"
             self.add_bleeding_wound(severity, is_critical=critical and part in ["chest", "stomach", "left_upper_leg", "right_upper_leg"])
-        self.total_hp = sum(self.health.values())
+        self.total_hp = self.health.total
         if self.total_hp <= 0:
             self.character.alive = False
-            print(f"💀 {self.character.name} has fallen!")
+            _fell(self.character, "fallen")
 
     def take_damage_to_zone(self, zone, damage, damage_type, critical=False):
         if not self.character.alive:
@@ -314,9 +413,9 @@ class CombatHealthManager:
             self.add_bleeding_wound(severity, is_critical=critical and zone in ["chest", "stomach", "left_upper_leg", "right_upper_leg"])
             if self.total_hp <= 0:
                 self.character.die()
-            logging.debug(f"{self.character.name} took {damage} {damage_type} damage to {zone}")
+            logging.debug("%s took %s %s damage to %s", self.character.name, damage, damage_type, zone)
         else:
-            print(f"❌ Invalid zone: {zone}")
+            get_bus().narrate("❌ Invalid zone: {}", zone)
 
     def apply_partial_damage(self, zone):
         initial = self.initial_health.get(zone, 1)
@@ -325,45 +424,40 @@ class CombatHealthManager:
             penalty = 5  # 5% per threshold; can scale
             if 'leg' in zone:
                 self.character.mobility_penalty += penalty
-                print(f"⚠️ Partial damage to {zone}: +{penalty}% mobility penalty")
+                get_bus().narrate("⚠️ Partial damage to {}: +{}% mobility penalty", zone, penalty)
             elif 'arm' in zone:
                 self.character.pain_penalty += penalty
-                print(f"⚠️ Partial damage to {zone}: +{penalty}% pain penalty")
+                get_bus().narrate("⚠️ Partial damage to {}: +{}% pain penalty", zone, penalty)
             # Add more for head/chest etc. if needed
 
     def apply_critical_wound(self, zone, damage_type, overflow):
-        group = 'arm' if 'arm' in zone else 'leg' if 'leg' in zone else zone  # Map to group
-        table = self.critical_wound_tables.get(group, {}).get(damage_type, [])
-        if table:
-            roll = random.randint(1, 100) + overflow
-            roll = min(roll, 100)
-            effect = table[roll - 1]
-            print(f"Critical wound to {zone}: {effect}")
-            # Apply mechanical effects based on effect (parse string or map to dict for penalties)
-            # Example: if "severed" in effect.lower():
-            #     self.character.pain_penalty += 20
-            #     self.character.mobility_penalty += 25 if 'leg' in group else 0
+        bands = wound_bands(zone, damage_type)
+        if bands:
+            roll = min(get_dice().d100() + overflow, 100)
+            effect = bands[bisect_left(WOUND_BANDS, roll)]
+            get_bus().narrate("Critical wound to {}: {}", zone, effect.text)
+            # effect.penalties holds the mechanical effects; they are not applied yet.
             # Morale check if severe
-            if roll > 50 or "severed" in effect.lower() or "fatal" in effect.lower():
+            if roll > 50 or effect.severed or effect.fatal:
                 if not self.morale_check():
-                    print(f"💔 {self.character.name} breaks from the wound!")
+                    _fell(self.character, "broken")
                     self.character.alive = False
                     self.character.in_combat = False
 
     def morale_check(self):
-        roll = random.randint(1, 100)
+        roll = get_dice().d100()
         threshold = (self.character.willpower // 5) + 30 - (self.character.pain_penalty // 2)
-        print(f"Morale check for {self.character.name}: Roll {roll} vs threshold {threshold}")
+        get_bus().narrate("Morale check for {}: Roll {} vs threshold {}", self.character.name, roll, threshold)
         return roll > threshold
 
     def bleed_out(self):
         self.apply_bleeding()
-        self.total_hp = sum(self.health.values())
+        self.total_hp = self.health.total
         if self.total_hp <= 0:
             self.character.alive = False
-            print(f"💀 {self.character.name} bleeds out!")
+            _fell(self.character, "bleed_out")
 
     def recalculate_penalties(self):
         self.character.pain_penalty = sum(5 for key, hp in self.health.items() if hp < self.initial_health.get(key, 1) * 0.5)
         self.character.mobility_penalty = sum(5 for part in self.health if 'leg' in part and self.health[part] <= 0)
-        print(f"📉 {self.character.name} recalculates penalties: Pain {self.character.pain_penalty}%, Mobility {self.character.mobility_penalty}%")
\ No newline at end of file
+        get_bus().narrate("📉 {} recalculates penalties: Pain {}%, Mobility {}%", self.character.name, self.character.pain_penalty, self.character.mobility_penalty)
\ No newline at end of file
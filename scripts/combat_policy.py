@@ -0,0 +1,360 @@
+# file: scripts/combat_policy.py
+"""
+Player policies for adventure_new.run_combat.
+
+run_combat asks its policy at every decision point instead of calling
+input() directly, so the same loop (crits, ripostes, Veil's Grace, sorcery,
+stalemate fatigue) runs interactively or headless:
+
+    ConsolePolicy    – the classic prompts (adventure_new; the default)
+    PlayerPolicy     – passive baseline: neutral stance, plain attacks
+    RandomPolicy     – uniform choices from the current dice stream
+    ScriptedPolicy   – fixed values, cycling lists or callables per decision
+    GreedyPolicy     – maximises expected damage of this turn's swing
+    ReplayPolicy     – plays back decisions recorded by RecordingPolicy
+    EnemyRulePolicy  – the classic enemy turn (play_round's default enemy_policy)
+
+Every method receives a TurnView (player, target, enemies, round, allies);
+dicts are the live combat state, so policies must treat them as read-only.
+Enemy turns ask from the enemy's side: view.player is the acting enemy,
+view.target and view.enemies the player, view.allies its own side in turn
+order (tactical_ai.TacticalPolicy searches them).
+"""
+
+from __future__ import annotations
+
+import json
+from itertools import cycle
+from typing import IO, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from dice import DiceStream, get_dice
+from hit_tables import DamageRules, estimate_attack, hit_damage, rules_table
+
+STANCES = ("offensive", "neutral", "defensive")
+ATTACK_TYPES = ("normal", "aimed")
+
+
+class TurnView(NamedTuple):
+    player: dict
+    target: dict
+    enemies: List[dict]
+    round: int
+    allies: Sequence[dict] = ()     # the acting unit's side, itself included (enemy turns)
+
+
+class ReplayError(ValueError):
+    """Recorded decisions ran out or don't match what the combat loop asks for."""
+
+# =============================================================================
+# Base / simple policies
+# =============================================================================
+
+class PlayerPolicy:
+    """Passive baseline; subclasses override the decisions they care about."""
+
+    def choose_stance(self, view: TurnView) -> str:
+        return "neutral"
+
+    def choose_attack_type(self, view: TurnView) -> str:
+        return "normal"
+
+    def choose_target_zone(self, view: TurnView) -> str:
+        return "chest"
+
+    def choose_ability(self, view: TurnView) -> Optional[str]:
+        return None
+
+    def choose_spell(self, view: TurnView, spell_ids: Sequence[str]) -> Optional[str]:
+        """Spell id to cast, or None to fall back to a melee attack."""
+        return None
+
+    def bind_dice(self, dice: DiceStream) -> None:
+        """Give the policy its own stream so its choices don't consume combat rolls (no-op unless it rolls)."""
+
+
+def active_abilities(unit: dict) -> List[str]:
+    ab = unit.get("abilities", {})
+    return [k for k, v in ab.items() if isinstance(v, dict) and v.get("type") == "active"]
+
+
+class RandomPolicy(PlayerPolicy):
+    """
+    Uniform random choices, rolled on `dice` (default: the current stream).
+    Bind a separate stream (bind_dice) when decisions will be recorded, so a
+    replay, which rolls nothing, sees the same combat dice.
+    """
+
+    def __init__(self, aim_chance: float = 0.3, ability_chance: float = 0.5, spell_chance: float = 0.5,
+                 dice: Optional[DiceStream] = None):
+        self.aim_chance = aim_chance
+        self.ability_chance = ability_chance
+        self.spell_chance = spell_chance
+        self.dice = dice
+
+    def _dice(self) -> DiceStream:
+        return self.dice or get_dice()
+
+    def bind_dice(self, dice: DiceStream) -> None:
+        if self.dice is None:
+            self.dice = dice
+
+    def choose_stance(self, view: TurnView) -> str:
+        return self._dice().choice(STANCES)
+
+    def choose_attack_type(self, view: TurnView) -> str:
+        return "aimed" if self._dice().random() < self.aim_chance else "normal"
+
+    def choose_target_zone(self, view: TurnView) -> str:
+        from adventure_new import AIM_ZONES
+        return self._dice().choice(AIM_ZONES)
+
+    def choose_ability(self, view: TurnView) -> Optional[str]:
+        names = active_abilities(view.player)
+        if names and self._dice().random() < self.ability_chance:
+            return self._dice().choice(names)
+        return None
+
+    def choose_spell(self, view: TurnView, spell_ids: Sequence[str]) -> Optional[str]:
+        if spell_ids and self._dice().random() < self.spell_chance:
+            return self._dice().choice(list(spell_ids))
+        return None
+
+
+Choice = Union[Any, Sequence[Any], Callable[[TurnView], Any]]
+
+
+class ScriptedPolicy(PlayerPolicy):
+    """
+    Each decision is a fixed value, a list (cycled one entry per call) or a
+    callable(view). Spells: a callable gets (view, spell_ids).
+
+        ScriptedPolicy(stance="offensive", attack=["normal", "aimed"], zone="head")
+    """
+
+    def __init__(self, stance: Choice = "offensive", attack: Choice = "normal", zone: Choice = "head",
+                 ability: Choice = None, spell: Choice = None):
+        self._choices = {k: self._prepare(v) for k, v in
+                         (("stance", stance), ("attack", attack), ("zone", zone), ("ability", ability), ("spell", spell))}
+
+    @staticmethod
+    def _prepare(value: Choice):
+        if isinstance(value, (list, tuple)):
+            return cycle(value)
+        return value
+
+    def _pick(self, key: str, *args: Any) -> Any:
+        value = self._choices[key]
+        if isinstance(value, Iterator):
+            return next(value)
+        if callable(value):
+            return value(*args)
+        return value
+
+    def choose_stance(self, view):
+        return self._pick("stance", view)
+
+    def choose_attack_type(self, view):
+        return self._pick("attack", view)
+
+    def choose_target_zone(self, view):
+        return self._pick("zone", view)
+
+    def choose_ability(self, view):
+        return self._pick("ability", view)
+
+    def choose_spell(self, view, spell_ids):
+        return self._pick("spell", view, spell_ids)
+
+# =============================================================================
+# Greedy
+# =============================================================================
+
+class GreedyPolicy(PlayerPolicy):
+    """
+    Picks stance, attack type, zone and ability that maximise the exact
+    expected damage of this turn's swing (hit_tables: hit chance, crits, armor
+    coverage, unhelmeted headshots and the crit head bonus). It does not look
+    ahead and always melees rather than casting.
+    """
+
+    def __init__(self, use_abilities: bool = True):
+        self.use_abilities = use_abilities
+        self._plan_round: Optional[int] = None
+        self._plan: Tuple[str, str, Optional[str], Optional[str]] = ("offensive", "normal", None, None)
+
+    def expected_damage(self, view: TurnView, stance: str, attack_type: str,
+                        zone: Optional[str], ability: Optional[str]) -> float:
+        return estimate_attack(view.player, stance, view.target, attack_type, zone, ability).expected
+
+    def _abilities(self, player: dict) -> List[Optional[str]]:
+        if not self.use_abilities:
+            return [None]
+        st = player.get("current_stamina", player.get("max_stamina", 0))
+        ab = player.get("abilities", {})
+        return [None] + [n for n in active_abilities(player) if int(ab[n].get("stamina_cost", 0)) <= st]
+
+    def rank(self, view: TurnView) -> List[Tuple[float, Tuple[str, str, Optional[str], Optional[str]]]]:
+        """
+        Expected damage of every (stance, attack type, zone, ability) this
+        round, in scan order; the modifiers are computed once per attack type
+        and stance applied as a margin delta.
+        """
+        import adventure_new as game
+        table = rules_table(game.rules)
+        dmg_rules = DamageRules.from_rules(game.rules)
+        base_dmg = game.base_damage_for(view.player)
+        bases = [(a, base_dmg + game.ability_damage_bonus(view.player, a)) for a in self._abilities(view.player)]
+        options = []
+        for attack_type, zone in [("normal", None)] + [("aimed", z) for z in game.AIM_ZONES]:
+            covered = bool(zone) and game.is_zone_covered(view.target, zone)
+            dmg = [(a, hit_damage(raw, False, dmg_rules, zone, covered), hit_damage(raw, True, dmg_rules, zone, covered))
+                   for a, raw in bases]
+            options.append((attack_type, zone, dmg))
+        margins = {}
+        for attack_type in ATTACK_TYPES:
+            calc = game.attack_modifiers(view.player, "neutral", view.target, "neutral", attack_type)
+            margins[attack_type] = calc["attack_mod"] - calc["defense_mod"] - game.stance_mods("neutral")[0]
+
+        ranked = []
+        for stance in STANCES:
+            atk = game.stance_mods(stance)[0]
+            for attack_type, zone, dmg in options:
+                odds = table.odds(margins[attack_type] + atk)
+                for ability, normal, crit in dmg:
+                    ranked.append((odds.normal * normal + odds.crit * crit, (stance, attack_type, zone, ability)))
+        return ranked
+
+    def plan(self, view: TurnView) -> Tuple[str, str, Optional[str], Optional[str]]:
+        """Best (stance, attack type, zone, ability) for this round (first of rank's maxima)."""
+        if self._plan_round == view.round:
+            return self._plan
+        best, best_val = self._plan, -1.0
+        for val, choice in self.rank(view):
+            if val > best_val + 1e-9:
+                best, best_val = choice, val
+        self._plan_round, self._plan = view.round, best
+        return best
+
+    def choose_stance(self, view):
+        return self.plan(view)[0]
+
+    def choose_attack_type(self, view):
+        return self.plan(view)[1]
+
+    def choose_target_zone(self, view):
+        return self.plan(view)[2] or "chest"
+
+    def choose_ability(self, view):
+        return self.plan(view)[3]
+
+# =============================================================================
+# Record / replay
+# =============================================================================
+
+class RecordingPolicy(PlayerPolicy):
+    """Wraps `inner` and appends every decision as {"round", "decision", "value"} (JSONL when given a path/file)."""
+
+    def __init__(self, inner: PlayerPolicy, sink: Optional[Union[str, IO[str]]] = None):
+        self.inner = inner
+        self.decisions: List[Dict[str, Any]] = []
+        self._fh = open(sink, "w", encoding="utf-8") if isinstance(sink, str) else sink
+        self._owns = isinstance(sink, str)
+
+    def _note(self, view: TurnView, decision: str, value: Any) -> Any:
+        rec = {"round": view.round, "decision": decision, "value": value}
+        self.decisions.append(rec)
+        if self._fh is not None:
+            self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        return value
+
+    def bind_dice(self, dice: DiceStream) -> None:
+        self.inner.bind_dice(dice)
+
+    def close(self) -> None:
+        if self._owns and self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def choose_stance(self, view):
+        return self._note(view, "stance", self.inner.choose_stance(view))
+
+    def choose_attack_type(self, view):
+        return self._note(view, "attack", self.inner.choose_attack_type(view))
+
+    def choose_target_zone(self, view):
+        return self._note(view, "zone", self.inner.choose_target_zone(view))
+
+    def choose_ability(self, view):
+        return self._note(view, "ability", self.inner.choose_ability(view))
+
+    def choose_spell(self, view, spell_ids):
+        return self._note(view, "spell", self.inner.choose_spell(view, spell_ids))
+
+
+class ReplayPolicy(PlayerPolicy):
+    """
+    Plays back decisions from RecordingPolicy (a JSONL path or a list of
+    records). Replays are exact only with the same dice seed; any mismatch
+    raises ReplayError rather than silently diverging.
+    """
+
+    def __init__(self, source: Union[str, Sequence[Dict[str, Any]]]):
+        if isinstance(source, str):
+            with open(source, "r", encoding="utf-8") as f:
+                source = [json.loads(line) for line in f if line.strip()]
+        self._records = iter(source)
+
+    def _next(self, view: TurnView, decision: str) -> Any:
+        rec = next(self._records, None)
+        if rec is None:
+            raise ReplayError(f"replay exhausted at round {view.round} ({decision})")
+        if rec.get("decision") != decision or rec.get("round") != view.round:
+            raise ReplayError(
+                f"replay diverged at round {view.round}: expected {decision}, "
+                f"recorded {rec.get('decision')} (round {rec.get('round')})"
+            )
+        return rec.get("value")
+
+    def choose_stance(self, view):
+        return self._next(view, "stance")
+
+    def choose_attack_type(self, view):
+        return self._next(view, "attack")
+
+    def choose_target_zone(self, view):
+        return self._next(view, "zone")
+
+    def choose_ability(self, view):
+        return self._next(view, "ability")
+
+    def choose_spell(self, view, spell_ids):
+        return self._next(view, "spell")
+
+# =============================================================================
+# Enemy turns
+# =============================================================================
+
+class EnemyRulePolicy(PlayerPolicy):
+    """The classic enemy: offensive above `threshold` of its HP, defensive below; plain attacks, no spells."""
+
+    def __init__(self, threshold: float = 0.35):
+        self.threshold = threshold
+
+    def choose_stance(self, view: TurnView) -> str:
+        me = view.player
+        return "offensive" if me["current_hp"] > me["total_hp"] * self.threshold else "defensive"
+
+
+POLICIES: Dict[str, Callable[[], PlayerPolicy]] = {
+    "passive": PlayerPolicy,
+    "random": RandomPolicy,
+    "scripted": ScriptedPolicy,
+    "greedy": GreedyPolicy,
+}
+
+
+__all__ = [
+    "TurnView", "ReplayError", "PlayerPolicy", "RandomPolicy", "ScriptedPolicy", "GreedyPolicy",
+    "RecordingPolicy", "ReplayPolicy", "EnemyRulePolicy", "POLICIES", "STANCES", "ATTACK_TYPES",
+    "active_abilities",
+]
@@ -0,0 +1,220 @@
+# file: scripts/combat_profile.py
+"""
+Compiled per-combatant numbers for the attack hot path.
+
+Every roll used to re-derive the same values from raw fields: the dexterity /
+Dexterity fallback and aimed_attack_penalty in adventure_new, base_damage_for's
+weapon lookup, CombatEngine's dexterity-vs-dexterity_modifier choice, the
+swordsmanship/club_smash/weapon_skill scan and _choose_defense_type. None of
+them change between two swings. A CombatProfile holds them as plain ints:
+
+    prof = combat_profile(unit)      # unit dict or Character; built once, then cached
+    prof.dex_mod, prof.base_damage   # adventure_new to-hit/defence stat and weapon damage
+    prof.weapon_skill, prof.defense_kind, prof.defense_mod   # CombatEngine
+    prof.attack_cost[Stance.OFFENSIVE]                        # stamina per stance
+
+Invalidation is explicit and cheap: invalidate(unit) after changing a unit's
+equipment or stats (equip_armor, init_weapon_state and the Character
+equipment/stat methods already do), invalidate_all() after the rules change.
+Round-scoped state (hp and pain, stress, fog/fear/veil counters) is not
+compiled; attack_modifiers still reads it per roll.
+
+Unit dicts keep the profile under PROFILE_KEY and Characters as an
+attribute. It is a cache, not state: CombatState.to_dict and the snapshot
+hashes leave it out, and a profile that is missing (or came back from JSON
+as a list) is simply rebuilt.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Tuple
+
+from rules_repository import get_rules
+from stance_table import Stance, StanceTable
+from zones import zone_index
+
+PROFILE_KEY = "_combat_profile"
+_ATTR = "_combat_profile"
+
+# same order as combat_engine.DEFENSE_CODES (combat_engine imports this module, so not from it)
+DEFENSE_KEYS = ("dodge", "parry", "block")
+
+_EPOCH = 0
+_RULES: Optional[Mapping[str, Any]] = None
+_BASE_DAMAGE: Optional[Callable[[Any], int]] = None
+_SHARED: Optional[Tuple[int, Mapping[str, Any], Tuple[Any, ...]]] = None  # (epoch, rules, rule-only fields)
+
+
+def configure(rules: Optional[Mapping[str, Any]] = None,
+              base_damage: Optional[Callable[[Any], int]] = None) -> None:
+    """
+    Rules (default: rules/combat_rules.json) and the base-damage lookup
+    profiles are compiled with; adventure_new registers its own at import.
+    Drops every cached profile.
+    """
+    global _RULES, _BASE_DAMAGE
+    _RULES = rules
+    if base_damage is not None:
+        _BASE_DAMAGE = base_damage
+    invalidate_all()
+
+
+def _rules() -> Mapping[str, Any]:
+    return _RULES if _RULES is not None else get_rules().get("combat_rules.json", {})
+
+
+def _shared() -> Tuple[Mapping[str, Any], Tuple[Any, ...]]:
+    """Rules and the fields every profile shares, compiled once per epoch."""
+    global _SHARED
+    if _SHARED is None or _SHARED[0] != _EPOCH:
+        rules = _rules()
+        _SHARED = (_EPOCH, rules, (
+            _int(rules.get("critical_hit_threshold", 95), 95),
+            float((rules.get("critical_multipliers") or {}).get("default", 1.5)),
+            _int((rules.get("aimed_attack") or {}).get("crit_bonus_head_pct", 10), 10),
+        ) + _stamina(rules))
+    return _SHARED[1], _SHARED[2]
+
+
+def _getter(unit: Any) -> Callable[..., Any]:
+    return unit.get if isinstance(unit, dict) else lambda k, d=None: getattr(unit, k, d)
+
+
+def _int(x: Any, default: int = 0) -> int:
+    try:
+        return int(x)
+    except Exception:
+        return default
+
+# =============================================================================
+# Profile
+# =============================================================================
+
+class CombatProfile(NamedTuple):
+    epoch: int
+    # adventure_new rules
+    dex_mod: int              # dexterity (default 25) // 10; to-hit and defence stat
+    aimed_penalty: int        # aimed_attack_penalty(unit, rules)
+    base_damage: int          # base_damage_for(unit)
+    crit_threshold: int
+    crit_mult: float
+    head_crit_pct: int
+    armor_mask: int           # bits over zones.Zone
+    # CombatEngine rules
+    engine_dex_mod: int       # dexterity // 10, else the flat dexterity_modifier
+    weapon_skill: int
+    defense_kind: str         # "Block" > "Parry" > "Dodge"
+    defense_mod: int
+    # stamina, indexed by stance_table.Stance / DEFENSE_KEYS
+    attack_cost: Tuple[int, int, int]
+    defend_cost: Tuple[int, int, int]
+    regen: Tuple[int, int, int]
+
+
+def _weapon_skill(skills: Any) -> int:
+    if isinstance(skills, dict):
+        for k in ("swordsmanship", "club_smash", "weapon_skill"):
+            if k in skills:
+                try:
+                    return int(skills[k])
+                except Exception:
+                    pass
+    return 0
+
+
+def _stat_mod(val: Any) -> int:
+    return _int(val, 0) // 10 if val is not None else 0
+
+
+def _base_damage(unit: Any, get: Callable[..., Any]) -> int:
+    if _BASE_DAMAGE is not None and isinstance(unit, dict):
+        return int(_BASE_DAMAGE(unit))
+    weapon = get("weapon")
+    return _int(weapon.get("base_damage", 8), 8) if isinstance(weapon, dict) else 8
+
+
+def _stamina(rules: Mapping[str, Any]) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """Costs and regen as spend_stamina / regen_stamina compute them (no ability, no armor)."""
+    table = StanceTable.from_rules(rules, stances={}, weapon_stances={})
+    costs = rules.get("stamina_costs") or {}
+    defend = tuple(_int(costs.get(k, 0)) + table.stance_cost[Stance.NEUTRAL] for k in DEFENSE_KEYS)
+    return table.attack_cost, defend, table.regen
+
+
+def build_profile(unit: Any) -> CombatProfile:
+    """Compile a fresh profile for a unit dict or Character (not cached)."""
+    from combat_engine_ext import aimed_attack_penalty
+
+    rules, (crit_threshold, crit_mult, head_crit_pct, attack_cost, defend_cost, regen) = _shared()
+    get = _getter(unit)
+
+    dex = get("dexterity", None)
+    if dex is None:
+        flat = get("dexterity_modifier", None)
+        engine_dex_mod = _int(flat, 0) if flat is not None else 0
+    else:
+        engine_dex_mod = _stat_mod(dex)
+
+    if bool(get("shield_equipped", False)):
+        kind, stat = "Block", get("toughness", get("strength", None))
+    elif bool(get("weapon_equipped", False)):
+        kind, stat = "Parry", get("dexterity", get("agility", None))
+    else:
+        kind, stat = "Dodge", get("agility", get("dexterity", None))
+
+    return CombatProfile(
+        epoch=_EPOCH,
+        dex_mod=_int(get("dexterity", get("Dexterity", 25)), 25) // 10,
+        aimed_penalty=aimed_attack_penalty(unit if isinstance(unit, dict) else {"dexterity": get("dexterity", 0) or 0}, rules),
+        base_damage=_base_damage(unit, get),
+        crit_threshold=crit_threshold,
+        crit_mult=crit_mult,
+        head_crit_pct=head_crit_pct,
+        armor_mask=zone_index(unit).mask,
+        engine_dex_mod=engine_dex_mod,
+        weapon_skill=_weapon_skill(get("skills", {}) or {}),
+        defense_kind=kind,
+        defense_mod=_stat_mod(stat),
+        attack_cost=attack_cost,
+        defend_cost=defend_cost,
+        regen=regen,
+    )
+
+
+def combat_profile(unit: Any) -> CombatProfile:
+    """The unit's cached profile, compiled on first use or after invalidation."""
+    if isinstance(unit, dict):
+        prof = unit.get(PROFILE_KEY)
+        if type(prof) is CombatProfile and prof.epoch == _EPOCH:
+            return prof
+        prof = unit[PROFILE_KEY] = build_profile(unit)
+        return prof
+    prof = getattr(unit, _ATTR, None)
+    if prof is not None and prof.epoch == _EPOCH:
+        return prof
+    prof = build_profile(unit)
+    try:
+        setattr(unit, _ATTR, prof)
+    except AttributeError:
+        pass  # slotted objects without __dict__ just recompile
+    return prof
+
+
+def invalidate(unit: Any) -> None:
+    """Drop a unit's profile; call after changing its equipment or stats."""
+    if isinstance(unit, dict):
+        unit.pop(PROFILE_KEY, None)
+    elif getattr(unit, _ATTR, None) is not None:
+        setattr(unit, _ATTR, None)
+
+
+def invalidate_all() -> None:
+    """Drop every profile at once (rules reloaded or overridden)."""
+    global _EPOCH
+    _EPOCH += 1
+
+
+__all__ = [
+    "PROFILE_KEY", "DEFENSE_KEYS", "CombatProfile", "configure", "build_profile", "combat_profile",
+    "invalidate", "invalidate_all",
+]
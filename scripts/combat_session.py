@@ -0,0 +1,284 @@
+# file: scripts/combat_session.py
+"""
+Step-wise, resumable combat for server sessions.
+
+run_combat blocks in a loop until the fight ends, so a server needed a thread
+per fight. This module drives the same rounds (adventure_new.play_round) one
+player action at a time:
+
+    state = start(player, enemies, "You confront Bandit!")
+    events, state = submit(state, {"stance": "offensive", "attack": "aimed", "zone": "head"})
+    ...until state.status != "active"
+
+A CombatState is plain data (unit dicts, round counter, stalemate counter and
+a seed) and round-trips through JSON, so any worker can resume it from a
+SessionStore. Round n always rolls on DiceStream(seed).spawn("round", n): no
+RNG state has to be saved, and re-submitting the same action to the same
+state reproduces the same round (with a tactical_ai enemy policy, as long as
+its playout cap rather than its clock ends each search).
+
+submit() swaps the process-wide dice stream and event bus for its duration; it
+never awaits, so it is safe to call from asyncio handlers in one process (use
+separate processes, not threads, for parallelism).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from combat_events import CombatEvent, EventBus, Narration, RingBufferSink, quiet_bus, use_bus
+from combat_policy import STANCES, PlayerPolicy, TurnView
+from combat_profile import PROFILE_KEY
+from dice import DiceStream, use_dice
+from hit_tables import estimate_attack
+from rules_repository import thaw
+
+import adventure_new as game
+
+STATE_VERSION = 1
+
+
+class CombatOver(ValueError):
+    """An action was submitted to a session that has already ended."""
+
+# =============================================================================
+# Actions / state
+# =============================================================================
+
+@dataclass
+class PlayerAction:
+    """Everything the player decides in one round (zone only matters for aimed attacks)."""
+    stance: str = "neutral"
+    attack: str = "normal"
+    zone: Optional[str] = None
+    ability: Optional[str] = None
+    spell: Optional[str] = None   # sorceresses only; None = melee
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "PlayerAction":
+        return cls(**{k: d[k] for k in ("stance", "attack", "zone", "ability", "spell") if d.get(k) is not None})
+
+
+class ActionPolicy(PlayerPolicy):
+    """Answers run_combat's questions from one submitted PlayerAction."""
+
+    def __init__(self, action: PlayerAction):
+        self.action = action
+
+    def choose_stance(self, view: TurnView) -> str:
+        return self.action.stance
+
+    def choose_attack_type(self, view: TurnView) -> str:
+        return self.action.attack
+
+    def choose_target_zone(self, view: TurnView) -> str:
+        return self.action.zone or "chest"
+
+    def choose_ability(self, view: TurnView) -> Optional[str]:
+        return self.action.ability
+
+    def choose_spell(self, view: TurnView, spell_ids) -> Optional[str]:
+        return self.action.spell if self.action.spell in spell_ids else None
+
+
+@dataclass
+class CombatState:
+    session_id: str
+    seed: int
+    label: str
+    player: Dict[str, Any]
+    enemies: List[Dict[str, Any]]
+    round: int = 0
+    no_damage_rounds: int = 0
+    status: str = "active"          # active | won | lost | timeout
+    version: int = STATE_VERSION
+
+    @property
+    def active(self) -> bool:
+        return self.status == "active"
+
+    def units(self) -> List[Dict[str, Any]]:
+        return [self.player, *self.enemies]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain data; compiled combat profiles are left out (they are rebuilt on demand)."""
+        d = asdict(self)
+        for u in (d["player"], *d["enemies"]):
+            u.pop(PROFILE_KEY, None)
+        return d
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "CombatState":
+        if d.get("version") != STATE_VERSION:
+            raise ValueError(f"unsupported combat state version {d.get('version')!r}")
+        return cls(**d)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "CombatState":
+        return cls.from_dict(json.loads(raw))
+
+# =============================================================================
+# State machine
+# =============================================================================
+
+def start(player: dict, enemies: List[dict], label: str = "Encounter",
+          seed: Optional[int] = None, session_id: Optional[str] = None) -> CombatState:
+    """New session from (equipped) unit dicts; they are copied, never mutated."""
+    player, enemies = thaw(player), [thaw(e) for e in enemies]
+    with use_bus(quiet_bus()):
+        player, enemies = game.open_combat(player, enemies, label)
+    return CombatState(
+        session_id=session_id or uuid.uuid4().hex,
+        seed=secrets.randbits(63) if seed is None else int(seed),
+        label=label,
+        player=player,
+        enemies=enemies,
+    )
+
+
+def submit(state: CombatState, action: Union[PlayerAction, Dict[str, Any]],
+           max_events: int = 500, enemy_policy: Optional[PlayerPolicy] = None) -> Tuple[List[CombatEvent], CombatState]:
+    """
+    Play one round with `action`; returns the round's events and the next
+    state. The input state is left untouched, so a failed save can simply
+    retry with it. `enemy_policy` runs the enemy turns (default: the classic
+    rule; tactical_ai.TacticalPolicy is a budgeted search).
+    """
+    if not state.active:
+        raise CombatOver(f"session {state.session_id} is over ({state.status})")
+    if isinstance(action, dict):
+        action = PlayerAction.from_dict(action)
+
+    nxt = CombatState.from_dict(thaw(state.to_dict()))
+    for old, new in zip(state.units(), nxt.units()):
+        if PROFILE_KEY in old:              # same stats: keep the compiled profile
+            new[PROFILE_KEY] = old[PROFILE_KEY]
+    nxt.round += 1
+    nxt.player["_last_combat_rounds"] = nxt.round
+    watch = game.StalemateWatch(threshold=6)
+    watch.no_damage_rounds = nxt.no_damage_rounds
+
+    sink = RingBufferSink(maxlen=max_events)
+    with use_bus(EventBus([sink])), use_dice(DiceStream(nxt.seed).spawn("round", nxt.round)):
+        outcome, nxt.enemies = game.play_round(nxt.player, nxt.enemies, nxt.round, ActionPolicy(action), watch,
+                                            enemy_policy)
+        if outcome is not None:
+            nxt.status = outcome
+        elif nxt.round >= game.MAX_ROUNDS:
+            nxt.status = "timeout"
+            sink.handle(Narration("⏱️ Combat auto-ended (max rounds reached)."))
+    nxt.no_damage_rounds = watch.no_damage_rounds
+    return sink.events(), nxt
+
+
+def view(state: CombatState) -> Dict[str, Any]:
+    """Compact client-facing summary of a state (no full character sheets)."""
+    def unit(u: dict) -> Dict[str, Any]:
+        return {
+            "name": u.get("name"),
+            "hp": u.get("current_hp"),
+            "max_hp": u.get("total_hp"),
+            "stamina": u.get("current_stamina"),
+            "max_stamina": u.get("max_stamina"),
+            "alive": u.get("alive", True),
+        }
+    return {
+        "session_id": state.session_id,
+        "round": state.round,
+        "status": state.status,
+        "player": unit(state.player),
+        "enemies": [unit(e) for e in state.enemies],
+        "abilities": [k for k, v in state.player.get("abilities", {}).items()
+                      if isinstance(v, dict) and v.get("type") == "active"],
+        "spells": game.list_spells(state.player) if game.is_sorceress(state.player) else [],
+        "hit_chance": _hit_hints(state),
+    }
+
+
+def _hit_hints(state: CombatState) -> Dict[str, float]:
+    """Exact P(hit) of a normal attack on the current target, per stance (UI hint)."""
+    target = next((e for e in state.enemies if e.get("alive", True)), None)
+    if target is None or not state.active:
+        return {}
+    return {s: round(estimate_attack(state.player, s, target).odds.hit, 4) for s in STANCES}
+
+# =============================================================================
+# Storage
+# =============================================================================
+
+class SessionStore:
+    """
+    Serialised states by session id: in memory, or one JSON file per session
+    under `root` so any worker process can pick a session up.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root
+        self._mem: Dict[str, str] = {}
+        if root:
+            os.makedirs(root, exist_ok=True)
+
+    def _path(self, session_id: str) -> str:
+        if not session_id.isalnum():
+            raise KeyError(session_id)
+        return os.path.join(self.root, f"{session_id}.json")
+
+    def put(self, state: CombatState) -> None:
+        raw = state.to_json()
+        if not self.root:
+            self._mem[state.session_id] = raw
+            return
+        path = self._path(state.session_id)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+
+    def get(self, session_id: str) -> Optional[CombatState]:
+        if not self.root:
+            raw = self._mem.get(session_id)
+        else:
+            try:
+                with open(self._path(session_id), "r", encoding="utf-8") as f:
+                    raw = f.read()
+            except (FileNotFoundError, KeyError):
+                raw = None
+        return CombatState.from_json(raw) if raw is not None else None
+
+    def delete(self, session_id: str) -> None:
+        if not self.root:
+            self._mem.pop(session_id, None)
+            return
+        try:
+            os.remove(self._path(session_id))
+        except (FileNotFoundError, KeyError):
+            pass
+
+    def __len__(self) -> int:
+        if not self.root:
+            return len(self._mem)
+        return sum(1 for n in os.listdir(self.root) if n.endswith(".json"))
+
+    def submit(self, session_id: str, action: Union[PlayerAction, Dict[str, Any]],
+               enemy_policy: Optional[PlayerPolicy] = None) -> Tuple[List[CombatEvent], CombatState]:
+        """Load, play one round, save; raises KeyError for unknown sessions."""
+        state = self.get(session_id)
+        if state is None:
+            raise KeyError(session_id)
+        events, state = submit(state, action, enemy_policy=enemy_policy)
+        self.put(state)
+        return events, state
+
+
+__all__ = [
+    "STATE_VERSION", "CombatOver", "PlayerAction", "ActionPolicy", "CombatState",
+    "start", "submit", "view", "SessionStore",
+]
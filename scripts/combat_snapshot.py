@@ -0,0 +1,457 @@
+# file: scripts/combat_snapshot.py
+"""
+Copy-on-write combat state snapshots: undo, checkpoint replays and lookahead.
+
+Copying a fight used to mean json.loads(json.dumps(unit)) or thaw() of every
+unit sheet, tens of fields each, even when a round only moved a few HP and
+stamina points. Here units are TrackedUnits: ordinary dicts (play_round and
+friends keep working on them unchanged) that remember which top-level keys
+were written since the last snapshot, nested dicts/lists included. A
+snapshot copies only those keys into a new frozen UnitRecord and shares
+everything else with the previous record; restore rewrites only the keys
+that differ.
+
+    tl = CombatTimeline(player, enemies)      # tracked copies; originals untouched
+    tl.checkpoint(round=0)
+    outcome, _ = game.play_round(tl.player, tl.enemies, 1, policy, watch)
+    tl.state_hash()                           # stable blake2b hex (transposition tables)
+    tl.undo()                                 # back to the last checkpoint
+
+Lower level: track(unit), snapshot(units, **extra), restore(units, snap),
+state_hash(snap). Records are read-only (FrozenDict / FrozenList); their
+digests are computed once and shared by every snapshot that reuses them.
+
+Only JSON-like values (dict, list, scalars, tuples) are tracked; other
+mutable objects in a unit are shared between snapshots, not copied. A dict
+or list stored into a unit is copied into a tracked one, so keep mutating
+the unit's entry rather than the original. Copies (copy.deepcopy, pickle,
+thaw) of a TrackedUnit are plain dicts.
+
+Usage (benchmark and self-check):
+    python scripts/combat_snapshot.py -n 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from combat_profile import PROFILE_KEY
+from rules_repository import FrozenDict, FrozenList
+
+HASH_EXCLUDE = frozenset({PROFILE_KEY})   # derived caches, rebuilt on demand
+
+# =============================================================================
+# Tracked containers
+# =============================================================================
+
+def _wrap(value: Any, root: "TrackedUnit", key: str) -> Any:
+    """Mutable JSON containers become tracked children of `root[key]`; everything else is kept as is."""
+    cls = type(value)
+    if cls is dict or (isinstance(value, dict) and not isinstance(value, FrozenDict)):
+        if cls is TrackedDict and value._root is root and value._key == key:
+            return value
+        return TrackedDict(root, key, value)
+    if cls is list or (isinstance(value, list) and not isinstance(value, FrozenList)):
+        if cls is TrackedList and value._root is root and value._key == key:
+            return value
+        return TrackedList(root, key, value)
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, FrozenDict) or isinstance(value, FrozenList):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(_freeze(v) for v in value)
+    return value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+class TrackedDict(dict):
+    """Nested dict inside a TrackedUnit; any write marks the owning top-level key dirty."""
+
+    __slots__ = ("_root", "_key")
+
+    def __init__(self, root: "TrackedUnit", key: str, items: Any = ()):
+        self._root, self._key = root, key
+        dict.__init__(self, ((k, _wrap(v, root, key)) for k, v in dict(items).items()))
+
+    def _touch(self) -> None:
+        self._root._dirty.add(self._key)
+
+    def __setitem__(self, k, v):
+        self._touch()
+        dict.__setitem__(self, k, _wrap(v, self._root, self._key))
+
+    def __delitem__(self, k):
+        self._touch()
+        dict.__delitem__(self, k)
+
+    def pop(self, *args):
+        self._touch()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._touch()
+        return dict.popitem(self)
+
+    def setdefault(self, k, default=None):
+        if k not in self:
+            self[k] = default
+        return dict.__getitem__(self, k)
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        self._touch()
+        dict.clear(self)
+
+    def __deepcopy__(self, memo):
+        return _plain(self)
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (_plain(self),))
+
+
+class TrackedList(list):
+    """Nested list inside a TrackedUnit; any write marks the owning top-level key dirty."""
+
+    __slots__ = ("_root", "_key")
+
+    def __init__(self, root: "TrackedUnit", key: str, items: Iterable[Any] = ()):
+        self._root, self._key = root, key
+        list.__init__(self, (_wrap(v, root, key) for v in items))
+
+    def _touch(self) -> None:
+        self._root._dirty.add(self._key)
+
+    def __setitem__(self, i, v):
+        self._touch()
+        if isinstance(i, slice):
+            list.__setitem__(self, i, [_wrap(x, self._root, self._key) for x in v])
+        else:
+            list.__setitem__(self, i, _wrap(v, self._root, self._key))
+
+    def __delitem__(self, i):
+        self._touch()
+        list.__delitem__(self, i)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        self._touch()
+        return list.__imul__(self, n)
+
+    def append(self, v):
+        self._touch()
+        list.append(self, _wrap(v, self._root, self._key))
+
+    def extend(self, vs):
+        self._touch()
+        list.extend(self, [_wrap(v, self._root, self._key) for v in vs])
+
+    def insert(self, i, v):
+        self._touch()
+        list.insert(self, i, _wrap(v, self._root, self._key))
+
+    def pop(self, *args):
+        self._touch()
+        return list.pop(self, *args)
+
+    def remove(self, v):
+        self._touch()
+        list.remove(self, v)
+
+    def clear(self):
+        self._touch()
+        list.clear(self)
+
+    def sort(self, *args, **kwargs):
+        self._touch()
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self):
+        self._touch()
+        list.reverse(self)
+
+    def __deepcopy__(self, memo):
+        return _plain(self)
+
+    def __reduce_ex__(self, protocol):
+        return (list, (_plain(self),))
+
+
+class UnitRecord(FrozenDict):
+    """Read-only version of a unit at one snapshot; the digest is computed once, on demand."""
+
+    __slots__ = ("_digest",)
+
+    def digest(self) -> str:
+        try:
+            return self._digest
+        except AttributeError:
+            payload = {k: v for k, v in self.items() if k not in HASH_EXCLUDE}
+            raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+            self._digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+            return self._digest
+
+
+_EMPTY = UnitRecord()
+
+
+class TrackedUnit(dict):
+    """
+    A unit dict that records which top-level keys changed since it was last
+    snapshotted or restored. Reads are plain dict reads; writes cost one set
+    insertion (plus wrapping, when the value is a fresh dict or list).
+    """
+
+    __slots__ = ("_dirty", "_base")
+
+    def __init__(self, unit: Any = ()):
+        self._dirty: Set[str] = set()
+        self._base: UnitRecord = _EMPTY
+        items = dict(unit)
+        dict.__init__(self, ((k, _wrap(v, self, k)) for k, v in items.items()))
+        self._dirty.update(items)
+
+    def __setitem__(self, k, v):
+        self._dirty.add(k)
+        dict.__setitem__(self, k, _wrap(v, self, k))
+
+    def __delitem__(self, k):
+        self._dirty.add(k)
+        dict.__delitem__(self, k)
+
+    def pop(self, k, *default):
+        self._dirty.add(k)
+        return dict.pop(self, k, *default)
+
+    def popitem(self):
+        k, v = dict.popitem(self)
+        self._dirty.add(k)
+        return k, v
+
+    def setdefault(self, k, default=None):
+        if k not in self:
+            self[k] = default
+        return dict.__getitem__(self, k)
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        self._dirty.update(self)
+        dict.clear(self)
+
+    def __deepcopy__(self, memo):
+        return _plain(self)
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (_plain(self),))
+
+    @property
+    def dirty(self) -> frozenset:
+        return frozenset(self._dirty)
+
+    def record(self) -> UnitRecord:
+        """Freeze the current state, copying only the keys written since the last record/restore."""
+        base = self._base
+        if not self._dirty:
+            return base
+        fields = dict(base)
+        for k in self._dirty:
+            if k in self:
+                fields[k] = _freeze(dict.__getitem__(self, k))
+            else:
+                fields.pop(k, None)
+        rec = UnitRecord(fields)
+        self._base, self._dirty = rec, set()
+        return rec
+
+    def restore(self, rec: UnitRecord) -> None:
+        """Rewrite this unit to `rec`, touching only keys that differ from it."""
+        base = self._base
+        changed = self._dirty
+        if rec is not base:
+            changed = set(changed)
+            for k, v in rec.items():
+                if base.get(k, _MISSING) is not v:
+                    changed.add(k)
+            changed.update(k for k in base if k not in rec)
+        for k in changed:
+            if k in rec:
+                dict.__setitem__(self, k, _wrap(_plain(rec[k]), self, k))
+            elif k in self:
+                dict.__delitem__(self, k)
+        self._base, self._dirty = rec, set()
+
+
+_MISSING = object()
+
+
+def track(unit: dict) -> TrackedUnit:
+    """Tracked copy of a unit dict (a TrackedUnit is returned as is)."""
+    return unit if isinstance(unit, TrackedUnit) else TrackedUnit(unit)
+
+# =============================================================================
+# Snapshots
+# =============================================================================
+
+class CombatSnapshot(NamedTuple):
+    units: tuple            # UnitRecord per tracked unit, in order
+    extra: FrozenDict       # round counter, stalemate counter, ... (JSON scalars)
+
+
+def snapshot(units: Sequence[TrackedUnit], **extra: Any) -> CombatSnapshot:
+    """Freeze `units` (O(changed fields) each) plus any scalar bookkeeping passed as keywords."""
+    return CombatSnapshot(tuple(u.record() for u in units), FrozenDict(extra))
+
+
+def restore(units: Sequence[TrackedUnit], snap: CombatSnapshot) -> Dict[str, Any]:
+    """Put `units` back to `snap` in place; returns the snapshot's extra fields."""
+    if len(units) != len(snap.units):
+        raise ValueError("snapshot was taken of a different number of units")
+    for u, rec in zip(units, snap.units):
+        u.restore(rec)
+    return dict(snap.extra)
+
+
+def state_hash(snap: CombatSnapshot) -> str:
+    """Stable hex digest of a snapshot (same state → same hash, across processes)."""
+    h = hashlib.blake2b(digest_size=16)
+    for rec in snap.units:
+        h.update(rec.digest().encode("ascii"))
+    h.update(json.dumps(dict(snap.extra), sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+class CombatTimeline:
+    """
+    Tracked player and enemies plus a stack of checkpoints. `enemies` always
+    holds every enemy (dead ones too), so it can be handed to play_round
+    again after a restore.
+    """
+
+    def __init__(self, player: dict, enemies: Sequence[dict]):
+        self.player = track(player)
+        self.enemies: List[TrackedUnit] = [track(e) for e in enemies]
+        self.units: List[TrackedUnit] = [self.player, *self.enemies]
+        self.checkpoints: List[CombatSnapshot] = []
+
+    def snapshot(self, **extra: Any) -> CombatSnapshot:
+        return snapshot(self.units, **extra)
+
+    def restore(self, snap: CombatSnapshot) -> Dict[str, Any]:
+        return restore(self.units, snap)
+
+    def checkpoint(self, **extra: Any) -> CombatSnapshot:
+        snap = self.snapshot(**extra)
+        self.checkpoints.append(snap)
+        return snap
+
+    def undo(self) -> Optional[Dict[str, Any]]:
+        """Restore and drop the latest checkpoint; returns its extra fields (None when there is none)."""
+        if not self.checkpoints:
+            return None
+        return self.restore(self.checkpoints.pop())
+
+    def state_hash(self, **extra: Any) -> str:
+        return state_hash(self.snapshot(**extra))
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark snapshot/restore on a real fight and check replays.")
+    ap.add_argument("-n", type=int, default=5000, help="snapshot+restore pairs to time")
+    ap.add_argument("--player", default="torvald")
+    ap.add_argument("--bandits", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    from combat_events import quiet_bus, use_bus
+    from combat_policy import ScriptedPolicy
+    from dice import DiceStream, use_dice
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), use_bus(quiet_bus()):
+        import adventure_new as game
+        player = game.load_character_file(args.player)
+        game.equip_armor(player)
+        player, enemies = game.open_combat(player, game.make_bandits(args.bandits), "snapshot bench")
+
+    tl = CombatTimeline(player, enemies)
+    policy = ScriptedPolicy(stance="offensive")
+    watch = game.StalemateWatch(threshold=6)
+
+    def play(rnd: int) -> None:
+        with use_bus(quiet_bus()), use_dice(DiceStream(args.seed).spawn("round", rnd)):
+            game.play_round(tl.player, tl.enemies, rnd, policy, watch)
+
+    start = tl.checkpoint(round=0, no_damage_rounds=watch.no_damage_rounds)
+    play(1)
+    after_one = tl.state_hash(round=1, no_damage_rounds=watch.no_damage_rounds)
+
+    t_snap = t_restore = 0.0
+    for _ in range(args.n):
+        t0 = time.perf_counter()
+        watch.no_damage_rounds = tl.restore(start)["no_damage_rounds"]
+        t1 = time.perf_counter()
+        play(1)
+        t2 = time.perf_counter()
+        tl.snapshot(round=1, no_damage_rounds=watch.no_damage_rounds)
+        t_snap += time.perf_counter() - t2
+        t_restore += t1 - t0
+    replay_ok = tl.state_hash(round=1, no_damage_rounds=watch.no_damage_rounds) == after_one
+    tl.undo()
+    undo_ok = tl.state_hash(round=0, no_damage_rounds=0) == state_hash(start)
+
+    sheets = [_plain(u) for u in tl.units]
+    t3 = time.perf_counter()
+    for _ in range(args.n):
+        [json.loads(json.dumps(u)) for u in sheets]
+    t_json = time.perf_counter() - t3
+    print(f"📸 {len(tl.units)} units, {args.n} rounds: snapshot {1e6 * t_snap / args.n:.1f} µs, "
+          f"restore {1e6 * t_restore / args.n:.1f} µs (JSON round-trip copy {1e6 * t_json / args.n:.1f} µs)")
+    print("✅ replay from checkpoint reproduces the state hash" if replay_ok else "❌ replay hash differs")
+    print("✅ undo restores the checkpoint" if undo_ok else "❌ undo did not restore the checkpoint")
+
+
+__all__ = [
+    "HASH_EXCLUDE", "TrackedDict", "TrackedList", "TrackedUnit", "UnitRecord", "track",
+    "CombatSnapshot", "snapshot", "restore", "state_hash", "CombatTimeline", "main",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -1,113 +1,231 @@
-import random
+# file: scripts/damage_consequences.py
+"""
+Consequences of a body part being destroyed: d100 + excess damage picks an
+injury per damage type (pain, stress, bleeding, mobility, collapse).
 
-class DamageConsequences:
-    def __init__(self):
-        self.consequences = {
-            "slashing": {
-                (1, 20): {
-                    "effect": "Minor Laceration",
-                    "description": "A shallow slash tears the skin, blood trickling down in thin rivulets.",
-                    "pain": 3, "stress": 5, "bleeding": 0.3
-                },
-                (21, 40): {
-                    "effect": "Deep Cut",
-                    "description": "The blade carves a deep gash, exposing raw muscle as blood spurts with each heartbeat.",
-                    "pain": 6, "stress": 10, "bleeding": 0.6
-                },
-                (41, 60): {
-                    "effect": "Severed Muscle",
-                    "description": "A brutal swing severs muscle fibers, leaving the limb twitching and useless, blood pooling beneath.",
-                    "pain": 9, "stress": 15, "bleeding": 1.2, "mobility_penalty": 10
-                },
-                (61, 80): {
-                    "effect": "Artery Slashed",
-                    "description": "The blade slices an artery, unleashing a crimson fountain that sprays across the battlefield.",
-                    "pain": 12, "stress": 20, "bleeding": 2.4
-                },
-                (81, 100): {
-                    "effect": "Limb Severed",
-                    "description": "With a sickening crunch, the blade cleaves through bone, sending the severed limb spinning away in a spray of gore.",
-                    "pain": 15, "stress": 25, "bleeding": 3.6, "mobility_penalty": 25
-                }
-            },
-            "piercing": {
-                (1, 20): {
-                    "effect": "Puncture Wound",
-                    "description": "The point pierces flesh, leaving a neat hole that weeps blood slowly.",
-                    "pain": 3, "stress": 5, "bleeding": 0.3
-                },
-                (21, 40): {
-                    "effect": "Deep Stab",
-                    "description": "The weapon plunges deep, blood bubbling around the embedded blade as it’s wrenched free.",
-                    "pain": 6, "stress": 10, "bleeding": 0.6
-                },
-                (41, 60): {
-                    "effect": "Organ Puncture",
-                    "description": "A precise thrust skewers an organ, blood and bile mixing in a gruesome torrent.",
-                    "pain": 9, "stress": 15, "bleeding": 1.2
-                },
-                (61, 80): {
-                    "effect": "Internal Bleeding",
-                    "description": "The stab tears internal vessels, blood pooling invisibly, each breath a labored gasp.",
-                    "pain": 12, "stress": 20, "bleeding": 2.4
-                },
-                (81, 100): {
-                    "effect": "Critical Organ Hit",
-                    "description": "The blade impales a vital organ, blood gushing as the victim collapses, life fading fast.",
-                    "pain": 15, "stress": 25, "bleeding": 3.6, "collapse": True
-                }
-            },
-            "blunt": {
-                (1, 20): {
-                    "effect": "Bruise",
-                    "description": "A heavy blow leaves a purpling bruise, tender and throbbing with each movement.",
-                    "pain": 3, "stress": 5
-                },
-                (21, 40): {
-                    "effect": "Fractured Bone",
-                    "description": "The impact cracks bone, sending sharp pain lancing through with every step.",
-                    "pain": 6, "stress": 10, "mobility_penalty": 10
-                },
-                (41, 60): {
-                    "effect": "Broken Bone",
-                    "description": "A sickening snap echoes as bone shatters, the limb dangling uselessly.",
-                    "pain": 9, "stress": 15, "mobility_penalty": 20
-                },
-                (61, 80): {
-                    "effect": "Crushed Tissue",
-                    "description": "The blow pulverizes flesh, leaving a mangled, swollen mass of ruined tissue.",
-                    "pain": 12, "stress": 20, "mobility_penalty": 25
-                },
-                (81, 100): {
-                    "effect": "Shattered Bone",
-                    "description": "The weapon crushes bone to splinters, the limb collapsing in a grotesque ruin.",
-                    "pain": 15, "stress": 25, "mobility_penalty": 30, "collapse": True
-                }
-            }
+The table is compiled once into a read-only ConsequenceIndex per damage type
+(sorted band bounds, bisect lookup) that every DamageConsequences shares.
+resolve_batch() looks up many (damage type, excess damage) hits at once.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from combat_events import get_bus
+from dice import get_dice, load_numpy
+from rules_repository import FrozenDict, freeze
+
+ROLL_MIN, ROLL_MAX = 1, 100
+LETHAL_ZONES = ("head", "throat")
+LETHAL_EFFECTS = ("Limb Severed", "Artery Slashed", "Critical Organ Hit", "Shattered Bone")
+
+_TABLE = {
+    "slashing": {
+        (1, 20): {
+            "effect": "Minor Laceration",
+            "description": "A shallow slash tears the skin, blood trickling down in thin rivulets.",
+            "pain": 3, "stress": 5, "bleeding": 0.3
+        },
+        (21, 40): {
+            "effect": "Deep Cut",
+            "description": "The blade carves a deep gash, exposing raw muscle as blood spurts with each heartbeat.",
+            "pain": 6, "stress": 10, "bleeding": 0.6
+        },
+        (41, 60): {
+            "effect": "Severed Muscle",
+            "description": "A brutal swing severs muscle fibers, leaving the limb twitching and useless, blood pooling beneath.",
+            "pain": 9, "stress": 15, "bleeding": 1.2, "mobility_penalty": 10
+        },
+        (61, 80): {
+            "effect": "Artery Slashed",
+            "description": "The blade slices an artery, unleashing a crimson fountain that sprays across the battlefield.",
+            "pain": 12, "stress": 20, "bleeding": 2.4
+        },
+        (81, 100): {
+            "effect": "Limb Severed",
+            "description": "With a sickening crunch, the blade cleaves through bone, sending the severed limb spinning away in a spray of gore.",
+            "pain": 15, "stress": 25, "bleeding": 3.6, "mobility_penalty": 25
+        }
+    },
+    "piercing": {
+        (1, 20): {
+            "effect": "Puncture Wound",
+            "description": "The point pierces flesh, leaving a neat hole that weeps blood slowly.",
+            "pain": 3, "stress": 5, "bleeding": 0.3
+        },
+        (21, 40): {
+            "effect": "Deep Stab",
+            "description": "The weapon plunges deep, blood bubbling around the embedded blade as it’s wrenched free.",
+            "pain": 6, "stress": 10, "bleeding": 0.6
+        },
+        (41, 60): {
+            "effect": "Organ Puncture",
+            "description": "A precise thrust skewers an organ, blood and bile mixing in a gruesome torrent.",
+            "pain": 9, "stress": 15, "bleeding": 1.2
+        },
+        (61, 80): {
+            "effect": "Internal Bleeding",
+            "description": "The stab tears internal vessels, blood pooling invisibly, each breath a labored gasp.",
+            "pain": 12, "stress": 20, "bleeding": 2.4
+        },
+        (81, 100): {
+            "effect": "Critical Organ Hit",
+            "description": "The blade impales a vital organ, blood gushing as the victim collapses, life fading fast.",
+            "pain": 15, "stress": 25, "bleeding": 3.6, "collapse": True
+        }
+    },
+    "blunt": {
+        (1, 20): {
+            "effect": "Bruise",
+            "description": "A heavy blow leaves a purpling bruise, tender and throbbing with each movement.",
+            "pain": 3, "stress": 5
+        },
+        (21, 40): {
+            "effect": "Fractured Bone",
+            "description": "The impact cracks bone, sending sharp pain lancing through with every step.",
+            "pain": 6, "stress": 10, "mobility_penalty": 10
+        },
+        (41, 60): {
+            "effect": "Broken Bone",
+            "description": "A sickening snap echoes as bone shatters, the limb dangling uselessly.",
+            "pain": 9, "stress": 15, "mobility_penalty": 20
+        },
+        (61, 80): {
+            "effect": "Crushed Tissue",
+            "description": "The blow pulverizes flesh, leaving a mangled, swollen mass of ruined tissue.",
+            "pain": 12, "stress": 20, "mobility_penalty": 25
+        },
+        (81, 100): {
+            "effect": "Shattered Bone",
+            "description": "The weapon crushes bone to splinters, the limb collapsing in a grotesque ruin.",
+            "pain": 15, "stress": 25, "mobility_penalty": 30, "collapse": True
         }
+    }
+}
+
+
+class ConsequenceIndex:
+    """Sorted, non-overlapping (low, high) roll bands of one damage type."""
+
+    __slots__ = ("lows", "highs", "effects", "_np_bounds")
+
+    def __init__(self, bands: Mapping[Tuple[int, int], Mapping[str, Any]]):
+        ordered = sorted(bands.items())
+        self.lows = tuple(lo for (lo, _), _ in ordered)
+        self.highs = tuple(hi for (_, hi), _ in ordered)
+        self.effects = tuple(freeze(effect) for _, effect in ordered)
+        self._np_bounds = None
+        for prev_hi, lo in zip(self.highs, self.lows[1:]):
+            if lo <= prev_hi:
+                raise ValueError(f"overlapping consequence bands at {lo}")
+
+    def __len__(self) -> int:
+        return len(self.effects)
+
+    def band(self, roll: int) -> int:
+        """Index of the band containing `roll`, or -1."""
+        i = bisect_right(self.lows, roll) - 1
+        return i if i >= 0 and roll <= self.highs[i] else -1
+
+    def find(self, roll: int) -> Optional[FrozenDict]:
+        i = self.band(roll)
+        return self.effects[i] if i >= 0 else None
+
+    def bands(self, rolls: Sequence[int]) -> List[int]:
+        """band() for many rolls (one searchsorted with NumPy)."""
+        np = load_numpy()
+        if np is None or len(rolls) < 64:
+            return [self.band(r) for r in rolls]
+        if self._np_bounds is None:
+            self._np_bounds = (np.asarray(self.lows), np.asarray(self.highs))
+        lows, highs = self._np_bounds
+        rolls = np.asarray(rolls)
+        idx = np.searchsorted(lows, rolls, side="right") - 1
+        ok = (idx >= 0) & (rolls <= highs[np.maximum(idx, 0)])
+        return np.where(ok, idx, -1).tolist()
+
+
+CONSEQUENCE_INDEX: Mapping[str, ConsequenceIndex] = FrozenDict(
+    {damage_type: ConsequenceIndex(bands) for damage_type, bands in _TABLE.items()}
+)
+del _TABLE
+
+
+def consequence_roll(excess_damage: int, d100: Optional[int] = None) -> int:
+    roll = (get_dice().d100() if d100 is None else d100) + excess_damage
+    return min(ROLL_MAX, max(ROLL_MIN, roll))
+
+
+def lookup(damage_type: str, roll: int) -> Optional[FrozenDict]:
+    """Effect for an already clamped roll; None for unknown types."""
+    index = CONSEQUENCE_INDEX.get(damage_type)
+    return index.find(roll) if index is not None else None
+
+
+def resolve_batch(hits: Iterable[Tuple[str, int]],
+                  rolls: Optional[Sequence[int]] = None) -> List[Optional[FrozenDict]]:
+    """
+    Effects for many (damage_type, excess_damage) hits. `rolls` are the raw
+    d100s (one per hit); without them one d100 per hit is drawn from the
+    current dice stream, in order, like calling apply_consequence per hit.
+    Unknown damage types resolve to None and consume no roll.
+    """
+    hits = list(hits)
+    known = [i for i, (damage_type, _) in enumerate(hits) if damage_type in CONSEQUENCE_INDEX]
+    if rolls is None:
+        dice = get_dice()
+        raw = {i: dice.d100() for i in known}
+    else:
+        if len(rolls) != len(hits):
+            raise ValueError("need one roll per hit")
+        raw = {i: int(rolls[i]) for i in known}
+
+    by_type: Dict[str, List[int]] = {}
+    for i in known:
+        by_type.setdefault(hits[i][0], []).append(i)
+    out: List[Optional[FrozenDict]] = [None] * len(hits)
+    for damage_type, idxs in by_type.items():
+        index = CONSEQUENCE_INDEX[damage_type]
+        bands = index.bands([consequence_roll(hits[i][1], raw[i]) for i in idxs])
+        for i, b in zip(idxs, bands):
+            out[i] = index.effects[b] if b >= 0 else None
+    return out
+
+
+class DamageConsequences:
+    """Applies consequences to characters; all instances share CONSEQUENCE_INDEX."""
+
+    # legacy view: damage type → {(low, high): effect}
+    consequences = FrozenDict({
+        t: FrozenDict(zip(zip(ix.lows, ix.highs), ix.effects)) for t, ix in CONSEQUENCE_INDEX.items()
+    })
+    index = CONSEQUENCE_INDEX
+
+    resolve_batch = staticmethod(resolve_batch)
 
     def apply_consequence(self, character, body_part, damage_type, excess_damage):
-        if damage_type not in self.consequences:
-            print(f"⚠️ Unknown damage type: {damage_type}")
+        bus = get_bus()
+        if damage_type not in self.index:
+            bus.narrate("⚠️ Unknown damage type: {}", damage_type)
+            return
+        effect = self.index[damage_type].find(consequence_roll(excess_damage))
+        if effect is None:
             return
-        roll = random.randint(1, 100) + excess_damage
-        roll = min(100, max(1, roll))
-        for (low, high), effect in self.consequences[damage_type].items():
-            if low <= roll <= high:
-                print(f"💥 {character.name}'s {body_part} suffers: {effect['effect']}!")
-                print(f"🩸 {effect['description']}")
-                character.pain_penalty += effect.get("pain", 0)
-                character.stress_level += effect.get("stress", 0)
-                character.bleeding += effect.get("bleeding", 0)
-                if "mobility_penalty" in effect:
-                    character.mobility_penalty += effect["mobility_penalty"]
-                if effect.get("collapse", False):
-                    character.exhausted = True
-                    character.last_action = True
-                    character.in_combat = False
-                    print(f"💀 {character.name} collapses from injury!")
-                if body_part in ["head", "throat"] and effect["effect"] in ["Limb Severed", "Artery Slashed", "Critical Organ Hit", "Shattered Bone"]:
-                    character.alive = False
-                    character.in_combat = False
-                    print(f"💀 {character.name} is killed instantly by a catastrophic {body_part} injury!")
-                break
\ No newline at end of file
+        bus.narrate("💥 {}'s {} suffers: {}!", character.name, body_part, effect["effect"])
+        bus.narrate("🩸 {}", effect["description"])
+        character.pain_penalty += effect.get("pain", 0)
+        character.stress_level += effect.get("stress", 0)
+        character.bleeding += effect.get("bleeding", 0)
+        if "mobility_penalty" in effect:
+            character.mobility_penalty += effect["mobility_penalty"]
+        if effect.get("collapse", False):
+            character.exhausted = True
+            character.last_action = True
+            character.in_combat = False
+            bus.narrate("💀 {} collapses from injury!", character.name)
+        if body_part in LETHAL_ZONES and effect["effect"] in LETHAL_EFFECTS:
+            character.alive = False
+            character.in_combat = False
+            bus.narrate("💀 {} is killed instantly by a catastrophic {} injury!", character.name, body_part)
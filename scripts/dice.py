@@ -0,0 +1,207 @@
+# file: scripts/dice.py
+"""
+Central dice service: seeded, splittable random streams for every roll.
+
+All combat modules roll through the *current* stream (get_dice()) instead of
+the global `random` module, so one seed reproduces a whole session:
+
+    from dice import DiceStream, use_dice
+
+    with use_dice(DiceStream(seed=42)):
+        run_combat(...)
+
+Streams are splittable: `stream.spawn("duel", 17)` derives an independent
+child from the parent's seed and the key path (SHA-256), without consuming
+any rolls from the parent. Parallel workers that spawn by duel index therefore
+get identical dice whatever the worker count or scheduling order.
+
+Bulk mode (`DiceStream(seed, bulk=True)` or `stream.bulk()`) pre-generates
+d100/d20 blocks with NumPy and serves single rolls from those buffers; blocks
+grow geometrically so short-lived streams don't pay for big buffers. Bulk
+streams are deterministic per seed but produce a different sequence than
+non-bulk streams with the same seed. Without NumPy, bulk mode silently falls
+back to per-roll Python draws.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import random
+from typing import Any, Iterator, List, MutableSequence, Optional, Sequence, Tuple, TypeVar
+
+_np: Any = None  # NumPy module, False when unavailable, None until first needed
+
+T = TypeVar("T")
+
+_BLOCK_MIN = 64
+_BLOCK_MAX = 8192
+
+
+def load_numpy():
+    """
+    NumPy, imported on first use (None when not installed). NumPy is optional
+    and its import costs more than the whole game start, so only bulk dice and
+    batched APIs pay for it.
+    """
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+
+def derive_seed(seed: Any, path: Sequence[Any] = ()) -> int:
+    """Stable 64-bit seed for `seed` + key path (independent of PYTHONHASHSEED)."""
+    key = "/".join([repr(seed)] + [str(p) for p in path])
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
+
+
+class DiceStream:
+    """
+    A random.Random-compatible stream (randint/choice/sample/random/shuffle/
+    getrandbits) plus d100()/d20() shortcuts and spawn() for child streams.
+
+    seed=None gives an OS-seeded stream; its children are OS-seeded too.
+    """
+
+    def __init__(self, seed: Any = None, path: Tuple[Any, ...] = (), bulk: bool = False):
+        self.seed = seed
+        self.path = tuple(path)
+        self._rng = random.Random(derive_seed(seed, self.path) if seed is not None else None)
+        self._np_gen = None
+        self._d100: Optional[List[int]] = None
+        self._d20: Optional[List[int]] = None
+        self._block = _BLOCK_MIN
+        if bulk:
+            self.bulk()
+
+    def __repr__(self) -> str:
+        mode = "bulk" if self._d100 is not None else "scalar"
+        return f"DiceStream(seed={self.seed!r}, path={self.path!r}, {mode})"
+
+    # ---- splitting ----
+    def spawn(self, *keys: Any) -> "DiceStream":
+        """Independent child stream keyed by `keys`; inherits bulk mode."""
+        return DiceStream(self.seed, self.path + keys, bulk=self._d100 is not None)
+
+    # ---- bulk mode ----
+    def bulk(self, block: int = _BLOCK_MIN) -> "DiceStream":
+        """Serve d100/d20 from pre-generated NumPy blocks (no-op without NumPy)."""
+        np = load_numpy()
+        if np is not None and self._d100 is None:
+            self._np_gen = np.random.default_rng(self._rng.getrandbits(64))
+            self._block = max(1, int(block))
+            self._d100 = []
+            self._d20 = []
+        return self
+
+    def _grow(self) -> int:
+        n = self._block
+        self._block = min(_BLOCK_MAX, n * 2)
+        return n
+
+    def block_d100(self, n: int):
+        """n d100 rolls at once (NumPy array when available, else a list)."""
+        np = load_numpy()
+        if np is not None:
+            gen = self._np_gen or np.random.default_rng(self._rng.getrandbits(64))
+            self._np_gen = gen
+            return gen.integers(1, 101, size=n)
+        return [self._rng.randint(1, 100) for _ in range(n)]
+
+    def block_d20(self, n: int):
+        """n d20 rolls at once (NumPy array when available, else a list)."""
+        np = load_numpy()
+        if np is not None:
+            gen = self._np_gen or np.random.default_rng(self._rng.getrandbits(64))
+            self._np_gen = gen
+            return gen.integers(1, 21, size=n)
+        return [self._rng.randint(1, 20) for _ in range(n)]
+
+    # ---- dice ----
+    def d100(self) -> int:
+        buf = self._d100
+        if buf is None:
+            return self._rng.randint(1, 100)
+        if not buf:
+            buf.extend(self._np_gen.integers(1, 101, size=self._grow()).tolist())
+        return buf.pop()
+
+    def d20(self) -> int:
+        buf = self._d20
+        if buf is None:
+            return self._rng.randint(1, 20)
+        if not buf:
+            buf.extend(self._np_gen.integers(1, 21, size=self._grow()).tolist())
+        return buf.pop()
+
+    # ---- random.Random surface ----
+    def randint(self, a: int, b: int) -> int:
+        if a == 1:
+            if b == 100:
+                return self.d100()
+            if b == 20:
+                return self.d20()
+        return self._rng.randint(a, b)
+
+    def random(self) -> float:
+        return self._rng.random()
+
+    def choice(self, seq: Sequence[T]) -> T:
+        return self._rng.choice(seq)
+
+    def sample(self, population: Sequence[T], k: int) -> List[T]:
+        return self._rng.sample(population, k)
+
+    def shuffle(self, seq: MutableSequence[Any]) -> None:
+        self._rng.shuffle(seq)
+
+    def uniform(self, a: float, b: float) -> float:
+        return self._rng.uniform(a, b)
+
+    def getrandbits(self, k: int) -> int:
+        return self._rng.getrandbits(k)
+
+
+# =============================================================================
+# Current stream
+# =============================================================================
+
+_current = DiceStream()
+
+
+def get_dice() -> DiceStream:
+    return _current
+
+
+def set_dice(stream: DiceStream) -> DiceStream:
+    """Install `stream` process-wide; returns the previous stream."""
+    global _current
+    prev, _current = _current, stream
+    return prev
+
+
+@contextlib.contextmanager
+def use_dice(stream: DiceStream) -> Iterator[DiceStream]:
+    prev = set_dice(stream)
+    try:
+        yield stream
+    finally:
+        set_dice(prev)
+
+
+def seed_dice(seed: Any, bulk: bool = False) -> DiceStream:
+    """Replace the current stream with a fresh seeded one (session start)."""
+    stream = DiceStream(seed, bulk=bulk)
+    set_dice(stream)
+    return stream
+
+
+__all__ = [
+    "DiceStream", "derive_seed", "load_numpy",
+    "get_dice", "set_dice", "use_dice", "seed_dice",
+]
@@ -0,0 +1,372 @@
+# file: scripts/duel_lab.py
+"""
+Headless duel lab.
+
+Runs N independent duels between two characters from rules/characters/ across a
+process pool, using CombatEngine for the rolls and CombatHealthManager for the
+body-part damage model, and reports:
+
+  - win rate (with Wilson 95% confidence interval)
+  - rounds-to-kill: mean (95% CI) and percentiles
+  - damage per round for each side (95% CI)
+
+Usage:
+    python scripts/duel_lab.py torvald gorthak -n 100000 -j 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from character import Character
+from character_loader import CharacterLoader
+from combat_engine import CombatEngine
+from combat_events import quiet_bus, use_bus
+from combat_health import CombatHealthManager
+from dice import DiceStream, use_dice
+from rules_repository import get_rules, thaw
+
+HERE = Path(__file__).resolve().parent
+CHAR_DIR = (HERE / "../rules/characters").resolve()
+
+DEFAULT_MAX_ROUNDS = 200
+BULK_DICE = True  # serve d100s from pre-generated NumPy blocks (see dice.DiceStream.bulk)
+FALLBACK_BASE_DAMAGE = 8
+
+# One duel result: (winner, rounds, damage dealt by A, damage dealt by B)
+#   winner: 0 = A, 1 = B, -1 = draw (both fell or max rounds reached)
+DuelResult = Tuple[int, int, int, int]
+
+# =============================================================================
+# Combatant loading
+# =============================================================================
+
+_STAT_FIELDS = (
+    "strength", "toughness", "agility", "mobility", "dexterity", "endurance",
+    "intelligence", "willpower", "perception", "charisma", "corruption_level",
+    "stress_level", "weapon_skill", "faith", "reputation",
+)
+
+
+def find_character_file(key: str) -> Path:
+    """Resolve a short name ("torvald", "ser caldran", "gorthak.json") or a path to a character file."""
+    p = Path(key)
+    if p.suffix == ".json" and p.exists():
+        return p.resolve()
+    query = key.lower().replace(".json", "").replace(" ", "_")
+    for cand in sorted(CHAR_DIR.glob("*.json")):
+        stem = cand.stem.lower()
+        if stem == query or stem.endswith("_" + query) or stem.startswith(query + "_"):
+            return cand
+    raise FileNotFoundError(f"No character file matching '{key}' in {CHAR_DIR}")
+
+
+def _scaled_body_parts(total_hp: int) -> Dict[str, int]:
+    """Spread total_hp over the default body plan, keeping the plan's proportions."""
+    weights = Character().body_parts
+    scale = max(1, int(total_hp)) / sum(weights.values())
+    return {part: max(1, int(round(w * scale))) for part, w in weights.items()}
+
+
+def load_combatant(key: str, loader: Optional[CharacterLoader] = None) -> Character:
+    """
+    Build a combat-ready Character from a rules/characters/*.json file.
+
+    Per-file stats win over defaults; weapons and armor are looked up in
+    rules/weapons.json and rules/armors.json through CharacterLoader.
+    """
+    loader = loader or CharacterLoader()
+    path = find_character_file(key)
+    data = thaw(get_rules().get(path))
+
+    char = Character()
+    char.name = data.get("name", path.stem)
+    char.race = data.get("race", "Human")
+    char.gender = data.get("gender", "Male")
+    char.class_name = data.get("class", "")
+    char.total_hp = int(data.get("total_hp", 100))
+    char.max_stamina = int(data.get("max_stamina", 100))
+    char.stamina = char.max_stamina
+    char.shield_equipped = bool(data.get("shield_equipped", False))
+    char.weapon_equipped = bool(data.get("weapon_equipped", True))
+    for stat in _STAT_FIELDS:
+        if stat in data:
+            setattr(char, stat, data[stat])
+    char.skills = dict(data.get("skills") or {})
+    char.body_parts = dict(data["body_parts"]) if data.get("body_parts") else _scaled_body_parts(char.total_hp)
+
+    weapon = data.get("weapon")
+    if isinstance(weapon, dict):
+        char.weapon = dict(weapon)
+    elif weapon:
+        char.weapon = dict(loader.load_weapon(str(weapon).lower()))
+    if not int(char.weapon.get("base_damage", 0) or 0):
+        char.weapon["base_damage"] = FALLBACK_BASE_DAMAGE
+
+    for tier in data.get("armor") or []:
+        char.armor.append(loader.load_armor_piece(tier, "standard"))
+    return char
+
+# =============================================================================
+# Single duel
+# =============================================================================
+
+def _zone_key(zone: str) -> str:
+    return str(zone).lower().replace(" ", "_")
+
+
+def _strike(engine: CombatEngine, attacker: Character, defender: Character,
+            att_hp: CombatHealthManager, def_hp: CombatHealthManager, stance: str = "NEUTRAL") -> int:
+    """One attack; returns damage that got through armor."""
+    weapon = attacker.weapon or {}
+    damage_type = weapon.get("damage_type", "slashing")
+    hit, damage = engine.attack_roll(
+        attacker=attacker,
+        defender=defender,
+        weapon_damage=int(weapon.get("base_damage", FALLBACK_BASE_DAMAGE)),
+        damage_type=damage_type,
+        attacker_health=att_hp,
+        defender_health=def_hp,
+        chosen_stance=stance,
+    )
+    if not hit:
+        return 0
+    dealt = 0
+    for zone, dmg in damage:
+        zone = _zone_key(zone)
+        for piece in defender.armor:
+            if dmg > 0 and zone in getattr(piece, "coverage", ()):
+                dmg = piece.absorb_damage(dmg, damage_type, zone)
+        if dmg > 0:
+            def_hp.take_damage_to_zone(zone, dmg, damage_type)
+            dealt += dmg
+    return dealt
+
+
+class DuelPair:
+    """
+    Two fighters reused for a run of duels between the same templates: deep-copied
+    once, then reset in place (Character.reset_for_duel) before every duel, which
+    is several times cheaper than a deepcopy of both per duel.
+    """
+
+    def __init__(self, template_a: Character, template_b: Character):
+        self.templates = (template_a, template_b)
+        self.fighters = (copy.deepcopy(template_a), copy.deepcopy(template_b))
+
+    def fresh(self) -> Tuple[Character, Character]:
+        for fighter, template in zip(self.fighters, self.templates):
+            fighter.reset_for_duel(template)
+        return self.fighters
+
+
+def run_duel(template_a: Character, template_b: Character, dice: Any,
+             max_rounds: int = DEFAULT_MAX_ROUNDS, a_first: bool = True,
+             stances: Tuple[str, str] = ("NEUTRAL", "NEUTRAL"), pair: Optional[DuelPair] = None) -> DuelResult:
+    """
+    Fight fresh copies of the two templates to the end; templates are never mutated.
+    `dice` is a DiceStream (or a seed for one); the engine and the wound tables
+    each roll on their own child stream. `stances` are A's and B's attack stances.
+    Pass a DuelPair of the same templates when running many duels.
+    """
+    if not isinstance(dice, DiceStream):
+        dice = DiceStream(dice)
+    if pair is not None:
+        a, b = pair.fresh()
+    else:
+        a, b = copy.deepcopy(template_a), copy.deepcopy(template_b)
+    engine = CombatEngine(rng=dice.spawn("engine"))
+    a_hp = CombatHealthManager(a)
+    b_hp = CombatHealthManager(b)
+
+    order = ((a, b, a_hp, b_hp, 0, stances[0]), (b, a, b_hp, a_hp, 1, stances[1]))
+    if not a_first:
+        order = order[::-1]
+    dealt = [0, 0]
+    rounds = 0
+    with use_dice(dice.spawn("wounds")):
+        while a.alive and b.alive and rounds < max_rounds:
+            rounds += 1
+            for attacker, defender, att_hp, def_hp, side, stance in order:
+                if not (attacker.alive and defender.alive):
+                    break
+                dealt[side] += _strike(engine, attacker, defender, att_hp, def_hp, stance)
+
+    if a.alive and not b.alive:
+        winner = 0
+    elif b.alive and not a.alive:
+        winner = 1
+    else:
+        winner = -1
+    return winner, rounds, dealt[0], dealt[1]
+
+# =============================================================================
+# Pool workers
+# =============================================================================
+
+_TEMPLATES: Dict[str, Character] = {}
+
+
+def _template(key: str) -> Character:
+    """Per-process template cache so each worker parses a character only once."""
+    if key not in _TEMPLATES:
+        _TEMPLATES[key] = load_combatant(key)
+    return _TEMPLATES[key]
+
+
+def _run_chunk(args: Tuple[str, str, int, int, int, int]) -> List[DuelResult]:
+    key_a, key_b, seed, start, count, max_rounds = args
+    logging.disable(logging.WARNING)
+    # Combat output goes through a NullSink bus, so no event or string is built;
+    # stdout is still discarded for the loader's plain prints.
+    with use_bus(quiet_bus()), open(os.devnull, "w", encoding="utf-8") as sink, \
+            contextlib.redirect_stdout(sink):
+        a = _template(key_a)
+        b = _template(key_b)
+        # Duel i always gets the same dice stream and initiative, whichever worker runs it.
+        lab = DiceStream(seed, bulk=BULK_DICE)
+        pair = DuelPair(a, b)
+        return [
+            run_duel(a, b, lab.spawn(i), max_rounds, a_first=(i % 2 == 0), pair=pair)
+            for i in range(start, start + count)
+        ]
+
+
+def run_lab(key_a: str, key_b: str, n: int, workers: Optional[int] = None, seed: int = 0,
+            max_rounds: int = DEFAULT_MAX_ROUNDS, chunk_size: Optional[int] = None) -> List[DuelResult]:
+    """Run n duels across `workers` processes (1 = in-process). Results come back in duel order."""
+    workers = max(1, workers or os.cpu_count() or 1)
+    if chunk_size is None:
+        chunk_size = max(1, min(2000, math.ceil(n / (workers * 4))))
+    jobs = [
+        (key_a, key_b, seed, start, min(chunk_size, n - start), max_rounds)
+        for start in range(0, n, chunk_size)
+    ]
+    if workers == 1:
+        chunks = [_run_chunk(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_chunk, jobs))
+    return [r for chunk in chunks for r in chunk]
+
+# =============================================================================
+# Statistics
+# =============================================================================
+
+Z95 = 1.959963984540054
+
+
+def wilson_interval(successes: int, n: int, z: float = Z95) -> Tuple[float, float]:
+    if n <= 0:
+        return 0.0, 0.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def mean_ci(values: Sequence[float], z: float = Z95) -> Tuple[float, float, float]:
+    """(mean, low, high) using the normal approximation."""
+    n = len(values)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    mean = sum(values) / n
+    if n == 1:
+        return mean, mean, mean
+    var = sum((v - mean) ** 2 for v in values) / (n - 1)
+    half = z * math.sqrt(var / n)
+    return mean, mean - half, mean + half
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(math.floor(k))
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(results: Sequence[DuelResult]) -> Dict[str, Any]:
+    n = len(results)
+    wins_a = sum(1 for r in results if r[0] == 0)
+    wins_b = sum(1 for r in results if r[0] == 1)
+    decisive = sorted(r[1] for r in results if r[0] != -1)
+    dpr_a = [r[2] / r[1] for r in results if r[1] > 0]
+    dpr_b = [r[3] / r[1] for r in results if r[1] > 0]
+    rtk_mean, rtk_lo, rtk_hi = mean_ci(decisive)
+    return {
+        "duels": n,
+        "win_rate_a": wins_a / n if n else 0.0,
+        "win_rate_a_ci": wilson_interval(wins_a, n),
+        "win_rate_b": wins_b / n if n else 0.0,
+        "win_rate_b_ci": wilson_interval(wins_b, n),
+        "draw_rate": (n - wins_a - wins_b) / n if n else 0.0,
+        "rounds_to_kill_mean": rtk_mean,
+        "rounds_to_kill_ci": (rtk_lo, rtk_hi),
+        "rounds_to_kill_pct": {p: percentile(decisive, p) for p in (10, 50, 90, 99)},
+        "damage_per_round_a": mean_ci(dpr_a),
+        "damage_per_round_b": mean_ci(dpr_b),
+    }
+
+
+def format_report(name_a: str, name_b: str, stats: Dict[str, Any], elapsed: float) -> str:
+    pct = stats["rounds_to_kill_pct"]
+    a_lo, a_hi = stats["win_rate_a_ci"]
+    b_lo, b_hi = stats["win_rate_b_ci"]
+    lo, hi = stats["rounds_to_kill_ci"]
+    dpr_a, dpr_a_lo, dpr_a_hi = stats["damage_per_round_a"]
+    dpr_b, dpr_b_lo, dpr_b_hi = stats["damage_per_round_b"]
+    rate = stats["duels"] / elapsed if elapsed > 0 else float("inf")
+    return "\n".join([
+        f"⚔️ {name_a} vs {name_b}: {stats['duels']} duels in {elapsed:.2f}s ({rate:,.0f} duels/s)",
+        f"🏆 {name_a} wins {stats['win_rate_a']:.2%} (95% CI {a_lo:.2%}–{a_hi:.2%})",
+        f"🏆 {name_b} wins {stats['win_rate_b']:.2%} (95% CI {b_lo:.2%}–{b_hi:.2%})",
+        f"☠️ Draws / timeouts: {stats['draw_rate']:.2%}",
+        f"⏱️ Rounds to kill: mean {stats['rounds_to_kill_mean']:.2f} (95% CI {lo:.2f}–{hi:.2f}), "
+        f"p10 {pct[10]:.0f} · p50 {pct[50]:.0f} · p90 {pct[90]:.0f} · p99 {pct[99]:.0f}",
+        f"💥 {name_a} damage/round: {dpr_a:.2f} (95% CI {dpr_a_lo:.2f}–{dpr_a_hi:.2f})",
+        f"💥 {name_b} damage/round: {dpr_b:.2f} (95% CI {dpr_b_lo:.2f}–{dpr_b_hi:.2f})",
+    ])
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    ap = argparse.ArgumentParser(description="Run N headless duels between two characters from rules/characters/.")
+    ap.add_argument("a", help="first character (short name or path), e.g. torvald")
+    ap.add_argument("b", help="second character (short name or path), e.g. gorthak")
+    ap.add_argument("-n", "--duels", type=int, default=10000, help="number of duels (default 10000)")
+    ap.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    ap.add_argument("--seed", type=int, default=0, help="base seed; results are reproducible per seed")
+    ap.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS, help="rounds before a duel is called a draw")
+    args = ap.parse_args(argv)
+
+    with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        logging.disable(logging.WARNING)
+        name_a = load_combatant(args.a).name
+        name_b = load_combatant(args.b).name
+        logging.disable(logging.NOTSET)
+
+    t0 = time.perf_counter()
+    results = run_lab(args.a, args.b, args.duels, workers=args.workers, seed=args.seed, max_rounds=args.max_rounds)
+    elapsed = time.perf_counter() - t0
+    stats = summarize(results)
+    print(format_report(name_a, name_b, stats, elapsed))
+    return stats
+
+
+if __name__ == "__main__":
+    main()
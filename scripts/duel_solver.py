@@ -0,0 +1,401 @@
+# file: scripts/duel_solver.py
+"""
+Exact 1-vs-1 duel outcomes under the adventure_new rules (no sampling).
+
+A run_combat duel with a fixed player action is a Markov chain on
+
+    (player HP, enemy HP, rounds without damage, Fade Step evade pending)
+
+and this module walks it round by round with exact probabilities from
+hit_tables: pain penalties (HP-dependent margins), the enemy's HP-dependent
+stance, crits and head bonus, armor coverage, crit misses → ripostes (both
+ways), Veil's Grace and melee vulnerability for a sorceress player, stalemate
+fatigue, and the 40-round limit (a timeout counts as a loss, as in
+run_combat). A riposte that kills the enemy during its own turn wins at the
+start of the next round, again exactly as run_combat reports it.
+
+Stamina is not part of the state: spend_stamina clamps at zero and nothing
+in melee checks it, so per-stance regen/costs never change an outcome and
+every stamina bucket would carry identical probabilities. Spells are not
+modelled (the player always melees).
+
+    from duel_solver import solve_duel, DuelAction
+    sol = solve_duel(torvald, leader, DuelAction("offensive", "aimed", "head", "brutal_strike"))
+    sol.win, sol.rounds_pmf("win")
+
+Solutions are memoised on the rules digests (combat_rules/weapons/armors),
+both unit sheets and the action, so balance reviews over hundreds of
+matchups only solve each distinct one once.
+
+CLI:
+    python scripts/duel_solver.py torvald bandit_leader --stance offensive --attack aimed --zone head
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from dice import load_numpy
+from hit_tables import DamageRules, HitOdds, hit_damage, rules_table
+from rules_repository import get_rules, thaw
+from sorcery_ext import MELEE_VULN_MULT
+
+import adventure_new as game
+
+STALEMATE_THRESHOLD = 6
+VEIL_GRACE_CHANCE = 0.20     # run_combat: d100 <= 20 averts a lethal melee hit
+
+
+class DuelAction(NamedTuple):
+    """The player's fixed choice every round (zone only for aimed attacks)."""
+    stance: str = "offensive"
+    attack: str = "normal"
+    zone: Optional[str] = None
+    ability: Optional[str] = None
+
+
+class _State(NamedTuple):
+    hp_p: int
+    hp_e: int
+    idle: int        # consecutive rounds without damage
+    evade: bool      # Fade Step / Veil's Grace evade pending on the player
+
+
+@dataclass(frozen=True)
+class DuelSolution:
+    win: float
+    loss: float
+    timeout: float
+    win_by_round: Tuple[float, ...]    # index r-1 = P(win in round r)
+    loss_by_round: Tuple[float, ...]
+    states: int                        # distinct states visited
+
+    def rounds_pmf(self, outcome: str = "win") -> Dict[int, float]:
+        seq = self.win_by_round if outcome == "win" else self.loss_by_round
+        return {r: p for r, p in enumerate(seq, 1) if p > 0}
+
+    @property
+    def expected_rounds(self) -> float:
+        """Mean rounds over all fights (timeouts count as MAX_ROUNDS)."""
+        total = sum(r * (w + l) for r, (w, l) in enumerate(zip(self.win_by_round, self.loss_by_round), 1))
+        return total + self.timeout * game.MAX_ROUNDS
+
+    def rounds_quantile(self, q: float, outcome: str = "win") -> Optional[int]:
+        """Smallest r with P(outcome by round r | outcome) >= q."""
+        seq = self.win_by_round if outcome == "win" else self.loss_by_round
+        total = sum(seq)
+        acc = 0.0
+        for r, p in enumerate(seq, 1):
+            acc += p
+            if total and acc / total >= q - 1e-12:
+                return r
+        return None
+
+# =============================================================================
+# Chain
+# =============================================================================
+
+class DuelChain:
+    """Per-round transition law for one matchup; the idle-independent part is cached per (HP, HP, evade)."""
+
+    def __init__(self, player: dict, enemy: dict, action: DuelAction):
+        self.player = thaw(player)
+        self.enemy = thaw(enemy)
+        for u in (self.player, self.enemy):
+            game.ensure_hp_fields(u)
+            game.init_weapon_state(u)
+        self.action = action
+        self.aimed = str(action.attack).lower().startswith("aim")
+        self.zone = action.zone if self.aimed else None
+        self.sorceress = game.is_sorceress(self.player)
+        self.table = rules_table(game.rules)
+        self.dmg_rules = DamageRules.from_rules(game.rules)
+        self.total_p = int(self.player["total_hp"])
+        self.total_e = int(self.enemy["total_hp"])
+
+        raw = game.base_damage_for(self.player) + game.ability_damage_bonus(self.player, action.ability)
+        covered = bool(self.zone) and game.is_zone_covered(self.enemy, self.zone)
+        self.p_hit = (hit_damage(raw, False, self.dmg_rules, self.zone, covered),
+                      hit_damage(raw, True, self.dmg_rules, self.zone, covered))
+        p_base = game.base_damage_for(self.player)
+        self.p_riposte = (p_base, int(round(p_base * self.dmg_rules.crit_mult)))
+        e_base = game.base_damage_for(self.enemy)
+        self.e_hit = (e_base, int(round(e_base * self.dmg_rules.crit_mult)))
+        self._margins: Dict[Tuple, int] = {}
+        self._attacks: Dict[Tuple, List[Tuple[float, int, bool, bool, bool]]] = {}
+        self._cores: Dict[Tuple[int, int, bool], List[Tuple[float, str, int, int, bool, bool]]] = {}
+
+    # ---- odds ----
+    def _margin(self, attacker: dict, hp: int, stance: str, defender: dict, attack_type: str) -> int:
+        key = (id(attacker), hp, stance, attack_type)
+        m = self._margins.get(key)
+        if m is None:
+            unit = dict(attacker, current_hp=hp)
+            calc = game.attack_modifiers(unit, stance, defender, "neutral", attack_type, aimed_zone=self.zone)
+            m = self._margins[key] = calc["attack_mod"] - calc["defense_mod"]
+        return m
+
+    def _odds(self, attacker: dict, hp: int, stance: str, defender: dict, attack_type: str = "normal") -> HitOdds:
+        return self.table.odds(self._margin(attacker, hp, stance, defender, attack_type))
+
+    def _enemy_stance(self, hp_e: int) -> str:
+        return "offensive" if hp_e > self.total_e * 0.35 else "defensive"
+
+    # ---- enemy melee on the player (turn or riposte) ----
+    def _vulnerable(self, dmg: int) -> int:
+        """apply_melee_vulnerability for the player (sorceresses take +50% from melee)."""
+        return int(round(dmg * MELEE_VULN_MULT)) if self.sorceress else dmg
+
+    def _melee_on_player(self, hp_p: int, evade: bool, dmg: int) -> List[Tuple[float, int, bool, bool]]:
+        """[(p, hp_p', evade', damaged)] for one landed enemy melee hit of `dmg`."""
+        if self.sorceress and hp_p - dmg <= 0:
+            halved = (dmg + 1) // 2
+            out = [(VEIL_GRACE_CHANCE, hp_p, True, False)]
+            if evade:
+                out.append((1 - VEIL_GRACE_CHANCE, hp_p, False, False))
+            else:
+                taken = self._vulnerable(halved)
+                out.append((1 - VEIL_GRACE_CHANCE, max(0, hp_p - taken), False, True))
+            return out
+        if evade:
+            return [(1.0, hp_p, False, False)]
+        taken = self._vulnerable(dmg)
+        return [(1.0, max(0, hp_p - taken), False, True)]
+
+    def _enemy_attack(self, hp_p: int, hp_e: int, evade: bool, stance: str
+                      ) -> List[Tuple[float, int, bool, bool, bool]]:
+        """[(p, hp_p', evade', damaged, crit_miss)] for one enemy attack roll."""
+        key = (hp_p, hp_e, evade, stance)
+        out = self._attacks.get(key)
+        if out is not None:
+            return out
+        out = []
+        odds = self._odds(self.enemy, hp_e, stance, self.player)
+        for p_branch, dmg in ((odds.normal, self.e_hit[0]), (odds.crit, self.e_hit[1])):
+            if p_branch > 0:
+                for p, hp2, ev2, dmgd in self._melee_on_player(hp_p, evade, dmg):
+                    out.append((p_branch * p, hp2, ev2, dmgd, False))
+        if odds.crit_miss > 0:
+            out.append((odds.crit_miss, hp_p, evade, False, True))
+        plain_miss = odds.miss - odds.crit_miss
+        if plain_miss > 0:
+            out.append((plain_miss, hp_p, evade, False, False))
+        self._attacks[key] = out
+        return out
+
+    # ---- one round ----
+    def _round_core(self, hp_p: int, hp_e: int, evade: bool) -> List[Tuple[float, str, int, int, bool, bool]]:
+        """
+        Everything in a round up to the stalemate check, which does not depend
+        on the idle counter: [(p, kind, hp_p', hp_e', evade', damaged)] with
+        kind "won", "won_next", "lost" or "next".
+        """
+        key = (hp_p, hp_e, evade)
+        hit = self._cores.get(key)
+        if hit is not None:
+            return hit
+        out: Dict[Tuple, float] = defaultdict(float)
+
+        def settle(p: float, hp_p: int, hp_e: int, evade: bool, damaged: bool, enemy_dead: bool) -> None:
+            if hp_p <= 0:
+                out[("lost", 0, 0, False, False)] += p
+            elif enemy_dead:
+                out[("won_next", 0, 0, False, False)] += p
+            else:
+                out[("next", hp_p, hp_e, evade, damaged)] += p
+
+        def enemy_turn(p: float, hp_p: int, hp_e: int, evade: bool, damaged: bool) -> None:
+            if hp_p <= 0:  # player already fell to a riposte
+                settle(p, hp_p, hp_e, evade, damaged, False)
+                return
+            for q, hp_p2, ev2, dmgd, crit_miss in self._enemy_attack(hp_p, hp_e, evade, self._enemy_stance(hp_e)):
+                if not crit_miss:
+                    settle(p * q, hp_p2, hp_e, ev2, damaged or dmgd, False)
+                    continue
+                # player's riposte: offensive, normal attack, plain weapon damage
+                r = self._odds(self.player, hp_p2, "offensive", self.enemy)
+                for pr, dmg in ((r.normal, self.p_riposte[0]), (r.crit, self.p_riposte[1])):
+                    if pr > 0:
+                        hp_e2 = max(0, hp_e - dmg)
+                        settle(p * q * pr, hp_p2, hp_e2, ev2, True, hp_e2 <= 0)
+                if r.miss > 0:
+                    settle(p * q * r.miss, hp_p2, hp_e, ev2, damaged, False)
+
+        # player's attack
+        odds = self._odds(self.player, hp_p, self.action.stance, self.enemy, self.action.attack)
+        for p_branch, dmg in ((odds.normal, self.p_hit[0]), (odds.crit, self.p_hit[1])):
+            if p_branch > 0:
+                hp_e2 = max(0, hp_e - dmg)
+                if hp_e2 <= 0:
+                    out[("won", 0, 0, False, False)] += p_branch
+                else:
+                    enemy_turn(p_branch, hp_p, hp_e2, evade, True)
+        if odds.crit_miss > 0:
+            # enemy riposte: offensive, normal attack
+            for q, hp_p2, ev2, dmgd, _ in self._enemy_attack(hp_p, hp_e, evade, "offensive"):
+                enemy_turn(odds.crit_miss * q, hp_p2, hp_e, ev2, dmgd)
+        plain_miss = odds.miss - odds.crit_miss
+        if plain_miss > 0:
+            enemy_turn(plain_miss, hp_p, hp_e, evade, False)
+
+        result = [(p,) + k for k, p in out.items() if p > 0]
+        self._cores[key] = result
+        return result
+
+    def transitions(self, s: _State) -> List[Tuple[float, str, Optional[_State]]]:
+        """
+        [(p, kind, payload)]: kind "won" / "won_next" / "lost" (payload None) or
+        "next" (payload = next _State), after the stalemate check.
+        """
+        out: Dict[Tuple[str, Optional[_State]], float] = defaultdict(float)
+        for p, kind, hp_p, hp_e, evade, damaged in self._round_core(s.hp_p, s.hp_e, s.evade):
+            if kind != "next":
+                out[(kind, None)] += p
+                continue
+            idle = 0 if damaged else s.idle + 1
+            if idle >= STALEMATE_THRESHOLD:
+                idle, hp_p, hp_e = 0, max(0, hp_p - 1), max(0, hp_e - 1)
+            out[("next", _State(hp_p, hp_e, idle, evade))] += p
+        return [(p, kind, payload) for (kind, payload), p in out.items()]
+
+    def compile(self) -> Tuple[List[_State], List[Tuple[int, int, float]], Dict[str, List[float]]]:
+        """
+        Every state reachable from the start (index 0), the state→state edges
+        (src, dst, p) and per-state absorption probabilities by kind.
+        """
+        start = _State(int(self.player["current_hp"]), int(self.enemy["current_hp"]), 0,
+                       bool(self.player.get("_evade_next_melee", False)))
+        index = {start: 0}
+        states = [start]
+        edges: List[Tuple[int, int, float]] = []
+        absorb: Dict[str, List[float]] = {"won": [], "won_next": [], "lost": []}
+        i = 0
+        while i < len(states):
+            row = {"won": 0.0, "won_next": 0.0, "lost": 0.0}
+            for p, kind, payload in self.transitions(states[i]):
+                if kind != "next":
+                    row[kind] += p
+                    continue
+                j = index.get(payload)
+                if j is None:
+                    j = index[payload] = len(states)
+                    states.append(payload)
+                edges.append((i, j, p))
+            for kind, p in row.items():
+                absorb[kind].append(p)
+            i += 1
+        return states, edges, absorb
+
+    def solve(self, max_rounds: int = game.MAX_ROUNDS) -> DuelSolution:
+        states, edges, absorb = self.compile()
+        n = len(states)
+        win = [0.0] * max_rounds
+        loss = [0.0] * max_rounds
+        timeout = 0.0
+        np = load_numpy()
+
+        if np is not None:
+            src = np.fromiter((e[0] for e in edges), dtype=np.int64, count=len(edges))
+            dst = np.fromiter((e[1] for e in edges), dtype=np.int64, count=len(edges))
+            prob = np.fromiter((e[2] for e in edges), dtype=np.float64, count=len(edges))
+            won, won_next, lost = (np.asarray(absorb[k]) for k in ("won", "won_next", "lost"))
+            v = np.zeros(n)
+            v[0] = 1.0
+            for r in range(1, max_rounds + 1):
+                win[r - 1] += float(v @ won)
+                loss[r - 1] += float(v @ lost)
+                later = float(v @ won_next)  # the dead enemy is noticed next round
+                if r < max_rounds:
+                    win[r] += later
+                else:
+                    timeout += later
+                v = np.bincount(dst, weights=v[src] * prob, minlength=n)
+            timeout += float(v.sum())
+        else:
+            won, won_next, lost = absorb["won"], absorb["won_next"], absorb["lost"]
+            v = {0: 1.0}
+            for r in range(1, max_rounds + 1):
+                for i, pi in v.items():
+                    win[r - 1] += pi * won[i]
+                    loss[r - 1] += pi * lost[i]
+                    if r < max_rounds:
+                        win[r] += pi * won_next[i]
+                    else:
+                        timeout += pi * won_next[i]
+                nxt: Dict[int, float] = defaultdict(float)
+                for i, j, p in edges:
+                    pi = v.get(i)
+                    if pi:
+                        nxt[j] += pi * p
+                v = nxt
+            timeout += sum(v.values())
+
+        return DuelSolution(sum(win), sum(loss) + timeout, timeout, tuple(win), tuple(loss), n)
+
+# =============================================================================
+# Memoised entry points
+# =============================================================================
+
+_SOLVED: Dict[str, DuelSolution] = {}
+
+
+def rules_key() -> str:
+    """Digest of every rules file the duel depends on."""
+    repo = get_rules()
+    return "/".join(repo.digest(n) for n in ("combat_rules.json", "weapons.json", "armors.json"))
+
+
+def _unit_key(unit: dict) -> str:
+    raw = json.dumps(unit, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def solve_duel(player: dict, enemy: dict, action: DuelAction = DuelAction()) -> DuelSolution:
+    """Exact outcome distribution of player vs enemy (equipped sheets), memoised."""
+    key = f"{rules_key()}|{_unit_key(player)}|{_unit_key(enemy)}|{tuple(action)}"
+    sol = _SOLVED.get(key)
+    if sol is None:
+        sol = _SOLVED[key] = DuelChain(player, enemy, action).solve()
+    return sol
+
+
+def solve_matchups(pairs: Sequence[Tuple[dict, dict, DuelAction]]) -> List[DuelSolution]:
+    return [solve_duel(p, e, a) for p, e, a in pairs]
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> DuelSolution:
+    from combat_driver import load_enemies, load_player
+
+    ap = argparse.ArgumentParser(description="Exact duel outcome distribution under adventure_new rules.")
+    ap.add_argument("player", help="player character, e.g. torvald")
+    ap.add_argument("enemy", help="enemy: bandit, bandit_leader or a character file")
+    ap.add_argument("--stance", default="offensive", choices=("offensive", "neutral", "defensive"))
+    ap.add_argument("--attack", default="normal", choices=("normal", "aimed"))
+    ap.add_argument("--zone", default=None, help="aimed zone, e.g. head")
+    ap.add_argument("--ability", default=None)
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    player = load_player(args.player)
+    enemy = load_enemies(args.enemy)[0]
+    action = DuelAction(args.stance, args.attack, args.zone, args.ability)
+    sol = solve_duel(player, enemy, action)
+    print(f"⚔️ {player['name']} vs {enemy['name']} ({', '.join(str(a) for a in action if a)}), "
+          f"{sol.states} states")
+    print(f"🏆 Win {sol.win:.4%} · Loss {sol.loss - sol.timeout:.4%} · Timeout {sol.timeout:.4%}")
+    print(f"⏱️ Expected rounds {sol.expected_rounds:.3f}; win round p10/p50/p90: "
+          f"{sol.rounds_quantile(0.1)}/{sol.rounds_quantile(0.5)}/{sol.rounds_quantile(0.9)}")
+    return sol
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 # file: scripts/faction_system.py
-import random
-import json
 import logging
 import os
+from dice import get_dice
+from rules_repository import get_rules
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -15,8 +15,7 @@ class FactionSystem:
     def load_factions(self):
         path = os.path.join(os.path.dirname(__file__), "../rules/factions.json")
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            return get_rules().get(path)
         except FileNotFoundError:
             return {
                 "daughters_drowned_moon": {
@@ -50,7 +49,7 @@ class FactionSystem:
             self.character.status_effects.append({"name": "brine_marks", "count": 1})
             print(f"😈 {self.character.name} gains Brine Marks from Daughters of the Drowned Moon!")
         elif faction_name == "saffron_veil" and self.alignment[faction_name] >= 50:
-            if random.random() < 0.1:
+            if get_dice().random() < 0.1:
                 self.character.status_effects.append({"name": "abyss_tether", "willpower_penalty": -5, "duration": 3})
                 print(f"😈 {self.character.name} suffers Abyss Tether from Saffron Veil!")
         elif faction_name == "iron_covenant" and self.alignment[faction_name] >= 50:
@@ -58,7 +57,7 @@ class FactionSystem:
                 self.character.rune_craft = getattr(self.character, "rune_craft", 0) + 10
                 print(f"🔨 {self.character.name} masters rune crafting with Iron Covenant!")
             else:
-                roll = random.randint(1, 100)
+                roll = get_dice().d100()
                 if roll < 25:
                     print(f"⚠️ {self.character.name} fails Iron Covenant's faith test!")
                     self.alignment[faction_name] -= 10
@@ -66,7 +65,7 @@ class FactionSystem:
 
     def charisma_check(self, difficulty):
         charisma = self.character.charisma + getattr(self.character, "charisma_penalty", 0)
-        roll = random.randint(1, 100) + (charisma // 5)
+        roll = get_dice().d100() + (charisma // 5)
         print(f"🎭 {self.character.name} charisma check: rolled {roll} vs difficulty {difficulty}")
         logging.debug(f"Charisma check for {self.character.name}: {roll} vs {difficulty}")
         return roll >= difficulty
\ No newline at end of file
@@ -1,7 +1,7 @@
-import json
-import random
 import os
 import logging
+from dice import get_dice
+from rules_repository import get_rules
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -13,10 +13,9 @@ class FearSystem:
     def load_trauma(self):
         path = os.path.join(os.path.dirname(__file__), "../rules/trauma.json")
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                logging.debug(f"Loaded trauma.json: {data}")
-                return data
+            data = get_rules().get(path)
+            logging.debug("Loaded trauma.json: %s", data)
+            return data
         except Exception as e:
             logging.error(f"Failed to load trauma.json: {e}")
             return {}
@@ -24,8 +23,7 @@ class FearSystem:
     def load_mental_state(self):
         path = os.path.join(os.path.dirname(__file__), "../rules/player_mental_state.json")
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return get_rules().get(path)
         except Exception as e:
             logging.error(f"Failed to load player_mental_state.json: {e}")
             return {}
@@ -44,12 +42,12 @@ class FearSystem:
 
         if weapon["name"].lower() in [fw.lower() for fw in feared_weapons]:
             chance = trauma.get("active_traumas", [{}])[0].get("chance_to_interfere", 0)
-            if random.random() < chance:
+            if get_dice().random() < chance:
                 response["triggered"] = True
-                response["outburst"] = random.choice(trauma.get("active_traumas", [{}])[0].get("example_outbursts", ["I can’t face that weapon!"]))
+                response["outburst"] = get_dice().choice(trauma.get("active_traumas", [{}])[0].get("example_outbursts", ["I can’t face that weapon!"]))
                 response["stress_increase"] = weapon["fear_intensity"]
                 response["roll_penalty"] = 10 if mental_state.get("stress", 0) > 50 else 5
-                response["force_stance"] = random.random() < 0.3
+                response["force_stance"] = get_dice().random() < 0.3
                 logging.debug(f"Fear triggered for {defender_key}: {response}")
         else:
             logging.debug(f"No fear for weapon {weapon['name']} in {feared_weapons}")
@@ -0,0 +1,379 @@
+# file: scripts/formations.py
+"""
+Formation-level mass battles.
+
+For war-scale fights (riots, sieges, the events in lore/events/) even the
+columnar Skirmish engine does more than needed. Here identical units — one
+template from make_bandits / make_bandit_leader, an EnemySpawner entry or a
+character file — are grouped into a Block: a unit count spread over an HP
+histogram (hist[h] = how many members have h HP left) plus one morale value.
+
+Each round is resolved in expectation with the combat_rules.json constants:
+
+  * hit / crit / fumble chances come from the exact d100-vs-d100 table for
+    every pair of attacker and target HP buckets (attack modifier against
+    dex + stance defence; stance and pain follow HP);
+  * attackers spread over enemy blocks in proportion to their size (the mean
+    of uniform random targeting), or all hit the first block ("focus");
+  * hits landing on a block are a compound Poisson process per member with
+    normal and crit damage as jump sizes; its PMF (Panjer recursion) shifts
+    the HP histogram down and whatever crosses 0 is the casualty count;
+  * crit misses become riposte hits from the defending block;
+  * morale and rout follow combat_engine_ext.morale_event / check_rout,
+    with the ally-down drop scaled to the side's size and mutual routs
+    settled by average morale exactly as in skirmish (SkirmishRules.ally_down
+    and .routs).
+
+Once either side falls to `detail_at` units the blocks are rounded back to
+individual units and the battle finishes in skirmish.Skirmish, so the end
+game has real dice. Stamina and weapon durability are not tracked (no roll
+reads them), and the stalemate rule never fires in expectation.
+
+Usage:
+    python scripts/formations.py --a bandit:6000 --b bandit_leader:200,drowned_thrall:3800
+    python scripts/formations.py --a torvald:50 --b bandit:5000 --fear
+
+Requires NumPy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import math
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from combat_events import quiet_bus, use_bus
+from dice import DiceStream, load_numpy
+from stance_table import ATTACK_MOD, DEFENSE_MOD
+from skirmish import DEFENSIVE, MAX_ROUNDS, OFFENSIVE, Skirmish, SkirmishRules
+
+BLOCK_TARGETING = ("random", "focus")   # blocks have no positions
+DETAIL_AT = 20             # hand over to Skirmish once a side is this small
+STANCE_ATK = ATTACK_MOD  # adventure_new.stance_mods attack column
+STANCE_DEF = DEFENSE_MOD  # ... and defence column
+
+
+class FormationResult(NamedTuple):
+    winner: int            # 0 / 1, -1 for a draw or timeout
+    rounds: int
+    survivors: Tuple[int, int]   # living units per side, routed or not
+    casualties: Tuple[int, int]
+    routed: Tuple[bool, bool]
+    detail_round: Optional[int]   # round the battle dropped to per-unit resolution
+
+# =============================================================================
+# Templates
+# =============================================================================
+
+def load_template(key: str) -> dict:
+    """Equipped unit dict for 'bandit', 'bandit_leader', an EnemySpawner key or a character file."""
+    import adventure_new as game  # heavy import; unit helpers
+
+    if key == "bandit":
+        unit = game.make_bandits(1)[0]
+        unit["name"] = "Bandit"
+    elif key == "bandit_leader":
+        unit = game.make_bandit_leader()
+    else:
+        from enemy_spawner import EnemySpawner
+
+        spawn = EnemySpawner().enemies.get(key)
+        if spawn is not None:
+            unit = {"name": spawn["name"], "total_hp": spawn["hp"], "max_stamina": spawn["stamina"],
+                    **spawn.get("stats", {})}
+        else:
+            unit = game.load_character_file(key)
+            if not unit:
+                raise KeyError(f"Unknown unit template: {key}")
+            game.equip_armor(unit)
+    game.ensure_hp_fields(unit)
+    game.init_weapon_state(unit)
+    return unit
+
+# =============================================================================
+# Blocks
+# =============================================================================
+
+class Block:
+    """`count` copies of one template, tracked as an HP histogram and a shared morale."""
+
+    def __init__(self, template: dict, count: int, key: Optional[str] = None):
+        np = load_numpy()
+        if np is None:
+            raise ImportError("formations requires NumPy (pip install numpy)")
+        import adventure_new as game
+
+        self.template = template
+        self.key = key or str(template.get("name", "unit"))
+        self.total_hp = max(1, int(template.get("total_hp", template.get("current_hp", 1)) or 1))
+        hp = min(self.total_hp, max(0, int(template.get("current_hp", self.total_hp))))
+        self.hist = np.zeros(self.total_hp + 1)
+        self.hist[hp] = count if hp > 0 else 0
+        self.morale = float(template.get("morale", 100))
+        self.dex_mod = int(template.get("dexterity", template.get("Dexterity", 25))) // 10
+        self.stress = int(template.get("stress_level", 0))
+        self.base = game.base_damage_for(template)
+        self.initial = float(self.hist.sum())
+
+        h = np.arange(self.total_hp + 1)
+        self.stance = np.where(h > self.total_hp * 0.35, OFFENSIVE, DEFENSIVE)
+        pain_pct = np.trunc(100 * (1 - h / self.total_hp)).astype(np.int64)
+        # attack_modifiers()['attack_mod'] per HP bucket (normal attack, no statuses)
+        self.attack_mod = self.dex_mod + np.array(STANCE_ATK)[self.stance] - self.stress - pain_pct // 25
+        self.riposte_mod = self.dex_mod + STANCE_ATK[OFFENSIVE] - self.stress - pain_pct // 25
+        # attack_modifiers()['defense_mod'] per HP bucket
+        self.defense_mod = self.dex_mod + np.array(STANCE_DEF)[self.stance]
+
+    @classmethod
+    def of(cls, key: str, count: int) -> "Block":
+        return cls(load_template(key), count, key)
+
+    @property
+    def count(self) -> float:
+        return float(self.hist.sum())
+
+    def __repr__(self) -> str:
+        return f"Block({self.key!r}, {self.count:.1f}/{self.initial:.0f})"
+
+    def units(self, n: int) -> List[dict]:
+        """Round the histogram to `n` unit dicts (largest remainder per HP bucket)."""
+        np = load_numpy()
+        if n <= 0 or self.count <= 0:
+            return []
+        share = self.hist * (n / self.count)
+        whole = np.floor(share).astype(np.int64)
+        for h in np.argsort(-(share - whole))[: n - int(whole.sum())]:
+            whole[h] += 1
+        out = []
+        for h in np.flatnonzero(whole):
+            for _ in range(int(whole[h])):
+                out.append(dict(self.template, name=f"{self.template.get('name', self.key)} {len(out) + 1}",
+                                current_hp=int(h), alive=True, morale=int(round(self.morale))))
+        return out
+
+
+def _hit_tables(rules: SkirmishRules, span: int = 200):
+    """P(hit), P(crit hit), P(crit miss) for every attack-minus-defense modifier in [-span, span]."""
+    np = load_numpy()
+    delta = np.arange(-span, span + 1)[:, None]
+    a = np.arange(1, 101)[None, :]
+    beats = np.clip(a + delta - 1, 0, 100) / 100.0        # P(d100 < a + delta) for each attack roll a
+    hit = beats.mean(axis=1)
+    crit = (beats * (a >= rules.crit_hi)).mean(axis=1)
+    fumble = ((1 - beats) * (a <= rules.crit_lo)).mean(axis=1)
+    return span, hit, crit, fumble
+
+
+def _damage_pmf(jumps: Dict[int, float], size: int):
+    """Compound Poisson PMF of damage taken per member, f[0..size-1] (Panjer recursion)."""
+    np = load_numpy()
+    f = np.zeros(size)
+    lam = sum(jumps.values())
+    f[0] = math.exp(-lam)
+    terms = [(j, j * rate) for j, rate in jumps.items() if j > 0 and rate > 0]
+    for s in range(1, size):
+        f[s] = sum(w * f[s - j] for j, w in terms if j <= s) / s
+    return f
+
+# =============================================================================
+# Battle
+# =============================================================================
+
+class FormationBattle:
+    """Two sides of Blocks resolved in expectation until one side is small enough for Skirmish."""
+
+    def __init__(self, side_a: Sequence[Block], side_b: Sequence[Block], rules: Optional[SkirmishRules] = None,
+                 dice: Optional[DiceStream] = None, targeting: str = "random", detail_at: int = DETAIL_AT,
+                 fear: Optional[bool] = None):
+        if targeting not in BLOCK_TARGETING:
+            raise ValueError(f"targeting must be one of {BLOCK_TARGETING}")
+        import adventure_new as game
+
+        self.sides = (list(side_a), list(side_b))
+        self.rules = rules or SkirmishRules.from_rules(game.rules, fear=fear)
+        self.dice = dice
+        self.targeting = targeting
+        self.detail_at = detail_at
+        self.round = 0
+        self.routed = [False, False]
+        self.detail: Optional[Skirmish] = None
+        self.detail_round: Optional[int] = None
+        self._tables = _hit_tables(self.rules)
+
+    def counts(self) -> Tuple[float, float]:
+        return tuple(0.0 if self.routed[s] else sum(b.count for b in self.sides[s]) for s in (0, 1))
+
+    def outcome(self) -> Optional[int]:
+        if self.detail is not None:
+            return self.detail.outcome()
+        a, b = self.counts()
+        if a >= 0.5 and b >= 0.5:
+            return None
+        return 0 if a >= 0.5 else 1 if b >= 0.5 else -1
+
+    def _odds(self, mod):
+        span, hit, crit, fumble = self._tables
+        i = (mod + span).clip(0, 2 * span)
+        return hit[i], crit[i], fumble[i]
+
+    def _exchange(self, att: Block, tgt: Block) -> Tuple[float, float, float, float]:
+        """
+        Expected hits and crits of `att` on `tgt` and of the ripostes they draw,
+        per attacking member: every occupied attacker HP bucket against every
+        occupied target bucket, each weighted by its share of the block. A
+        riposte comes from the target bucket the fumble was made against and
+        meets the fumbler's own bucket defence.
+        """
+        np = load_numpy()
+        ia, it = np.flatnonzero(att.hist), np.flatnonzero(tgt.hist)
+        wa, wt = att.hist[ia], tgt.hist[it] / tgt.count
+        p_hit, p_crit, p_fum = self._odds(att.attack_mod[ia][:, None] - tgt.defense_mod[it][None, :])
+        rh, rc, _ = self._odds(tgt.riposte_mod[it][None, :] - att.defense_mod[ia][:, None])
+        fum = p_fum * wt
+        return (float(wa @ p_hit @ wt), float(wa @ p_crit @ wt),
+                float(wa @ (fum * rh).sum(axis=1)), float(wa @ (fum * rc).sum(axis=1)))
+
+    def step(self) -> None:
+        """One aggregated round; both sides act on the start-of-round histograms."""
+        np, r = load_numpy(), self.rules
+        self.round += 1
+        jumps: Dict[int, Dict[int, float]] = {}          # id(block) → damage value → hits on the block
+        crits: Dict[int, float] = {}
+        for s in (0, 1):
+            foes = [b for b in self.sides[1 - s] if b.count > 0]
+            if self.routed[s] or self.routed[1 - s] or not foes:
+                continue
+            if self.targeting == "focus":
+                shares = [(foes[0], 1.0)]
+            else:
+                total = sum(b.count for b in foes)
+                shares = [(b, b.count / total) for b in foes]
+            for att in self.sides[s]:
+                if att.count <= 0:
+                    continue
+                normal, critical = att.base, int(round(att.base * r.crit_mult))
+                for tgt, share in shares:
+                    n_hit, n_crit, r_hit, r_crit = (share * x for x in self._exchange(att, tgt))
+                    self._add(jumps, crits, tgt, normal, n_hit - n_crit, critical, n_crit)
+                    # each fumble draws a riposte from the target block
+                    self._add(jumps, crits, att, tgt.base, r_hit - r_crit,
+                              int(round(tgt.base * r.crit_mult)), r_crit)
+
+        fallen = [0.0, 0.0]
+        size = [sum(b.count for b in self.sides[s]) for s in (0, 1)]   # before this round's casualties
+        for s in (0, 1):
+            for b in self.sides[s]:
+                n = b.count
+                if n <= 0 or id(b) not in jumps:
+                    continue
+                f = _damage_pmf({d: hits / n for d, hits in jumps[id(b)].items()}, len(b.hist) - 1)
+                shifted = np.convolve(b.hist[::-1], f)[: len(b.hist) - 1][::-1]
+                b.hist = np.concatenate(([0.0], shifted))
+                fallen[s] += n - b.count
+        if r.fear:
+            self._morale(fallen, size, crits)
+
+    @staticmethod
+    def _add(jumps, crits, block, normal, n_normal, critical, n_crit):
+        hits = jumps.setdefault(id(block), {})
+        hits[normal] = hits.get(normal, 0.0) + n_normal
+        hits[critical] = hits.get(critical, 0.0) + n_crit
+        crits[id(block)] = crits.get(id(block), 0.0) + n_crit
+
+    def _morale(self, fallen, size, crits) -> None:
+        """morale_event per member in expectation (ally-down drop scaled to the side), then check_rout per side."""
+        r = self.rules
+        means = []
+        for s in (0, 1):
+            felt = r.ally_down(fallen[s], size[s])
+            for b in self.sides[s]:
+                if b.count > 0:
+                    heavy = crits.get(id(b), 0.0) / b.count
+                    b.morale = max(r.min_morale, b.morale - felt - r.heavy_hit_drop * heavy)
+            alive = [(b.count, b.morale) for b in self.sides[s] if b.count > 0]
+            n = sum(c for c, _ in alive)
+            means.append(sum(c * m for c, m in alive) / n if n else None)
+        self.routed = r.routs(self.routed, means)
+
+    def _drop_to_detail(self) -> Skirmish:
+        units = []
+        for s in (0, 1):
+            side = []
+            for b in self.sides[s]:
+                side.extend(b.units(int(round(b.count))))
+            units.append(side)
+        self.detail_round = self.round
+        return Skirmish(units[0], units[1], rules=self.rules, dice=self.dice, targeting=self.targeting)
+
+    def run(self, max_rounds: int = MAX_ROUNDS) -> FormationResult:
+        while self.outcome() is None and self.round < max_rounds:
+            if min(self.counts()) <= self.detail_at:
+                self.detail = self._drop_to_detail()
+                self.detail.round = self.round
+                self.detail.run(max_rounds)
+                self.round = self.detail.round
+                break
+            self.step()
+        winner = self.outcome()
+        if self.detail is not None:
+            sk = self.detail
+            survivors = tuple(int((sk.alive & (sk.side == s)).sum()) for s in (0, 1))
+            routed = tuple(a or b for a, b in zip(self.routed, sk.routed))
+        else:
+            survivors = tuple(int(round(sum(b.count for b in self.sides[s]))) for s in (0, 1))
+            routed = tuple(self.routed)
+        start = tuple(int(round(sum(b.initial for b in self.sides[s]))) for s in (0, 1))
+        return FormationResult(-1 if winner is None else winner, self.round, survivors,
+                               tuple(max(0, start[s] - survivors[s]) for s in (0, 1)), routed, self.detail_round)
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def parse_side(spec: str) -> List[Block]:
+    """'bandit:6000,bandit_leader:20' → Blocks."""
+    blocks = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        key, _, count = part.partition(":")
+        blocks.append(Block.of(key, int(count or 1)))
+    return blocks
+
+
+def main(argv: Optional[Sequence[str]] = None) -> FormationResult:
+    ap = argparse.ArgumentParser(description="Resolve a mass battle between formations of identical units.")
+    ap.add_argument("--a", default="bandit:5000", help="side A blocks, key:count[,key:count...] (default bandit:5000)")
+    ap.add_argument("--b", default="bandit:5000", help="side B blocks (default bandit:5000)")
+    ap.add_argument("--targeting", default="random", choices=BLOCK_TARGETING)
+    ap.add_argument("--detail-at", type=int, default=DETAIL_AT, help="side size that switches to per-unit rounds")
+    ap.add_argument("--fear", action="store_true", help="enable morale/rout even if fear_system is disabled")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    with use_bus(quiet_bus()), open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        side_a, side_b = parse_side(args.a), parse_side(args.b)
+    t0 = time.perf_counter()
+    battle = FormationBattle(side_a, side_b, dice=DiceStream(args.seed), targeting=args.targeting,
+                             detail_at=args.detail_at, fear=True if args.fear else None)
+    result = battle.run()
+    elapsed = time.perf_counter() - t0
+    label = {0: "side A", 1: "side B", -1: "nobody"}[result.winner]
+    print(f"⚔️ {args.a} vs {args.b}: {label} wins after {result.rounds} rounds; "
+          f"survivors {result.survivors[0]} / {result.survivors[1]}, casualties {result.casualties[0]} / "
+          f"{result.casualties[1]}" + (f", routed {result.routed}" if any(result.routed) else ""))
+    detail = f", per-unit from round {result.detail_round}" if result.detail_round is not None else ""
+    print(f"⏱️ {1000 * elapsed:.1f} ms{detail}")
+    return result
+
+
+__all__ = [
+    "BLOCK_TARGETING", "DETAIL_AT", "FormationResult", "load_template", "Block", "FormationBattle", "parse_side", "main",
+]
+
+
+if __name__ == "__main__":
+    main()
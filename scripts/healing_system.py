@@ -1,5 +1,5 @@
-import random
 import logging
+from dice import get_dice
 from character import Character
 from healing_items import HealingItem
 
@@ -27,7 +27,7 @@ class HealingSystem:
 
         bleeding_level = target.bleeding_rate
         difficulty = item.difficulty_threshold
-        roll = random.randint(1, 100)
+        roll = get_dice().d100()
         dexterity_bonus = healer.dexterity // 5
         pain_penalty = min(healer.pain_penalty, 20)
         total_roll = roll + dexterity_bonus - pain_penalty
@@ -66,18 +66,18 @@ class HealingSystem:
             else:
                 print(f"⚠️ {character.name} starves—reduced healing.")
                 logging.debug(f"Ogre {character.name} underfed, reduced healing")
-                hunger_roll = random.randint(1, 100)
+                hunger_roll = get_dice().d100()
                 if hunger_roll < 10 and character.allies:
-                    ally = random.choice(character.allies)
+                    ally = get_dice().choice(character.allies)
                     print(f"🍖 {character.name} attacks {ally.name} in hunger!")
-                    limb = random.choice(["left_upper_arm", "right_upper_arm"])
+                    limb = get_dice().choice(["left_upper_arm", "right_upper_arm"])
                     ally.take_damage_to_zone(limb, 20)
                     ally.bleeding_rate += 1.0
                     ally.pain_penalty += 10
                     ally.stress_level += 10
                     character.health = min(character.total_hp, character.health + 5)
                     print(f"🩸 {ally.name} bleeds and suffers pain! {character.name} gains 5 HP from flesh!")
-                    roll = random.randint(1, 100)
+                    roll = get_dice().d100()
                     threshold = (ally.willpower // 5) + 30 - ally.pain_penalty // 2 - ally.stress_level // 10
                     if roll > threshold:
                         print(f"💔 {ally.name} panics from the attack and may flee!")
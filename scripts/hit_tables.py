@@ -0,0 +1,202 @@
+# file: scripts/hit_tables.py
+"""
+Exact odds for the d100-vs-d100 contest both combat paths use.
+
+CombatEngine.attack_roll and adventure_new.attack_roll both reduce to
+
+    hit  ⇔  d100 + attack_mod > d100 + defense_mod
+
+so everything depends on the margin m = attack_mod - defense_mod. For an
+attack roll a, the defence loses on b < a + m, i.e. clamp(a + m - 1, 0, 100)
+of the 100 defence rolls. HitTable sums that once per margin (−100…101; any
+margin beyond saturates) into exact counts out of 10 000:
+
+    hit        P(attack_total > defense_total)
+    crit       P(hit and attack roll ≥ critical_hit_threshold)
+    crit_miss  P(miss and attack roll ≤ critical_miss_threshold)  (adventure riposte)
+
+    from hit_tables import rules_table, estimate_attack
+
+    rules_table().odds(+12).hit                  # O(1) lookup
+    estimate_attack(player, "offensive", bandit, "aimed", "head").expected
+
+Expected damage follows adventure_new's rounding chain exactly (crit head
+bonus → crit multiplier → armor coverage ×0.75 / unhelmeted headshot), so it
+equals the mean of the sampled damage, not an approximation of it.
+CombatEngine has no crits; use engine_odds(...).hit × weapon damage there.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, List, Mapping, NamedTuple, Optional, Tuple
+
+from rules_repository import get_rules
+from zones import Zone, zone_of
+
+ROLL = 100
+OUTCOMES = ROLL * ROLL
+MIN_MARGIN = -ROLL       # at or below: never hits
+MAX_MARGIN = ROLL + 1    # at or above: always hits
+ARMOR_COVERED_FACTOR = 0.75  # adventure_new.apply_damage
+
+
+class HitOdds(NamedTuple):
+    hit: float
+    crit: float
+    crit_miss: float
+
+    @property
+    def normal(self) -> float:
+        """P(hit without a crit)."""
+        return self.hit - self.crit
+
+    @property
+    def miss(self) -> float:
+        return 1.0 - self.hit
+
+
+class HitTable:
+    """Exact odds for every margin, for one pair of crit thresholds."""
+
+    __slots__ = ("crit_hi", "crit_lo", "_counts", "_odds")
+
+    def __init__(self, crit_hi: int = 95, crit_lo: int = 5):
+        self.crit_hi = int(crit_hi)
+        self.crit_lo = int(crit_lo)
+        counts: List[Tuple[int, int, int]] = []
+        for m in range(MIN_MARGIN, MAX_MARGIN + 1):
+            hit = crit = fumble = 0
+            for a in range(1, ROLL + 1):
+                wins = min(ROLL, max(0, a + m - 1))
+                hit += wins
+                if a >= self.crit_hi:
+                    crit += wins
+                if a <= self.crit_lo:
+                    fumble += ROLL - wins
+            counts.append((hit, crit, fumble))
+        self._counts = tuple(counts)
+        self._odds = tuple(HitOdds(h / OUTCOMES, c / OUTCOMES, f / OUTCOMES) for h, c, f in counts)
+
+    def __repr__(self) -> str:
+        return f"HitTable(crit_hi={self.crit_hi}, crit_lo={self.crit_lo})"
+
+    @staticmethod
+    def _index(margin: int) -> int:
+        return min(max(int(margin), MIN_MARGIN), MAX_MARGIN) - MIN_MARGIN
+
+    def counts(self, margin: int) -> Tuple[int, int, int]:
+        """(hit, crit, crit_miss) as exact counts out of OUTCOMES."""
+        return self._counts[self._index(margin)]
+
+    def odds(self, margin: int) -> HitOdds:
+        return self._odds[self._index(margin)]
+
+    __getitem__ = odds
+
+
+@lru_cache(maxsize=None)
+def hit_table(crit_hi: int = 95, crit_lo: int = 5) -> HitTable:
+    return HitTable(crit_hi, crit_lo)
+
+
+def _combat_rules(rules: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    return rules if rules is not None else get_rules().get("combat_rules.json", {})
+
+
+def rules_table(rules: Optional[Mapping[str, Any]] = None) -> HitTable:
+    """Table for the thresholds in `rules` (default: rules/combat_rules.json)."""
+    rules = _combat_rules(rules)
+    return hit_table(int(rules.get("critical_hit_threshold", 95)), int(rules.get("critical_miss_threshold", 5)))
+
+# =============================================================================
+# Damage (adventure_new rules)
+# =============================================================================
+
+class DamageRules(NamedTuple):
+    crit_mult: float
+    head_crit_bonus_pct: int
+    unhelmeted_mult: float
+
+    @classmethod
+    def from_rules(cls, rules: Optional[Mapping[str, Any]] = None) -> "DamageRules":
+        rules = _combat_rules(rules)
+        return cls(
+            float((rules.get("critical_multipliers") or {}).get("default", 1.5)),
+            int((rules.get("aimed_attack") or {}).get("crit_bonus_head_pct", 10)),
+            float((rules.get("helmet_rules") or {}).get("unhelmeted_headshot_mult", 1.0)),
+        )
+
+
+@lru_cache(maxsize=4096)
+def hit_damage(raw: int, crit: bool, dmg_rules: DamageRules,
+               zone: Optional[str] = None, covered: bool = False) -> int:
+    """Damage one landed player hit deals (run_combat + apply_damage, same rounding)."""
+    if crit:
+        if zone and zone.lower() == "head":
+            raw = int(round(raw * (1 + dmg_rules.head_crit_bonus_pct / 100.0)))
+        dmg = int(round(raw * dmg_rules.crit_mult))
+    else:
+        dmg = int(round(raw))
+    dmg = max(0, dmg)
+    if zone and covered:
+        dmg = max(0, int(round(dmg * ARMOR_COVERED_FACTOR)))
+    elif zone and zone_of(zone) is Zone.HEAD and dmg_rules.unhelmeted_mult > 1.0:
+        dmg = int(round(dmg * dmg_rules.unhelmeted_mult))
+    return dmg
+
+
+def expected_damage(margin: int, raw: int, zone: Optional[str] = None, covered: bool = False,
+                    rules: Optional[Mapping[str, Any]] = None) -> float:
+    """Exact mean damage of one attack at `margin` with `raw` pre-crit damage."""
+    odds = rules_table(rules).odds(margin)
+    dmg_rules = DamageRules.from_rules(rules)
+    return (odds.normal * hit_damage(raw, False, dmg_rules, zone, covered)
+            + odds.crit * hit_damage(raw, True, dmg_rules, zone, covered))
+
+
+class AttackEstimate(NamedTuple):
+    margin: int
+    odds: HitOdds
+    damage: int        # on a normal hit
+    crit_damage: int   # on a critical hit
+    expected: float
+
+
+def estimate_attack(attacker: dict, stance: str, target: dict, attack_type: str = "normal",
+                    zone: Optional[str] = None, ability: Optional[str] = None,
+                    target_stance: str = "neutral") -> AttackEstimate:
+    """
+    Exact odds and expected damage of one adventure_new player attack
+    (stance, aimed penalty, status penalties, ability bonus, armor coverage).
+    """
+    import adventure_new as game  # heavy import; only when estimating adventure attacks
+
+    if not str(attack_type).lower().startswith("aim"):
+        zone = None  # normal attacks bypass armor
+    calc = game.attack_modifiers(attacker, stance, target, target_stance, attack_type, aimed_zone=zone)
+    margin = calc["attack_mod"] - calc["defense_mod"]
+    odds = rules_table(game.rules).odds(margin)
+    dmg_rules = DamageRules.from_rules(game.rules)
+    raw = game.base_damage_for(attacker) + game.ability_damage_bonus(attacker, ability)
+    covered = bool(zone) and game.is_zone_covered(target, zone)
+    dmg = hit_damage(raw, False, dmg_rules, zone, covered)
+    crit_dmg = hit_damage(raw, True, dmg_rules, zone, covered)
+    return AttackEstimate(margin, odds, dmg, crit_dmg, odds.normal * dmg + odds.crit * crit_dmg)
+
+
+def engine_odds(attacker: Any, defender: Any, stance: str = "NEUTRAL",
+                ambush_bonus: int = 0, roll_penalty: int = 0) -> HitOdds:
+    """Exact CombatEngine.attack_roll odds (only .hit applies; the engine has no crits)."""
+    from combat_engine import CombatEngine
+
+    engine = CombatEngine.__new__(CombatEngine)  # no dice needed
+    mods = engine.attack_modifiers(attacker, defender, stance, ambush_bonus, roll_penalty)
+    return hit_table().odds(mods["attack_mod"] - mods["defense_mod"])
+
+
+__all__ = [
+    "HitOdds", "HitTable", "hit_table", "rules_table",
+    "DamageRules", "hit_damage", "expected_damage",
+    "AttackEstimate", "estimate_attack", "engine_odds",
+]
@@ -1,6 +1,6 @@
 # file: scripts/item_system.py
-import random
 import logging
+from dice import get_dice
 from character import Character
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,9 +24,9 @@ class ItemSystem:
         if "stress_relief" in item:
             target.stress_level = max(0, target.stress_level + item["stress_relief"])
             print(f"😌 {target.name} reduces stress by {abs(item['stress_relief'])}")
-            if random.random() < item.get("secret_spill_chance", 0):
+            if get_dice().random() < item.get("secret_spill_chance", 0):
                 print(f"🗣️ {target.name} spills secrets under {item_name} influence!")
-            if random.random() < item.get("addiction_risk", 0):
+            if get_dice().random() < item.get("addiction_risk", 0):
                 target.status_effects.append({"name": "moonbloom_addiction", "duration": 5, "stress_penalty": 5})
                 print(f"⚠️ {target.name} risks addiction to {item_name}!")
         logging.debug(f"Item used: {item_name} by {user.name} on {target.name}")
@@ -35,7 +35,7 @@ def save_character_to_json(character, file_path):
         "total_hp": character.total_hp,
         "max_stamina": character.max_stamina,
         "current_stamina": character.stamina,
-        "body_parts": character.body_parts,
+        "body_parts": dict(character.body_parts),
         "alive": character.alive,
         "bleeding": character.bleeding,
         "pain_penalty": character.pain_penalty,
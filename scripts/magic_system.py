@@ -1,7 +1,7 @@
-import random
 import json
 import sqlite3
 import logging
+from dice import get_dice
 from character import Character
 from combat_health import CombatHealthManager
 
@@ -104,7 +104,7 @@ class MagicSystem:
         # Proficiency-based roll
         proficiency = self.get_proficiency(caster.name, spell_name)
         difficulty = 30 - min(proficiency // 5, 5)
-        roll = random.randint(1, 100)
+        roll = get_dice().d100()
         total_roll = roll - caster.pain_penalty - caster.stamina_penalty()
 
         print(f"✨ {caster.name} rolls {total_roll} to cast {spell_name} (need {difficulty}+)")
@@ -118,43 +118,43 @@ class MagicSystem:
                 if target.corruption_level > 0:
                     damage += spell["bonus_vs_corrupted"]
                 target_health.take_damage_to_zone("chest", damage, spell["damage_type"])
-                if random.random() < spell["overload_chance"]:
+                if get_dice().random() < spell["overload_chance"]:
                     caster.status_effects.append({"name": "breath_overload", "duration": 3, "stamina_penalty": -5})
                     print(f"⚠️ {caster.name} suffers Breath Overload (-5 stamina, 3 rounds).")
             elif spell_name == "veil_whisper":
                 target.defense_bonus = spell["effect"]["defense_bonus"]
                 target.status_effects.append({"name": "taint_mark", "hunt_check_bonus": 5})
-                caster.corruption_level = min(100, caster.corruption_level + (5 if random.random() < spell["corruption_risk"] else 0))
+                caster.corruption_level = min(100, caster.corruption_level + (5 if get_dice().random() < spell["corruption_risk"] else 0))
                 print(f"😈 {caster.name}'s corruption: {caster.corruption_level}%")
             elif spell_name == "sacrificial_pact":
                 caster.power_bonus = spell["effects"]["power_bonus"]
                 caster.aging_rate = spell["effects"]["aging_rate"]
                 caster.status_effects.append({"name": "sterility", "charisma_penalty": -10})
-                caster.corruption_level = min(100, caster.corruption_level + (15 if random.random() < spell["corruption_risk"] else 0))
+                caster.corruption_level = min(100, caster.corruption_level + (15 if get_dice().random() < spell["corruption_risk"] else 0))
                 print(f"😈 {caster.name} completes Sacrificial Pact, gains power but sterility. Corruption: {caster.corruption_level}%")
             elif spell_name == "tide_wail":
                 for ally in caster.allies + [caster]:
                     ally.status_effects.append({"name": "fear", "intensity": spell["effect"]["fear_intensity"], "duration": 1})
-                caster.corruption_level = min(100, caster.corruption_level + (5 if random.random() < spell["corruption_risk"] else 0))
+                caster.corruption_level = min(100, caster.corruption_level + (5 if get_dice().random() < spell["corruption_risk"] else 0))
                 caster.status_effects.append({"name": "brine_marks", "count": spell["brine_marks"]})
                 print(f"😈 {caster.name}'s corruption: {caster.corruption_level}%, Brine Marks added.")
             elif spell_name == "veil_caress":
                 charmed = min(spell["effect"]["charm_count"], len(caster.allies))
                 for _ in range(charmed):
                     if caster.allies:
-                        ally = random.choice(caster.allies)
+                        ally = get_dice().choice(caster.allies)
                         ally.status_effects.append({"name": "charmed", "duration": 1})
                         ally.status_effects.append({"name": "taint_mark", "hunt_check_bonus": 5})
-                caster.corruption_level = min(100, caster.corruption_level + (5 if random.random() < spell["corruption_risk"] else 0))
+                caster.corruption_level = min(100, caster.corruption_level + (5 if get_dice().random() < spell["corruption_risk"] else 0))
                 print(f"😈 {caster.name}'s corruption: {caster.corruption_level}%")
             elif spell_name == "rune_trap":
                 target_health.take_damage_to_zone("legs", spell["damage"], "blunt")
-                if random.random() < spell["effect"]["immobilize_chance"]:
+                if get_dice().random() < spell["effect"]["immobilize_chance"]:
                     target.status_effects.append({"name": "immobilized", "duration": 1, "mobility_penalty": 20})
                     print(f"🪤 {target.name} is immobilized by {caster.name}'s rune trap!")
             elif spell_name == "salt_kiss":
                 target.status_effects.append({"name": "salt_kiss", "max_hp_drain": 2, "duration": 3})
-                caster.corruption_level = min(100, caster.corruption_level + (5 if random.random() < spell["corruption_risk"] else 0))
+                caster.corruption_level = min(100, caster.corruption_level + (5 if get_dice().random() < spell["corruption_risk"] else 0))
                 caster.status_effects.append({"name": "brine_marks", "count": spell["brine_marks"]})
                 print(f"😈 {caster.name}'s corruption: {caster.corruption_level}%, Brine Marks added.")
             self.update_proficiency(caster.name, spell_name)
@@ -190,9 +190,9 @@ class MagicSystem:
         if "stress_relief" in item:
             user.stress_level = max(0, user.stress_level + item["stress_relief"])
             print(f"😌 {user.name} reduces stress by {abs(item['stress_relief'])}!")
-            if random.random() < item["secret_spill_chance"]:
+            if get_dice().random() < item["secret_spill_chance"]:
                 print(f"🗣️ {user.name} spills secrets under Moonbloom's influence!")
-            if random.random() < item["addiction_risk"]:
+            if get_dice().random() < item["addiction_risk"]:
                 user.status_effects.append({"name": "moonbloom_addiction", "duration": 5, "stress_penalty": 5})
                 print(f"⚠️ {user.name} risks addiction to Moonbloom Elixir!")
         return True
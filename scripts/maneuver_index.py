@@ -0,0 +1,123 @@
+# file: scripts/maneuver_index.py
+"""
+Shared, memoised lookup over rules/weapon_maneuvers.json.
+
+ManeuverEngine and ManeuverHandler each loaded the file themselves and
+rescanned every maneuver of a weapon type on each call, comparing stance,
+trigger and aimed zone one entry at a time. One ManeuverIndex per file
+version now serves both:
+
+    idx = maneuver_index()                                 # shared; rebuilt when the file changes
+    idx.maneuvers("2H_sword", "half_sword", "after_parry")  # tuple of maneuver entries
+    idx.effects("2H_sword", "vom_tag", "after_block", "head")
+    # ManeuverEffects(attack_bonus=18, defense_bonus=-1, stamina_cost_modifier=5, notes=(...), lines=(...))
+
+Entries are grouped by (weapon_type, stance) at build time; the result for
+each (weapon_type, stance, trigger, zone) key, including its summed effects,
+is computed on first use and served from a dict afterwards. Matching is the
+engines' old rule: same stance, trigger equal or "always", and when a zone
+is aimed at, entries listing aimed_zone must include it. stance_required
+and trigger are compared as raw values, exactly as before, so entries that
+list several stances or triggers never match.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from rules_repository import get_rules
+
+DEFAULT_PATH = "weapon_maneuvers.json"
+
+Key = Tuple[str, str, str, Optional[str]]
+
+
+class ManeuverEffects(NamedTuple):
+    attack_bonus: int = 0
+    defense_bonus: int = 0
+    stamina_cost_modifier: int = 0
+    notes: Tuple[str, ...] = ()
+    lines: Tuple[str, ...] = ()        # "🗡️ name: description" for each maneuver with a note
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The dict shape ManeuverHandler.get_bonus_effects has always returned."""
+        return {"attack_bonus": self.attack_bonus, "defense_bonus": self.defense_bonus,
+                "stamina_cost_modifier": self.stamina_cost_modifier, "notes": list(self.notes)}
+
+
+NO_EFFECTS = ManeuverEffects()
+
+
+def _sum_effects(entries: Sequence[Mapping[str, Any]]) -> ManeuverEffects:
+    atk = dfn = stam = 0
+    notes: List[str] = []
+    lines: List[str] = []
+    for m in entries:
+        effects = m.get("effects", {})
+        atk += effects.get("attack_bonus", 0)
+        dfn += effects.get("defense_bonus", 0)
+        stam += effects.get("stamina_cost_modifier", 0)
+        if effects.get("notes"):
+            notes.append(effects["notes"])
+            lines.append(f"🗡️ {m.get('name', '?')}: {m.get('description', '')}")
+    return ManeuverEffects(atk, dfn, stam, tuple(notes), tuple(lines))
+
+
+class ManeuverIndex:
+    """Maneuvers of one weapon_maneuvers.json version, keyed by (weapon_type, stance, trigger, zone)."""
+
+    __slots__ = ("data", "_by_stance", "_hits")
+
+    def __init__(self, data: Mapping[str, Sequence[Mapping[str, Any]]]):
+        self.data = data
+        by_stance: Dict[Tuple[str, str], List[Mapping[str, Any]]] = {}
+        for weapon_type, entries in (data or {}).items():
+            for m in entries or ():
+                stance = m.get("stance_required")
+                try:
+                    by_stance.setdefault((weapon_type, stance), []).append(m)
+                except TypeError:
+                    pass  # unhashable (a list): never equal to a stance name
+        self._by_stance = {k: tuple(v) for k, v in by_stance.items()}
+        self._hits: Dict[Key, Tuple[Tuple[Mapping[str, Any], ...], ManeuverEffects]] = {}
+
+    def weapon_types(self) -> List[str]:
+        return list(self.data or ())
+
+    def _lookup(self, weapon_type: str, stance: str, trigger: str, zone: Optional[str]):
+        key = (weapon_type, stance, trigger, zone or None)
+        hit = self._hits.get(key)
+        if hit is None:
+            found = tuple(
+                m for m in self._by_stance.get((weapon_type, stance), ())
+                if (m.get("trigger") == trigger or m.get("trigger") == "always")
+                and not (zone and "aimed_zone" in m and zone not in m["aimed_zone"])
+            )
+            hit = self._hits[key] = (found, _sum_effects(found) if found else NO_EFFECTS)
+        return hit
+
+    def maneuvers(self, weapon_type: str, stance: str, trigger: str = "always",
+                  zone: Optional[str] = None) -> Tuple[Mapping[str, Any], ...]:
+        return self._lookup(weapon_type, stance, trigger, zone)[0]
+
+    def effects(self, weapon_type: str, stance: str, trigger: str = "always",
+                zone: Optional[str] = None) -> ManeuverEffects:
+        return self._lookup(weapon_type, stance, trigger, zone)[1]
+
+
+_INDEXES: Dict[str, ManeuverIndex] = {}
+
+
+def maneuver_index(path: Union[str, Path, None] = None) -> ManeuverIndex:
+    """Shared index for `path` (default rules/weapon_maneuvers.json); rebuilt only when the file changes."""
+    repo = get_rules()
+    key = str(repo.resolve(path or DEFAULT_PATH))
+    data = repo.get(key)
+    index = _INDEXES.get(key)
+    if index is None or index.data is not data:
+        index = _INDEXES[key] = ManeuverIndex(data)
+    return index
+
+
+__all__ = ["DEFAULT_PATH", "ManeuverEffects", "NO_EFFECTS", "ManeuverIndex", "maneuver_index"]
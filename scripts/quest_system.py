@@ -1,7 +1,7 @@
 # file: scripts/quest_system.py
-import random
 import json
 import logging
+from dice import get_dice
 from character import Character
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -37,7 +37,7 @@ class QuestSystem:
         if not quest:
             print(f"❌ Unknown quest: {quest_name}")
             return False
-        roll = random.randint(1, 100) + (character.intelligence // 5)
+        roll = get_dice().d100() + (character.intelligence // 5)
         print(f"📜 {character.name} attempts {quest_name} (roll: {roll} vs difficulty {quest['difficulty']})")
         if roll >= quest["difficulty"]:
             print(f"✅ {character.name} completes {quest_name}!")
@@ -51,7 +51,7 @@ class QuestSystem:
                 character.status_effects.append({"name": "brine_marks", "count": quest["penalty"]["brine_marks"]})
                 print(f"😈 {character.name} gains {quest['penalty']['brine_marks']} Brine Marks!")
             elif quest["faction"] == "iron_covenant" and character.race != "Dwarf":
-                if random.randint(1, 100) < quest["penalty"]["willpower_check"]:
+                if get_dice().d100() < quest["penalty"]["willpower_check"]:
                     print(f"⚠️ {character.name} fails Iron Covenant's faith test!")
                     faction_system.align_with_faction("iron_covenant", -10)
             return True
@@ -0,0 +1,292 @@
+# file: scripts/rules_bundle.py
+"""
+Compiled rules bundle: every JSON file under rules/ and lore/ in one pickle.
+
+Build step (re-run after editing rules; the game works without it):
+
+    python scripts/rules_bundle.py            # writes build/rules_bundle.pickle
+    python scripts/rules_bundle.py --check    # lists files changed since the build
+
+The bundle holds, per file, the parsed data (BOM already stripped, already
+frozen into read-only containers and pickled on its own so a lookup only
+unpickles the files it needs) plus the (mtime, size, blake2b) it was built
+from, and a few derived tables whose keys are already normalised:
+
+    armor_variants   – armors.json flattened to {category: {"default", "variants"}}
+    weapon_overlay   – weapons.json as {lower-case key: {"base_damage", "durability"}}
+    character_index  – rules/characters/*.json by normalised stem
+
+RulesRepository loads the bundle with a single read the first time any rules
+file is requested. A file whose mtime/size no longer matches the bundle is
+read from the raw JSON instead, so a stale bundle is never wrong, only slower.
+Runtime-written state files (NPC memory, emotions, world time …) are never
+bundled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from rules_repository import SCRIPTS_DIR, freeze, get_rules
+
+BUNDLE_VERSION = 2
+PROJECT_DIR = SCRIPTS_DIR.parent
+_PROJECT_PREFIX = str(PROJECT_DIR) + os.sep
+BUNDLE_PATH = PROJECT_DIR / "build" / "rules_bundle.pickle"
+SOURCE_DIRS = ("rules", "lore")
+
+# Written back at runtime by the game / chat API; bundling them would go stale instantly.
+MUTABLE_FILES = frozenset({
+    "rules/npc_memory.json",
+    "rules/emotions.json",
+    "rules/last_interactions.json",
+    "rules/world_time.json",
+    "rules/player_mental_state.json",
+    "rules/memory_log.json",
+})
+
+FileStamp = Tuple[int, int, str]  # (mtime_ns, size, blake2b hex)
+
+
+def relpath(path: os.PathLike) -> str:
+    """Bundle key for `path`: project-relative, forward slashes."""
+    s = os.fspath(path)
+    if s.startswith(_PROJECT_PREFIX) and ".." not in s:
+        return s[len(_PROJECT_PREFIX):].replace(os.sep, "/")
+    try:
+        return Path(path).resolve().relative_to(PROJECT_DIR).as_posix()
+    except ValueError:
+        return Path(path).resolve().as_posix()
+
+
+def norm_key(key: Any) -> str:
+    return str(key).strip().lower().replace(" ", "_")
+
+# =============================================================================
+# Derived tables (also built at runtime from raw JSON when the bundle is stale)
+# =============================================================================
+
+def index_armors(raw: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    armors.json → {category: {"default": variant_key, "variants": {variant_key: armor dict}}}.
+    Accepts both {"Key": {"standard": {...}}} and flat {"Key": {...}} entries
+    (flat ones become a single "flat" variant); other shapes are skipped.
+    """
+    out: Dict[str, Dict[str, Any]] = {}
+    for cat, node in (raw or {}).items():
+        if not isinstance(node, dict):
+            continue
+        if "name" in node or "weight" in node or ("coverage" in node and "armor_rating" in node):
+            out[cat] = {"default": "flat", "variants": {"flat": node}}
+            continue
+        variants = {k: v for k, v in node.items() if isinstance(v, dict)}
+        if not variants:
+            continue
+        default = "standard" if "standard" in variants else next(iter(variants))
+        out[cat] = {"default": default, "variants": variants}
+    return out
+
+
+def index_weapons(raw: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """weapons.json → {lower-case key: {"base_damage": int, "durability": int}} (fields only when valid)."""
+    out: Dict[str, Dict[str, int]] = {}
+    for key, w in (raw or {}).items():
+        if not isinstance(w, dict):
+            continue
+        entry: Dict[str, int] = {}
+        for field in ("base_damage", "durability"):
+            if field in w:
+                try:
+                    entry[field] = int(w[field])
+                except (TypeError, ValueError):
+                    pass
+        out[str(key).lower()] = entry
+    return out
+
+
+# name -> (source rules file, builder)
+DERIVED: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "armor_variants": ("armors.json", index_armors),
+    "weapon_overlay": ("weapons.json", index_weapons),
+}
+
+
+def armor_variant(category: str, variant: Optional[str] = None) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """(variant_key, armor dict) for an armor category; `variant=None` picks the default one."""
+    node = get_rules().derived("armor_variants").get(category)
+    if not node:
+        return None, None
+    variants = node["variants"]
+    if variant in variants:
+        vkey = variant
+    elif variant is not None and "standard" in variants:
+        vkey = "standard"
+    else:
+        vkey = node["default"]
+    return vkey, variants[vkey]
+
+
+def character_index() -> Dict[str, str]:
+    """Normalised stem → project-relative path for rules/characters/*.json (bundle only; {} without one)."""
+    bundle = get_rules().bundle
+    return bundle.character_index if bundle else {}
+
+# =============================================================================
+# Build / load
+# =============================================================================
+
+def iter_sources() -> Iterator[Path]:
+    for d in SOURCE_DIRS:
+        for p in sorted((PROJECT_DIR / d).rglob("*.json")):
+            if relpath(p) not in MUTABLE_FILES:
+                yield p
+
+
+def _blob(data: Any) -> bytes:
+    return pickle.dumps(freeze(data), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _stamp(path: Path, raw: bytes) -> FileStamp:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size, hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def build_bundle(out: Path = BUNDLE_PATH, verbose: bool = False) -> Dict[str, Any]:
+    """Parse every source file and write the bundle; unparsable files are reported and skipped."""
+    files: Dict[str, FileStamp] = {}
+    data: Dict[str, Any] = {}
+    skipped: Dict[str, str] = {}
+    for path in iter_sources():
+        raw = path.read_bytes()
+        key = relpath(path)
+        try:
+            data[key] = json.loads(raw.decode("utf-8-sig"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            skipped[key] = str(e)
+            continue
+        files[key] = _stamp(path, raw)
+
+    derived: Dict[str, Tuple[str, bytes]] = {}
+    for name, (source, build) in DERIVED.items():
+        key = f"rules/{source}"
+        if key in data:
+            derived[name] = (files[key][2], _blob(build(data[key])))
+
+    char_index = {
+        norm_key(Path(k).stem): k
+        for k in files if k.startswith("rules/characters/") and k.count("/") == 2
+    }
+    content_hash = hashlib.blake2b(
+        "".join(f"{k}:{files[k][2]};" for k in sorted(files)).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+    bundle = {
+        "version": BUNDLE_VERSION,
+        "content_hash": content_hash,
+        "built_at": time.time(),
+        "files": files,
+        "data": {k: _blob(v) for k, v in data.items()},
+        "derived": derived,
+        "character_index": char_index,
+    }
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, out)
+    if verbose:
+        for k, err in skipped.items():
+            print(f"⚠️ Skipped {k}: {err}")
+    bundle["skipped"] = skipped
+    return bundle
+
+
+class RulesBundle:
+    """A loaded bundle; `lookup(path)` returns data only while the file is unchanged on disk."""
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.content_hash: str = raw["content_hash"]
+        self.built_at: float = raw["built_at"]
+        self.files: Dict[str, FileStamp] = raw["files"]
+        self.character_index: Dict[str, str] = raw["character_index"]
+        self._data: Dict[str, bytes] = raw["data"]
+        self._derived: Dict[str, Tuple[str, bytes]] = raw["derived"]
+
+    def lookup(self, path: Path, st: os.stat_result) -> Optional[Tuple[str, Any]]:
+        """(digest, read-only data) if `path` is bundled and its mtime/size still match, else None."""
+        key = relpath(path)
+        stamp = self.files.get(key)
+        if stamp is None or stamp[0] != st.st_mtime_ns or stamp[1] != st.st_size:
+            return None
+        return stamp[2], pickle.loads(self._data[key])
+
+    def derived(self, name: str) -> Optional[Tuple[str, Any]]:
+        """(source digest, read-only table) for a DERIVED table, or None if not bundled."""
+        hit = self._derived.get(name)
+        return (hit[0], pickle.loads(hit[1])) if hit else None
+
+    def stale_files(self) -> Dict[str, str]:
+        """Bundled files that changed or vanished since the build."""
+        out = {}
+        for key, (mtime_ns, size, _) in self.files.items():
+            try:
+                st = os.stat(PROJECT_DIR / key)
+            except FileNotFoundError:
+                out[key] = "missing"
+                continue
+            if st.st_mtime_ns != mtime_ns or st.st_size != size:
+                out[key] = "changed"
+        return out
+
+
+def load_bundle(path: Path = BUNDLE_PATH) -> Optional[RulesBundle]:
+    """One read of the bundle; None when missing, unreadable or built by another BUNDLE_VERSION."""
+    try:
+        with open(path, "rb") as f:
+            raw = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != BUNDLE_VERSION:
+        return None
+    return RulesBundle(raw)
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[list] = None) -> int:
+    import argparse  # CLI only; keeps the runtime import of this module light
+
+    ap = argparse.ArgumentParser(description="Compile rules/ and lore/ JSON into build/rules_bundle.pickle")
+    ap.add_argument("--out", type=Path, default=BUNDLE_PATH)
+    ap.add_argument("--check", action="store_true", help="report files changed since the last build")
+    args = ap.parse_args(argv)
+
+    if args.check:
+        bundle = load_bundle(args.out)
+        if bundle is None:
+            print(f"❌ No usable bundle at {args.out}")
+            return 1
+        stale = bundle.stale_files()
+        for key, why in sorted(stale.items()):
+            print(f"⚠️ {key}: {why}")
+        print(f"📦 {len(bundle.files)} files, {len(stale)} stale (hash {bundle.content_hash})")
+        return 1 if stale else 0
+
+    t0 = time.perf_counter()
+    bundle = build_bundle(args.out, verbose=True)
+    size_kb = args.out.stat().st_size / 1024
+    print(f"📦 Bundled {len(bundle['files'])} files into {args.out} "
+          f"({size_kb:,.0f} KB, hash {bundle['content_hash']}) in {time.perf_counter() - t0:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
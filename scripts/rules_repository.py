@@ -0,0 +1,231 @@
+# file: scripts/rules_repository.py
+"""
+Process-wide cache for the JSON rules files.
+
+Every loader used to re-open and re-parse its rules file on each call
+(classes.json alone is ~100 KB and was parsed once per character). The
+RulesRepository parses each file once and hands out read-only views:
+
+    from rules_repository import get_rules
+
+    weapons = get_rules().get("weapons.json")      # FrozenDict
+    sword = get_rules().mutable("weapons.json")["longsword"]  # private copy
+
+A file is re-read only when its (mtime, size) changes, and re-parsed only when
+the bytes actually differ (blake2b digest), so editing a rules file during a
+session is picked up on the next lookup without a restart.
+
+When build/rules_bundle.pickle exists (see rules_bundle.py) the first lookup
+loads it in one read and unchanged files are served from it without touching
+their JSON; files edited since the build fall back to the raw JSON.
+
+Read-only views raise TypeError on mutation. Use `thaw()` / `mutable()` (or
+copy.deepcopy) when a caller needs to modify the data, e.g. a character's
+weapon dict whose durability ticks down.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+RULES_DIR = SCRIPTS_DIR.parent / "rules"
+
+_MISSING = object()
+
+# =============================================================================
+# Read-only containers
+# =============================================================================
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only; use rules_repository.thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation; deepcopy/thaw give a plain mutable dict."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """list that refuses mutation; deepcopy/thaw give a plain mutable list."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    """Recursively convert parsed JSON into FrozenDict/FrozenList."""
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Recursively copy (frozen or plain) JSON data into mutable dicts/lists."""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(v) for v in obj]
+    return obj
+
+# =============================================================================
+# Repository
+# =============================================================================
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    data: Any
+
+
+class RulesRepository:
+    """
+    Parses each rules file once; `get()` stats the file and reloads only when
+    it changed. Names without a directory resolve under rules/ ("weapons" or
+    "weapons.json"); relative paths such as "../rules/armors.json" resolve
+    against scripts/, the way the loaders always built them.
+    """
+
+    def __init__(self, root: Union[str, Path] = RULES_DIR, use_bundle: bool = True):
+        self.root = Path(root)
+        self.use_bundle = use_bundle
+        self._cache: Dict[str, _Entry] = {}
+        self._derived: Dict[str, Tuple[str, Any]] = {}
+        self._bundle: Any = None
+        self._bundle_loaded = False
+        self._lock = threading.RLock()
+        self.parses = 0
+        self.hits = 0
+
+    @property
+    def bundle(self):
+        """The compiled rules bundle (rules_bundle.RulesBundle) or None; loaded on first use."""
+        if not self._bundle_loaded:
+            self._bundle_loaded = True
+            if self.use_bundle:
+                from rules_bundle import load_bundle
+                self._bundle = load_bundle()
+        return self._bundle
+
+    def resolve(self, name: Union[str, Path]) -> Path:
+        p = Path(name)
+        if p.is_absolute():
+            return p
+        if len(p.parts) == 1:
+            return self.root / (p if p.suffix else p.with_suffix(".json"))
+        return (SCRIPTS_DIR / p).resolve()
+
+    def get(self, name: Union[str, Path], default: Any = _MISSING) -> Any:
+        """Read-only parsed contents of `name`; FileNotFoundError unless `default` is given."""
+        path = self.resolve(name)
+        key = str(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if default is _MISSING:
+                raise
+            return default
+
+        entry = self._cache.get(key)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            self.hits += 1
+            return entry.data
+
+        with self._lock:
+            bundled = self.bundle.lookup(path, st) if entry is None and self.bundle else None
+            if bundled is not None:
+                digest, data = bundled
+            else:
+                raw = path.read_bytes()
+                digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                if entry is not None and entry.digest == digest:
+                    # touched but unchanged: keep the parsed object
+                    entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+                    return entry.data
+                data = freeze(json.loads(raw.decode("utf-8-sig")))
+                self.parses += 1
+            self._cache[key] = _Entry(st.st_mtime_ns, st.st_size, digest, data)
+            return data
+
+    def mutable(self, name: Union[str, Path], default: Any = _MISSING) -> Any:
+        """Private mutable deep copy of `name`'s contents."""
+        return thaw(self.get(name, default))
+
+    def digest(self, name: Union[str, Path]) -> str:
+        """Content hash of the currently cached version of `name`."""
+        self.get(name)
+        return self._cache[str(self.resolve(name))].digest
+
+    def derived(self, name: str) -> Any:
+        """
+        Read-only derived table registered in rules_bundle.DERIVED (e.g.
+        "armor_variants"); taken from the bundle when its source file is
+        unchanged, otherwise rebuilt once per source-file version.
+        """
+        from rules_bundle import DERIVED
+        source, build = DERIVED[name]
+        digest = self.digest(source)
+        hit = self._derived.get(name)
+        if hit is not None and hit[0] == digest:
+            return hit[1]
+        bundled = self.bundle.derived(name) if self.bundle else None
+        if bundled is not None and bundled[0] == digest:
+            value = bundled[1]
+        else:
+            value = freeze(build(self.get(source)))
+        self._derived[name] = (digest, value)
+        return value
+
+    def invalidate(self, name: Optional[Union[str, Path]] = None) -> None:
+        """Drop one file (or everything) from the cache; the bundle is re-read on next use."""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+                self._derived.clear()
+                self._bundle, self._bundle_loaded = None, False
+            else:
+                self._cache.pop(str(self.resolve(name)), None)
+
+
+_repo = RulesRepository()
+
+
+def get_rules() -> RulesRepository:
+    return _repo
+
+
+def set_rules(repo: RulesRepository) -> RulesRepository:
+    """Install `repo` process-wide (e.g. one rooted at a test rules/ dir); returns the previous one."""
+    global _repo
+    prev, _repo = _repo, repo
+    return prev
+
+
+__all__ = [
+    "FrozenDict", "FrozenList", "freeze", "thaw",
+    "RulesRepository", "get_rules", "set_rules", "RULES_DIR",
+]
@@ -0,0 +1,469 @@
+# file: scripts/skirmish.py
+"""
+Struct-of-arrays skirmish engine: two sides of hundreds of units each.
+
+adventure_new.run_combat walks unit dicts one at a time and always fights
+enemies[0]. Skirmish copies every combatant into NumPy columns once (HP,
+stamina, stance, morale, status-round counters, weapon base damage, armor
+coverage bitmask, ...) and resolves a whole round in vectorised passes:
+
+    status decay → skip dazed/rooted → stance → stamina regen/spend →
+    targeting → attack rolls → crits/aim/armor → ripostes → parry stamina →
+    damage → deaths → morale / rout → stalemate fatigue
+
+Roll maths are adventure_new's (attack_modifiers, the crit/head/armor
+rounding chain, stamina tables, check_rout's average-morale test), with two
+deliberate differences: both sides act on the same start-of-round snapshot
+(simultaneous resolution), and sorcery/abilities are not modelled (units
+fight in melee).
+
+Morale scales with the army. morale_event takes on_ally_down_morale_drop
+per fallen ally, which suits a party of a few; applied as is to a side of
+thousands, a handful of casualties would rout it. Each member instead feels
+the casualties of a squad of fear_system.morale_squad comrades (default 5):
+fallen × min(1, squad / side size) ally-down drops, so parties up to the
+squad size keep the per-ally rule exactly. When both sides break in the same
+round, only the one with the lower average morale routs and the other holds
+the field; on an exact tie neither breaks that round and the fight goes on
+(it ends by attrition or the round limit, like any other stalemate). A side
+never breaks in the round its enemy is wiped out.
+
+    sk = Skirmish(make_bandits(500), [make_bandit_leader() for _ in range(500)])
+    result = sk.run()
+    sk.write_back(side_a_units, side_b_units)   # optional: HP/stamina/... back into the dicts
+
+Requires NumPy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import time
+from typing import Any, List, Mapping, NamedTuple, Optional, Sequence
+
+from combat_events import quiet_bus, use_bus
+from dice import DiceStream, get_dice, load_numpy
+from rules_repository import get_rules
+from stance_table import ATTACK_MOD, DEFENSE_MOD, STANCE_KEYS, Stance, StanceTable, stance_of
+from spatial_index import SpatialGrid, deploy_line, position
+from zones import Zone, unit_mask, zone_of
+
+OFFENSIVE, NEUTRAL, DEFENSIVE = Stance.OFFENSIVE, Stance.NEUTRAL, Stance.DEFENSIVE
+STANCE_NAMES = STANCE_KEYS
+AUTO_STANCE = -1          # adventure_new enemy rule: offensive above 35% HP, else defensive
+NO_AIM = -1
+MAX_ROUNDS = 40
+STALEMATE_ROUNDS = 6      # adventure_new.StalemateWatch default
+MORALE_SQUAD = 5          # comrades whose fall a unit feels in full (see ally_down)
+TARGETING = ("random", "focus", "nearest")   # nearest needs unit positions (spatial_index)
+
+
+class SkirmishRules(NamedTuple):
+    crit_hi: int
+    crit_lo: int
+    crit_mult: float
+    head_crit_bonus_pct: int
+    unhelmeted_mult: float
+    regen: tuple           # per stance code
+    attack_cost: tuple     # attack_base + stance cost, per stance code
+    parry_cost: int
+    fear: bool
+    ally_down_drop: int
+    heavy_hit_drop: int
+    headshot_drop: int
+    rout_threshold: int
+    min_morale: int
+    morale_squad: int = MORALE_SQUAD
+
+    @classmethod
+    def from_rules(cls, rules: Optional[Mapping[str, Any]] = None, fear: Optional[bool] = None) -> "SkirmishRules":
+        rules = rules if rules is not None else get_rules().get("combat_rules.json", {})
+        costs = rules.get("stamina_costs") or {}
+        stances = StanceTable.from_rules(rules, stances={}, weapon_stances={})
+        fs = rules.get("fear_system") or {}
+        return cls(
+            crit_hi=int(rules.get("critical_hit_threshold", 95)),
+            crit_lo=int(rules.get("critical_miss_threshold", 5)),
+            crit_mult=float((rules.get("critical_multipliers") or {}).get("default", 1.5)),
+            head_crit_bonus_pct=int((rules.get("aimed_attack") or {}).get("crit_bonus_head_pct", 10)),
+            unhelmeted_mult=float((rules.get("helmet_rules") or {}).get("unhelmeted_headshot_mult", 1.0)),
+            regen=stances.regen,
+            attack_cost=stances.attack_cost,
+            parry_cost=int(costs.get("parry", 0)) + stances.stance_cost[NEUTRAL],
+            fear=bool(fs.get("enabled", True)) if fear is None else bool(fear),
+            ally_down_drop=int(fs.get("on_ally_down_morale_drop", 0)),
+            heavy_hit_drop=int(fs.get("heavy_hit_morale_drop", 0)),
+            headshot_drop=int(fs.get("headshot_morale_drop", 0)),
+            rout_threshold=int(fs.get("rout_threshold", 10)),
+            min_morale=int(fs.get("min_morale", 0)),
+            morale_squad=max(1, int(fs.get("morale_squad", MORALE_SQUAD))),
+        )
+
+    def ally_down(self, fallen: float, side_size: float) -> float:
+        """Morale each member loses when `fallen` of a side that numbered `side_size` went down this round."""
+        if side_size <= 0:
+            return 0.0
+        return self.ally_down_drop * fallen * min(1.0, self.morale_squad / side_size)
+
+    def routs(self, routed: Sequence[bool], mean_morale: Sequence[Optional[float]]) -> List[bool]:
+        """
+        check_rout for both sides at once (mean_morale None: nobody left). If
+        both break in the same round, the one with the higher average holds;
+        on an exact tie both hold and the fight continues. Nobody breaks in the
+        round the enemy is wiped out.
+        """
+        broke = [not routed[s] and mean_morale[s] is not None and mean_morale[s] <= self.rout_threshold
+                 and mean_morale[1 - s] is not None for s in (0, 1)]
+        if broke[0] and broke[1]:
+            if mean_morale[0] == mean_morale[1]:
+                broke = [False, False]
+            else:
+                broke[0 if mean_morale[0] > mean_morale[1] else 1] = False
+        return [bool(routed[s] or broke[s]) for s in (0, 1)]
+
+
+class RoundSummary(NamedTuple):
+    round: int
+    alive: tuple           # living (not routed) units per side
+    damage: tuple          # damage dealt by each side this round
+    hits: tuple            # landed attacks per side (ripostes included)
+    routed: tuple          # side routed this round or earlier
+
+
+class SkirmishResult(NamedTuple):
+    winner: int            # 0 / 1, -1 for a draw or timeout
+    rounds: int
+    survivors: tuple       # living units per side at the end
+    routed: tuple
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+class Skirmish:
+    """
+    Two sides of unit dicts (equipped like make_bandits output) held as
+    columns. `stances` / `aim` optionally fix a unit's stance (code or name) or aimed
+    zone (index into adventure_new.AIM_ZONES) per unit; default is the enemy
+    AI stance rule and normal attacks. "nearest" targeting uses the units'
+    `pos` entries (or `positions`, one (x, y) per unit) through a SpatialGrid.
+    """
+
+    def __init__(self, side_a: Sequence[dict], side_b: Sequence[dict],
+                 rules: Optional[SkirmishRules] = None, dice: Optional[DiceStream] = None,
+                 targeting: str = "random", stances: Optional[Sequence[int]] = None,
+                 aim: Optional[Sequence[int]] = None, fear: Optional[bool] = None,
+                 positions: Optional[Sequence[tuple]] = None):
+        np = load_numpy()
+        if np is None:
+            raise ImportError("Skirmish requires NumPy (pip install numpy)")
+        if targeting not in TARGETING:
+            raise ValueError(f"targeting must be one of {TARGETING}")
+        import adventure_new as game  # heavy import; unit helpers and aim zones
+
+        self._np = np
+        self.rules = rules or SkirmishRules.from_rules(game.rules, fear=fear)
+        self.targeting = targeting
+        self._gen = np.random.default_rng((dice or get_dice()).getrandbits(64))
+        self.round = 0
+        self.no_damage_rounds = 0
+        self.routed = [False, False]
+
+        units = list(side_a) + list(side_b)
+        n = len(units)
+        self.names = [str(u.get("name", f"unit {i}")) for i, u in enumerate(units)]
+        self.aim_zones = tuple(game.AIM_ZONES)
+        self._head_aims = np.array([zone_of(z) is Zone.HEAD for z in self.aim_zones])
+
+        def col(values, dtype=np.int64):
+            return np.array(list(values), dtype=dtype)
+
+        for u in units:
+            game.ensure_hp_fields(u)
+            if "_weapon_type" not in u:
+                game.init_weapon_state(u)
+        self.side = col([0] * len(side_a) + [1] * len(side_b), np.int8)
+        self.hp = col(int(u["current_hp"]) for u in units)
+        self.max_hp = col(max(1, int(u.get("total_hp", u["current_hp"]) or 1)) for u in units)
+        self.stamina = col(int(u.get("current_stamina", u.get("max_stamina", 0))) for u in units)
+        self.max_stamina = col(int(u.get("max_stamina", 0)) for u in units)
+        self.dex_mod = col(int(u.get("dexterity", u.get("Dexterity", 25))) // 10 for u in units)
+        self.stress = col(int(u.get("stress_level", 0)) for u in units)
+        self.base_dmg = col(game.base_damage_for(u) for u in units)
+        self.durability = col(int(u.get("_weapon_durability", 50)) for u in units)
+        self.morale = col((int(u.get("morale", 100)) for u in units), np.float64)   # drops are fractional
+        self.alive = col((bool(u.get("alive", True)) and int(u["current_hp"]) > 0 for u in units), bool)
+        for key in ("_fogged_rounds", "_fog_atk_penalty", "_feared_rounds", "_rooted_rounds",
+                    "_dazed_rounds", "_veil_aura_rounds", "_veil_aura_penalty"):
+            setattr(self, key.strip("_"), col(int(u.get(key, 0) or 0) for u in units))
+        self.cover = col((unit_mask(u) for u in units), np.int64)   # AIM_ZONES follow zones.Zone order
+        self.stance = col((int(stance_of(s)) if isinstance(s, str) else s for s in stances)
+                          if stances is not None else [AUTO_STANCE] * n, np.int8)
+        self.aim = col(aim if aim is not None else [NO_AIM] * n, np.int8)
+        self.aim_pen = np.where(self.aim >= 0, col(game.aimed_attack_penalty(u, game.rules) for u in units), 0)
+        if len(self.stance) != n or len(self.aim) != n:
+            raise ValueError("stances / aim need one entry per unit")
+        points = list(positions) if positions is not None else [position(u) for u in units]
+        self.pos = col(points, np.float64) if n and all(p is not None for p in points) else None
+        if targeting == "nearest" and self.pos is None:
+            raise ValueError("nearest targeting needs a position for every unit")
+
+    def __len__(self) -> int:
+        return len(self.hp)
+
+    # ---- queries ----
+    def active(self):
+        """Living units whose side has not routed."""
+        return self.alive & ~self._np.array(self.routed)[self.side]
+
+    def counts(self) -> tuple:
+        act = self.active()
+        return int((act & (self.side == 0)).sum()), int((act & (self.side == 1)).sum())
+
+    def outcome(self) -> Optional[int]:
+        """Winning side once the other has no active units; -1 if neither has any."""
+        a, b = self.counts()
+        if a and b:
+            return None
+        return 0 if a else 1 if b else -1
+
+    # ---- one round ----
+    def step(self) -> RoundSummary:
+        np, g, r = self._np, self._gen, self.rules
+        self.round += 1
+
+        # status decay (sorcery_ext.on_new_round_tick)
+        for counter in (self.fogged_rounds, self.feared_rounds, self.rooted_rounds,
+                        self.dazed_rounds, self.veil_aura_rounds):
+            counter -= counter > 0
+        self.veil_aura_penalty[self.veil_aura_rounds <= 0] = 0
+
+        live = self.active()
+        dazed = live & (self.dazed_rounds > 0)
+        rooted = live & ~dazed & (self.rooted_rounds > 0)
+        self.dazed_rounds[dazed] = 0      # the lost action consumes the status
+        self.rooted_rounds[rooted] = 0
+        acts = live & ~dazed & ~rooted
+
+        stance = np.where(self.stance >= 0, self.stance,
+                          np.where(self.hp > self.max_hp * 0.35, OFFENSIVE, DEFENSIVE)).astype(np.int64)
+        regen = np.array(r.regen)[stance]
+        cost = np.array(r.attack_cost)[stance]
+        self.stamina = np.where(acts, np.maximum(0, np.minimum(self.max_stamina, self.stamina + regen) - cost),
+                                self.stamina)
+
+        defense = self.dex_mod + np.array(DEFENSE_MOD)[stance]   # attack_modifiers' t_stat + DEFENSE_MOD
+
+        att = np.flatnonzero(acts)
+        tgt = self._pick_targets(att, live)
+        att, tgt = att[tgt >= 0], tgt[tgt >= 0]
+
+        atk_roll = g.integers(1, 101, size=len(att))
+        def_roll = g.integers(1, 101, size=len(att))
+        hit = atk_roll + self._attack_mod(att, stance[att], self.aim[att]) > def_roll + defense[tgt]
+        crit = hit & (atk_roll >= r.crit_hi)
+        dmg = np.where(hit, self._damage(att, tgt, self.aim[att], crit), 0)
+
+        # critical miss → the target ripostes (offensive, normal attack) if it still stands
+        fumble = ~hit & (atk_roll <= r.crit_lo)
+        rip, vic = tgt[fumble], att[fumble]
+        self.stamina[rip] = np.maximum(0, np.minimum(self.max_stamina[rip], self.stamina[rip] + r.regen[OFFENSIVE])
+                                       - r.attack_cost[OFFENSIVE])
+        r_atk = g.integers(1, 101, size=len(rip))
+        r_def = g.integers(1, 101, size=len(rip))
+        r_hit = r_atk + self._attack_mod(rip, np.full(len(rip), OFFENSIVE), np.full(len(rip), NO_AIM)) \
+            > r_def + defense[vic]
+        r_crit = r_hit & (r_atk >= r.crit_hi)
+        r_dmg = np.where(r_hit, self._damage(rip, vic, np.full(len(rip), NO_AIM), r_crit), 0)
+
+        # parry stamina for every miss taken (spend_stamina(target, "parry", "neutral"))
+        n = len(self)
+        parries = np.bincount(tgt[~hit], minlength=n)
+        self.stamina = np.maximum(0, self.stamina - parries * r.parry_cost)
+
+        victims = np.concatenate([tgt, vic])
+        dealers = np.concatenate([att, rip])
+        dealt = np.concatenate([dmg, r_dmg])
+        landed = np.concatenate([hit, r_hit])
+        taken = np.bincount(victims, weights=dealt, minlength=n).astype(np.int64)
+        self.hp = np.maximum(0, self.hp - taken)
+        self.durability = np.maximum(0, self.durability - np.bincount(dealers[landed], minlength=n))
+
+        fell = self.alive & (self.hp <= 0)
+        self.alive &= self.hp > 0
+        if r.fear:
+            self._morale(fell, victims[np.concatenate([crit, r_crit])],
+                         tgt[hit & (self.aim[att] >= 0) & self._head_aims[np.maximum(self.aim[att], 0)]])
+
+        by_side = np.bincount(self.side[dealers], weights=dealt, minlength=2)
+        hits = np.bincount(self.side[dealers[landed]], minlength=2)
+        if by_side.sum() > 0:
+            self.no_damage_rounds = 0
+        else:
+            self.no_damage_rounds += 1
+            if self.no_damage_rounds >= STALEMATE_ROUNDS:   # apply_fatigue_to_all
+                self.no_damage_rounds = 0
+                self.max_stamina = np.maximum(0, self.max_stamina - 2)
+                self.hp = np.where(self.alive, np.maximum(0, self.hp - 1), self.hp)
+                self.alive &= self.hp > 0
+        return RoundSummary(self.round, self.counts(), (int(by_side[0]), int(by_side[1])),
+                            (int(hits[0]), int(hits[1])), tuple(self.routed))
+
+    def run(self, max_rounds: int = MAX_ROUNDS) -> SkirmishResult:
+        """Rounds until one side is down or routed; -1 on a timeout."""
+        winner = self.outcome()
+        while winner is None and self.round < max_rounds:
+            self.step()
+            winner = self.outcome()
+        return SkirmishResult(-1 if winner is None else winner, self.round, self.counts(), tuple(self.routed))
+
+    # ---- passes ----
+    def _pick_targets(self, att, live):
+        """One living enemy per attacker (-1 if none): uniform, the first one like enemies[0], or the nearest."""
+        np = self._np
+        tgt = np.full(len(att), -1, dtype=np.int64)
+        for s in (0, 1):
+            mine = self.side[att] == s
+            foes = np.flatnonzero(live & (self.side != s))
+            if not len(foes) or not mine.any():
+                continue
+            if self.targeting == "focus":
+                tgt[mine] = foes[0]
+            elif self.targeting == "nearest":
+                grid = SpatialGrid.from_points(foes.tolist(), self.pos[foes].tolist())
+                tgt[mine] = [grid.nearest(x, y) for x, y in self.pos[att[mine]].tolist()]
+            else:
+                tgt[mine] = foes[self._gen.integers(0, len(foes), size=int(mine.sum()))]
+        return tgt
+
+    def _attack_mod(self, idx, stance, aim):
+        """adventure_new.attack_modifiers()['attack_mod'] for many attackers."""
+        np = self._np
+        stance_atk = np.array(ATTACK_MOD)[stance]
+        status = (np.where(self.fogged_rounds[idx] > 0, self.fog_atk_penalty[idx], 0)
+                  + np.where(self.feared_rounds[idx] > 0, 10, 0)
+                  + np.where(self.veil_aura_rounds[idx] > 0,
+                             np.where(self.veil_aura_penalty[idx] != 0, self.veil_aura_penalty[idx], 10), 0))
+        pain_pct = np.trunc(100 * (1 - self.hp[idx] / self.max_hp[idx])).astype(np.int64)
+        aim_pen = np.where(aim >= 0, self.aim_pen[idx], 0)
+        return self.dex_mod[idx] + stance_atk - status - aim_pen - self.stress[idx] - pain_pct // 25
+
+    def _damage(self, att, tgt, aim, crit):
+        """hit_tables.hit_damage for many hits: head crit bonus → crit mult → armor / unhelmeted head."""
+        np, r = self._np, self.rules
+        aimed = aim >= 0
+        head = aimed & self._head_aims[np.maximum(aim, 0)]
+        raw = self.base_dmg[att].astype(np.float64)
+        raw = np.where(crit & head, np.round(raw * (1 + r.head_crit_bonus_pct / 100.0)), raw)
+        dmg = np.maximum(0, np.where(crit, np.round(raw * r.crit_mult), raw))
+        covered = aimed & ((self.cover[tgt] >> np.maximum(aim, 0)) & 1).astype(bool)
+        dmg = np.where(covered, np.round(dmg * 0.75), dmg)
+        if r.unhelmeted_mult > 1.0:
+            dmg = np.where(head & ~covered, np.round(dmg * r.unhelmeted_mult), dmg)
+        return dmg.astype(np.int64)
+
+    def _morale(self, fell, heavy_hit, headshot):
+        """combat_engine_ext.morale_event for the round's casualties and hits, then check_rout per side."""
+        np, r = self._np, self.rules
+        n = len(self)
+        drop = np.bincount(heavy_hit, minlength=n) * r.heavy_hit_drop + np.bincount(headshot, minlength=n) * r.headshot_drop
+        downs = np.bincount(self.side[fell], minlength=2)
+        size = np.bincount(self.side[self.alive], minlength=2) + downs     # members at the start of the round
+        felt = np.array([r.ally_down(downs[s], size[s]) for s in (0, 1)])
+        drop = drop + felt[self.side]
+        self.morale = np.where(self.alive, np.maximum(r.min_morale, self.morale - drop), self.morale)
+        means = []
+        for s in (0, 1):
+            team = self.alive & (self.side == s)
+            means.append(float(self.morale[team].mean()) if team.any() else None)
+        self.routed = r.routs(self.routed, means)
+
+    # ---- back to dicts ----
+    def write_back(self, side_a: Sequence[dict], side_b: Sequence[dict]) -> None:
+        """Copy HP, stamina, morale, status counters and durability back into the unit dicts."""
+        for i, u in enumerate(list(side_a) + list(side_b)):
+            u["current_hp"] = int(self.hp[i])
+            u["alive"] = bool(self.alive[i])
+            u["current_stamina"] = int(self.stamina[i])
+            u["max_stamina"] = int(self.max_stamina[i])
+            u["morale"] = int(round(self.morale[i]))
+            u["_weapon_durability"] = int(self.durability[i])
+            for key in ("_fogged_rounds", "_feared_rounds", "_rooted_rounds", "_dazed_rounds", "_veil_aura_rounds",
+                        "_veil_aura_penalty"):
+                u[key] = int(getattr(self, key.strip("_"))[i])
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _side(game, spec: str, n: int) -> List[dict]:
+    if spec == "bandit":
+        return game.make_bandits(n)
+    if spec == "bandit_leader":
+        return [game.make_bandit_leader() for _ in range(n)]
+    base = game.load_character_file(spec)
+    if not base:
+        raise SystemExit(f"❌ Unknown character: {spec}")
+    game.equip_armor(base)
+    return [dict(base, name=f"{base.get('name', spec)} {i + 1}") for i in range(n)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> SkirmishResult:
+    ap = argparse.ArgumentParser(description="Resolve a large two-sided skirmish with vectorised rounds.")
+    ap.add_argument("--a", default="bandit", help="side A template: bandit, bandit_leader or a character (default bandit)")
+    ap.add_argument("--b", default="bandit", help="side B template (default bandit)")
+    ap.add_argument("-n", "--size", type=int, default=500, help="units per side (default 500)")
+    ap.add_argument("--targeting", default="random", choices=TARGETING)
+    ap.add_argument("--fear", action="store_true", help="enable morale/rout even if fear_system is disabled")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--check", action="store_true",
+                    help="also check that side A lands fewer hits on a defensive side B than on an offensive one")
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    with use_bus(quiet_bus()), open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        import adventure_new as game
+        side_a, side_b = _side(game, args.a, args.size), _side(game, args.b, args.size)
+    if args.targeting == "nearest":
+        deploy_line(side_a, -1.0)
+        deploy_line(side_b, 1.0)
+    t0 = time.perf_counter()
+    sk = Skirmish(side_a, side_b, dice=DiceStream(args.seed), targeting=args.targeting,
+                  fear=True if args.fear else None)
+    t1 = time.perf_counter()
+    result = sk.run()
+    t2 = time.perf_counter()
+    label = {0: f"side A ({args.a})", 1: f"side B ({args.b})", -1: "nobody"}[result.winner]
+    print(f"⚔️ {args.size} {args.a} vs {args.size} {args.b}: {label} wins after {result.rounds} rounds; "
+          f"survivors {result.survivors[0]} / {result.survivors[1]}"
+          + (f", routed {result.routed}" if any(result.routed) else ""))
+    per_round = (t2 - t1) / max(1, result.rounds)
+    print(f"⏱️ setup {1000 * (t1 - t0):.1f} ms, {1000 * per_round:.2f} ms/round")
+    if args.check:
+        hits = stance_check(side_a, side_b, args.seed)
+        print(f"{'✅' if hits[DEFENSIVE] < hits[OFFENSIVE] else '❌'} side A hits in round 1: "
+              f"{hits[OFFENSIVE]} on offensive side B, {hits[DEFENSIVE]} on defensive side B")
+    return result
+
+
+def stance_check(side_a: Sequence[dict], side_b: Sequence[dict], seed: int = 0) -> dict:
+    """Side A's round-1 hits with side B held offensive, then defensive, on the same dice."""
+    hits = {}
+    for stance in (OFFENSIVE, DEFENSIVE):
+        stances = [AUTO_STANCE] * len(side_a) + [stance] * len(side_b)
+        sk = Skirmish(side_a, side_b, dice=DiceStream(seed), stances=stances)
+        hits[stance] = sk.step().hits[0]
+    return hits
+
+
+__all__ = [
+    "OFFENSIVE", "NEUTRAL", "DEFENSIVE", "AUTO_STANCE", "NO_AIM", "TARGETING", "MORALE_SQUAD",
+    "SkirmishRules", "RoundSummary", "SkirmishResult", "Skirmish", "stance_check", "main",
+]
+
+
+if __name__ == "__main__":
+    main()
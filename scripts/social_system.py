@@ -1,5 +1,5 @@
-import random
 import logging
+from dice import get_dice
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -9,7 +9,7 @@ class SocialSystem:
 
     def charisma_check(self, difficulty):
         charisma = self.character.charisma + getattr(self.character, "charisma_penalty", 0)
-        roll = random.randint(1, 100) + (charisma // 5)
+        roll = get_dice().d100() + (charisma // 5)
         print(f"🎭 {self.character.name} charisma check: rolled {roll} vs difficulty {difficulty}")
         logging.debug(f"Charisma check for {self.character.name}: {roll} vs {difficulty}")
         return roll >= difficulty
@@ -1,11 +1,14 @@
 # scripts/sorcery_ext.py
 from __future__ import annotations
-import random
+from dice import get_dice
+from spatial_index import POS_KEY, SpatialGrid, nearest_unit, position, positioned, units_in_radius
 
 __all__ = [
     "is_sorceress",
     "present_spells_menu",
     "cast_spell",
+    "list_spells",
+    "castable_spells",
     "on_new_round_tick",
     "apply_melee_vulnerability",
     "consume_evade_on_melee_if_any",
@@ -28,6 +31,7 @@ DEFAULT_SPELLS = {
         "fog_duration": 1,        # rounds
         "bonus_vs_feared_pct": 5, # small synergy
         "atk_penalty": 20,        # −20 to attack rolls for affected units
+        "radius": 4,              # around the target; positionless fights fog every enemy
     },
     "blood_pact": {
         "label": "Blood Pact",
@@ -60,7 +64,7 @@ DEFAULT_SPELLS = {
         "stamina": 30,
         "corruption": 20,          # +20
         "damage": 40,              # 20+20 veil damage (no resistances in this build)
-        "radius": 5,
+        "radius": 5,               # around the caster; positionless fights catch every enemy
         "root_rounds": 1,          # all trapped (incl. caster)
         "heal_on_fear_pct": 15,    # heal 15% max HP if any enemy feared
         "spawn_chance_pct": 25,    # 25% chance to spawn a Veil entity
@@ -88,6 +92,7 @@ def override_from_rules(rules: dict):
 
     # Veil Fog
     apply("veil_fog",        "stamina",   "veil_fog",        "stamina_cost")
+    apply("veil_fog",        "radius",    "veil_fog")
     # Blood Pact
     apply("blood_pact",      "stamina",   "blood_pact",      "stamina_cost")
     apply("blood_pact",      "hp_pct_cost","blood_pact",     "hp_cost_percent")
@@ -99,6 +104,7 @@ def override_from_rules(rules: dict):
     # Shroud’s Embrace
     apply("shrouds_embrace", "stamina",   "shrouds_embrace", "stamina_cost")
     apply("shrouds_embrace", "cooldown",  "shrouds_embrace", "cooldown")
+    apply("shrouds_embrace", "radius",    "shrouds_embrace")
 
     DEFAULT_SPELLS = book
 
@@ -109,6 +115,18 @@ def is_sorceress(unit: dict) -> bool:
 def _is_female(unit: dict) -> bool:
     return str(unit.get("gender", "")).lower() == "female"
 
+def list_spells(unit: dict) -> list[str]:
+    """Spell ids in the caster's spellbook, in menu order."""
+    return list(_get_spellbook(unit).keys())
+
+def castable_spells(unit: dict) -> list[str]:
+    """Spells cast_spell would accept right now: affordable, and Shroud's Embrace not yet used."""
+    st = _cur_st(unit)
+    tax = int(unit.get("_exhaust_spell_tax", 0))
+    return [sid for sid, meta in _get_spellbook(unit).items()
+            if int(meta.get("stamina", 0)) + tax <= st
+            and not (sid == "shrouds_embrace" and unit.get(SHROUD_ONCE_PER_ENCOUNTER_FLAG, False))]
+
 def _get_spellbook(unit: dict) -> dict:
     sb = unit.get("spells")
     return sb if isinstance(sb, dict) and sb else DEFAULT_SPELLS
@@ -166,7 +184,7 @@ def _miscast_chance(unit: dict) -> float:
     return MISCAST_BASE + (unit.get("corruption_level", 0) / 20.0)
 
 def _roll(n=100):
-    return random.randint(1, n)
+    return get_dice().randint(1, n)
 
 def _apply_fear(target: dict, rounds: int, round_log: list):
     target["_feared_rounds"] = max(int(target.get("_feared_rounds", 0)), rounds)
@@ -274,7 +292,9 @@ def cast_spell(
     caster: dict,
     enemies: list[dict],
     apply_damage_cb,   # function(attacker, target, raw_damage, round_log, zone=None, is_crit=False)
-    round_log: list
+    round_log: list,
+    choose=None,       # function(caster) -> spell id or None; default: interactive menu
+    grid: SpatialGrid | None = None,  # optional index of `enemies` positions (built on demand)
 ) -> bool:
     if not _is_female(caster):
         round_log.append("⚠️ The Veil recoils—only women may wield this sorcery.")
@@ -284,7 +304,7 @@ def cast_spell(
         round_log.append(f"💫 {caster['name']} is dazed and cannot cast this round.")
         return True
 
-    sid = present_spells_menu(caster)
+    sid = choose(caster) if choose is not None else present_spells_menu(caster)
     if sid is None:
         return False  # do melee instead
 
@@ -330,8 +350,10 @@ def cast_spell(
             round_log.append("☠️ Miscast! The Veil roots the caster in place (1 round).")
         return True
 
-    # pick a default target (single-target engine)
-    target = enemies[0] if enemies else None
+    # default target: the nearest enemy (enemies[0] when units have no positions)
+    if grid is None and position(caster) is not None and len(enemies) > 1 and positioned(enemies):
+        grid = SpatialGrid.from_units(enemies)
+    target = nearest_unit(enemies, caster, grid)
     cor = int(caster.get("corruption_level", 0))
     dmg_mult = _spell_damage_mult(cor)
     ffire_pct = _friendly_fire_chance(cor)
@@ -339,7 +361,8 @@ def cast_spell(
     # effects per spell
     if sid == "veil_fog":
         atk_pen = int(meta.get("atk_penalty", 20))
-        _apply_fog(enemies, meta.get("fog_duration", 1), round_log, atk_penalty=atk_pen)
+        fogged = units_in_radius(enemies, target, float(meta.get("radius", 4)), grid) if target else []
+        _apply_fog(fogged, meta.get("fog_duration", 1), round_log, atk_penalty=atk_pen)
         return True
 
     if sid == "blood_pact":
@@ -384,7 +407,8 @@ def cast_spell(
         return True
 
     if sid == "shrouds_embrace":
-        any_feared = any(e.get("_feared_rounds", 0) > 0 for e in enemies)
+        caught = units_in_radius(enemies, caster, float(meta.get("radius", 5)), grid)
+        any_feared = any(e.get("_feared_rounds", 0) > 0 for e in caught)
         base = int(meta.get("damage", 40))
         dmg = int(round(base * dmg_mult))
         # friendly fire check: if it procs, the AoE collapses onto the caster
@@ -393,7 +417,7 @@ def cast_spell(
             apply_damage_cb(caster, caster, dmg, round_log, zone=None, is_crit=False)
             round_log.append("🕳️ The Shroud backlashes—Isolde is torn by her own rift!")
         else:
-            for e in enemies:
+            for e in caught:
                 _apply_root(e, meta.get("root_rounds", 1), round_log)
                 apply_damage_cb(caster, e, dmg, round_log, zone=None, is_crit=False)
 
@@ -415,6 +439,11 @@ def cast_spell(
                 "armor": ["Light_Light"],
                 "alive": True,
             }
+            if position(caster) is not None:
+                x, y = position(caster)
+                spawn[POS_KEY] = (x + 1.0, y)
+                if grid is not None:
+                    grid.insert(spawn, *spawn[POS_KEY])
             enemies.append(spawn)
             round_log.append("👾 The rift births a Veil Spawn—an enemy joins the fray next round!")
 
@@ -0,0 +1,282 @@
+# file: scripts/spatial_index.py
+"""
+Optional unit positions and a uniform-grid spatial index.
+
+Units may carry a battlefield position as `unit["pos"] = (x, y)` (any unit
+without one keeps the old positionless behaviour: area effects hit the whole
+enemy list and single-target spells take enemies[0]). SpatialGrid buckets
+items into square cells so the common queries only look at nearby cells:
+
+    grid = SpatialGrid.from_units(enemies, cell=2.0)
+    grid.radius(x, y, 5)                    # everything within 5
+    grid.cone(x, y, (1, 0), 6, math.pi / 4) # 90° cone facing +x
+    grid.nearest(x, y)                      # closest item, ring by ring
+
+Query cost is O(k) in the items of the visited cells, not the army size.
+Insert/move/remove are O(1) (plus a scan of one cell), so a grid can be kept
+up to date while units move instead of rebuilt.
+
+Usage (demo):
+    python scripts/spatial_index.py -n 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+POS_KEY = "pos"
+DEFAULT_CELL = 2.0
+
+Point = Tuple[float, float]
+
+
+def position(unit: Any) -> Optional[Point]:
+    """(x, y) of a unit dict, or None when it has no position."""
+    pos = unit.get(POS_KEY) if isinstance(unit, dict) else getattr(unit, POS_KEY, None)
+    if pos is None:
+        return None
+    return float(pos[0]), float(pos[1])
+
+
+def positioned(units: Iterable[Any]) -> bool:
+    """True when every unit has a position (an empty list counts as positioned)."""
+    return all(position(u) is not None for u in units)
+
+
+def deploy_line(units: Sequence[dict], y: float, width: int = 50, spacing: float = 1.0,
+                depth: float = 1.0, x0: float = 0.0) -> None:
+    """Give positionless units a block position: rows of `width`, `depth` apart, growing away from y=0."""
+    step = depth if y >= 0 else -depth
+    for i, u in enumerate(units):
+        if position(u) is None:
+            row, col = divmod(i, width)
+            u[POS_KEY] = (x0 + col * spacing, y + row * step)
+
+
+def _ident(item: Any):
+    # dicts are unhashable; index them by identity
+    return item if getattr(type(item), "__hash__", None) is not None else ("id", id(item))
+
+# =============================================================================
+# Grid
+# =============================================================================
+
+class SpatialGrid:
+    """Uniform grid of (x, y, item) entries keyed by integer cell coordinates."""
+
+    __slots__ = ("cell", "_cells", "_where", "_bounds")
+
+    def __init__(self, cell: float = DEFAULT_CELL):
+        if cell <= 0:
+            raise ValueError("cell size must be positive")
+        self.cell = float(cell)
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, Any]]] = {}
+        self._where: Dict[Any, Tuple[Tuple[int, int], float, float]] = {}
+        self._bounds: Optional[List[int]] = None     # min cx, min cy, max cx, max cy (grows only)
+
+    @classmethod
+    def from_units(cls, units: Iterable[Any], cell: float = DEFAULT_CELL) -> "SpatialGrid":
+        """Grid of every unit that has a position; the rest are left out."""
+        grid = cls(cell)
+        for u in units:
+            pos = position(u)
+            if pos is not None:
+                grid.insert(u, *pos)
+        return grid
+
+    @classmethod
+    def from_points(cls, items: Iterable[Any], points: Iterable[Point], cell: float = DEFAULT_CELL) -> "SpatialGrid":
+        grid = cls(cell)
+        for item, (x, y) in zip(items, points):
+            grid.insert(item, x, y)
+        return grid
+
+    def _key(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell), math.floor(y / self.cell)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, item: Any) -> bool:
+        return _ident(item) in self._where
+
+    # ---- updates ----
+    def insert(self, item: Any, x: float, y: float) -> None:
+        if _ident(item) in self._where:
+            self.move(item, x, y)
+            return
+        key = self._key(x, y)
+        self._cells.setdefault(key, []).append((x, y, item))
+        self._where[_ident(item)] = (key, x, y)
+        b = self._bounds
+        if b is None:
+            self._bounds = [key[0], key[1], key[0], key[1]]
+        else:
+            b[0], b[1], b[2], b[3] = min(b[0], key[0]), min(b[1], key[1]), max(b[2], key[0]), max(b[3], key[1])
+
+    def remove(self, item: Any) -> None:
+        ident = _ident(item)
+        key = self._where.pop(ident)[0]
+        bucket = self._cells[key]
+        for i, entry in enumerate(bucket):
+            if _ident(entry[2]) == ident:   # same key as _where (equal ints/strings need not be identical)
+                bucket[i] = bucket[-1]
+                bucket.pop()
+                break
+        if not bucket:
+            del self._cells[key]
+
+    def discard(self, item: Any) -> None:
+        if item in self:
+            self.remove(item)
+
+    def move(self, item: Any, x: float, y: float) -> None:
+        self.remove(item)
+        self.insert(item, x, y)
+
+    def position_of(self, item: Any) -> Point:
+        _, x, y = self._where[_ident(item)]
+        return x, y
+
+    # ---- queries ----
+    def _span(self, x: float, y: float, r: float):
+        c = self.cell
+        return (math.floor((x - r) / c), math.floor((y - r) / c),
+                math.floor((x + r) / c), math.floor((y + r) / c))
+
+    def radius(self, x: float, y: float, r: float) -> List[Any]:
+        """Items within distance r (inclusive) of (x, y)."""
+        out = []
+        r2 = r * r
+        x0, y0, x1, y1 = self._span(x, y, r)
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for px, py, item in cells.get((cx, cy), ()):
+                    if (px - x) * (px - x) + (py - y) * (py - y) <= r2:
+                        out.append(item)
+        return out
+
+    def cone(self, x: float, y: float, facing: Point, r: float, half_angle: float = math.pi / 4) -> List[Any]:
+        """Items within r of (x, y) and at most `half_angle` radians off the `facing` direction."""
+        fx, fy = facing
+        norm = math.hypot(fx, fy)
+        if norm == 0:
+            raise ValueError("cone needs a non-zero facing vector")
+        fx, fy = fx / norm, fy / norm
+        cos_lim = math.cos(half_angle)
+        out = []
+        for item in self.radius(x, y, r):
+            px, py = self.position_of(item)
+            dx, dy = px - x, py - y
+            d = math.hypot(dx, dy)
+            if d == 0 or (dx * fx + dy * fy) >= cos_lim * d:
+                out.append(item)
+        return out
+
+    def nearest(self, x: float, y: float, max_r: Optional[float] = None,
+                where: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """Closest item (optionally passing `where`), scanning rings of cells outwards; None if none."""
+        if not self._where:
+            return None
+        cells, c = self._cells, self.cell
+        cx, cy = self._key(x, y)
+        b = self._bounds
+        last_ring = max(abs(cx - b[0]), abs(cx - b[2]), abs(cy - b[1]), abs(cy - b[3]))
+        if max_r is not None:
+            last_ring = min(last_ring, math.ceil(max_r / c) + 1)
+        best, best_d2 = None, math.inf
+        for ring in range(last_ring + 1):
+            for key in _ring(cx, cy, ring):
+                for px, py, item in cells.get(key, ()):
+                    d2 = (px - x) * (px - x) + (py - y) * (py - y)
+                    if d2 < best_d2 and (where is None or where(item)):
+                        best, best_d2 = item, d2
+            # anything in an unscanned cell is at least ring * cell away
+            if best is not None and best_d2 <= (ring * c) ** 2:
+                break
+        if best is not None and max_r is not None and best_d2 > max_r * max_r:
+            return None
+        return best
+
+
+def _ring(cx: int, cy: int, ring: int):
+    """Cell keys at Chebyshev distance `ring` from (cx, cy)."""
+    if ring == 0:
+        yield cx, cy
+        return
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
+
+# =============================================================================
+# Unit-list helpers (positionless fallback built in)
+# =============================================================================
+
+def units_in_radius(units: Sequence[Any], center: Any, r: float,
+                    grid: Optional[SpatialGrid] = None) -> List[Any]:
+    """Units within r of `center` (a unit or a point); all of them when positions are missing."""
+    origin = center if isinstance(center, tuple) else position(center)
+    if origin is None or (grid is None and not positioned(units)):
+        return list(units)
+    grid = grid if grid is not None else SpatialGrid.from_units(units)
+    return grid.radius(origin[0], origin[1], r)
+
+
+def nearest_unit(units: Sequence[Any], center: Any, grid: Optional[SpatialGrid] = None,
+                 where: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+    """Closest unit to `center`; the first (matching) unit when positions are missing."""
+    origin = center if isinstance(center, tuple) else position(center)
+    if origin is None or (grid is None and not positioned(units)):
+        return next((u for u in units if where is None or where(u)), None)
+    grid = grid if grid is not None else SpatialGrid.from_units(units)
+    return grid.nearest(origin[0], origin[1], where=where)
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="Time grid queries against a brute-force scan.")
+    ap.add_argument("-n", type=int, default=100_000, help="random points (default 100000)")
+    ap.add_argument("--size", type=float, default=1000.0, help="field edge length")
+    ap.add_argument("--radius", type=float, default=5.0)
+    ap.add_argument("--queries", type=int, default=1000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    pts = [(rng.uniform(0, args.size), rng.uniform(0, args.size)) for _ in range(args.n)]
+    t0 = time.perf_counter()
+    grid = SpatialGrid.from_points(range(args.n), pts, cell=args.radius)
+    t1 = time.perf_counter()
+    qs = [(rng.uniform(0, args.size), rng.uniform(0, args.size)) for _ in range(args.queries)]
+    found = sum(len(grid.radius(x, y, args.radius)) for x, y in qs)
+    near = [grid.nearest(x, y) for x, y in qs]
+    t2 = time.perf_counter()
+    r2 = args.radius ** 2
+    brute = sum(sum(1 for px, py in pts if (px - x) ** 2 + (py - y) ** 2 <= r2) for x, y in qs[:20])
+    t3 = time.perf_counter()
+    ok = brute == sum(len(grid.radius(x, y, args.radius)) for x, y in qs[:20]) and all(
+        near[i] == min(range(args.n), key=lambda j: (pts[j][0] - x) ** 2 + (pts[j][1] - y) ** 2)
+        for i, (x, y) in enumerate(qs[:5]))
+    print(f"🗺️ {args.n} points: build {1000 * (t1 - t0):.1f} ms; {args.queries} radius + nearest queries "
+          f"{1000 * (t2 - t1):.1f} ms ({found} hits); brute radius {1000 * (t3 - t2) / 20:.1f} ms/query")
+    print("✅ matches brute force" if ok else "❌ grid disagrees with brute force")
+
+
+__all__ = [
+    "POS_KEY", "DEFAULT_CELL", "position", "positioned", "deploy_line", "SpatialGrid",
+    "units_in_radius", "nearest_unit", "main",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 # ✅ stance_logic.py
 # file: scripts/stance_logic.py
 
+from rules_repository import get_rules
+from stance_table import StanceTable, stance_of
+
 STANCE_DATA = {
     "offensive": {
         "attack_bonus": 3,
@@ -19,26 +22,34 @@ STANCE_DATA = {
     }
 }
 
+# Compiled from rules/stances.json (same numbers as STANCE_DATA) by stance_table,
+# on first use and again whenever stances.json changes
+_TABLE = None  # (stances.json digest, StanceTable)
+
+def _table():
+    global _TABLE
+    repo = get_rules()
+    stances = repo.get("stances.json", None)
+    key = repo.digest("stances.json") if stances is not None else ""
+    if _TABLE is None or _TABLE[0] != key:
+        _TABLE = (key, StanceTable.from_rules(stances=stances or STANCE_DATA))
+    return _TABLE[1]
+
 def apply_stance_modifiers(attacker, defender, stance_type, roll_type):
     """
     Applies stance-based roll modifiers. 
     roll_type = "attack" or "defense"
     """
-    stance = STANCE_DATA.get(stance_type, STANCE_DATA["neutral"])
-    bonus = 0
-
+    s = stance_of(stance_type)
     if roll_type == "attack":
-        bonus += stance.get("attack_bonus", 0)
-        bonus -= stance.get("attack_penalty", 0)
-    elif roll_type == "defense":
-        bonus += stance.get("defense_bonus", 0)
-        bonus -= stance.get("defense_penalty", 0)
-
-    return bonus
+        return _table().logic_attack[s]
+    if roll_type == "defense":
+        return _table().logic_defense[s]
+    return 0
 
 def get_stamina_cost_modifier(stance_type, maneuver_type):
     """
     Returns stamina modifier: offensive or defensive maneuver during stance.
     """
-    stance = STANCE_DATA.get(stance_type, STANCE_DATA["neutral"])
-    return stance["stamina_cost_modifier"].get(maneuver_type, 0)
\ No newline at end of file
+    offensive, defensive = _table().logic_stamina[stance_of(stance_type)]
+    return {"offensive": offensive, "defensive": defensive}.get(maneuver_type, 0)
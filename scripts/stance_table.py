@@ -0,0 +1,213 @@
+# file: scripts/stance_table.py
+"""
+One compiled stance table, indexed by a small integer enum.
+
+Stance effects were spread over combat_engine (_STANCE_ATTACK/_STANCE_DEFENSE),
+adventure_new.stance_mods, stance_logic.STANCE_DATA, the stamina sections of
+combat_rules.json and rules/stances.json + weapon_stances.json, and every roll
+re-cased the stance string before looking it up. Here a stance is resolved to
+a Stance once and every effect is one tuple index:
+
+    s = stance_of("Offensive")        # Stance.OFFENSIVE (known spellings memoised; unknown → NEUTRAL)
+    ATTACK_MOD[s], DEFENSE_MOD[s]     # +10 / -10: the d100 roll modifiers
+    table = stance_table()            # combat_rules.json + stances.json + weapon_stances.json
+                                      # (recompiled when one of them changes)
+    table.attack_cost[s], table.regen[s]
+    table.weapon("2H_sword")          # WeaponStance tree for a weapon class
+
+Batch engines take stance codes directly: table.arrays()["attack_mod"][codes].
+"""
+
+from __future__ import annotations
+
+import operator
+from enum import IntEnum
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from dice import load_numpy
+from rules_repository import FrozenDict, get_rules
+
+
+class Stance(IntEnum):
+    OFFENSIVE = 0
+    NEUTRAL = 1
+    DEFENSIVE = 2
+
+    @property
+    def key(self) -> str:
+        return STANCE_KEYS[self]
+
+    @property
+    def code(self) -> str:
+        return STANCE_CODES[self]
+
+
+STANCE_KEYS: Tuple[str, ...] = ("offensive", "neutral", "defensive")   # rules JSON keys
+STANCE_CODES: Tuple[str, ...] = ("OFFENSIVE", "NEUTRAL", "DEFENSIVE")  # engine / event spelling
+
+# d100 roll modifiers (combat_engine and adventure_new agree on these)
+ATTACK_MOD: Tuple[int, ...] = (+10, 0, -10)
+DEFENSE_MOD: Tuple[int, ...] = (-10, 0, +10)
+
+_LOOKUP: Dict[Any, Stance] = {**{k: s for k, s in zip(STANCE_KEYS, Stance)},
+                              **{c: s for c, s in zip(STANCE_CODES, Stance)}}
+
+
+def stance_of(stance: Any) -> Stance:
+    """Stance for a name in any case, a Stance or a code; None and unknown names are NEUTRAL."""
+    if isinstance(stance, Stance):
+        return stance
+    try:
+        return _LOOKUP[stance]
+    except KeyError:
+        pass
+    except TypeError:
+        return Stance.NEUTRAL
+    if not isinstance(stance, str):
+        try:
+            i = operator.index(stance)      # ints and NumPy integers
+        except TypeError:
+            return Stance.NEUTRAL
+        return Stance(i) if 0 <= i < len(Stance) else Stance.NEUTRAL
+    found = _LOOKUP.get(stance.strip().lower())
+    if found is None:
+        return Stance.NEUTRAL
+    _LOOKUP[stance] = found  # memoise spellings of known stances only, so the table stays bounded
+    return found
+
+# =============================================================================
+# Compiled table
+# =============================================================================
+
+class WeaponStance(NamedTuple):
+    key: str
+    name: str
+    kind: Stance
+    attack_mod: int           # attack_bonus - attack_penalty
+    defense_mod: int          # defense_bonus - defense_penalty
+    initiative: int
+    fatigue_recovery: int
+    stamina_mod: Tuple[int, int]   # (offensive, defensive) maneuver cost modifiers
+
+
+class WeaponStanceTree(NamedTuple):
+    default: str
+    stances: Mapping[str, WeaponStance]
+
+    def by_kind(self, kind: Any) -> Tuple[WeaponStance, ...]:
+        s = stance_of(kind)
+        return tuple(ws for ws in self.stances.values() if ws.kind is s)
+
+
+def _int(x: Any) -> int:
+    try:
+        return int(x)
+    except Exception:
+        return 0
+
+
+def _bonus(entry: Mapping[str, Any], what: str) -> int:
+    return _int(entry.get(f"{what}_bonus", 0)) - _int(entry.get(f"{what}_penalty", 0))
+
+
+def _weapon_tree(node: Mapping[str, Any]) -> WeaponStanceTree:
+    stances = {}
+    for key, entry in (node.get("stances") or {}).items():
+        mod = entry.get("stamina_modifier") or {}
+        stances[key] = WeaponStance(
+            key=key,
+            name=str(entry.get("name", key)),
+            kind=stance_of(entry.get("type")),
+            attack_mod=_bonus(entry, "attack"),
+            defense_mod=_bonus(entry, "defense"),
+            initiative=_int(entry.get("initiative_bonus", 0)),
+            fatigue_recovery=_int(entry.get("fatigue_recovery", 0)),
+            stamina_mod=(_int(mod.get("offensive", 0)), _int(mod.get("defensive", 0))),
+        )
+    return WeaponStanceTree(str(node.get("default_stance", "")), FrozenDict(stances))
+
+
+class StanceTable(NamedTuple):
+    attack_mod: Tuple[int, ...]        # d100 modifiers, per Stance
+    defense_mod: Tuple[int, ...]
+    logic_attack: Tuple[int, ...]      # stances.json bonuses (stance_logic)
+    logic_defense: Tuple[int, ...]
+    logic_stamina: Tuple[Tuple[int, int], ...]   # (offensive, defensive) maneuver modifiers
+    attack_cost: Tuple[int, ...]       # stamina_costs.attack_base + stamina_costs.stance
+    stance_cost: Tuple[int, ...]       # stamina_costs.stance alone
+    regen: Tuple[int, ...]             # stamina_regen (or the stamina_regeneration fallback)
+    weapons: Mapping[str, WeaponStanceTree]
+
+    @classmethod
+    def from_rules(cls, rules: Optional[Mapping[str, Any]] = None,
+                   stances: Optional[Mapping[str, Any]] = None,
+                   weapon_stances: Optional[Mapping[str, Any]] = None) -> "StanceTable":
+        """Compile from combat_rules.json, stances.json and weapon_stances.json (or the mappings given)."""
+        repo = get_rules()
+        rules = rules if rules is not None else repo.get("combat_rules.json", {})
+        stances = stances if stances is not None else repo.get("stances.json", {})
+        weapon_stances = weapon_stances if weapon_stances is not None else repo.get("weapon_stances.json", {})
+
+        costs = rules.get("stamina_costs") or {}
+        by_stance = costs.get("stance") or {}
+        sr = rules.get("stamina_regen")
+        if isinstance(sr, dict):
+            regen = tuple(_int(sr.get(k, sr.get("neutral", 0))) for k in STANCE_KEYS)
+        else:  # regen_stamina's legacy fallback
+            base = _int((rules.get("stamina_regeneration") or {}).get("base", 0))
+            syn = rules.get("stance_synergies") or {}
+            regen = tuple(int(round(base * (1 + _int((syn.get(k) or {}).get("stamina_regen_pct", 0)) / 100.0)))
+                          for k in STANCE_KEYS)
+        logic = [stances.get(k) or {} for k in STANCE_KEYS]
+        return cls(
+            attack_mod=ATTACK_MOD,
+            defense_mod=DEFENSE_MOD,
+            logic_attack=tuple(_bonus(e, "attack") for e in logic),
+            logic_defense=tuple(_bonus(e, "defense") for e in logic),
+            logic_stamina=tuple((_int((e.get("stamina_cost_modifier") or {}).get("offensive", 0)),
+                                 _int((e.get("stamina_cost_modifier") or {}).get("defensive", 0))) for e in logic),
+            attack_cost=tuple(_int(costs.get("attack_base", 0)) + _int(by_stance.get(k, 0)) for k in STANCE_KEYS),
+            stance_cost=tuple(_int(by_stance.get(k, 0)) for k in STANCE_KEYS),
+            regen=regen,
+            weapons=FrozenDict({k: _weapon_tree(v) for k, v in weapon_stances.items() if hasattr(v, "get")}),
+        )
+
+    def weapon(self, weapon_class: str) -> Optional[WeaponStanceTree]:
+        return self.weapons.get(weapon_class)
+
+    def arrays(self) -> Dict[str, Any]:
+        """The per-stance columns as NumPy arrays, for indexing with stance code arrays."""
+        np = load_numpy()
+        if np is None:
+            raise ImportError("StanceTable.arrays requires NumPy (pip install numpy)")
+        return {k: np.asarray(getattr(self, k), dtype=np.int64) for k in (
+            "attack_mod", "defense_mod", "logic_attack", "logic_defense", "attack_cost", "stance_cost", "regen")}
+
+
+RULE_FILES: Tuple[str, ...] = ("combat_rules.json", "stances.json", "weapon_stances.json")
+
+_TABLE: Optional[Tuple[Tuple[str, ...], StanceTable]] = None   # (digests of RULE_FILES, table)
+
+
+def _digest(repo: Any, name: str) -> str:
+    try:
+        return repo.digest(name)
+    except FileNotFoundError:
+        return ""
+
+
+def stance_table() -> StanceTable:
+    """The table for the default rules files; recompiled whenever one of RULE_FILES changes."""
+    global _TABLE
+    repo = get_rules()
+    key = tuple(_digest(repo, name) for name in RULE_FILES)
+    hit = _TABLE
+    if hit is None or hit[0] != key:
+        hit = _TABLE = (key, StanceTable.from_rules())
+    return hit[1]
+
+
+__all__ = [
+    "Stance", "STANCE_KEYS", "STANCE_CODES", "ATTACK_MOD", "DEFENSE_MOD", "stance_of",
+    "WeaponStance", "WeaponStanceTree", "StanceTable", "RULE_FILES", "stance_table",
+]
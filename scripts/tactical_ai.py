@@ -0,0 +1,333 @@
+# file: scripts/tactical_ai.py
+"""
+Time-budgeted tactical search for enemy turns.
+
+adventure_new's enemies follow one rule (offensive above 35% HP, defensive
+below, plain attack on the player). TacticalPolicy is an enemy_policy that
+searches instead: stance, normal or aimed attack per zone, affordable
+abilities and, for enemy casters, castable sorcery_ext spells.
+
+    ai = TacticalPolicy(budget_ms=20, max_playouts=400)
+    game.run_combat(player, enemies, "Ambush!", policy=GreedyPolicy(), enemy_policy=ai)
+    combat_session.submit(state, action, enemy_policy=ai)   # server rounds
+    ai.last                   # SearchStats of the latest decision
+    ai.metrics.as_dict()      # decisions, playouts, mean/max ms, timeouts, budget overruns
+
+Each turn, GreedyPolicy.rank scores every melee option by exact expected
+damage; the best per stance, the overall top `width`, the classic rule's
+action and each castable spell become the candidates. A flat UCB1 search
+(Monte Carlo tree search one ply deep) then spends the budget on playouts:
+restore a CombatTimeline checkpoint of tracked copies, play the candidate
+through adventure_new.enemy_turn, the rest of this round's enemy turns with
+ENEMY_RULE, then `horizon` full rounds against the `opponent` player model,
+and score the HP balance. The k-th playout of every candidate rolls the same
+dice, so candidates are compared on equal luck. The most-visited candidate
+is played.
+
+The search stops before a playout of average length would cross the
+deadline (candidate ranking counts against the budget too); budget_ms=0
+skips the search (best-ranked action) and budget_ms=None leaves only
+max_playouts. Both are plain attributes, so a server can lower them under
+load. Playouts roll on children of the current dice stream (spawned per
+round and unit, which consumes nothing) under a quiet bus: the live fight's
+rolls and events are untouched, and decisions repeat exactly whenever
+max_playouts rather than the clock ends the search.
+
+Usage (enemy rule vs search, same seeds):
+    python scripts/tactical_ai.py --player torvald --bandits 3 -n 20 --budget-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from combat_events import quiet_bus, use_bus
+from combat_policy import GreedyPolicy, PlayerPolicy, ScriptedPolicy, TurnView
+from combat_snapshot import CombatTimeline
+from dice import DiceStream, get_dice, use_dice
+from sorcery_ext import castable_spells, is_sorceress
+from stance_table import Stance, stance_table
+
+
+class EnemyAction(NamedTuple):
+    """One enemy turn; field names match ScriptedPolicy's keywords."""
+    stance: str
+    attack: str = "normal"
+    zone: Optional[str] = None
+    ability: Optional[str] = None
+    spell: Optional[str] = None
+
+
+class SearchStats(NamedTuple):
+    unit: str
+    round: int
+    action: EnemyAction
+    candidates: int
+    playouts: int
+    elapsed_ms: float
+    value: float          # mean playout score of the chosen action (0 = side wiped, 1 = player dead)
+    timed_out: bool       # the clock, not max_playouts, ended the search
+
+
+class TacticalMetrics:
+    """Running totals over a policy's decisions (cheap to read from a status endpoint)."""
+
+    __slots__ = ("decisions", "playouts", "total_ms", "max_ms", "timeouts", "overruns")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.decisions = 0
+        self.playouts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.timeouts = 0
+        self.overruns = 0       # decisions that took longer than the budget
+
+    def record(self, stats: SearchStats, budget_ms: Optional[float]) -> None:
+        self.decisions += 1
+        self.playouts += stats.playouts
+        self.total_ms += stats.elapsed_ms
+        self.max_ms = max(self.max_ms, stats.elapsed_ms)
+        self.timeouts += stats.timed_out
+        self.overruns += bool(budget_ms) and stats.elapsed_ms > budget_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        n = max(1, self.decisions)
+        return {
+            "decisions": self.decisions,
+            "playouts": self.playouts,
+            "playouts_per_decision": round(self.playouts / n, 1),
+            "mean_ms": round(self.total_ms / n, 3),
+            "max_ms": round(self.max_ms, 3),
+            "timeouts": self.timeouts,
+            "overruns": self.overruns,
+        }
+
+# =============================================================================
+# Candidates / scoring
+# =============================================================================
+
+def candidate_actions(view: TurnView, width: int = 6) -> List[EnemyAction]:
+    """Actions worth searching for view.player against view.target, best prior first."""
+    import adventure_new as game
+
+    ranked = sorted(GreedyPolicy().rank(view), key=lambda r: -r[0])
+    melee = [EnemyAction(*choice) for _, choice in ranked]
+    out = melee[:max(1, width)]
+    for stance in (s.key for s in Stance):
+        out.append(next(a for a in melee if a.stance == stance))
+    out.append(EnemyAction(game.ENEMY_RULE.choose_stance(view)))
+    me = view.player
+    if is_sorceress(me):
+        regen = stance_table().regen
+        rest = max(Stance, key=lambda s: regen[s]).key    # stance only changes regen when casting
+        out += [EnemyAction(rest, spell=sid) for sid in castable_spells(me)]
+    return list(dict.fromkeys(out))
+
+
+def side_score(side: Sequence[dict], foes: Sequence[dict]) -> float:
+    """0.5 ± half the difference in HP fraction lost; 1 when every foe is down and the side untouched."""
+    def left(units: Sequence[dict]) -> float:
+        total = sum(max(0, int(u.get("total_hp", 0))) for u in units)
+        hp = sum(max(0, int(u.get("current_hp", 0))) for u in units if u.get("alive", True))
+        return hp / total if total else 0.0
+    return 0.5 + 0.5 * (left(side) - left(foes))
+
+# =============================================================================
+# Policy
+# =============================================================================
+
+class TacticalPolicy(PlayerPolicy):
+    """
+    Enemy policy (play_round / run_combat enemy_policy) that picks each turn
+    by time-budgeted flat UCB1 playouts. `opponent` builds the player model
+    for playouts (a fresh one per playout); None replays the player's
+    GreedyPolicy plan at the start of the search, which is much cheaper.
+    """
+
+    def __init__(self, budget_ms: Optional[float] = 20.0, max_playouts: int = 400, horizon: int = 2,
+                 width: int = 6, exploration: float = 0.4,
+                 opponent: Optional[Callable[[], PlayerPolicy]] = None, dice: Optional[DiceStream] = None):
+        self.budget_ms = budget_ms
+        self.max_playouts = max_playouts
+        self.horizon = horizon
+        self.width = width
+        self.exploration = exploration
+        self.opponent = opponent
+        self.dice = dice
+        self.metrics = TacticalMetrics()
+        self.last: Optional[SearchStats] = None
+        self._turn: Optional[tuple] = None
+        self._action = EnemyAction("neutral")
+
+    def bind_dice(self, dice: DiceStream) -> None:
+        if self.dice is None:
+            self.dice = dice
+
+    # ---- decisions (choose_stance starts a turn; the rest reuse its plan) ----
+    def plan(self, view: TurnView) -> EnemyAction:
+        turn = (view.round, id(view.player))
+        if self._turn != turn:
+            self._action = self.search(view)
+            self._turn = turn
+        return self._action
+
+    def choose_stance(self, view):
+        self._turn = None
+        return self.plan(view).stance
+
+    def choose_attack_type(self, view):
+        return self.plan(view).attack
+
+    def choose_target_zone(self, view):
+        return self.plan(view).zone or "chest"
+
+    def choose_ability(self, view):
+        return self.plan(view).ability
+
+    def choose_spell(self, view, spell_ids):
+        sid = self.plan(view).spell
+        return sid if sid in spell_ids else None
+
+    # ---- search ----
+    def search(self, view: TurnView) -> EnemyAction:
+        """Best action for view.player this turn; updates .last and .metrics."""
+        t0 = time.perf_counter()
+        deadline = None if self.budget_ms is None else t0 + self.budget_ms / 1000.0
+        me = view.player
+        cands = candidate_actions(view, self.width)
+        visits = [0] * len(cands)
+        totals = [0.0] * len(cands)
+        playouts, timed_out = 0, False
+
+        if len(cands) > 1 and self.max_playouts > 0 and (deadline is None or self.budget_ms > 0):
+            allies = list(view.allies) or [me]
+            idx = next((i for i, u in enumerate(allies) if u is me), None)
+            if idx is None:
+                allies, idx = [me] + allies, 0
+            tl = CombatTimeline(view.target, allies)
+            root = tl.checkpoint()
+            scripts = [ScriptedPolicy(**a._asdict()) for a in cands]
+            opponent = self.opponent or self._replay_player(view, allies)
+            stream = (self.dice or get_dice()).spawn("tactics", view.round, str(me.get("name", idx)))
+            with use_bus(quiet_bus()):
+                started = time.perf_counter()
+                while playouts < self.max_playouts:
+                    now = time.perf_counter()
+                    # stop before a playout of average length would cross the deadline
+                    if deadline is not None and (now >= deadline or
+                                                 playouts and now + (now - started) / playouts > deadline):
+                        timed_out = True
+                        break
+                    arm = self._select(visits, totals, playouts)
+                    tl.restore(root)
+                    with use_dice(stream.spawn(visits[arm])):   # k-th playout of every arm sees the same dice
+                        totals[arm] += self._playout(tl, idx, view.round, scripts[arm], opponent)
+                    visits[arm] += 1
+                    playouts += 1
+
+        best = max(range(len(cands)), key=lambda i: (visits[i], totals[i] / visits[i] if visits[i] else 0.0, -i))
+        stats = SearchStats(str(me.get("name", "?")), view.round, cands[best], len(cands), playouts,
+                            1000.0 * (time.perf_counter() - t0),
+                            totals[best] / visits[best] if visits[best] else 0.5, timed_out)
+        self.last = stats
+        self.metrics.record(stats, self.budget_ms)
+        return cands[best]
+
+    @staticmethod
+    def _replay_player(view: TurnView, allies: Sequence[dict]) -> Callable[[], PlayerPolicy]:
+        target = next((u for u in allies if u.get("alive", True)), view.player)
+        living = [u for u in allies if u.get("alive", True)]
+        stance, attack, zone, ability = GreedyPolicy().plan(TurnView(view.target, target, living, view.round))
+        script = ScriptedPolicy(stance, attack, zone or "chest", ability)
+        return lambda: script
+
+    def _select(self, visits: List[int], totals: List[float], n: int) -> int:
+        for i, v in enumerate(visits):
+            if not v:
+                return i   # untried candidates first, in prior order
+        log_n = math.log(n)
+        c = self.exploration
+        return max(range(len(visits)), key=lambda i: totals[i] / visits[i] + c * math.sqrt(log_n / visits[i]))
+
+    def _playout(self, tl: CombatTimeline, idx: int, rnd: int, script: PlayerPolicy,
+                 opponent: Callable[[], PlayerPolicy]) -> float:
+        """Finish this round from the candidate onwards, play `horizon` more; score for the searching side."""
+        import adventure_new as game
+
+        player, side = tl.player, list(tl.enemies)    # a summoned Veil Spawn joins this copy, not the timeline
+        later = side[idx + 1:]          # play_round's loop: later enemies still act this round, spawns don't
+        log: List[Any] = []
+        game.enemy_turn(side[idx], player, side, rnd, script, log)
+        for e in later:
+            if not player.get("alive", True):
+                break
+            game.enemy_turn(e, player, side, rnd, game.ENEMY_RULE, log)
+
+        model = opponent()
+        watch = game.StalemateWatch(threshold=6)   # the live counter is not visible to policies
+        enemies: List[dict] = side
+        for r in range(1, self.horizon + 1):
+            if not player.get("alive", True) or player["current_hp"] <= 0:
+                break
+            outcome, enemies = game.play_round(player, enemies, rnd + r, model, watch)
+            if outcome is not None:
+                break
+        return side_score(tl.enemies, [player])
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="Compare the enemy rule with the tactical search on the same seeds.")
+    ap.add_argument("--player", default="torvald")
+    ap.add_argument("--bandits", type=int, default=3)
+    ap.add_argument("-n", type=int, default=10, help="fights per enemy policy")
+    ap.add_argument("--budget-ms", type=float, default=20.0, help="per-turn search budget (0 = no search)")
+    ap.add_argument("--playouts", type=int, default=400, help="max playouts per turn")
+    ap.add_argument("--horizon", type=int, default=2)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        import adventure_new as game
+        player = game.load_character_file(args.player)
+        game.equip_armor(player)
+        bandits = game.make_bandits(args.bandits)
+
+    from rules_repository import thaw
+    ai = TacticalPolicy(budget_ms=args.budget_ms, max_playouts=args.playouts, horizon=args.horizon)
+    for label, enemy_policy in (("enemy rule", None), ("tactical", ai)):
+        wins = rounds = 0
+        t0 = time.perf_counter()
+        for i in range(args.n):
+            p, es = thaw(player), [thaw(b) for b in bandits]
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), \
+                    use_bus(quiet_bus()), use_dice(DiceStream(args.seed).spawn("fight", i)):
+                wins += game.run_combat(p, es, "tactics", policy=GreedyPolicy(), enemy_policy=enemy_policy)
+            rounds += p.get("_last_combat_rounds", 0)
+        print(f"🧠 {label:>10}: {args.player} wins {100.0 * wins / args.n:.1f}% of {args.n} "
+              f"(mean {rounds / args.n:.1f} rounds, {time.perf_counter() - t0:.2f}s)")
+    m = ai.metrics.as_dict()
+    print(f"📊 {m['decisions']} decisions, {m['playouts_per_decision']} playouts each, "
+          f"mean {m['mean_ms']} ms / max {m['max_ms']} ms (budget {args.budget_ms} ms), "
+          f"{m['timeouts']} timeouts, {m['overruns']} overruns")
+
+
+__all__ = [
+    "EnemyAction", "SearchStats", "TacticalMetrics", "candidate_actions", "side_score", "TacticalPolicy", "main",
+]
+
+
+if __name__ == "__main__":
+    main()
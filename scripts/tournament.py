@@ -0,0 +1,298 @@
+# file: scripts/tournament.py
+"""
+Round-robin roster tournament.
+
+Loads every combatant in rules/characters/ once, fights every pair with
+duel_lab.run_duel across a process pool and ranks the roster with a
+Bradley-Terry model, reported on the Elo scale:
+
+    P(i beats j) = s_i / (s_i + s_j),   elo_i = 1500 + 400·log10(s_i)
+
+Duel k of *every* pair rolls on DiceStream(seed).spawn(k) with the same
+initiative (common random numbers), so a rules change moves all pairings
+through the same dice and rating differences between two runs are the
+change, not the noise. Draws count half a win each way, and every pair gets
+one virtual half win per side so undefeated builds keep a finite rating.
+
+Uncertainty comes from a parametric bootstrap: each pair's (wins, losses,
+draws) is resampled from its observed rates and the model refitted; the
+report shows 95% intervals for rating and rank, and calls a build dominant
+when its lower win-rate bound beats 50% against every other build.
+
+Usage:
+    python scripts/tournament.py -n 1000 -j 8
+    python scripts/tournament.py --roster torvald,lyssa,brock,gorthak --csv build/pairs.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import itertools
+import logging
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from character import Character
+from combat_events import quiet_bus, use_bus
+from dice import DiceStream, load_numpy
+from duel_lab import (
+    BULK_DICE, CHAR_DIR, DEFAULT_MAX_ROUNDS, DuelPair, find_character_file, load_combatant,
+    run_duel, wilson_interval,
+)
+
+ROSTER_INDEX = "character_list.json"  # index file, not a combatant
+BASE_ELO = 1500.0
+ELO_SCALE = 400.0
+PRIOR_WINS = 0.5                      # virtual half win per side per pair
+
+
+class PairResult(NamedTuple):
+    a: int
+    b: int
+    wins_a: int
+    wins_b: int
+    draws: int
+
+    @property
+    def duels(self) -> int:
+        return self.wins_a + self.wins_b + self.draws
+
+
+class Standing(NamedTuple):
+    name: str
+    elo: float
+    elo_ci: Tuple[float, float]
+    rank_ci: Tuple[int, int]
+    score: float          # (wins + draws/2) / duels over all pairings
+    dominant: bool
+
+# =============================================================================
+# Roster
+# =============================================================================
+
+def roster_files(keys: Optional[Sequence[str]] = None) -> List[str]:
+    """Character files to enter: `keys` (short names or paths) or every file in rules/characters/."""
+    if keys:
+        return [str(find_character_file(k)) for k in keys]
+    return [str(p) for p in sorted(CHAR_DIR.glob("*.json")) if p.name != ROSTER_INDEX]
+
+
+_TEMPLATES: Dict[str, Character] = {}
+
+
+def _template(path: str) -> Character:
+    """Per-process template cache so each worker parses a character only once."""
+    if path not in _TEMPLATES:
+        _TEMPLATES[path] = load_combatant(path)
+    return _TEMPLATES[path]
+
+# =============================================================================
+# Fights
+# =============================================================================
+
+def _run_pair(args: Tuple[List[str], int, int, int, int, int]) -> PairResult:
+    files, a, b, n, seed, max_rounds = args
+    logging.disable(logging.WARNING)
+    with use_bus(quiet_bus()), open(os.devnull, "w", encoding="utf-8") as sink, \
+            contextlib.redirect_stdout(sink):
+        ta, tb = _template(files[a]), _template(files[b])
+        lab = DiceStream(seed, bulk=BULK_DICE)
+        pair = DuelPair(ta, tb)
+        tally = [0, 0, 0]  # wins a, wins b, draws
+        for k in range(n):
+            winner = run_duel(ta, tb, lab.spawn(k), max_rounds, a_first=(k % 2 == 0), pair=pair)[0]
+            tally[winner] += 1  # -1 → draws
+    return PairResult(a, b, *tally)
+
+
+def play_round_robin(files: Sequence[str], n: int, seed: int = 0, workers: Optional[int] = None,
+                     max_rounds: int = DEFAULT_MAX_ROUNDS) -> List[PairResult]:
+    """n duels for every unordered pair; one pool job per pair."""
+    files = list(files)
+    jobs = [(files, a, b, n, seed, max_rounds) for a, b in itertools.combinations(range(len(files)), 2)]
+    workers = max(1, workers or os.cpu_count() or 1)
+    if workers == 1:
+        return [_run_pair(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_pair, jobs))
+
+# =============================================================================
+# Bradley-Terry
+# =============================================================================
+
+def fit_bradley_terry(size: int, pairs: Sequence[Tuple[int, int, float, float]],
+                      iters: int = 500, tol: float = 1e-9) -> List[float]:
+    """
+    Strengths from (i, j, score_i, score_j) pair totals by Hunter's MM
+    iteration, normalised to geometric mean 1. PRIOR_WINS is added per side.
+    """
+    won = [0.0] * size
+    games: List[List[Tuple[int, float]]] = [[] for _ in range(size)]
+    for i, j, si, sj in pairs:
+        si, sj = si + PRIOR_WINS, sj + PRIOR_WINS
+        won[i] += si
+        won[j] += sj
+        games[i].append((j, si + sj))
+        games[j].append((i, si + sj))
+    s = [1.0] * size
+    for _ in range(iters):
+        new = [
+            won[i] / sum(n_ij / (s[i] + s[j]) for j, n_ij in games[i]) if games[i] else 1.0
+            for i in range(size)
+        ]
+        g = math.exp(sum(math.log(v) for v in new) / size)
+        new = [v / g for v in new]
+        delta = max(abs(x - y) for x, y in zip(new, s))
+        s = new
+        if delta < tol:
+            break
+    return s
+
+
+def to_elo(strength: float) -> float:
+    return BASE_ELO + ELO_SCALE * math.log10(strength)
+
+
+def _scores(results: Sequence[PairResult]) -> List[Tuple[int, int, float, float]]:
+    return [(r.a, r.b, r.wins_a + r.draws / 2, r.wins_b + r.draws / 2) for r in results]
+
+
+def _resample(results: Sequence[PairResult], rng: random.Random, np_rng=None) -> List[PairResult]:
+    """One parametric bootstrap replicate of the pair tallies."""
+    out = []
+    for r in results:
+        n = r.duels
+        if np_rng is not None:
+            wa, wb, d = (int(x) for x in np_rng.multinomial(n, [r.wins_a / n, r.wins_b / n, r.draws / n]))
+        else:
+            wa = wb = d = 0
+            pa, pb = r.wins_a / n, (r.wins_a + r.wins_b) / n
+            for _ in range(n):
+                u = rng.random()
+                if u < pa:
+                    wa += 1
+                elif u < pb:
+                    wb += 1
+                else:
+                    d += 1
+        out.append(PairResult(r.a, r.b, wa, wb, d))
+    return out
+
+
+def rank(names: Sequence[str], results: Sequence[PairResult], bootstrap: int = 200,
+         seed: int = 0) -> List[Standing]:
+    """Standings sorted by rating, with bootstrap intervals."""
+    size = len(names)
+    elo = [to_elo(v) for v in fit_bradley_terry(size, _scores(results))]
+
+    np = load_numpy()
+    np_rng = np.random.default_rng(seed) if np is not None else None
+    rng = random.Random(seed)
+    samples: List[List[float]] = [[] for _ in range(size)]
+    ranks: List[List[int]] = [[] for _ in range(size)]
+    for _ in range(bootstrap):
+        rep = [to_elo(v) for v in fit_bradley_terry(size, _scores(_resample(results, rng, np_rng)))]
+        order = sorted(range(size), key=lambda i: -rep[i])
+        for pos, i in enumerate(order, 1):
+            ranks[i].append(pos)
+        for i in range(size):
+            samples[i].append(rep[i])
+
+    played = [[0, 0.0] for _ in range(size)]
+    beats_all = [True] * size
+    for r in results:
+        for me, wins in ((r.a, r.wins_a), (r.b, r.wins_b)):
+            played[me][0] += r.duels
+            played[me][1] += wins + r.draws / 2
+            if wilson_interval(wins, r.duels)[0] <= 0.5:
+                beats_all[me] = False
+
+    def interval(values: List[float]) -> Tuple[float, float]:
+        if not values:
+            return math.nan, math.nan
+        values = sorted(values)
+        return values[int(0.025 * (len(values) - 1))], values[int(math.ceil(0.975 * (len(values) - 1)))]
+
+    standings = []
+    for i in range(size):
+        lo, hi = interval(samples[i])
+        r_lo, r_hi = interval(ranks[i])
+        standings.append(Standing(
+            names[i], elo[i], (lo, hi),
+            (int(r_lo), int(r_hi)) if ranks[i] else (0, 0),
+            played[i][1] / played[i][0] if played[i][0] else 0.0,
+            beats_all[i] and size > 1,
+        ))
+    return sorted(standings, key=lambda s: -s.elo)
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def format_table(standings: Sequence[Standing], elapsed: float, duels: int) -> str:
+    width = max([len(s.name) for s in standings] + [4])
+    lines = [
+        f"🏟️ {len(standings)} combatants, {duels} duels in {elapsed:.1f}s",
+        f"{'#':>3}  {'Name':<{width}}  {'Elo':>6}  {'95% CI':>13}  {'Rank CI':>7}  {'Score':>6}",
+    ]
+    for pos, s in enumerate(standings, 1):
+        lo, hi = s.elo_ci
+        lines.append(
+            f"{pos:>3}  {s.name:<{width}}  {s.elo:6.0f}  {lo:6.0f}–{hi:<6.0f}  "
+            f"{s.rank_ci[0]:>3}–{s.rank_ci[1]:<3}  {s.score:6.1%}" + ("  👑 dominant" if s.dominant else "")
+        )
+    dominant = [s.name for s in standings if s.dominant]
+    lines.append(f"⚠️ Dominant build: {', '.join(dominant)}" if dominant else "✅ No build beats every other build")
+    return "\n".join(lines)
+
+
+def write_pairs_csv(path: str, names: Sequence[str], results: Sequence[PairResult]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["a", "b", "duels", "wins_a", "wins_b", "draws", "win_rate_a"])
+        for r in results:
+            w.writerow([names[r.a], names[r.b], r.duels, r.wins_a, r.wins_b, r.draws,
+                        f"{r.wins_a / r.duels:.4f}" if r.duels else ""])
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> List[Standing]:
+    ap = argparse.ArgumentParser(description="Round-robin every character in rules/characters/ and rank them.")
+    ap.add_argument("--roster", help="comma-separated characters (default: every file in rules/characters/)")
+    ap.add_argument("-n", "--duels", type=int, default=500, help="duels per pairing (default 500)")
+    ap.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    ap.add_argument("--seed", type=int, default=0, help="base seed shared by every pairing")
+    ap.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS, help="rounds before a duel is called a draw")
+    ap.add_argument("--bootstrap", type=int, default=200, help="bootstrap replicates for intervals (default 200)")
+    ap.add_argument("--csv", metavar="PATH", help="also write per-pair results here")
+    args = ap.parse_args(argv)
+
+    files = roster_files(args.roster.split(",") if args.roster else None)
+    if len(files) < 2:
+        raise SystemExit("❌ A tournament needs at least two combatants")
+    with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        logging.disable(logging.WARNING)
+        names = [_template(f).name for f in files]
+
+    t0 = time.perf_counter()
+    results = play_round_robin(files, args.duels, seed=args.seed, workers=args.workers,
+                               max_rounds=args.max_rounds)
+    elapsed = time.perf_counter() - t0
+    standings = rank(names, results, bootstrap=args.bootstrap, seed=args.seed)
+    print(format_table(standings, elapsed, sum(r.duels for r in results)))
+    if args.csv:
+        write_pairs_csv(args.csv, names, results)
+    return standings
+
+
+if __name__ == "__main__":
+    main()
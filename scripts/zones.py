@@ -0,0 +1,266 @@
+# file: scripts/zones.py
+"""
+Canonical hit zones, their aliases and per-character armor coverage masks.
+
+Zone strings arrive in several spellings ("left upper arm", "left_upper_arm",
+"Left-Upper-Arm") and several anatomical synonyms ("skull", "face" for the
+head; "belly" for the stomach). Every hit used to re-lowercase the armor's
+coverage list and rebuild coverage_keys_for_zone's key list. Here:
+
+    Zone.LEFT_UPPER_ARM            # IntEnum, same order as adventure_new.AIM_ZONES
+    zone_of("Left upper arm")      # Zone.LEFT_UPPER_ARM (known spellings memoised; None if unknown)
+    zone_key("skull")              # 'head'  — canonical snake_case, aliases folded
+    zone_label("left_upper_arm")   # 'left upper arm' for log lines
+
+    idx = zone_index(unit)         # unit dict or Character
+    idx.covered(Zone.HEAD)         # one bit test
+    covering_piece(unit, "chest")  # armor covering the chest, or None
+
+coverage_mask() turns a coverage list into a bitmask over Zone, using the
+same coverage keys the adventure has always used (coverage_keys_for_zone lives
+here now and adventure_new re-exports it).
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from body_plans import canonical_zone
+
+
+class Zone(IntEnum):
+    HEAD = 0
+    THROAT = 1
+    NECK = 2
+    CHEST = 3
+    STOMACH = 4
+    GROIN = 5
+    LEFT_UPPER_ARM = 6
+    LEFT_LOWER_ARM = 7
+    RIGHT_UPPER_ARM = 8
+    RIGHT_LOWER_ARM = 9
+    LEFT_UPPER_LEG = 10
+    LEFT_LOWER_LEG = 11
+    RIGHT_UPPER_LEG = 12
+    RIGHT_LOWER_LEG = 13
+
+    @property
+    def key(self) -> str:
+        return _KEYS[self]
+
+    @property
+    def label(self) -> str:
+        return _LABELS[self]
+
+    @property
+    def bit(self) -> int:
+        return 1 << self
+
+
+_KEYS = tuple(z.name.lower() for z in Zone)
+_LABELS = tuple(k.replace("_", " ") for k in _KEYS)
+ZONE_KEYS: Tuple[str, ...] = _KEYS
+ALL_ZONES = (1 << len(Zone)) - 1
+
+ALIASES: Dict[str, Zone] = {
+    "skull": Zone.HEAD, "face": Zone.HEAD, "eyes": Zone.HEAD,
+    "gorget": Zone.NECK, "collar": Zone.NECK,
+    "heart": Zone.CHEST, "rib": Zone.CHEST, "ribs": Zone.CHEST, "breast": Zone.CHEST,
+    "belly": Zone.STOMACH, "abdomen": Zone.STOMACH, "gut": Zone.STOMACH,
+    "hip": Zone.GROIN, "hips": Zone.GROIN, "pelvis": Zone.GROIN,
+    "left_forearm": Zone.LEFT_LOWER_ARM, "right_forearm": Zone.RIGHT_LOWER_ARM,
+    "left_thigh": Zone.LEFT_UPPER_LEG, "right_thigh": Zone.RIGHT_UPPER_LEG,
+    "left_shin": Zone.LEFT_LOWER_LEG, "right_shin": Zone.RIGHT_LOWER_LEG,
+    "left_calf": Zone.LEFT_LOWER_LEG, "right_calf": Zone.RIGHT_LOWER_LEG,
+}
+_LOOKUP: Dict[str, Optional[Zone]] = {**{k: z for k, z in zip(_KEYS, Zone)}, **ALIASES}
+
+# =============================================================================
+# Names
+# =============================================================================
+
+def zone_of(name: Any) -> Optional[Zone]:
+    """Zone for any spelling or alias of a zone name (or a Zone / int); None when unknown."""
+    if isinstance(name, Zone):
+        return name
+    if isinstance(name, int):
+        return Zone(name) if 0 <= name < len(Zone) else None
+    try:
+        return _LOOKUP[name]
+    except KeyError:
+        zone = _LOOKUP.get(canonical_zone(name))
+        if zone is not None:
+            _LOOKUP[name] = zone  # memoise spellings of known zones only, so the table stays bounded
+        return zone
+    except TypeError:
+        return None
+
+
+_KEY_MEMO: Dict[str, str] = {}
+
+
+def zone_key(name: str) -> str:
+    """Canonical snake_case key; aliases fold onto their zone, unknown names are just normalised."""
+    key = _KEY_MEMO.get(name)
+    if key is None:
+        zone = zone_of(name)
+        if zone is None:
+            return canonical_zone(name)
+        key = _KEY_MEMO[name] = zone.key
+    return key
+
+
+def zone_label(name: Any) -> str:
+    """Human-readable zone for log lines ('left upper arm')."""
+    zone = zone_of(name)
+    return zone.label if zone is not None else str(name).replace("_", " ")
+
+# =============================================================================
+# Coverage
+# =============================================================================
+
+def coverage_keys_for_zone(zone: str):
+    """Return coverage keys that should count as protection for a given hit zone."""
+    z = zone.lower()
+    if z in ("head","skull","face"):
+        return ["head","skull","face","eyes","neck"]
+    if z in ("neck",):
+        return ["neck","gorget","collar","torso"]
+    if z in ("chest","heart","rib","ribs"):
+        return ["chest","torso","breast","cuirass"]
+    if z in ("stomach","belly","abdomen","gut"):
+        return ["stomach","abdomen","belly","torso"]
+    if z in ("groin","hip","hips"):
+        return ["groin","hips","pelvis","torso"]
+
+    # Arms
+    if "arm" in z:
+        keys = [z, "arm", "arms", "shoulder", "upper_arm", "forearm"]
+        if "left" in z:
+            keys += ["left_arm","left_upper_arm","left_forearm"]
+        if "right" in z:
+            keys += ["right_arm","right_upper_arm","right_forearm"]
+        return keys
+
+    if "hand" in z:
+        return [z, "hand", "hands", "gauntlet", "arms"]
+
+    # Legs
+    if any(part in z for part in ("leg","thigh","calf","shin")):
+        keys = [z, "leg", "legs", "thigh", "calf", "shin"]
+        if "left" in z:
+            keys += ["left_leg","left_thigh","left_calf","left_shin"]
+        if "right" in z:
+            keys += ["right_leg","right_thigh","right_calf","right_shin"]
+        return keys
+
+    if any(part in z for part in ("foot","feet")):
+        return [z, "foot", "feet", "boots", "shoes", "legs"]
+
+    return [z, "torso"]
+
+
+_PROTECTED_BY: Tuple[frozenset, ...] = tuple(frozenset(coverage_keys_for_zone(k)) for k in _KEYS)
+_MASKS: Dict[Tuple[str, ...], int] = {}
+
+
+def coverage_mask(coverage: Iterable[str]) -> int:
+    """Bitmask over Zone of everything a coverage list protects (memoised per list)."""
+    cov = tuple(coverage or ())
+    mask = _MASKS.get(cov)
+    if mask is None:
+        low = {str(c).lower() for c in cov}
+        mask = sum(1 << z for z in range(len(Zone)) if _PROTECTED_BY[z] & low)
+        _MASKS[cov] = mask
+    return mask
+
+
+def named_mask(coverage: Iterable[str]) -> int:
+    """Bitmask of exactly the zones a coverage list names (aliases folded); unknown names are ignored."""
+    mask = 0
+    for c in coverage or ():
+        z = zone_of(c)
+        if z is not None:
+            mask |= 1 << z
+    return mask
+
+
+class ZoneArmorIndex:
+    """Zone → covering armor piece for one character, as a bitmask and an index array."""
+
+    __slots__ = ("source", "pieces", "by_zone", "mask")
+
+    def __init__(self, pieces: Sequence[Any], masks: Sequence[int], source: Any = None):
+        self.source = source
+        self.pieces = tuple(pieces)
+        by_zone = [-1] * len(Zone)
+        for i, m in enumerate(masks):
+            for z in range(len(Zone)):
+                if m >> z & 1 and by_zone[z] < 0:
+                    by_zone[z] = i          # first piece listed wins, like the old list scans
+        self.by_zone = tuple(by_zone)
+        self.mask = sum(1 << z for z, i in enumerate(by_zone) if i >= 0)
+
+    def covered(self, zone: Any) -> bool:
+        z = zone_of(zone)
+        return z is not None and bool(self.mask >> z & 1)
+
+    def piece(self, zone: Any) -> Optional[Any]:
+        z = zone_of(zone)
+        if z is None:
+            return None
+        i = self.by_zone[z]
+        return self.pieces[i] if i >= 0 else None
+
+    def zones(self) -> List[Zone]:
+        return [z for z in Zone if self.mask >> z & 1]
+
+
+_MASK_INDEX: Dict[int, ZoneArmorIndex] = {}
+
+
+def unit_mask(unit: dict) -> int:
+    """Coverage bitmask of an adventure unit dict; equip_armor stores it as _equipped_armor['coverage_mask']."""
+    armor = unit.get("_equipped_armor") or {}
+    mask = armor.get("coverage_mask")
+    return mask if mask is not None else coverage_mask(armor.get("coverage") or ())
+
+
+def zone_index(unit: Any) -> ZoneArmorIndex:
+    """
+    ZoneArmorIndex for a unit dict or a Character.
+
+    Unit dicts have one piece (_equipped_armor) and the adventure's broad
+    coverage keys ("torso" protects the gut too); they stay JSON-plain, so
+    their index is shared per mask. A Character's Armor pieces cover exactly
+    the zones they name; that index is cached on the character and rebuilt
+    when its armor list changes.
+    """
+    if isinstance(unit, dict):
+        mask = unit_mask(unit)
+        index = _MASK_INDEX.get(mask)
+        if index is None:
+            index = _MASK_INDEX[mask] = ZoneArmorIndex([None], [mask])
+        return index
+    source = tuple(getattr(unit, "armor", None) or ())
+    cached = getattr(unit, "_zone_index", None)
+    if cached is not None and cached.source == source:
+        return cached
+    index = ZoneArmorIndex(source, [named_mask(getattr(p, "coverage", None)) for p in source], source)
+    unit._zone_index = index
+    return index
+
+
+def covering_piece(unit: Any, zone: Any) -> Optional[Any]:
+    """The armor protecting `zone`: the _equipped_armor dict for unit dicts, the Armor piece for Characters."""
+    index = zone_index(unit)
+    if isinstance(unit, dict):
+        return unit.get("_equipped_armor") if index.covered(zone) else None
+    return index.piece(zone)
+
+
+__all__ = [
+    "Zone", "ZONE_KEYS", "ALL_ZONES", "ALIASES", "zone_of", "zone_key", "zone_label",
+    "coverage_keys_for_zone", "coverage_mask", "named_mask", "ZoneArmorIndex", "unit_mask", "zone_index", "covering_piece",
+]